@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+内容识别微基准 - 在合成的混合缓存上测量ContentIdentifier的吞吐量，并与原先基于解码文本的实现核对识别结果
+Content Identifier Microbenchmark - Measures ContentIdentifier throughput over a synthetic mixed cache
+and checks its classification against the original decoded-text implementation
+
+用法 / Usage:
+    python benchmarks/bench_content_identifier.py [--items 20000] [--repeat 5]
+"""
+
+import os
+import sys
+import json
+import random
+import struct
+import argparse
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.extractors.content_identifier import AssetType, ContentIdentifier  # noqa: E402
+
+# 曾被误识别为MP3的内容开头：第二个字节满足帧同步位，但首字节不是0xFF，
+# 且开头包含"包含"类签名（跳过了首字节分组）
+REGRESSION_PREFIXES = [
+    (b"\x00\xf0\x00\x00GDEF", AssetType.Ignored),
+    (b'A\xff  "name": "Arial"', AssetType.FontList),
+    (b"\x12\xe7 KTX 11", AssetType.Khronos),
+]
+
+
+def _fontlist(rng: random.Random) -> bytes:
+    """生成字体列表JSON"""
+    faces = [{"name": f"Face{i}", "weight": 400 + i * 100, "style": "normal",
+              "assetId": f"rbxassetid://{rng.randint(10 ** 8, 10 ** 10)}"} for i in range(rng.randint(1, 12))]
+    return json.dumps({"name": f"Family{rng.randint(0, 999)}", "faces": faces}, indent=2).encode("utf-8")
+
+
+def _translation(rng: random.Random) -> bytes:
+    """生成翻译文件JSON"""
+    entries = {f"key{i}": "文本" * rng.randint(1, 20) for i in range(rng.randint(10, 400))}
+    return json.dumps({"locale": "zh-cn", "entries": entries}, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def _binary(header: bytes, rng: random.Random, size: int) -> bytes:
+    """生成带文件头的随机二进制数据"""
+    return header + rng.randbytes(size)
+
+
+def legacy_identify(content: bytes, block_avatar_images: bool = True) -> tuple:
+    """
+    原先的识别实现：把开头解码为文本后按优先级逐条检查
+
+    Returns:
+        tuple: (资源类型, 类型名称)
+    """
+    if len(content) == 0:
+        return AssetType.Unknown, "empty content"
+    begin_size = min(48, len(content) - 1) if len(content) > 1 else len(content)
+    begin = content[:begin_size].decode("utf-8", errors="ignore")
+    magic = struct.unpack("<I", content[:4])[0] if len(content) >= 4 else 0
+
+    if "<roblox!" in begin:
+        return AssetType.NoConvert, "RBXM"
+    if "<roblox xml" in begin:
+        return AssetType.Ignored, "unsupported XML"
+    if not begin.startswith("\"version") and begin.startswith("version"):
+        return AssetType.Mesh, ""
+    if begin.startswith("{\"translations"):
+        return AssetType.Ignored, "translation list JSON"
+    if "{\"locale\":\"" in begin:
+        return AssetType.Translation, ""
+    if "PNG\r\n" in begin:
+        return AssetType.NoConvert, "PNG"
+    if begin.startswith("GIF87a") or begin.startswith("GIF89a"):
+        return AssetType.NoConvert, "GIF"
+    if "JFIF" in begin or "Exif" in begin:
+        return AssetType.NoConvert, "JFIF"
+    if begin.startswith("RIFF") and "WEBP" in begin:
+        return (AssetType.WebP if block_avatar_images else AssetType.NoConvert), "WebP"
+    if begin.startswith("OggS"):
+        return AssetType.NoConvert, "OGG"
+    if begin.startswith("ID3") or (len(content) > 2 and content[0] == 0xFF and (content[1] & 0xE0) == 0xE0):
+        return AssetType.NoConvert, "MP3"
+    if "KTX 11" in begin:
+        return AssetType.Khronos, ""
+    if begin.startswith("#EXTM3U"):
+        return AssetType.EXTM3U, ""
+    if "\"name\": \"" in begin:
+        return AssetType.FontList, ""
+    if "{\"applicationSettings" in begin:
+        return AssetType.Ignored, "FFlags JSON"
+    if "{\"version" in begin:
+        return AssetType.Ignored, "client version JSON"
+    if "GDEF" in begin or "GPOS" in begin or "GSUB" in begin:
+        return AssetType.Ignored, "OpenType/TrueType font"
+    if magic == 0xFD2FB528:
+        return AssetType.Ignored, "Zstandard compressed data (likely FFlags)"
+    if content[:4] == b"\x1a\x45\xdf\xa3":
+        return AssetType.Video, "VideoFrame"
+    if begin.startswith("RIFF") and "WEBM" in begin.upper():
+        return AssetType.Video, "WebM"
+    return AssetType.Unknown, ""
+
+
+def check_classification(identifier: ContentIdentifier, items: list) -> int:
+    """
+    核对回归用例和混合缓存上的识别结果与原先实现一致
+
+    Returns:
+        int: 不一致的数量
+    """
+    rng = random.Random(99)
+    mismatches = 0
+    for prefix, expected in REGRESSION_PREFIXES:
+        content = prefix + rng.randbytes(256)
+        old = legacy_identify(content)[0]
+        new = identifier.identify_content(content).asset_type
+        ok = old == new == expected
+        mismatches += not ok
+        print(f"{'ok' if ok else 'MISMATCH':<9} {prefix!r:<32} expected={expected.name} old={old.name} new={new.name}")
+
+    mixed = 0
+    for content in items:
+        result = identifier.identify_content(content)
+        if (result.asset_type, result.type_name) != legacy_identify(content):
+            mixed += 1
+    print(f"{'ok' if not mixed else 'MISMATCH':<9} mixed cache: {len(items) - mixed}/{len(items)} items match the old implementation")
+    return mismatches + mixed
+
+
+def build_mixed_cache(count: int, seed: int = 1234) -> list:
+    """
+    生成合成的混合缓存内容
+
+    Args:
+        count: 缓存项数量
+        seed: 随机种子
+
+    Returns:
+        list: 缓存内容字节列表
+    """
+    rng = random.Random(seed)
+    makers = [
+        lambda: _binary(b"OggS\x00\x02", rng, rng.randint(4096, 65536)),
+        lambda: _binary(b"ID3\x04\x00", rng, rng.randint(4096, 65536)),
+        lambda: _binary(b"\x89PNG\r\n\x1a\n", rng, rng.randint(1024, 32768)),
+        lambda: _binary(b"\xff\xd8\xff\xe0\x00\x10JFIF\x00", rng, rng.randint(1024, 32768)),
+        lambda: _binary(b"RIFF\x10\x00\x00\x00WEBPVP8 ", rng, rng.randint(1024, 16384)),
+        lambda: _binary(b"\xabKTX 11\xbb\r\n\x1a\n", rng, rng.randint(4096, 65536)),
+        lambda: _binary(b"version 4.00\n", rng, rng.randint(4096, 65536)),
+        lambda: _binary(b"<roblox!\x89\xff\r\n\x1a\n", rng, rng.randint(1024, 32768)),
+        lambda: _binary(b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01", rng, rng.randint(4096, 65536)),
+        lambda: b"#EXTM3U\n#EXT-X-VERSION:3\n" + b"#EXTINF:2.0,\nseg.webm\n" * rng.randint(1, 50),
+        lambda: _fontlist(rng),
+        lambda: _translation(rng),
+        lambda: _binary(b"\x28\xb5\x2f\xfd", rng, rng.randint(1024, 8192)),
+        lambda: rng.randbytes(rng.randint(64, 8192)),
+    ]
+    return [rng.choice(makers)() for _ in range(count)]
+
+
+def _measure(label: str, func, items: list, repeat: int):
+    """运行并打印吞吐量和每项分配的内存"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+
+    # 每项的峰值分配（包括调用结束前已释放的临时对象）
+    tracemalloc.start()
+    alloc_total = 0
+    for item in items:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        func(item)
+        alloc_total += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    total_bytes = sum(len(item) for item in items)
+    print(f"{label:<22} {len(items) / best:>12,.0f} items/s  {total_bytes / best / 1e6:>10,.1f} MB/s  "
+          f"{best * 1e9 / len(items):>8,.0f} ns/item  {alloc_total / len(items):>10,.0f} B alloc/item")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ContentIdentifier microbenchmark")
+    parser.add_argument("--items", type=int, default=20000, help="number of synthetic cache items")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    items = build_mixed_cache(args.items)
+    identifier = ContentIdentifier()
+    print(f"{len(items)} items, {sum(len(i) for i in items) / 1e6:.1f} MB")
+    if check_classification(identifier, items):
+        print("warning: classification differs from the old implementation")
+    _measure("identify_content", identifier.identify_content, items, args.repeat)
+    _measure("is_fontlist", identifier.is_fontlist, items, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+下载管理器检查 - 通过本地HTTP替身服务器检查并发限制、重试和退避、完整性校验
+Download Manager Checks - Exercises the per-host limit, retry/backoff and integrity checks against a local HTTP stand-in
+
+检查项目：
+    per-host-limit  并发请求数不超过每主机连接数
+    retry-503       503（带Retry-After）后重试并成功，重试次数和退避时间正确
+    no-retry-404    404不重试，立即失败
+    truncated       响应数据少于Content-Length时不当作成功，重试用完后失败
+    truncated-once  第一次响应截断、之后完整时重试后得到完整数据
+任一检查失败时返回1。
+
+用法 / Usage:
+    python benchmarks/bench_download_manager.py [--connections 3] [--requests 12]
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.local_server import LocalServer  # noqa: E402
+from src.utils.download_manager import DownloadManager, DownloadStats  # noqa: E402
+
+_BODY = bytes(range(256)) * 256
+
+
+def check_per_host_limit(server: LocalServer, connections: int, requests: int) -> List[str]:
+    """同时发起多个请求，服务器观察到的并发数应等于每主机连接数"""
+    for index in range(requests):
+        server.add(f"/limit/{index}", _BODY, latency=0.1)
+    manager = DownloadManager(max_connections_per_host=connections)
+    results: Dict[int, bytes] = {}
+    try:
+        def fetch(index: int):
+            results[index] = manager.fetch(server.url(f"/limit/{index}"))
+
+        threads = [threading.Thread(target=fetch, args=(index,)) for index in range(requests)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        manager.close()
+
+    problems = []
+    if server.max_active != connections:
+        problems.append(f"peak concurrency {server.max_active}, expected {connections}")
+    if any(results.get(index) != _BODY for index in range(requests)):
+        problems.append("not every request returned the full body")
+    return problems
+
+
+def check_retry_503(server: LocalServer) -> List[str]:
+    """前两次返回503和Retry-After，第三次成功"""
+    server.add("/retry", _BODY, fail_first=2, fail_status=503, headers={"Retry-After": "1"})
+    manager = DownloadManager(max_retries=3, backoff_base=0.05, backoff_max=0.5)
+    stats = DownloadStats()
+    try:
+        start = time.perf_counter()
+        data = manager.fetch(server.url("/retry"), stats=stats)
+        seconds = time.perf_counter() - start
+    finally:
+        manager.close()
+
+    problems = []
+    if data != _BODY:
+        problems.append("download did not succeed after retrying")
+    if server.request_count("/retry") != 3:
+        problems.append(f"{server.request_count('/retry')} requests, expected 3")
+    if stats.get_all()["retries"] != 2:
+        problems.append(f"{stats.get_all()['retries']} retries recorded, expected 2")
+    # Retry-After: 1 应让两次退避各等待约1秒
+    if seconds < 1.8:
+        problems.append(f"finished in {seconds:.2f}s, Retry-After was not honoured")
+    return problems
+
+
+def check_no_retry_404(server: LocalServer) -> List[str]:
+    """404不可重试：只请求一次"""
+    server.add("/missing", b"", status=404)
+    manager = DownloadManager(max_retries=3, backoff_base=0.05)
+    stats = DownloadStats()
+    try:
+        data = manager.fetch(server.url("/missing"), stats=stats)
+    finally:
+        manager.close()
+
+    problems = []
+    if data is not None:
+        problems.append("404 response was treated as success")
+    if server.request_count("/missing") != 1:
+        problems.append(f"{server.request_count('/missing')} requests, expected 1")
+    recorded = stats.get_all()
+    if recorded["retries"] != 0 or recorded["failures"] != 1:
+        problems.append(f"recorded {recorded['retries']} retries and {recorded['failures']} failures, expected 0 and 1")
+    return problems
+
+
+def check_truncated(server: LocalServer) -> List[str]:
+    """每次响应都被截断：下载失败，用完全部尝试次数，不留下.part文件"""
+    server.add("/truncated", _BODY, truncate_first=6)
+    manager = DownloadManager(max_retries=3, backoff_base=0.05)
+    work_dir = tempfile.mkdtemp(prefix="bench_download_manager_")
+    target = os.path.join(work_dir, "truncated.bin")
+    try:
+        data = manager.fetch(server.url("/truncated"))
+        saved = manager.download_to_file(server.url("/truncated"), target)
+        leftovers = os.listdir(work_dir)
+    finally:
+        manager.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    problems = []
+    if data is not None or saved:
+        problems.append("truncated response was treated as success")
+    if server.request_count("/truncated") != 6:
+        problems.append(f"{server.request_count('/truncated')} requests, expected 6 (3 per download)")
+    if leftovers:
+        problems.append(f"left {', '.join(leftovers)} behind")
+    return problems
+
+
+def check_truncated_once(server: LocalServer) -> List[str]:
+    """第一次响应被截断，重试后得到完整数据"""
+    server.add("/flaky", _BODY, truncate_first=1)
+    manager = DownloadManager(max_retries=3, backoff_base=0.05)
+    stats = DownloadStats()
+    try:
+        data = manager.fetch(server.url("/flaky"), stats=stats)
+    finally:
+        manager.close()
+
+    problems = []
+    if data != _BODY:
+        problems.append("complete response after a truncated one was not returned in full")
+    if server.request_count("/flaky") != 2 or stats.get_all()["retries"] != 1:
+        problems.append(f"{server.request_count('/flaky')} requests and {stats.get_all()['retries']} retries, "
+                        f"expected 2 and 1")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download manager checks against a local HTTP stand-in")
+    parser.add_argument("--connections", type=int, default=3, help="connections per host for the limit check")
+    parser.add_argument("--requests", type=int, default=12, help="concurrent requests for the limit check")
+    args = parser.parse_args()
+
+    checks: List[Tuple[str, Callable[[LocalServer], List[str]]]] = [
+        ("per-host-limit", lambda server: check_per_host_limit(server, args.connections, args.requests)),
+        ("retry-503", check_retry_503),
+        ("no-retry-404", check_no_retry_404),
+        ("truncated", check_truncated),
+        ("truncated-once", check_truncated_once),
+    ]
+    failed = False
+    with LocalServer() as server:
+        for name, check in checks:
+            server.reset_counters()
+            start = time.perf_counter()
+            problems = check(server)
+            status = "ok" if not problems else "FAIL: " + "; ".join(problems)
+            print(f"{name:<16} {time.perf_counter() - start:>7.2f}s  {status}")
+            failed = failed or bool(problems)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+提取器基准套件 - 在合成缓存上测量扫描、识别、去重、保存和转换的吞吐量
+Extractor Benchmark Suite - Measures scan, identify, dedup, save and convert throughput over a synthetic cache
+
+视频的分段播放列表和片段由本地HTTP替身服务器提供，未安装FFmpeg时默认不测视频。
+结果以JSON输出，可以保存为基线，之后用--baseline比较（吞吐量低于基线超过容差时返回1）。
+
+用法 / Usage:
+    python benchmarks/bench_extractors.py [--items 2000] [--modes threads,processes] [--output result.json]
+    python benchmarks/bench_extractors.py --baseline result.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import platform
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.local_server import LocalServer  # noqa: E402
+from benchmarks.synthetic_cache import LAYOUTS, add_spec_arguments, build_synthetic_cache, spec_from_args  # noqa: E402
+from src.cli import EXTRACTION_TYPES, CLIOptions, run_extraction  # noqa: E402
+from src.extractors.cache_scanner import RobloxCacheScanner, get_scanner  # noqa: E402
+from src.extractors.content_identifier import ContentIdentifier  # noqa: E402
+from src.extractors.rbxh_parser import RBXHParser  # noqa: E402
+
+MODES = ("threads", "processes")
+# 视频需要FFmpeg生成和合并片段，未安装时默认不测
+DEFAULT_TYPES = tuple(extraction_type for extraction_type in EXTRACTION_TYPES
+                      if extraction_type != "videos" or shutil.which("ffmpeg"))
+# 每次运行不同的缓存清单字段，与基线比较时忽略
+_VOLATILE_CACHE_KEYS = ("cache_path", "video_base_uri")
+
+
+def _entry(seconds: float, items: int, total_bytes: int, **extra) -> Dict[str, Any]:
+    """生成一条结果记录"""
+    return {
+        "seconds": round(seconds, 4),
+        "items": items,
+        "items_per_second": round(items / seconds, 2) if seconds > 0 else 0.0,
+        "bytes_per_second": round(total_bytes / seconds, 1) if seconds > 0 else 0.0,
+        **extra,
+    }
+
+
+def _best_of(repeat: int, func: Callable[[], Any]):
+    """重复运行，返回最短耗时和最后一次的返回值"""
+    best, value = float("inf"), None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        value = func()
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def _read_item(item) -> bytes:
+    """读取缓存项的原始数据"""
+    if item.data is not None:
+        return item.data
+    with open(item.path, "rb") as f:
+        return f.read()
+
+
+def bench_scan(cache_path: str, repeat: int) -> Dict[str, Any]:
+    """扫描阶段：列出全部缓存项（数据库模式包括读取内联内容）"""
+    def scan():
+        scanner = RobloxCacheScanner()
+        scanner.set_cache_path(cache_path)
+        return scanner.scan_cache()
+
+    seconds, items = _best_of(repeat, scan)
+    total_bytes = sum(len(item.data) if item.data is not None else os.path.getsize(item.path) for item in items)
+    return _entry(seconds, len(items), total_bytes)
+
+
+def bench_identify(raw_items: List[bytes], repeat: int) -> Dict[str, Any]:
+    """识别阶段：解析RBXH并识别内容类型"""
+    identifier = ContentIdentifier()
+
+    def identify():
+        # 解析器会跳过已见过的链接，每轮使用新的解析器
+        parser = RBXHParser()
+        identified = 0
+        for data in raw_items:
+            parsed = parser.parse_cache_data(data)
+            if parsed.success and identifier.identify_content(parsed.content).asset_type.name != "Unknown":
+                identified += 1
+        return identified
+
+    seconds, identified = _best_of(repeat, identify)
+    return _entry(seconds, len(raw_items), sum(len(data) for data in raw_items), identified=identified)
+
+
+def bench_dedup(raw_items: List[bytes], repeat: int) -> Dict[str, Any]:
+    """去重阶段：与提取器相同，按内容的SHA-256判断重复"""
+    parser = RBXHParser()
+    contents = [parser.parse_cache_data(data).content for data in raw_items]
+
+    def dedup():
+        seen = set()
+        duplicates = 0
+        for content in contents:
+            digest = hashlib.sha256(content).digest()
+            if digest in seen:
+                duplicates += 1
+            else:
+                seen.add(digest)
+        return duplicates
+
+    seconds, duplicates = _best_of(repeat, dedup)
+    return _entry(seconds, len(contents), sum(len(content) for content in contents), duplicates=duplicates)
+
+
+def _output_stats(output_dir: str) -> Dict[str, int]:
+    """统计输出目录中的文件数和字节数"""
+    files = size = 0
+    for root, _, names in os.walk(output_dir):
+        for name in names:
+            files += 1
+            size += os.path.getsize(os.path.join(root, name))
+    return {"files_written": files, "bytes_written": size}
+
+
+def _options(cache_path: str, output_dir: str, mode: str, workers: int) -> CLIOptions:
+    """提取选项：不使用历史，每次都完整处理"""
+    return CLIOptions(
+        cache_path=cache_path, output_dir=output_dir, workers=workers,
+        use_multiprocessing=mode == "processes", conservative_multiprocessing=False,
+        download_history=None, log_callback=None)
+
+
+def bench_save(extraction_type: str, mode: str, workers: int, manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """保存阶段：完整运行一种提取器（扫描、识别、去重并写入输出目录）"""
+    output_dir = tempfile.mkdtemp(prefix=f"bench_{extraction_type}_")
+    try:
+        summary = run_extraction(extraction_type, _options(manifest["cache_path"], output_dir, mode, workers))
+        return _entry(summary["wall_seconds"], summary["items"], manifest["bytes"],
+                      success=summary["success"], **_output_stats(output_dir))
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def _convert_textures(options: CLIOptions) -> Dict[str, Any]:
+    from src.extractors.texture_extractor import RobloxTextureExtractor
+    from src.extractors.ktx_texture import is_decode_available
+    if not is_decode_available():
+        return {"skipped": "numpy is not installed"}
+    extractor = RobloxTextureExtractor(
+        output_dir=options.output_dir, num_threads=options.workers,
+        use_multiprocessing=options.use_multiprocessing, conservative_multiprocessing=False,
+        decode_png=True)
+    return extractor.extract_textures()
+
+
+def _convert_meshes(options: CLIOptions) -> Dict[str, Any]:
+    from src.extractors.mesh_extractor import RobloxMeshExtractor
+    extractor = RobloxMeshExtractor(
+        output_dir=options.output_dir, num_threads=options.workers,
+        use_multiprocessing=options.use_multiprocessing, conservative_multiprocessing=False,
+        convert_obj=True)
+    return extractor.extract_meshes()
+
+
+# 音频转换依赖ffmpeg和图形界面的转换线程，不在此测量
+_CONVERTERS = {
+    "textures": _convert_textures,
+    "meshes": _convert_meshes,
+}
+
+
+def bench_convert(extraction_type: str, mode: str, workers: int, manifest: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """转换阶段：提取并转换格式（KTX解码为PNG、网格转换为OBJ）"""
+    output_dir = tempfile.mkdtemp(prefix=f"bench_convert_{extraction_type}_")
+    try:
+        start = time.perf_counter()
+        result = _CONVERTERS[extraction_type](_options(manifest["cache_path"], output_dir, mode, workers))
+        seconds = time.perf_counter() - start
+        if "skipped" in result:
+            return None
+        return _entry(seconds, result.get("processed_caches", 0), manifest["bytes"],
+                      success=bool(result.get("success")), **_output_stats(output_dir))
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def run_suite(args: argparse.Namespace, work_dir: str) -> Dict[str, Any]:
+    """
+    生成合成缓存并运行全部阶段
+
+    Args:
+        args: 命令行参数
+        work_dir: 放置合成缓存的目录
+
+    Returns:
+        Dict[str, Any]: {"meta", "cache", "results"}，results的键为 阶段.对象[.模式]
+    """
+    results = {}
+    manifests = {}
+    # 视频提取从本地服务器下载第一种布局生成的分段播放列表和片段
+    server = LocalServer(directory=os.path.join(work_dir, args.layouts[0], "cdn")).start()
+    try:
+        for layout in args.layouts:
+            manifest = build_synthetic_cache(os.path.join(work_dir, layout), spec_from_args(args, layout),
+                                             video_base_uri=server.url(""))
+            manifests[layout] = manifest
+            results[f"scan.{layout}"] = bench_scan(manifest["cache_path"], args.repeat)
+        _run_stages(args, manifests[args.layouts[0]], results)
+    finally:
+        server.stop()
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": multiprocessing.cpu_count(),
+            "threads": args.threads,
+            "processes": args.processes,
+            "repeat": args.repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "cache": {layout: {key: value for key, value in manifest.items() if key not in _VOLATILE_CACHE_KEYS}
+                  for layout, manifest in manifests.items()},
+        "results": results,
+    }
+
+
+def _run_stages(args: argparse.Namespace, manifest: Dict[str, Any], results: Dict[str, Any]):
+    """在第一种布局上运行识别、去重、保存和转换阶段，结果写入results"""
+    scanner = RobloxCacheScanner()
+    scanner.set_cache_path(manifest["cache_path"])
+    raw_items = [_read_item(item) for item in scanner.scan_cache()]
+    results["identify"] = bench_identify(raw_items, args.repeat)
+    results["dedup"] = bench_dedup(raw_items, args.repeat)
+
+    get_scanner().set_cache_path(manifest["cache_path"])
+    for mode in args.modes:
+        workers = args.processes if mode == "processes" else args.threads
+        for extraction_type in args.types:
+            results[f"save.{extraction_type}.{mode}"] = bench_save(
+                extraction_type, mode, workers, manifest)
+            if extraction_type in _CONVERTERS:
+                entry = bench_convert(extraction_type, mode, workers, manifest)
+                if entry is not None:
+                    results[f"convert.{extraction_type}.{mode}"] = entry
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    与基线比较每项的吞吐量并打印对比表
+
+    Args:
+        report: 本次结果
+        baseline: 基线结果
+        tolerance: 允许的吞吐量下降比例
+
+    Returns:
+        List[str]: 低于基线超过容差的项目
+    """
+    if baseline.get("cache") != report.get("cache"):
+        print("warning: synthetic cache differs from the baseline, results are not directly comparable")
+
+    regressions = []
+    print(f"{'benchmark':<30} {'baseline':>14} {'current':>14} {'ratio':>8}")
+    for name, entry in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("items_per_second"):
+            print(f"{name:<30} {'-':>14} {entry['items_per_second']:>14,.1f}")
+            continue
+        ratio = entry["items_per_second"] / base["items_per_second"]
+        flag = ""
+        if ratio < 1.0 - tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<30} {base['items_per_second']:>14,.1f} {entry['items_per_second']:>14,.1f} "
+              f"{ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def _print_report(report: Dict[str, Any]):
+    """打印结果表"""
+    print(f"{'benchmark':<30} {'seconds':>9} {'items':>7} {'items/s':>12} {'MB/s':>9}")
+    for name, entry in report["results"].items():
+        print(f"{name:<30} {entry['seconds']:>9.3f} {entry['items']:>7} {entry['items_per_second']:>12,.1f} "
+              f"{entry['bytes_per_second'] / 1e6:>9.1f}")
+
+
+def _csv(allowed: tuple) -> Callable[[str], List[str]]:
+    """解析逗号分隔且限定取值的参数"""
+    def parse(value: str) -> List[str]:
+        values = [part.strip() for part in value.split(",") if part.strip()]
+        unknown = [part for part in values if part not in allowed]
+        if unknown or not values:
+            raise argparse.ArgumentTypeError(f"可选: {', '.join(allowed)}")
+        return values
+    return parse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extractor benchmark suite over a synthetic Roblox cache")
+    add_spec_arguments(parser)
+    parser.add_argument("--layouts", type=_csv(LAYOUTS), default=list(LAYOUTS),
+                        help="cache layouts to scan; the first one is used for the other stages")
+    parser.add_argument("--types", type=_csv(EXTRACTION_TYPES), default=list(DEFAULT_TYPES),
+                        help="extractors to run")
+    parser.add_argument("--modes", type=_csv(MODES), default=list(MODES), help="threads and/or processes")
+    parser.add_argument("--threads", type=int, default=min(32, multiprocessing.cpu_count() * 2),
+                        help="worker threads for threading mode")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes for multiprocessing mode")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions for scan/identify/dedup (best is kept)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="compare against a previously saved JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed throughput drop against the baseline before failing")
+    parser.add_argument("--work-dir", help="keep the synthetic caches in this directory")
+    args = parser.parse_args()
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="bench_extractors_")
+    try:
+        # 提取器的进度输出写到标准错误，标准输出只保留结果
+        with contextlib.redirect_stdout(sys.stderr):
+            report = run_suite(args, work_dir)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    _print_report(report)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}: "
+                  f"{', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日志写入基准 - 比较逐行打开文件写入与后台线程批量写入的日志吞吐量
+Log Writer Benchmark - Compares per-line open/append/close against the background AsyncLogWriter
+
+用法 / Usage:
+    python benchmarks/bench_log_writer.py [--lines 100000] [--line-bytes 83]
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import datetime
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.logging.log_file_writer import AsyncLogWriter  # noqa: E402
+
+
+def _make_lines(count: int, line_bytes: int) -> list:
+    """生成与界面日志格式相同的日志行"""
+    timestamp = datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S] ")
+    lines = []
+    for i in range(count):
+        message = f"[INFO] Processed cache entry {i:08d} "
+        padding = max(0, line_bytes - len(timestamp) - len(message))
+        lines.append(timestamp + message + "x" * padding)
+    return lines
+
+
+def bench_sync(log_dir: str, lines: list) -> float:
+    """
+    每行打开、追加、关闭一次日志文件（后台写入之前的做法）
+
+    Returns:
+        float: 调用方每行耗时（秒）
+    """
+    path = os.path.join(log_dir, "sync_log.txt")
+    start = time.perf_counter()
+    for line in lines:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(f"{line}\n")
+    return (time.perf_counter() - start) / len(lines)
+
+
+def bench_async(log_dir: str, lines: list, queue_size: int) -> dict:
+    """
+    通过AsyncLogWriter写入，分别测量调用方入队耗时和后台线程写入吞吐量
+
+    Returns:
+        dict: enqueue_seconds_per_line、drain_seconds和写入器统计
+    """
+    writer = AsyncLogWriter(log_dir, max_bytes=1 << 40, queue_size=queue_size)
+    try:
+        start = time.perf_counter()
+        for line in lines:
+            writer.write(line)
+        enqueue = time.perf_counter() - start
+        if not writer.flush(timeout=300):
+            print("warning: writer did not drain within 300 s")
+        drain = time.perf_counter() - start
+        stats = writer.get_stats()
+    finally:
+        writer.close()
+    return {"enqueue_seconds_per_line": enqueue / len(lines), "drain_seconds": drain, **stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Log file writer benchmark")
+    parser.add_argument("--lines", type=int, default=100000, help="number of log lines")
+    parser.add_argument("--line-bytes", type=int, default=83, help="approximate length of each line")
+    parser.add_argument("--queue-size", type=int, default=0,
+                        help="AsyncLogWriter queue size (default: --lines, so no line is dropped)")
+    args = parser.parse_args()
+
+    lines = _make_lines(args.lines, args.line_bytes)
+    log_dir = tempfile.mkdtemp(prefix="bench_log_writer_")
+    try:
+        sync_per_line = bench_sync(log_dir, lines)
+        result = bench_async(log_dir, lines, args.queue_size or args.lines)
+
+        print(f"{args.lines} lines of ~{args.line_bytes} bytes")
+        print(f"{'open/append/close':<24} {sync_per_line * 1e6:>8.2f} us/line on the caller  "
+              f"{1 / sync_per_line:>12,.0f} lines/s")
+        print(f"{'AsyncLogWriter enqueue':<24} {result['enqueue_seconds_per_line'] * 1e6:>8.2f} us/line on the caller")
+        print(f"{'AsyncLogWriter thread':<24} {result['lines_per_second']:>12,.0f} lines/s  "
+              f"{result['bytes_per_second'] / (1024 * 1024):>8.1f} MB/s  "
+              f"written={result['lines_written']} dropped={result['dropped']}  "
+              f"drained in {result['drain_seconds']:.2f} s")
+    finally:
+        shutil.rmtree(log_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
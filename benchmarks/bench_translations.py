@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译提取基准 - 在合成的缓存目录上测量翻译文件提取的吞吐量
+Translation Extraction Benchmark - Measures translation extraction throughput over a synthetic cache directory
+
+用法 / Usage:
+    python benchmarks/bench_translations.py [--tables 5000] [--threads 8] [--processes 4]
+"""
+
+import os
+import sys
+import json
+import random
+import hashlib
+import shutil
+import struct
+import argparse
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.extractors.translation_extractor import (  # noqa: E402
+    RobloxTranslationExtractor, TranslationClassificationMethod
+)
+from src.utils.history_manager import ExtractedHistory  # noqa: E402
+
+_LOCALES = ["zh-cn", "en-us", "ja-jp", "ko-kr", "fr-fr", "de-de", "es-es", "pt-br", "ru-ru", "it-it"]
+_PREFIXES = ["ui.button.", "menu.", "error.", "game.item.", "player.", "feature.", "misc."]
+
+
+def _rbxh(link: str, content: bytes) -> bytes:
+    """生成RBXH格式的缓存文件"""
+    link_bytes = link.encode("utf-8")
+    return (b"RBXH" + b"\0" * 4 + struct.pack("<I", len(link_bytes)) + link_bytes + b"\0"
+            + struct.pack("<I", 200) + struct.pack("<I", 0) + b"\0" * 4
+            + struct.pack("<I", len(content)) + b"\0" * 8 + content)
+
+
+def _translation(rng: random.Random) -> bytes:
+    """生成本地化表JSON（与缓存中一样是紧凑格式）"""
+    prefix = rng.choice(_PREFIXES)
+    entries = {f"{prefix}key{i}": "文本 text " * rng.randint(1, 12) for i in range(rng.randint(20, 600))}
+    return json.dumps({"locale": rng.choice(_LOCALES), "entries": entries}, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def build_translation_cache(directory: str, tables: int, seed: int = 1234) -> int:
+    """
+    在目录中生成合成的翻译缓存文件，另加约10%的非翻译文件
+
+    Args:
+        directory: 缓存目录
+        tables: 本地化表数量
+        seed: 随机种子
+
+    Returns:
+        int: 生成的数据总字节数
+    """
+    rng = random.Random(seed)
+    total = 0
+    for i in range(tables + tables // 10):
+        if i < tables:
+            content = _translation(rng)
+        else:
+            content = b"OggS\x00\x02" + rng.randbytes(rng.randint(1024, 8192))
+        data = _rbxh(f"https://assetdelivery.roblox.com/v1/asset?id={10 ** 9 + i}", content)
+        # 输出文件名取转储名称前8位，缓存文件名需要像真实缓存一样是哈希
+        name = hashlib.md5(str(i).encode("ascii")).hexdigest()
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(data)
+        total += len(data)
+    return total
+
+
+def _run(cache_dir: str, label: str, tables: int, expect_saved: int = None, **kwargs):
+    """运行一次提取并打印吞吐量"""
+    output_dir = tempfile.mkdtemp(prefix="bench_translations_out_")
+    try:
+        extractor = RobloxTranslationExtractor(output_dir=output_dir,
+                                               classification_method=TranslationClassificationMethod.LOCALE,
+                                               **kwargs)
+        start = time.perf_counter()
+        result = extractor.extract_translations(custom_cache_path=cache_dir)
+        elapsed = time.perf_counter() - start
+        stats = result["stats"]
+        expect_saved = tables if expect_saved is None else expect_saved
+        if stats["translation_saved"] != expect_saved:
+            print(f"warning: {label} saved {stats['translation_saved']} tables, expected {expect_saved}")
+        files = sum(len(names) for _, _, names in os.walk(output_dir))
+        print(f"{label:<28} {elapsed:>8.2f} s  {tables / elapsed:>10,.0f} tables/s  "
+              f"{files:>6} files  errors={stats['processing_errors']}")
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translation extraction benchmark")
+    parser.add_argument("--tables", type=int, default=5000, help="number of synthetic localization tables")
+    parser.add_argument("--threads", type=int, default=8, help="worker threads for threading mode")
+    parser.add_argument("--processes", type=int, default=4, help="worker processes for multiprocessing mode")
+    args = parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp(prefix="bench_translations_cache_")
+    try:
+        total = build_translation_cache(cache_dir, args.tables)
+        print(f"{args.tables} tables, {total / 1e6:.1f} MB")
+        for fmt, options in (("json", {}), ("raw", {"pretty_print": False}), ("bundle", {"bundle": True})):
+            _run(cache_dir, f"threads={args.threads} {fmt}", args.tables,
+                 num_threads=args.threads, **options)
+            _run(cache_dir, f"processes={args.processes} {fmt}", args.tables,
+                 num_threads=args.processes, use_multiprocessing=True, conservative_multiprocessing=False,
+                 **options)
+
+        # 缓存未变化时的重复运行：所有翻译文件都应在哈希检查阶段跳过
+        history_dir = tempfile.mkdtemp(prefix="bench_translations_history_")
+        try:
+            history = ExtractedHistory(os.path.join(history_dir, "history.json"))
+            _run(cache_dir, f"threads={args.threads} first run", args.tables,
+                 num_threads=args.threads, download_history=history)
+            _run(cache_dir, f"threads={args.threads} re-run", args.tables, expect_saved=0,
+                 num_threads=args.threads, download_history=history)
+        finally:
+            shutil.rmtree(history_dir, ignore_errors=True)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+视频片段下载基准 - 通过本地HTTP替身服务器测量HLS片段的串行和并发下载
+Video Segment Benchmark - Measures serial vs concurrent HLS segment downloads against a local HTTP stand-in
+
+服务器提供一个合成的片段播放列表，各片段的响应延迟不同，因此并发下载时的完成顺序
+与播放列表顺序不一致。检查下载结果和FFmpeg concat片段列表仍按播放列表顺序排列、
+每个片段的内容正确，然后比较串行和并发下载的耗时。检查失败时返回1。
+
+用法 / Usage:
+    python benchmarks/bench_video_segments.py [--segments 24] [--latency 0.05] [--concurrency 4]
+"""
+
+import os
+import sys
+import random
+import shutil
+import argparse
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.local_server import LocalServer  # noqa: E402
+from src.extractors.video_extractor import VideoProcessingStats, VideoProcessor  # noqa: E402
+from src.utils.download_manager import DownloadManager  # noqa: E402
+
+_SEGMENT_DURATION = 2.002
+
+
+def publish_playlist(server: LocalServer, segments: int, latency: float, segment_size: int,
+                     seed: int = 1234) -> Tuple[str, Dict[str, bytes]]:
+    """
+    在服务器上登记片段播放列表和片段
+
+    Args:
+        server: 已启动的本地服务器
+        segments: 片段数量
+        latency: 片段的平均响应延迟（秒），各片段在0.25到1.75倍之间
+        segment_size: 每个片段的字节数
+        seed: 随机种子
+
+    Returns:
+        Tuple[str, Dict[str, bytes]]: (播放列表URL, 片段文件名 -> 内容)
+    """
+    rng = random.Random(seed)
+    bodies = {}
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3", f"#EXT-X-TARGETDURATION:{int(_SEGMENT_DURATION) + 1}"]
+    for index in range(segments):
+        name = f"segment{index:04d}.webm"
+        bodies[name] = f"{index:08d}".encode("ascii") + rng.randbytes(segment_size)
+        server.add(f"/video/{name}", bodies[name], latency=latency * rng.uniform(0.25, 1.75))
+        lines += [f"#EXTINF:{_SEGMENT_DURATION},", name]
+    lines.append("#EXT-X-ENDLIST")
+    playlist_url = server.add("/video/playlist.m3u8", "\n".join(lines).encode("ascii"),
+                              content_type="application/vnd.apple.mpegurl")
+    return playlist_url, bodies
+
+
+def _read_segment_list(path: str) -> List[str]:
+    """读取FFmpeg concat片段列表中的文件名"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line[len("file '"):-1] for line in f.read().splitlines() if line.startswith("file '")]
+
+
+def run_download(playlist_url: str, bodies: Dict[str, bytes], concurrency: int) -> Tuple[float, List[str]]:
+    """
+    下载播放列表中的全部片段并检查顺序和内容
+
+    Args:
+        playlist_url: 片段播放列表URL
+        bodies: 片段文件名 -> 期望的内容
+        concurrency: 并发下载数，1表示串行
+
+    Returns:
+        Tuple[float, List[str]]: (下载耗时, 发现的问题)
+    """
+    work_dir = tempfile.mkdtemp(prefix="bench_video_segments_")
+    downloader = DownloadManager(max_connections_per_host=concurrency, backoff_base=0.05)
+    try:
+        processor = VideoProcessor(work_dir, timestamp_repair=False, concurrent_downloads=concurrency > 1,
+                                   max_concurrent_segments=concurrency, downloader=downloader)
+        playlist = processor._download_segment_playlist(playlist_url)
+        segments = [segment for segment, _ in playlist]
+        durations = [duration for _, duration in playlist]
+        expected = list(bodies)
+        if segments != expected:
+            return 0.0, [f"playlist parsed as {len(segments)} segments, expected {len(expected)}"]
+
+        temp_dir = os.path.join(work_dir, "segments")
+        os.makedirs(temp_dir)
+        start = time.perf_counter()
+        files = processor._fetch_segments(segments, playlist_url.rsplit("/", 1)[0] + "/", temp_dir,
+                                          VideoProcessingStats())
+        seconds = time.perf_counter() - start
+
+        problems = []
+        if files is None:
+            return seconds, ["segment download failed"]
+        if files != expected:
+            problems.append("downloaded segments are not in playlist order")
+        listed = _read_segment_list(processor._write_segment_list(files, temp_dir, durations))
+        if listed != expected:
+            problems.append("concat list is not in playlist order")
+        for name in files:
+            with open(os.path.join(temp_dir, name), "rb") as f:
+                if f.read() != bodies[name]:
+                    problems.append(f"content mismatch: {name}")
+        return seconds, problems
+    finally:
+        downloader.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs concurrent HLS segment download benchmark")
+    parser.add_argument("--segments", type=int, default=24, help="segments in the playlist")
+    parser.add_argument("--latency", type=float, default=0.05, help="mean per-segment response latency (s)")
+    parser.add_argument("--segment-size", type=int, default=256 * 1024, help="bytes per segment")
+    parser.add_argument("--concurrency", type=int, default=4, help="concurrent segment downloads")
+    args = parser.parse_args()
+
+    failed = False
+    with LocalServer() as server:
+        playlist_url, bodies = publish_playlist(server, args.segments, args.latency, args.segment_size)
+        timings = {}
+        for label, concurrency in (("serial", 1), (f"concurrent={args.concurrency}", args.concurrency)):
+            server.reset_counters()
+            seconds, problems = run_download(playlist_url, bodies, concurrency)
+            timings[label] = seconds
+            status = "ok" if not problems else "FAIL: " + "; ".join(problems)
+            print(f"{label:<16} {seconds:>8.3f}s  peak connections {server.max_active:>2}  {status}")
+            failed = failed or bool(problems)
+
+    serial, concurrent = timings.values()
+    if concurrent > 0:
+        print(f"speedup {serial / concurrent:.2f}x")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
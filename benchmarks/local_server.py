@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地HTTP替身服务器 - 在127.0.0.1上提供合成的播放列表、片段和资源，让下载相关的基准和检查离线运行
+Local HTTP Stand-in - Serves synthetic playlists, segments and assets on 127.0.0.1 so download benchmarks run offline
+
+登记的路径返回内存中的内容，可以设置延迟、前几次请求失败（如503）、固定错误状态（如404）
+或截断前几次响应（Content-Length大于实际发送的数据）；其余路径从可选的目录中提供静态文件。
+服务器记录每个路径的请求次数和同时处理的最大请求数，供检查并发限制和重试次数。
+"""
+
+import time
+import threading
+import functools
+from dataclasses import dataclass, field
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+@dataclass
+class Route:
+    """一个登记路径的响应"""
+    body: bytes
+    status: int = 200
+    content_type: str = "application/octet-stream"
+    latency: float = 0.0  # 每次请求在发送响应前等待的秒数
+    fail_first: int = 0  # 前几次请求返回fail_status
+    fail_status: int = 503
+    truncate_first: int = 0  # 前几次成功的请求只发送一半内容，Content-Length仍为完整长度
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class LocalServer:
+    """
+    本地HTTP替身服务器，可作为上下文管理器使用
+
+    用法:
+        with LocalServer() as server:
+            server.add("/a.bin", b"data", latency=0.05)
+            url = server.url("/a.bin")
+    """
+
+    def __init__(self, directory: Optional[str] = None, latency: float = 0.0):
+        """
+        初始化服务器
+
+        Args:
+            directory: 未登记的路径从此目录提供静态文件，None表示返回404
+            latency: 所有请求的默认延迟（秒），登记路径的latency为0时使用
+        """
+        self.directory = directory
+        self.latency = latency
+        self._routes: Dict[str, Route] = {}
+        self._requests: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, path: str, body: bytes, **options) -> str:
+        """
+        登记路径的响应
+
+        Args:
+            path: 以/开头的路径
+            body: 响应内容
+            **options: Route的其他字段
+
+        Returns:
+            str: 该路径的完整URL（服务器已启动时）
+        """
+        with self._lock:
+            self._routes[path] = Route(body, **options)
+        return self.url(path) if self._server else path
+
+    def url(self, path: str = "/") -> str:
+        """获取路径的完整URL"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def request_count(self, path: str) -> int:
+        """获取路径被请求的次数"""
+        with self._lock:
+            return self._requests.get(path, 0)
+
+    def reset_counters(self):
+        """清空请求次数和最大并发数"""
+        with self._lock:
+            self._requests.clear()
+            self.max_active = 0
+
+    def start(self) -> "LocalServer":
+        """在后台线程中启动服务器（随机端口）"""
+        handler = functools.partial(_Handler, self)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="LocalServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """停止服务器"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "LocalServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _begin(self, path: str) -> int:
+        """记录请求开始，返回该路径的请求序号（从1开始）"""
+        with self._lock:
+            count = self._requests[path] = self._requests.get(path, 0) + 1
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+            return count
+
+    def _end(self):
+        with self._lock:
+            self._active -= 1
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    """请求处理：登记的路径返回内存内容，其余路径从目录提供静态文件"""
+
+    def __init__(self, server_state: LocalServer, *args, **kwargs):
+        self.state = server_state
+        super().__init__(*args, directory=server_state.directory or ".", **kwargs)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        count = self.state._begin(path)
+        try:
+            with self.state._lock:
+                route = self.state._routes.get(path)
+            time.sleep((route.latency if route and route.latency else 0.0) or self.state.latency)
+
+            if route is None:
+                if self.state.directory is None:
+                    self.send_error(404)
+                else:
+                    super().do_GET()
+                return
+
+            if count <= route.fail_first:
+                self._send(route.fail_status, b"", route.headers)
+                return
+            if route.status != 200:
+                self._send(route.status, b"")
+                return
+
+            truncated = count - route.fail_first <= route.truncate_first
+            body = route.body[:len(route.body) // 2] if truncated else route.body
+            self._send(200, body, route.headers, content_type=route.content_type, length=len(route.body))
+        finally:
+            self.state._end()
+
+    def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None,
+              content_type: str = "application/octet-stream", length: Optional[int] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body) if length is None else length))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        if length is not None and length != len(body):
+            # 截断的响应：关闭连接，客户端收到的数据少于Content-Length
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        """不输出访问日志"""
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成缓存生成器 - 生成可复现的Roblox缓存，供基准测试使用
+Synthetic Cache Generator - Builds reproducible Roblox caches for the benchmarks
+
+生成的缓存与真实客户端一致：数据库布局为rbx-storage.db（小内容内联在数据库中，
+其余内容以NULL占位并保存在rbx-storage文件夹中），文件夹布局为旧版的RBXH缓存文件目录。
+内容混合OGG/MP3/PNG/KTX/网格/模型/字体列表/翻译/M3U8以及无法识别的数据，
+大小和重复内容的比例可配置。
+
+提取时不访问外网：
+    字体列表引用rbxassetid://字体，被引用的字体文件以assetdelivery链接保存在同一缓存中，
+    多个字体列表共用一组字体，覆盖本地缓存查找和同一资源ID的合并下载。
+    M3U8为带RBX-BASE-URI的主播放列表，分段播放列表和WebM片段（由FFmpeg生成，
+    未安装FFmpeg时不生成片段）写入DIR/cdn，需要在video_base_uri上提供该目录，
+    例如 python -m http.server 8000 -d DIR/cdn。
+
+用法 / Usage:
+    python benchmarks/synthetic_cache.py DIR [--items 2000] [--layout db] [--duplicate-ratio 0.1]
+"""
+
+import os
+import sys
+import json
+import random
+import sqlite3
+import shutil
+import struct
+import zlib
+import hashlib
+import argparse
+import functools
+import contextlib
+import subprocess
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, Optional, Set
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.extractors.asset_index import ASSET_DELIVERY_URL  # noqa: E402
+from src.extractors.ktx_texture import KTX_IDENTIFIER  # noqa: E402
+from src.extractors.rbxm_index import RBXM_MAGIC  # noqa: E402
+
+LAYOUTS = ("db", "folder")
+
+# 默认内容组成（相对权重）
+DEFAULT_MIX = {
+    "ogg": 20,
+    "mp3": 8,
+    "png": 20,
+    "ktx": 10,
+    "mesh": 8,
+    "model": 6,
+    "fontlist": 4,
+    "translation": 8,
+    "m3u8": 4,
+    "unknown": 12,
+}
+
+_LOCALES = ["zh-cn", "en-us", "ja-jp", "ko-kr", "fr-fr", "de-de", "es-es", "pt-br"]
+_CLASSES = ["Part", "MeshPart", "Model", "Sound", "Script", "Decal", "Folder", "UnionOperation"]
+_GL_COMPRESSED_RGB_S3TC_DXT1_EXT = 0x83F0
+
+# 字体列表引用的字体资源ID从这组ID中选取，与普通缓存项的ID不重叠
+_FONT_ASSET_BASE = 3 * 10 ** 9
+_FONT_POOL_SIZE = 48
+
+# 视频的清晰度：(目录名, 分辨率, 带宽)，每个清晰度生成_VIDEO_SEGMENTS个2秒的片段
+_VIDEO_RENDITIONS = (("240p", "426x240", 300000), ("480p", "854x480", 900000))
+_VIDEO_SEGMENTS = 6
+_VIDEO_SEGMENT_SECONDS = 2
+DEFAULT_VIDEO_BASE_URI = "http://127.0.0.1:8000"
+
+
+@dataclass
+class SyntheticCacheSpec:
+    """合成缓存的参数"""
+    items: int = 2000
+    layout: str = "db"
+    inline_ratio: float = 0.7  # 数据库布局中内联在数据库里的比例，其余保存在rbx-storage文件夹
+    duplicate_ratio: float = 0.1  # 与之前某一项内容完全相同（链接不同）的比例
+    size_scale: float = 1.0  # 二进制内容大小的缩放系数
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    seed: int = 1234
+
+
+def _scaled(rng: random.Random, low: int, high: int, scale: float) -> int:
+    """按缩放系数取随机大小"""
+    return max(1, int(rng.randint(low, high) * scale))
+
+
+def _ogg(rng: random.Random, scale: float) -> bytes:
+    """生成OGG页序列"""
+    pages = []
+    for sequence in range(max(1, _scaled(rng, 2, 16, scale))):
+        payload = rng.randbytes(4096)
+        header = (b"OggS\x00" + (b"\x02" if sequence == 0 else b"\x00")
+                  + struct.pack("<qIII", sequence * 1024, 1, sequence, 0) + b"\x10" + b"\xff" * 16)
+        pages.append(header + payload)
+    return b"".join(pages)
+
+
+def _mp3(rng: random.Random, scale: float) -> bytes:
+    """生成带ID3标签的MP3帧序列"""
+    frames = b"".join(b"\xff\xfb\x90\x64" + rng.randbytes(413) for _ in range(_scaled(rng, 10, 150, scale)))
+    return b"ID3\x04\x00\x00\x00\x00\x00\x00" + frames
+
+
+def _png(rng: random.Random, scale: float) -> bytes:
+    """生成结构完整的PNG（IDAT为随机数据）"""
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+    width, height = rng.choice([32, 64, 128, 256, 512]), rng.choice([32, 64, 128, 256, 512])
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr)
+            + chunk(b"IDAT", rng.randbytes(_scaled(rng, 1024, 32768, scale))) + chunk(b"IEND", b""))
+
+
+def _ktx(rng: random.Random, scale: float) -> bytes:
+    """生成带完整mip链的BC1纹理（KTX 1.1）"""
+    size = max(4, int(rng.choice([32, 64, 128, 256]) * scale))
+    levels = size.bit_length()
+    key_values = b"\x00" * 16
+    header = KTX_IDENTIFIER + struct.pack("<I", 0x04030201) + struct.pack(
+        "<12I", 0, 1, 0, _GL_COMPRESSED_RGB_S3TC_DXT1_EXT, 0, size, size, 0, 0, 1, levels, len(key_values))
+    body = []
+    for level in range(levels):
+        edge = max(1, size >> level)
+        data = rng.randbytes(((edge + 3) // 4) ** 2 * 8)
+        body.append(struct.pack("<I", len(data)) + data)
+    return header + key_values + b"".join(body)
+
+
+def _mesh(rng: random.Random, scale: float) -> bytes:
+    """生成2.00版二进制网格"""
+    vertex_count = _scaled(rng, 50, 1500, scale)
+    face_count = vertex_count
+    vertices = b"".join(struct.pack("<9f", *(rng.uniform(-5, 5) for _ in range(8)), 0.0)
+                        for _ in range(vertex_count))
+    faces = struct.pack(f"<{face_count * 3}I", *(rng.randrange(vertex_count) for _ in range(face_count * 3)))
+    return b"version 2.00\n" + struct.pack("<HBBII", 12, 36, 12, vertex_count, face_count) + vertices + faces
+
+
+def _model(rng: random.Random, scale: float) -> bytes:
+    """生成二进制RBXM模型（块不压缩）"""
+    def chunk(name: bytes, payload: bytes) -> bytes:
+        return name + struct.pack("<II", 0, len(payload)) + b"\0" * 4 + payload
+
+    def string(value: str) -> bytes:
+        encoded = value.encode("utf-8")
+        return struct.pack("<I", len(encoded)) + encoded
+
+    classes = [(name, _scaled(rng, 1, 40, scale)) for name in rng.sample(_CLASSES, rng.randint(1, 4))]
+    total = sum(count for _, count in classes)
+    body = [chunk(b"META", struct.pack("<I", 0))]
+    for class_id, (name, count) in enumerate(classes):
+        body.append(chunk(b"INST", struct.pack("<i", class_id) + string(name) + b"\0"
+                          + struct.pack("<I", count) + rng.randbytes(4 * count)))
+    for class_id, (name, count) in enumerate(classes):
+        body.append(chunk(b"PROP", struct.pack("<i", class_id) + string("Name") + b"\x01"
+                          + rng.randbytes(16 * count)))
+    body.append(chunk(b"PRNT", b"\0" + struct.pack("<I", total) + rng.randbytes(8 * total)))
+    body.append(b"END\0" + struct.pack("<II", 0, 9) + b"\0" * 4 + b"</roblox>")
+    return RBXM_MAGIC + struct.pack("<Hii", 0, len(classes), total) + b"\0" * 8 + b"".join(body)
+
+
+def _fontlist(rng: random.Random, scale: float, fonts: Set[int]) -> bytes:
+    """生成字体列表JSON，引用的字体资源ID记录到fonts中"""
+    family = f"Family{rng.randint(0, 999)}"
+    faces = []
+    for i, style in enumerate(rng.sample(["Regular", "Bold", "Italic", "Light", "Medium"], rng.randint(1, 5))):
+        asset_id = _FONT_ASSET_BASE + rng.randrange(_FONT_POOL_SIZE)
+        fonts.add(asset_id)
+        faces.append({"name": style, "weight": 400 + i * 100, "style": "normal",
+                      "assetId": f"rbxassetid://{asset_id}"})
+    return json.dumps({"name": family, "faces": faces}, indent=2).encode("utf-8")
+
+
+def _font(rng: random.Random, scale: float) -> bytes:
+    """生成TrueType字体文件（表目录之后为随机数据）"""
+    return b"\x00\x01\x00\x00" + struct.pack(">HHHH", 4, 64, 2, 0) + rng.randbytes(_scaled(rng, 8192, 65536, scale))
+
+
+def _translation(rng: random.Random, scale: float) -> bytes:
+    """生成本地化表JSON（与缓存中一样是紧凑格式）"""
+    entries = {f"game.key{i}": "文本 text " * rng.randint(1, 12)
+               for i in range(_scaled(rng, 20, 600, scale))}
+    return json.dumps({"locale": rng.choice(_LOCALES), "entries": entries}, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def _m3u8(rng: random.Random, scale: float, base_uri: str) -> bytes:
+    """生成带RBX-BASE-URI的HLS主播放列表，分段播放列表位于base_uri下（见write_video_cdn）"""
+    video_id = f"{rng.getrandbits(64):016x}"
+    segments = rng.randint(1, _VIDEO_SEGMENTS)
+    renditions = rng.sample(_VIDEO_RENDITIONS, rng.randint(1, len(_VIDEO_RENDITIONS)))
+    streams = "".join(f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={resolution}\n"
+                      f"{{$RBX-BASE-URI}}/{name}/playlist-{segments}.m3u8?video={video_id}\n"
+                      for name, resolution, bandwidth in renditions)
+    return (f'#EXTM3U\n#EXT-X-DEFINE:NAME="RBX-BASE-URI",VALUE="{base_uri}"\n'
+            f"#EXT-X-INDEPENDENT-SEGMENTS\n{streams}").encode("ascii")
+
+
+def write_video_cdn(cdn_dir: str) -> int:
+    """
+    生成主播放列表引用的分段播放列表和WebM片段
+
+    每个清晰度用FFmpeg渲染一段测试画面并按2秒切分为独立的WebM片段，
+    playlist-N.m3u8引用前N个片段。
+
+    Args:
+        cdn_dir: 输出目录，需要在主播放列表的RBX-BASE-URI上提供
+
+    Returns:
+        int: 生成的片段数，未安装FFmpeg时为0
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    shutil.rmtree(cdn_dir, ignore_errors=True)
+    if not ffmpeg:
+        return 0
+
+    for name, resolution, bandwidth in _VIDEO_RENDITIONS:
+        directory = os.path.join(cdn_dir, name)
+        os.makedirs(directory)
+        subprocess.run(
+            [ffmpeg, "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+             "-i", f"testsrc2=size={resolution}:rate=15",
+             "-t", str(_VIDEO_SEGMENTS * _VIDEO_SEGMENT_SECONDS), "-c:v", "libvpx", "-deadline", "realtime",
+             "-cpu-used", "8", "-b:v", str(bandwidth), "-g", "30", "-keyint_min", "30",
+             "-f", "segment", "-segment_time", str(_VIDEO_SEGMENT_SECONDS), "-segment_format", "webm",
+             os.path.join(directory, "segment%d.webm")],
+            check=True, stdin=subprocess.DEVNULL)
+        for count in range(1, _VIDEO_SEGMENTS + 1):
+            lines = ["#EXTM3U", "#EXT-X-VERSION:3", f"#EXT-X-TARGETDURATION:{_VIDEO_SEGMENT_SECONDS}"]
+            for index in range(count):
+                lines += [f"#EXTINF:{_VIDEO_SEGMENT_SECONDS:.3f},", f"segment{index}.webm"]
+            lines.append("#EXT-X-ENDLIST")
+            with open(os.path.join(directory, f"playlist-{count}.m3u8"), "w", encoding="ascii") as f:
+                f.write("\n".join(lines) + "\n")
+    return len(_VIDEO_RENDITIONS) * _VIDEO_SEGMENTS
+
+
+def _unknown(rng: random.Random, scale: float) -> bytes:
+    """生成无法识别的数据"""
+    return rng.randbytes(_scaled(rng, 64, 8192, scale))
+
+
+# fontlist和m3u8需要的额外参数在build_synthetic_cache中绑定
+_MAKERS: Dict[str, Callable[..., bytes]] = {
+    "ogg": _ogg,
+    "mp3": _mp3,
+    "png": _png,
+    "ktx": _ktx,
+    "mesh": _mesh,
+    "model": _model,
+    "fontlist": _fontlist,
+    "translation": _translation,
+    "m3u8": _m3u8,
+    "unknown": _unknown,
+}
+
+
+def rbxh(link: str, content: bytes, status: int = 200) -> bytes:
+    """
+    把内容包装为RBXH缓存格式
+
+    Args:
+        link: 资源链接
+        content: 资源内容
+        status: HTTP状态码
+
+    Returns:
+        bytes: RBXH缓存数据
+    """
+    link_bytes = link.encode("utf-8")
+    return (b"RBXH" + b"\0" * 4 + struct.pack("<I", len(link_bytes)) + link_bytes + b"\0"
+            + struct.pack("<I", status) + struct.pack("<I", 0) + b"\0" * 4
+            + struct.pack("<I", len(content)) + b"\0" * 8 + content)
+
+
+def _validate(spec: SyntheticCacheSpec):
+    """检查参数"""
+    if spec.layout not in LAYOUTS:
+        raise ValueError(f"未知的缓存布局: {spec.layout}（可选: {', '.join(LAYOUTS)}）")
+    if spec.items < 0:
+        raise ValueError("缓存项数量不能为负数")
+    for name in ("inline_ratio", "duplicate_ratio"):
+        if not 0.0 <= getattr(spec, name) <= 1.0:
+            raise ValueError(f"{name} 需要在0到1之间")
+    unknown = set(spec.mix) - set(_MAKERS)
+    if unknown:
+        raise ValueError(f"未知的内容类型: {', '.join(sorted(unknown))}（可选: {', '.join(_MAKERS)}）")
+    if not any(weight > 0 for weight in spec.mix.values()):
+        raise ValueError("内容组成中至少需要一种权重大于0的类型")
+
+
+def build_synthetic_cache(root: str, spec: Optional[SyntheticCacheSpec] = None,
+                          video_base_uri: Optional[str] = None) -> Dict[str, Any]:
+    """
+    在目录中生成合成缓存，相同参数总是生成相同的缓存
+
+    Args:
+        root: 输出目录，其中之前生成的缓存会被替换
+        spec: 缓存参数，None表示使用默认参数
+        video_base_uri: 主播放列表中的RBX-BASE-URI，需要在此地址提供root/cdn，
+            None表示使用DEFAULT_VIDEO_BASE_URI
+
+    Returns:
+        Dict[str, Any]: 缓存清单，包括cache_path（传给扫描器或命令行--cache的路径）、
+            各类型数量（font为字体列表引用的字体文件）、重复项数量、视频片段数和总字节数；
+            同时写入root/manifest.json
+    """
+    spec = spec or SyntheticCacheSpec()
+    _validate(spec)
+    video_base_uri = (video_base_uri or DEFAULT_VIDEO_BASE_URI).rstrip("/")
+    rng = random.Random(spec.seed)
+    kinds = [kind for kind, weight in spec.mix.items() if weight > 0]
+    weights = [spec.mix[kind] for kind in kinds]
+    fonts: Set[int] = set()
+    makers = dict(_MAKERS, fontlist=functools.partial(_fontlist, fonts=fonts),
+                  m3u8=functools.partial(_m3u8, base_uri=video_base_uri))
+
+    folder = os.path.join(root, "rbx-storage" if spec.layout == "db" else "http")
+    db_path = os.path.join(root, "rbx-storage.db")
+    shutil.rmtree(folder, ignore_errors=True)
+    for path in (db_path, db_path + "-wal", db_path + "-shm"):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+    os.makedirs(folder)
+
+    counts = {kind: 0 for kind in kinds}
+    generated = []  # (kind, content)，重复项从中选取
+    duplicates = inline = total_bytes = content_bytes = 0
+
+    with contextlib.ExitStack() as stack:
+        conn = None
+        if spec.layout == "db":
+            conn = stack.enter_context(contextlib.closing(sqlite3.connect(db_path)))
+            conn.execute("CREATE TABLE IF NOT EXISTS files (id BLOB PRIMARY KEY, content BLOB)")
+
+        def store(index: int, link: str, content: bytes):
+            nonlocal inline, total_bytes, content_bytes
+            data = rbxh(link, content)
+            digest = hashlib.sha256(f"{spec.seed}:{index}".encode("ascii")).digest()[:20]
+            total_bytes += len(data)
+            content_bytes += len(content)
+
+            if conn is not None and rng.random() < spec.inline_ratio:
+                conn.execute("INSERT INTO files VALUES (?, ?)", (digest, data))
+                inline += 1
+                return
+            if conn is not None:
+                # 客户端把大内容保存在以哈希前两位命名的子目录中，数据库中content为NULL
+                conn.execute("INSERT INTO files VALUES (?, NULL)", (digest, ))
+                directory = os.path.join(folder, digest.hex()[:2])
+                os.makedirs(directory, exist_ok=True)
+                path = os.path.join(directory, digest.hex())
+            else:
+                path = os.path.join(folder, digest.hex())
+            with open(path, "wb") as f:
+                f.write(data)
+
+        for index in range(spec.items):
+            if generated and rng.random() < spec.duplicate_ratio:
+                kind, content = rng.choice(generated)
+                duplicates += 1
+            else:
+                kind = rng.choices(kinds, weights)[0]
+                content = makers[kind](rng, spec.size_scale)
+                generated.append((kind, content))
+            counts[kind] += 1
+            store(index, f"https://assetdelivery.roblox.com/v1/asset?id={10 ** 9 + index}", content)
+
+        # 字体列表引用的字体文件，链接与客户端从assetdelivery下载时一致，提取时从缓存中查找
+        for index, asset_id in enumerate(sorted(fonts), start=spec.items):
+            store(index, ASSET_DELIVERY_URL.format(asset_id), _font(rng, spec.size_scale))
+        if fonts:
+            counts["font"] = len(fonts)
+
+        if conn is not None:
+            conn.commit()
+
+    video_segments = write_video_cdn(os.path.join(root, "cdn")) if counts.get("m3u8") else 0
+
+    manifest = {
+        "cache_path": db_path if spec.layout == "db" else folder,
+        "spec": asdict(spec),
+        "items": spec.items + len(fonts),
+        "inline_items": inline,
+        "duplicates": duplicates,
+        "counts": counts,
+        "video_base_uri": video_base_uri,
+        "video_segments": video_segments,
+        "bytes": total_bytes,
+        "content_bytes": content_bytes,
+    }
+    with open(os.path.join(root, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _parse_mix(value: str) -> Dict[str, float]:
+    """解析 kind=weight,kind=weight 形式的内容组成"""
+    mix = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        kind, _, weight = part.partition("=")
+        try:
+            mix[kind.strip()] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"无效的权重: {part}")
+    return mix
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser):
+    """添加生成合成缓存的命令行参数（基准测试共用）"""
+    parser.add_argument("--items", type=int, default=2000, help="number of cache entries")
+    parser.add_argument("--inline-ratio", type=float, default=0.7,
+                        help="share of entries stored inline in rbx-storage.db (db layout)")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1,
+                        help="share of entries whose content repeats an earlier entry")
+    parser.add_argument("--size-scale", type=float, default=1.0, help="multiplier for binary content sizes")
+    parser.add_argument("--mix", type=_parse_mix, default=None,
+                        help=f"content weights, e.g. ogg=20,png=10 (kinds: {', '.join(_MAKERS)})")
+    parser.add_argument("--seed", type=int, default=1234, help="random seed")
+
+
+def spec_from_args(args: argparse.Namespace, layout: str) -> SyntheticCacheSpec:
+    """根据命令行参数创建缓存参数"""
+    return SyntheticCacheSpec(
+        items=args.items, layout=layout, inline_ratio=args.inline_ratio,
+        duplicate_ratio=args.duplicate_ratio, size_scale=args.size_scale,
+        mix=args.mix or dict(DEFAULT_MIX), seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a synthetic Roblox cache")
+    parser.add_argument("directory", help="output directory")
+    parser.add_argument("--layout", choices=LAYOUTS, default="db",
+                        help="db: rbx-storage.db with folder-backed blobs; folder: legacy RBXH files")
+    parser.add_argument("--video-base-uri", default=DEFAULT_VIDEO_BASE_URI,
+                        help="RBX-BASE-URI in the master playlists; serve DIRECTORY/cdn at this address")
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        manifest = build_synthetic_cache(args.directory, spec_from_args(args, args.layout), args.video_base_uri)
+    except ValueError as e:
+        parser.error(str(e))
+    print(json.dumps({key: value for key, value in manifest.items() if key != "spec"}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
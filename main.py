@@ -67,7 +67,7 @@ from src.components.cards.Settings.greeting_setting_card import GreetingSettingC
 
 from src.config import ConfigManager
 
-from src.interfaces import HomeInterface, AboutInterface, ExtractImagesInterface, ExtractTexturesInterface, ClearCacheInterface, HistoryInterface, ExtractAudioInterface, ExtractFontsInterface, ExtractTranslationsInterface, ExtractVideosInterface, SettingsInterface, DonationInterface
+from src.interfaces import HomeInterface, AboutInterface, ExtractImagesInterface, ExtractTexturesInterface, ExtractMeshesInterface, ExtractModelsInterface, ClearCacheInterface, HistoryInterface, ExtractAudioInterface, ExtractFontsInterface, ExtractTranslationsInterface, ExtractVideosInterface, SettingsInterface, DonationInterface
 
 
 if hasattr(sys, '_MEIPASS'):
@@ -256,14 +256,36 @@ class MainWindow(FluentWindow):
         self.extractImagesInterface = ExtractImagesInterface(
             parent=self,
             config_manager=self.config_manager,
-            lang=lang
+            lang=lang,
+            default_dir=self.default_dir,
+            download_history=self.download_history
         )
 
         
         self.extractTexturesInterface = ExtractTexturesInterface(
             parent=self,
             config_manager=self.config_manager,
-            lang=lang
+            lang=lang,
+            default_dir=self.default_dir,
+            download_history=self.download_history
+        )
+
+        
+        self.extractMeshesInterface = ExtractMeshesInterface(
+            parent=self,
+            config_manager=self.config_manager,
+            lang=lang,
+            default_dir=self.default_dir,
+            download_history=self.download_history
+        )
+
+        
+        self.extractModelsInterface = ExtractModelsInterface(
+            parent=self,
+            config_manager=self.config_manager,
+            lang=lang,
+            default_dir=self.default_dir,
+            download_history=self.download_history
         )
 
         
@@ -381,6 +403,8 @@ class MainWindow(FluentWindow):
         
         self.stackedWidget.addWidget(self.extractImagesInterface)
         self.stackedWidget.addWidget(self.extractTexturesInterface)
+        self.stackedWidget.addWidget(self.extractMeshesInterface)
+        self.stackedWidget.addWidget(self.extractModelsInterface)
         
         self.navigationInterface.addItem(
             routeKey=self.extractImagesInterface.objectName(),
@@ -402,6 +426,26 @@ class MainWindow(FluentWindow):
             parentRouteKey="extract"
         )
         
+        self.navigationInterface.addItem(
+            routeKey=self.extractMeshesInterface.objectName(),
+            icon=FluentIcon.TILES,
+            text=lang.get("extract_meshes"),
+            onClick=lambda: self.switchTo(self.extractMeshesInterface),
+            selectable=True,
+            position=NavigationItemPosition.SCROLL,
+            parentRouteKey="extract"
+        )
+        
+        self.navigationInterface.addItem(
+            routeKey=self.extractModelsInterface.objectName(),
+            icon=FluentIcon.LIBRARY,
+            text=lang.get("extract_models"),
+            onClick=lambda: self.switchTo(self.extractModelsInterface),
+            selectable=True,
+            position=NavigationItemPosition.SCROLL,
+            parentRouteKey="extract"
+        )
+        
         
         extract_tree.setExpanded(False)
         
@@ -731,6 +775,7 @@ class MainWindow(FluentWindow):
         self.extraction_worker.progressUpdated.connect(self.updateExtractionProgress)
         self.extraction_worker.finished.connect(self.extractionFinished)
         self.extraction_worker.logMessage.connect(self.handleExtractionLog)
+        self.extraction_worker.logBatch.connect(self.handleExtractionLogBatch)
 
         
         self.extractButton.hide()
@@ -908,6 +953,10 @@ class MainWindow(FluentWindow):
         elif msg_type == "error":
             self.extractLogHandler.error(message)
 
+    def handleExtractionLogBatch(self, entries):
+        """处理提取过程中合并发送的一批日志消息"""
+        self.extractLogHandler.batch(entries)
+
     def clearAudioCache(self):
         """清除音频缓存"""
         
@@ -1520,6 +1569,8 @@ class MainWindow(FluentWindow):
 
     def closeEvent(self, event):
         """窗口关闭事件处理"""
+        # 无论关闭还是最小化到托盘，都先把待写入的日志刷新到磁盘
+        CentralLogHandler.getInstance().flush_logs()
         try:
             # 检查系统托盘是否可用
             if not QSystemTrayIcon.isSystemTrayAvailable():
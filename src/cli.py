@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命令行入口 - 不依赖Qt，直接调用提取器进行批量或脚本化提取
+Command Line Interface - Drives the extractors directly, without Qt, for batch and scripted extraction
+
+用法 / Usage:
+    python -m src.cli extract --types audio,fonts --workers 8 --output DIR --json-stats
+    python -m src.cli extract --types audio --trace trace.json
+    python -m src.cli watch --types audio,images --output DIR
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import contextlib
+import multiprocessing
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from src.extractors.cache_scanner import CacheItem, get_scanner
+from src.utils.history_manager import ExtractedHistory
+from src.utils.stage_timer import start_trace, stop_trace, write_chrome_trace
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_TYPES = ("audio", "fonts", "translations", "videos", "images", "textures", "meshes", "models")
+# 视频需要同一次扫描中的全部分段，不支持监视模式
+WATCH_TYPES = tuple(extraction_type for extraction_type in EXTRACTION_TYPES if extraction_type != "videos")
+
+# 与图形界面共用的提取历史
+DEFAULT_HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".roblox_audio_extractor", "extracted_history.json")
+
+
+@dataclass
+class CLIOptions:
+    """所有提取类型共用的命令行选项"""
+    cache_path: str
+    output_dir: str
+    workers: int
+    use_multiprocessing: bool
+    conservative_multiprocessing: bool
+    download_history: Optional[ExtractedHistory]
+    log_callback: Callable
+
+
+def _run_audio(options: CLIOptions, cache_items: Optional[List[CacheItem]]) -> Dict[str, Any]:
+    from src.extractors.audio_extractor import RobloxAudioExtractor, ClassificationMethod
+    extractor = RobloxAudioExtractor(
+        options.cache_path, options.workers, ["oggs", "ID3"], options.download_history,
+        ClassificationMethod.DURATION, options.output_dir, True,
+        options.use_multiprocessing, options.conservative_multiprocessing, options.log_callback)
+    result = extractor.process_files(cache_items)
+    # 音频提取器不自己保存历史，与ExtractionWorker一致在结束后保存
+    if options.download_history:
+        options.download_history.save_history()
+    result["success"] = True
+    return result
+
+
+def _run_fonts(options: CLIOptions, cache_items: Optional[List[CacheItem]]) -> Dict[str, Any]:
+    from src.extractors.font_extractor import RobloxFontExtractor
+    extractor = RobloxFontExtractor(
+        output_dir=options.output_dir, num_threads=options.workers,
+        use_multiprocessing=options.use_multiprocessing,
+        conservative_multiprocessing=options.conservative_multiprocessing,
+        log_callback=options.log_callback, download_history=options.download_history)
+    return extractor.extract_fonts(cache_items=cache_items)
+
+
+def _run_translations(options: CLIOptions, cache_items: Optional[List[CacheItem]]) -> Dict[str, Any]:
+    from src.extractors.translation_extractor import RobloxTranslationExtractor
+    extractor = RobloxTranslationExtractor(
+        output_dir=options.output_dir, num_threads=options.workers,
+        use_multiprocessing=options.use_multiprocessing,
+        conservative_multiprocessing=options.conservative_multiprocessing,
+        log_callback=options.log_callback, download_history=options.download_history)
+    return extractor.extract_translations(cache_items=cache_items)
+
+
+def _run_videos(options: CLIOptions, cache_items: Optional[List[CacheItem]]) -> Dict[str, Any]:
+    from src.extractors.video_extractor import RobloxVideoExtractor
+    extractor = RobloxVideoExtractor(
+        options.cache_path, options.workers, options.download_history,
+        custom_output_dir=options.output_dir,
+        use_multiprocessing=options.use_multiprocessing,
+        conservative_multiprocessing=options.conservative_multiprocessing)
+    return extractor.extract_videos()
+
+
+def _run_images(options: CLIOptions, cache_items: Optional[List[CacheItem]]) -> Dict[str, Any]:
+    from src.extractors.image_extractor import RobloxImageExtractor
+    extractor = RobloxImageExtractor(
+        output_dir=options.output_dir, num_threads=options.workers,
+        use_multiprocessing=options.use_multiprocessing,
+        conservative_multiprocessing=options.conservative_multiprocessing,
+        log_callback=options.log_callback, download_history=options.download_history)
+    return extractor.extract_images(cache_items=cache_items)
+
+
+def _run_textures(options: CLIOptions, cache_items: Optional[List[CacheItem]]) -> Dict[str, Any]:
+    from src.extractors.texture_extractor import RobloxTextureExtractor
+    extractor = RobloxTextureExtractor(
+        output_dir=options.output_dir, num_threads=options.workers,
+        use_multiprocessing=options.use_multiprocessing,
+        conservative_multiprocessing=options.conservative_multiprocessing,
+        log_callback=options.log_callback, download_history=options.download_history)
+    return extractor.extract_textures(cache_items=cache_items)
+
+
+def _run_meshes(options: CLIOptions, cache_items: Optional[List[CacheItem]]) -> Dict[str, Any]:
+    from src.extractors.mesh_extractor import RobloxMeshExtractor
+    extractor = RobloxMeshExtractor(
+        output_dir=options.output_dir, num_threads=options.workers,
+        use_multiprocessing=options.use_multiprocessing,
+        conservative_multiprocessing=options.conservative_multiprocessing,
+        log_callback=options.log_callback, download_history=options.download_history)
+    return extractor.extract_meshes(cache_items=cache_items)
+
+
+def _run_models(options: CLIOptions, cache_items: Optional[List[CacheItem]]) -> Dict[str, Any]:
+    from src.extractors.model_extractor import RobloxModelExtractor
+    extractor = RobloxModelExtractor(
+        output_dir=options.output_dir, num_threads=options.workers,
+        use_multiprocessing=options.use_multiprocessing,
+        conservative_multiprocessing=options.conservative_multiprocessing,
+        log_callback=options.log_callback, download_history=options.download_history)
+    return extractor.extract_models(cache_items=cache_items)
+
+
+_RUNNERS = {
+    "audio": _run_audio,
+    "fonts": _run_fonts,
+    "translations": _run_translations,
+    "videos": _run_videos,
+    "images": _run_images,
+    "textures": _run_textures,
+    "meshes": _run_meshes,
+    "models": _run_models,
+}
+
+
+# 各提取类型实际写出的资源数量在结果stats中的键，音频为结果顶层的processed
+_WRITTEN_COUNT_KEYS = {
+    "audio": None,
+    "fonts": "fonts_downloaded",
+    "translations": "translation_saved",
+    "videos": "merged_videos",
+    "images": "images_saved",
+    "textures": "textures_saved",
+    "meshes": "meshes_saved",
+    "models": "models_saved",
+}
+
+
+def _written_count(extraction_type: str, result: Dict[str, Any]) -> int:
+    """获取一次提取实际写出的资源数量（不含重复、已处理和非该类型的缓存项）"""
+    key = _WRITTEN_COUNT_KEYS[extraction_type]
+    if key is None:
+        return result.get("processed", 0) or 0
+    return (result.get("stats") or {}).get(key, 0) or 0
+
+
+def run_extraction(extraction_type: str, options: CLIOptions,
+                   cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
+    """
+    运行一种提取并统计耗时和吞吐量
+
+    Args:
+        extraction_type: 提取类型，见EXTRACTION_TYPES
+        options: 命令行选项
+        cache_items: 要处理的缓存项目，None表示扫描整个缓存
+
+    Returns:
+        Dict[str, Any]: success、wall_seconds、items（实际写出的资源数量）、items_per_second、
+                        bytes_per_second、各阶段耗时(stages)以及提取器返回的完整结果(result)
+    """
+    start = time.perf_counter()
+    try:
+        result = _RUNNERS[extraction_type](options, cache_items)
+    except Exception as e:
+        logger.exception(f"{extraction_type} 提取失败")
+        result = {"success": False, "error": str(e)}
+    wall_seconds = time.perf_counter() - start
+
+    items = _written_count(extraction_type, result)
+    stages = result.get("stages") or {}
+
+    # 没有自己统计写入速度的提取器，用写入阶段的字节数估算
+    bytes_per_second = result.get("bytes_per_second")
+    written_bytes = stages.get("write", {}).get("bytes")
+    if bytes_per_second is None and written_bytes is not None and wall_seconds > 0:
+        bytes_per_second = round(written_bytes / wall_seconds, 2)
+
+    return {
+        "success": bool(result.get("success", False)),
+        "wall_seconds": round(wall_seconds, 4),
+        "items": items,
+        "items_per_second": round(items / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+        "bytes_per_second": bytes_per_second,
+        "stages": stages,
+        "result": result,
+    }
+
+
+def _parse_types(value: str, allowed: tuple) -> List[str]:
+    """解析逗号分隔的提取类型，all表示全部"""
+    if value.strip() == "all":
+        return list(allowed)
+    types = []
+    for name in value.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        if name not in allowed:
+            raise argparse.ArgumentTypeError(f"未知的提取类型: {name}（可选: {', '.join(allowed)}, all）")
+        if name not in types:
+            types.append(name)
+    if not types:
+        raise argparse.ArgumentTypeError("至少需要一种提取类型")
+    return types
+
+
+@contextlib.contextmanager
+def _stdout_to_stderr():
+    """
+    提取期间把标准输出（包括子进程继承的文件描述符）重定向到标准错误，
+    保证标准输出只有本程序的摘要或JSON
+
+    Yields:
+        写入原标准输出的文本流
+    """
+    sys.stdout.flush()
+    saved_fd = os.dup(1)
+    real_stdout = os.fdopen(os.dup(saved_fd), "w", encoding=sys.stdout.encoding or "utf-8")
+    try:
+        os.dup2(2, 1)
+        with contextlib.redirect_stdout(sys.stderr):
+            yield real_stdout
+    finally:
+        real_stdout.close()
+        sys.stdout.flush()
+        os.dup2(saved_fd, 1)
+        os.close(saved_fd)
+
+
+def _make_log_callback(verbose: bool) -> Callable:
+    """创建提取器日志回调：-v时把翻译后的消息写到标准错误"""
+    if not verbose:
+        return lambda message_key, log_type, *args: None
+
+    from src.locale.language_manager import LanguageManager
+    language = LanguageManager()
+
+    def log_callback(message_key: str, log_type: str, *args):
+        try:
+            message = language.get(message_key, *args)
+        except Exception:
+            message = " ".join([message_key, *map(str, args)])
+        print(f"[{log_type}] {message}", file=sys.stderr)
+
+    return log_callback
+
+
+def _build_options(args: argparse.Namespace) -> Optional[CLIOptions]:
+    """配置全局缓存扫描器并创建选项，缓存路径无效时返回None"""
+    scanner = get_scanner()
+    if args.cache:
+        scanner.set_cache_path(os.path.abspath(args.cache))
+    if not scanner.get_cache_info()["path_exists"]:
+        print(f"错误: Roblox缓存路径不存在或无法访问: {scanner.target_path or '(未检测到)'}", file=sys.stderr)
+        return None
+
+    output_dir = os.path.abspath(args.output)
+    os.makedirs(output_dir, exist_ok=True)
+
+    download_history = None
+    if not args.no_history:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        download_history = ExtractedHistory(args.history)
+
+    return CLIOptions(
+        cache_path=scanner.target_path,
+        output_dir=output_dir,
+        workers=args.workers,
+        use_multiprocessing=args.multiprocessing,
+        conservative_multiprocessing=args.conservative,
+        download_history=download_history,
+        log_callback=_make_log_callback(args.verbose),
+    )
+
+
+def _run_info(options: CLIOptions) -> Dict[str, Any]:
+    """JSON统计中的运行环境信息"""
+    return {
+        "cache": get_scanner().get_cache_info(),
+        "output_dir": options.output_dir,
+        "workers": options.workers,
+        "mode": "multiprocessing" if options.use_multiprocessing else "threading",
+        "cpu_count": multiprocessing.cpu_count(),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+    }
+
+
+def _print_summary(extraction_type: str, summary: Dict[str, Any], stream=None, show_stages: bool = False):
+    """打印一种提取的可读摘要，show_stages时逐行列出各阶段耗时"""
+    stream = stream or sys.stdout
+    status = "OK" if summary["success"] else f"FAILED ({summary['result'].get('error', 'unknown error')})"
+    line = (f"{extraction_type:<13} {status:<6} {summary['items']:>8} items "
+            f"{summary['wall_seconds']:>9.2f}s {summary['items_per_second']:>10.1f} items/s")
+    if summary["bytes_per_second"]:
+        line += f" {summary['bytes_per_second'] / (1024 * 1024):>8.1f} MB/s"
+    print(line, file=stream, flush=True)
+    if show_stages:
+        for name, stage in summary["stages"].items():
+            print(f"  {name:<18} {stage['seconds']:>9.2f}s {stage['count']:>8} times", file=stream, flush=True)
+
+
+def command_extract(args: argparse.Namespace) -> int:
+    """extract命令：依次运行指定类型的提取"""
+    options = _build_options(args)
+    if options is None:
+        return 2
+
+    report = {"command": "extract", **_run_info(options), "types": {}}
+    if args.trace:
+        start_trace()
+    start = time.perf_counter()
+    with _stdout_to_stderr() as stdout:
+        for extraction_type in args.types:
+            summary = run_extraction(extraction_type, options)
+            report["types"][extraction_type] = summary
+            if not args.json_stats:
+                _print_summary(extraction_type, summary, stdout, args.verbose)
+    report["total_seconds"] = round(time.perf_counter() - start, 4)
+    if args.trace:
+        report["trace"] = write_chrome_trace(args.trace, stop_trace())
+
+    if args.json_stats:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2, default=str)
+        sys.stdout.write("\n")
+    else:
+        print(f"{'total':<13} {report['total_seconds']:>31.2f}s")
+    return 0 if all(summary["success"] for summary in report["types"].values()) else 1
+
+
+def command_watch(args: argparse.Namespace) -> int:
+    """watch命令：监视缓存，新出现的项目按指定类型提取，直到Ctrl+C"""
+    from src.extractors.cache_watcher import CacheWatcher, create_watch_scanner
+
+    options = _build_options(args)
+    if options is None:
+        return 2
+
+    def process_batch(cache_items: List[CacheItem]):
+        batch = {"command": "watch", "items": len(cache_items), "types": {}}
+        with _stdout_to_stderr():
+            for extraction_type in args.types:
+                batch["types"][extraction_type] = run_extraction(extraction_type, options, cache_items)
+        if args.json_stats:
+            # 每批一行JSON
+            print(json.dumps(batch, ensure_ascii=False, default=str), flush=True)
+        else:
+            print(f"{len(cache_items)} new cache entries", flush=True)
+            for extraction_type, summary in batch["types"].items():
+                _print_summary(extraction_type, summary, show_stages=args.verbose)
+
+    watcher = CacheWatcher(
+        create_watch_scanner(options.cache_path),
+        process_batch,
+        poll_interval=args.poll_interval,
+        debounce=args.debounce,
+        log_callback=options.log_callback,
+    )
+    print(f"Watching {options.cache_path} (Ctrl+C to stop)", file=sys.stderr)
+    watcher.start()
+    try:
+        while not watcher.is_stopped:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    watcher.stop(wait=True)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """创建命令行参数解析器"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Extract Roblox cache assets without the GUI")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    default_workers = min(32, multiprocessing.cpu_count() * 2)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--cache", help="cache path: rbx-storage.db, the rbx-storage folder or a cache folder "
+                                        "(default: auto-detect)")
+    common.add_argument("--output", default=os.path.join(os.getcwd(), "extracted"),
+                        help="output directory (default: ./extracted)")
+    common.add_argument("--workers", type=int, default=default_workers,
+                        help=f"threads, or max processes with --multiprocessing (default: {default_workers})")
+    common.add_argument("--multiprocessing", action="store_true", help="use worker processes instead of threads")
+    common.add_argument("--aggressive", dest="conservative", action="store_false",
+                        help="allow more processes than the conservative multiprocessing default")
+    common.add_argument("--history", default=DEFAULT_HISTORY_FILE,
+                        help="extraction history file shared with the GUI (default: %(default)s)")
+    common.add_argument("--no-history", action="store_true", help="extract everything, ignoring history")
+    common.add_argument("--json-stats", action="store_true",
+                        help="print machine-readable timing and throughput as JSON on stdout")
+    common.add_argument("-v", "--verbose", action="store_true",
+                        help="show extractor progress messages on stderr and per-stage timings in the summary")
+
+    extract = subparsers.add_parser("extract", parents=[common], help="extract everything in the cache once")
+    extract.add_argument("--types", required=True, type=lambda value: _parse_types(value, EXTRACTION_TYPES),
+                         help=f"comma-separated types: {','.join(EXTRACTION_TYPES)} or all")
+    extract.add_argument("--trace", metavar="FILE",
+                         help="write a Chrome trace (chrome://tracing, Perfetto) of all extraction stages to FILE")
+    extract.set_defaults(handler=command_extract)
+
+    watch = subparsers.add_parser("watch", parents=[common], help="extract new cache entries as they appear")
+    watch.add_argument("--types", required=True, type=lambda value: _parse_types(value, WATCH_TYPES),
+                       help=f"comma-separated types: {','.join(WATCH_TYPES)} or all")
+    watch.add_argument("--poll-interval", type=float, default=2.0,
+                       help="seconds between cache checks when change notifications are unavailable")
+    watch.add_argument("--debounce", type=float, default=1.5,
+                       help="seconds the cache must stay unchanged before extracting")
+    watch.set_defaults(handler=command_watch)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行主函数，返回退出码（0成功，1有提取失败，2参数或缓存路径无效）"""
+    args = build_parser().parse_args(argv)
+    if args.workers < 1:
+        print("错误: --workers 必须大于0", file=sys.stderr)
+        return 2
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr)
+    try:
+        return args.handler(args)
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -9,9 +9,10 @@ from PyQt5.QtWidgets import QVBoxLayout, QSizePolicy, QHBoxLayout, QLabel, QFram
 from PyQt5.QtCore import Qt, QPoint, pyqtSignal
 from PyQt5.QtGui import QCursor, QPainter, QPen, QColor
 
-from qfluentwidgets import CardWidget, StrongBodyLabel, TextEdit, FluentIcon, IconWidget
+from qfluentwidgets import CardWidget, StrongBodyLabel, FluentIcon, IconWidget
 
 from src.utils.log_utils import LogHandler
+from src.logging.log_view_model import LogListView
 
 
 class ResizeHandle(QFrame):
@@ -138,9 +139,8 @@ class RecentActivityCard(CardWidget):
         self.title_label = StrongBodyLabel(title_text)
         self.main_layout.addWidget(self.title_label)
         
-        # 日志文本编辑器
-        self.log_text_edit = TextEdit()
-        self.log_text_edit.setReadOnly(True)
+        # 日志视图（虚拟化列表，只绘制可见行）
+        self.log_text_edit = LogListView()
         self.main_layout.addWidget(self.log_text_edit, 1)  # 设置拉伸因子为1
         
         # 添加可拖拽的调整手柄
@@ -199,9 +199,9 @@ class RecentActivityCard(CardWidget):
     
     def get_text_edit(self):
         """
-        获取TextEdit组件实例（用于向后兼容）
+        获取日志视图组件实例（用于向后兼容）
         
         Returns:
-            TextEdit: TextEdit组件实例
+            LogListView: 日志视图组件实例
         """
         return self.log_text_edit 
\ No newline at end of file
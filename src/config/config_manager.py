@@ -107,6 +107,35 @@ class AppConfig(QConfig):
         "Translations", "TranslationClassificationMethod", "locale",
         OptionsValidator(["locale", "content_type", "combined", "none"]))
     translationProcessingEnabled = ConfigItem("Translations", "TranslationProcessingEnabled", True, BoolValidator())
+    translationOutputFormat = OptionsConfigItem(
+        "Translations", "TranslationOutputFormat", "json",
+        OptionsValidator(["json", "raw"]))
+    translationBundleEnabled = ConfigItem("Translations", "TranslationBundleEnabled", False, BoolValidator())
+    
+    # 图像配置
+    imageClassificationMethod = OptionsConfigItem(
+        "Images", "ImageClassificationMethod", "dimensions",
+        OptionsValidator(["dimensions", "format", "none"]))
+    imageBlockAvatarImages = ConfigItem("Images", "ImageBlockAvatarImages", True, BoolValidator())
+    
+    # 纹理配置
+    textureClassificationMethod = OptionsConfigItem(
+        "Textures", "TextureClassificationMethod", "format",
+        OptionsValidator(["format", "dimensions", "none"]))
+    textureDecodePng = ConfigItem("Textures", "TextureDecodePng", False, BoolValidator())
+    textureDecodeAllMips = ConfigItem("Textures", "TextureDecodeAllMips", False, BoolValidator())
+    
+    # 网格配置
+    meshClassificationMethod = OptionsConfigItem(
+        "Meshes", "MeshClassificationMethod", "version",
+        OptionsValidator(["version", "none"]))
+    meshConvertObj = ConfigItem("Meshes", "MeshConvertObj", False, BoolValidator())
+    
+    # 模型配置
+    modelClassificationMethod = OptionsConfigItem(
+        "Models", "ModelClassificationMethod", "main_class",
+        OptionsValidator(["main_class", "none"]))
+    modelWriteIndex = ConfigItem("Models", "ModelWriteIndex", True, BoolValidator())
     
     # 视频配置
     videoClassificationMethod = OptionsConfigItem(
@@ -118,6 +147,7 @@ class AppConfig(QConfig):
     videoTimestampRepair = ConfigItem("Videos", "VideoTimestampRepair", True, BoolValidator())
     videoConcurrentDownloads = ConfigItem("Videos", "VideoConcurrentDownloads", True, BoolValidator())
     videoAutoCleanup = ConfigItem("Videos", "VideoAutoCleanup", True, BoolValidator())
+    videoResumeDownloads = ConfigItem("Videos", "VideoResumeDownloads", False, BoolValidator())
     
     # 视频转换配置
     convertVideoEnabled = ConfigItem("Videos", "ConvertVideoEnabled", False, BoolValidator())
@@ -130,6 +160,8 @@ class AppConfig(QConfig):
     convertAudioFormat = OptionsConfigItem(
         "Features", "ConvertAudioFormat", "MP3", 
         OptionsValidator(["MP3", "WAV", "FLAC", "AAC", "M4A"]))
+    convertWhileExtracting = ConfigItem("Features", "ConvertWhileExtracting", True, BoolValidator())
+    keepSourceAudio = ConfigItem("Features", "KeepSourceAudio", True, BoolValidator())
     
     # 缓存管理配置
     autoClearCacheEnabled = ConfigItem("Features", "AutoClearCacheEnabled", False, BoolValidator())
@@ -269,6 +301,7 @@ class ConfigManager:
                 "video_timestamp_repair": self.cfg.videoTimestampRepair,
                 "video_concurrent_downloads": self.cfg.videoConcurrentDownloads,
                 "video_auto_cleanup": self.cfg.videoAutoCleanup,
+                "video_resume_downloads": self.cfg.videoResumeDownloads,
             }
             
             for old_key, config_item in config_mapping.items():
@@ -381,18 +414,36 @@ class ConfigManager:
                 # 兼容旧的音频转换配置键名
                 "convert_enabled": self.cfg.convertAudioEnabled,
                 "convert_format": self.cfg.convertAudioFormat,
+                "convert_while_extracting": self.cfg.convertWhileExtracting,
+                "keep_source_audio": self.cfg.keepSourceAudio,
                 # 字体配置
                 "font_classification_method": self.cfg.fontClassificationMethod,
                 "font_threads": self.cfg.fontThreads,
                 # 翻译文件配置
                 "translation_classification_method": self.cfg.translationClassificationMethod,
                 "translation_processing_enabled": self.cfg.translationProcessingEnabled,
+                "translation_output_format": self.cfg.translationOutputFormat,
+                "translation_bundle_enabled": self.cfg.translationBundleEnabled,
+                # 图像配置
+                "image_classification_method": self.cfg.imageClassificationMethod,
+                "image_block_avatar_images": self.cfg.imageBlockAvatarImages,
+                # 纹理配置
+                "texture_classification_method": self.cfg.textureClassificationMethod,
+                "texture_decode_png": self.cfg.textureDecodePng,
+                "texture_decode_all_mips": self.cfg.textureDecodeAllMips,
+                # 网格配置
+                "mesh_classification_method": self.cfg.meshClassificationMethod,
+                "mesh_convert_obj": self.cfg.meshConvertObj,
+                # 模型配置
+                "model_classification_method": self.cfg.modelClassificationMethod,
+                "model_write_index": self.cfg.modelWriteIndex,
                 # 视频配置
                 "video_classification_method": self.cfg.videoClassificationMethod,
                 "video_quality_preference": self.cfg.videoQualityPreference,
                 "video_timestamp_repair": self.cfg.videoTimestampRepair,
                 "video_concurrent_downloads": self.cfg.videoConcurrentDownloads,
                 "video_auto_cleanup": self.cfg.videoAutoCleanup,
+                "video_resume_downloads": self.cfg.videoResumeDownloads,
                 # 视频转换配置
                 "convert_video_enabled": self.cfg.convertVideoEnabled,
                 "convert_video_format": self.cfg.convertVideoFormat,
@@ -480,18 +531,36 @@ class ConfigManager:
                 # 兼容旧的音频转换配置键名
                 "convert_enabled": self.cfg.convertAudioEnabled,
                 "convert_format": self.cfg.convertAudioFormat,
+                "convert_while_extracting": self.cfg.convertWhileExtracting,
+                "keep_source_audio": self.cfg.keepSourceAudio,
                 # 字体配置
                 "font_classification_method": self.cfg.fontClassificationMethod,
                 "font_threads": self.cfg.fontThreads,
                 # 翻译文件配置
                 "translation_classification_method": self.cfg.translationClassificationMethod,
                 "translation_processing_enabled": self.cfg.translationProcessingEnabled,
+                "translation_output_format": self.cfg.translationOutputFormat,
+                "translation_bundle_enabled": self.cfg.translationBundleEnabled,
+                # 图像配置
+                "image_classification_method": self.cfg.imageClassificationMethod,
+                "image_block_avatar_images": self.cfg.imageBlockAvatarImages,
+                # 纹理配置
+                "texture_classification_method": self.cfg.textureClassificationMethod,
+                "texture_decode_png": self.cfg.textureDecodePng,
+                "texture_decode_all_mips": self.cfg.textureDecodeAllMips,
+                # 网格配置
+                "mesh_classification_method": self.cfg.meshClassificationMethod,
+                "mesh_convert_obj": self.cfg.meshConvertObj,
+                # 模型配置
+                "model_classification_method": self.cfg.modelClassificationMethod,
+                "model_write_index": self.cfg.modelWriteIndex,
                 # 视频配置
                 "video_classification_method": self.cfg.videoClassificationMethod,
                 "video_quality_preference": self.cfg.videoQualityPreference,
                 "video_timestamp_repair": self.cfg.videoTimestampRepair,
                 "video_concurrent_downloads": self.cfg.videoConcurrentDownloads,
                 "video_auto_cleanup": self.cfg.videoAutoCleanup,
+                "video_resume_downloads": self.cfg.videoResumeDownloads,
                 # 视频转换配置
                 "convert_video_enabled": self.cfg.convertVideoEnabled,
                 "convert_video_format": self.cfg.convertVideoFormat,
@@ -14,6 +14,9 @@ from .audio_extractor import (
     # ExtractedHistory moved to src.utils.history_manager
 )
 
+# 导出音频格式转换器
+from .audio_converter import AudioConverter
+
 # 导出Roblox字体提取器及相关组件
 from .font_extractor import (
     RobloxFontExtractor,
@@ -31,6 +34,43 @@ from .translation_extractor import (
     TranslationProcessor,
     extract_roblox_translations
 )
+from .translation_bundle import TranslationBundle
+
+# 导出暂存式提取器基类
+from .staged_extractor import StagedCacheExtractor, StagedProcessingStats
+
+# 导出Roblox图像提取器及相关组件
+from .image_extractor import (
+    RobloxImageExtractor,
+    ImageClassificationMethod,
+    ImageProcessingStats,
+    extract_roblox_images
+)
+
+# 导出Roblox纹理提取器及相关组件
+from .texture_extractor import (
+    RobloxTextureExtractor,
+    TextureClassificationMethod,
+    TextureProcessingStats,
+    extract_roblox_textures
+)
+
+# 导出Roblox网格提取器及相关组件
+from .mesh_extractor import (
+    RobloxMeshExtractor,
+    MeshClassificationMethod,
+    MeshProcessingStats,
+    extract_roblox_meshes
+)
+
+# 导出Roblox模型提取器及相关组件
+from .model_extractor import (
+    RobloxModelExtractor,
+    ModelClassificationMethod,
+    ModelProcessingStats,
+    extract_roblox_models
+)
+from .rbxm_index import RBXMIndex, index_rbxm, index_rbxm_file
 
 # 导出Roblox视频提取器及相关组件
 from .video_extractor import (
@@ -69,6 +109,15 @@ from .cache_scanner import (
     get_scanner
 )
 
+# 导出缓存监视器
+from .cache_watcher import CacheWatcher, create_watch_scanner
+
+# 导出本地资源索引
+from .asset_index import (
+    AssetCacheIndex,
+    extract_asset_id
+)
+
 # 为了兼容性，保持原有的导出
 __all__ = [
     # 音频提取器
@@ -76,6 +125,7 @@ __all__ = [
     'AudioClassificationMethod',
     'AudioProcessingStats',
     'AudioContentHashCache',
+    'AudioConverter',
     
     # 字体提取器
     'RobloxFontExtractor',
@@ -90,6 +140,38 @@ __all__ = [
     'TranslationProcessingStats',
     'TranslationProcessor',
     'extract_roblox_translations',
+    'TranslationBundle',
+    
+    # 暂存式提取器基类
+    'StagedCacheExtractor',
+    'StagedProcessingStats',
+    
+    # 图像提取器
+    'RobloxImageExtractor',
+    'ImageClassificationMethod',
+    'ImageProcessingStats',
+    'extract_roblox_images',
+    
+    # 纹理提取器
+    'RobloxTextureExtractor',
+    'TextureClassificationMethod',
+    'TextureProcessingStats',
+    'extract_roblox_textures',
+    
+    # 网格提取器
+    'RobloxMeshExtractor',
+    'MeshClassificationMethod',
+    'MeshProcessingStats',
+    'extract_roblox_meshes',
+    
+    # 模型提取器
+    'RobloxModelExtractor',
+    'ModelClassificationMethod',
+    'ModelProcessingStats',
+    'extract_roblox_models',
+    'RBXMIndex',
+    'index_rbxm',
+    'index_rbxm_file',
     
     # 核心组件
     'RBXHParser',
@@ -106,5 +188,9 @@ __all__ = [
     'CacheItem',
     'CacheType',
     'scan_roblox_cache',
-    'get_scanner'
+    'get_scanner',
+    'CacheWatcher',
+    'create_watch_scanner',
+    'AssetCacheIndex',
+    'extract_asset_id'
 ] 
\ No newline at end of file
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地资源索引 - 根据RBXH链接把资源ID映射到缓存项，优先使用本地缓存数据
+Local Asset Index - Maps asset IDs to cache entries via RBXH links so local bytes are used first
+"""
+
+import re
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse, parse_qs
+
+from .rbxh_parser import RBXHParser
+from .cache_scanner import CacheItem
+
+logger = logging.getLogger(__name__)
+
+ASSET_DELIVERY_URL = "https://assetdelivery.roblox.com/v1/asset?id={}"
+
+_RBXASSETID_PATTERN = re.compile(r'^rbxassetid://(\d+)', re.IGNORECASE)
+_PATH_ID_PATTERN = re.compile(r'/asset-?id/(\d+)', re.IGNORECASE)
+_ID_QUERY_KEYS = ('id', 'assetid')
+
+
+def extract_asset_id(link: str) -> Optional[str]:
+    """
+    从缓存链接或资源引用中提取资源ID
+
+    支持 rbxassetid://123、.../v1/asset?id=123、.../v2/assetId/123 等形式。
+
+    Args:
+        link: 链接或资源引用
+
+    Returns:
+        Optional[str]: 资源ID，无法识别时返回None
+    """
+    if not link:
+        return None
+    link = link.strip()
+
+    match = _RBXASSETID_PATTERN.match(link)
+    if match:
+        return match.group(1)
+
+    try:
+        parsed = urlparse(link)
+    except ValueError:
+        return None
+    if not parsed.netloc or not parsed.netloc.lower().endswith(('roblox.com', 'rbxcdn.com')):
+        return None
+
+    query = {key.lower(): values for key, values in parse_qs(parsed.query).items()}
+    for key in _ID_QUERY_KEYS:
+        values = query.get(key)
+        if values and values[0].isdigit():
+            return values[0]
+
+    match = _PATH_ID_PATTERN.search(parsed.path)
+    if match:
+        return match.group(1)
+    return None
+
+
+class AssetCacheIndex:
+    """
+    资源ID到缓存项的索引
+
+    扫描时只读取每个缓存项的RBXH头部链接建立索引，需要时才读取完整内容。
+    字体等按资源ID引用的内容可先在本地缓存中查找，未命中时再走网络。
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, CacheItem] = {}
+        self._lock = threading.Lock()
+        self._parser = RBXHParser()  # 只用于读取头部链接，不影响全局已知链接记录
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def add(self, link: str, cache_item: CacheItem) -> bool:
+        """
+        根据链接登记缓存项
+
+        Returns:
+            bool: 链接中是否包含资源ID
+        """
+        asset_id = extract_asset_id(link)
+        if asset_id is None:
+            return False
+        with self._lock:
+            self._entries.setdefault(asset_id, cache_item)
+        return True
+
+    def add_cache_items(self, cache_items: Iterable[CacheItem]) -> int:
+        """
+        读取缓存项的链接并建立索引
+
+        Args:
+            cache_items: 扫描得到的缓存项
+
+        Returns:
+            int: 新登记的资源数量
+        """
+        added = 0
+        for cache_item in cache_items:
+            try:
+                if cache_item.data is not None:
+                    link = self._parser.read_link_data(cache_item.data)
+                else:
+                    link = self._parser.read_link_file(cache_item.path)
+            except Exception as e:
+                logger.debug(f"读取缓存链接失败 {cache_item.hash_id}: {e}")
+                continue
+            if link and self.add(link, cache_item):
+                added += 1
+        return added
+
+    def lookup(self, asset_id: str) -> Optional[CacheItem]:
+        """查找资源ID对应的缓存项"""
+        with self._lock:
+            return self._entries.get(str(asset_id))
+
+    def load(self, asset_id: str) -> Optional[bytes]:
+        """
+        读取资源ID对应的本地缓存内容
+
+        Args:
+            asset_id: 资源ID
+
+        Returns:
+            Optional[bytes]: 缓存内容，未命中或解析失败时返回None
+        """
+        cache_item = self.lookup(asset_id)
+        content = None
+        if cache_item is not None:
+            # 每次使用新的解析器，避免同一资源再次读取时被当作重复链接跳过
+            parser = RBXHParser()
+            if cache_item.data is not None:
+                parsed = parser.parse_cache_data(cache_item.data)
+            else:
+                parsed = parser.parse_cache_file(cache_item.path)
+            if parsed.success and parsed.content:
+                content = parsed.content
+
+        with self._lock:
+            if content is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return content
+
+    def fetch_asset(self, asset_id: str, downloader, **kwargs) -> Optional[bytes]:
+        """
+        获取资源内容：优先使用本地缓存，未命中时通过下载管理器下载
+
+        Args:
+            asset_id: 资源ID
+            downloader: 下载管理器
+            **kwargs: 传给downloader.fetch()的参数
+
+        Returns:
+            Optional[bytes]: 资源内容，失败时返回None
+        """
+        content = self.load(asset_id)
+        if content is not None:
+            return content
+        return downloader.fetch(ASSET_DELIVERY_URL.format(asset_id), **kwargs)
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取索引大小和命中统计"""
+        with self._lock:
+            return {'indexed_assets': len(self._entries), 'local_hits': self.hits, 'local_misses': self.misses}
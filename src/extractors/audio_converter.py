@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+音频格式转换模块 - 使用FFmpeg进程池并行转换提取出的音频文件
+Audio Conversion Module - Converts extracted audio files in parallel with a pool of FFmpeg processes
+"""
+
+import os
+import time
+import queue
+import shutil
+import logging
+import threading
+import subprocess
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 各输出格式的编码参数
+AUDIO_CODEC_ARGS = {
+    'MP3': ['-codec:a', 'libmp3lame', '-b:a', '192k'],
+    'WAV': ['-codec:a', 'pcm_s16le'],
+    'FLAC': ['-codec:a', 'flac'],
+    'AAC': ['-codec:a', 'aac', '-b:a', '128k'],
+    'M4A': ['-codec:a', 'aac', '-b:a', '128k'],
+}
+
+
+class AudioConversionStats:
+    """音频转换统计 - 线程安全"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.converted = 0
+        self.skipped = 0
+        self.failed = 0
+        self.bytes_in = 0
+        self.errors: List[str] = []
+        self.start_time = time.time()
+
+    def record(self, key: str, byte_count: int = 0, error: Optional[str] = None):
+        """记录一个文件的转换结果"""
+        with self._lock:
+            setattr(self, key, getattr(self, key) + 1)
+            self.bytes_in += byte_count
+            if error:
+                self.errors.append(error)
+
+    def add_submitted(self) -> int:
+        """记录提交了一个文件，返回已提交总数"""
+        with self._lock:
+            self.submitted += 1
+            return self.submitted
+
+    def get_all(self) -> Dict[str, Any]:
+        """获取统计信息"""
+        with self._lock:
+            duration = time.time() - self.start_time
+            done = self.converted + self.skipped + self.failed
+            return {
+                'submitted': self.submitted,
+                'converted': self.converted,
+                'skipped': self.skipped,
+                'failed': self.failed,
+                'errors': list(self.errors),
+                'duration': duration,
+                'files_per_second': done / duration if duration > 0 else 0,
+                'bytes_per_second': self.bytes_in / duration if duration > 0 else 0,
+            }
+
+
+class AudioConverter:
+    """
+    音频格式转换器
+
+    提交的文件放入队列，由与CPU核心数相同的工作线程各自启动一个单线程FFmpeg进程转换。
+    输出保存在 Audio/Audio_<格式>/ 下，保持与Audio目录相同的子目录结构；
+    输出已存在且不早于源文件时跳过。先写入临时文件，成功后再替换为正式文件，
+    中断的转换不会被误认为已完成。
+
+    队列有长度上限，提取线程边提取边提交时，转换跟不上就会阻塞提交，
+    等待中的数据量因此有界。直接提交音频数据时通过管道(pipe:0)传给FFmpeg，
+    不需要先写出中间文件。
+    """
+
+    def __init__(self, audio_dir: str, output_format: str, ffmpeg_path: Optional[str] = None,
+                 max_workers: Optional[int] = None,
+                 cancel_check: Optional[Callable[[], bool]] = None,
+                 progress_callback: Optional[Callable[[int, int, float, float], None]] = None,
+                 log_callback: Optional[Callable[[str, str], None]] = None,
+                 max_pending: Optional[int] = None, remove_source: bool = False):
+        """
+        初始化音频转换器
+
+        Args:
+            audio_dir: 提取输出的Audio目录
+            output_format: 输出格式（MP3、WAV、FLAC、AAC、M4A）
+            ffmpeg_path: FFmpeg可执行文件路径，默认从PATH查找
+            max_workers: 同时运行的FFmpeg进程数，默认为CPU核心数
+            cancel_check: 取消检查函数
+            progress_callback: 进度回调(已完成, 已提交, 已用时间, 速度)
+            log_callback: 日志回调(消息, 类型)
+            max_pending: 队列中等待转换的最大文件数，默认为进程数的4倍
+            remove_source: 转换成功（或输出已是最新）后是否删除源文件
+
+        Raises:
+            RuntimeError: 未找到FFmpeg
+        """
+        self.audio_dir = audio_dir
+        self.output_format = output_format.upper()
+        self.extension = f".{self.output_format.lower()}"
+        self.converted_dir = os.path.join(audio_dir, f"Audio_{self.output_format}")
+        self.ffmpeg_path = ffmpeg_path or shutil.which('ffmpeg')
+        if not self.ffmpeg_path:
+            raise RuntimeError("FFmpeg is not installed or not found in PATH")
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.cancel_check = cancel_check or (lambda: False)
+        self.progress_callback = progress_callback
+        self.log_callback = log_callback
+        self.remove_source = remove_source
+
+        self.stats = AudioConversionStats()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending or self.max_workers * 4)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._creationflags = 0
+        if os.name == 'nt' and hasattr(subprocess, 'CREATE_NO_WINDOW'):
+            self._creationflags = subprocess.CREATE_NO_WINDOW
+
+    def output_path_for(self, source_path: str) -> str:
+        """获取源文件对应的输出路径"""
+        rel_path = os.path.relpath(source_path, self.audio_dir)
+        if rel_path.startswith(os.pardir):
+            # 不在Audio目录下的文件直接输出到转换目录根部
+            rel_path = os.path.basename(source_path)
+        name = os.path.splitext(os.path.basename(rel_path))[0] + self.extension
+        return os.path.join(self.converted_dir, os.path.dirname(rel_path), name)
+
+    @staticmethod
+    def is_up_to_date(source_path: str, output_path: str) -> bool:
+        """输出文件存在、非空且不早于源文件时视为已是最新"""
+        try:
+            output_stat = os.stat(output_path)
+            return output_stat.st_size > 0 and output_stat.st_mtime >= os.stat(source_path).st_mtime
+        except OSError:
+            return False
+
+    def submit(self, source_path: str, data: Optional[bytes] = None,
+               on_done: Optional[Callable[[Optional[bool]], None]] = None):
+        """
+        提交一个要转换的文件（线程安全，可在提取过程中调用，队列已满时阻塞）
+
+        Args:
+            source_path: 源音频文件路径；提供data时只用于确定输出路径
+            data: 音频数据，提供时通过管道传给FFmpeg，源文件不需要存在
+            on_done: 完成回调，在转换线程中调用：成功（或已是最新）为True，
+                     失败为False，取消后未转换为None
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("converter already closed")
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._worker, name="AudioConvert", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self.stats.add_submitted()
+        self._queue.put((source_path, data, on_done))
+
+    def convert_all(self, source_paths: List[str]) -> Dict[str, Any]:
+        """
+        转换一批文件并等待完成
+
+        Args:
+            source_paths: 源音频文件路径列表
+
+        Returns:
+            Dict[str, Any]: 转换统计
+        """
+        for source_path in source_paths:
+            if self.cancel_check():
+                break
+            self.submit(source_path)
+        return self.close()
+
+    def close(self) -> Dict[str, Any]:
+        """
+        不再接受新文件，等待队列中的文件转换完成
+
+        Returns:
+            Dict[str, Any]: 转换统计，另含输出目录converted_dir
+        """
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+
+        result = self.stats.get_all()
+        result['converted_dir'] = self.converted_dir
+        return result
+
+    def _worker(self):
+        """工作线程：从队列取出文件并转换"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            source_path, data, on_done = item
+            converted = None if self.cancel_check() else self._convert(source_path, data)
+            if on_done is not None:
+                try:
+                    on_done(converted)
+                except Exception as e:
+                    logger.error(f"转换完成回调出错 {source_path}: {e}")
+            if converted is not None:
+                self._report_progress()
+
+    def _convert(self, source_path: str, data: Optional[bytes] = None) -> bool:
+        """
+        转换单个文件，data不为None时从管道读取输入
+
+        Returns:
+            bool: 是否转换成功（输出已是最新也视为成功）
+        """
+        name = os.path.basename(source_path)
+        output_path = self.output_path_for(source_path)
+        if data is None:
+            if os.path.splitext(source_path)[1].lower() == self.extension:
+                self.stats.record('skipped')
+                return True
+            if self.is_up_to_date(source_path, output_path):
+                self.stats.record('skipped')
+                self._remove_source(source_path)
+                return True
+
+        base, extension = os.path.splitext(output_path)
+        temp_path = f"{base}.part{extension}"  # 保留扩展名，FFmpeg据此选择封装格式
+        try:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            cmd = [self.ffmpeg_path, '-y', '-loglevel', 'error', '-i', source_path if data is None else 'pipe:0',
+                   '-threads', '1', *AUDIO_CODEC_ARGS.get(self.output_format, []), temp_path]
+            process = subprocess.run(cmd, input=data, stdin=subprocess.DEVNULL if data is None else None,
+                                     capture_output=True, creationflags=self._creationflags)
+            if process.returncode == 0:
+                os.replace(temp_path, output_path)
+                if data is None:
+                    self.stats.record('converted', os.path.getsize(source_path))
+                    self._remove_source(source_path)
+                else:
+                    self.stats.record('converted', len(data))
+                return True
+            error_msg = f"Failed to convert {name}: {process.stderr.decode('utf-8', errors='replace').strip()}"
+        except Exception as e:
+            error_msg = f"Error converting {name}: {e}"
+
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        self.stats.record('failed', error=error_msg)
+        logger.warning(error_msg)
+        if self.log_callback:
+            self.log_callback(error_msg, 'warning')
+        return False
+
+    def _remove_source(self, source_path: str):
+        """按设置删除已转换的源文件"""
+        if not self.remove_source:
+            return
+        try:
+            os.remove(source_path)
+        except OSError as e:
+            logger.warning(f"删除源文件失败 {source_path}: {e}")
+
+    def _report_progress(self):
+        """报告进度和吞吐量"""
+        if not self.progress_callback:
+            return
+        stats = self.stats.get_all()
+        done = stats['converted'] + stats['skipped'] + stats['failed']
+        self.progress_callback(done, stats['submitted'], stats['duration'], stats['files_per_second'])
@@ -26,6 +26,7 @@ from src.utils.multiprocessing_utils import (
     get_optimal_process_count,
     create_worker_function
 )
+from src.utils.stage_timer import StageTimer
 
 # 导入历史管理模块
 from src.utils.history_manager import ExtractedHistory, ContentHashCache
@@ -51,15 +52,17 @@ class ClassificationMethod(Enum):
     NONE = auto()  # 无分类
 
 
-def _process_file_worker(file_path: str, config: ProcessingConfig) -> Dict[str, Any]:
+def _process_file_worker(file_path: str, config: ProcessingConfig,
+                         timer: Optional[StageTimer] = None) -> Dict[str, Any]:
     """多进程工作函数 - 处理单个文件（已预处理去重）
     
     Args:
         file_path: 文件路径（已经预处理去重）
         config: 处理配置
+        timer: 阶段计时器（读取、哈希、写入），None时不统计
         
     Returns:
-        处理结果字典，包含 success, file_hash, content_hash, error 等字段
+        处理结果字典，包含 success, file_hash, content_hash, output_path, error 等字段
     """
     
     result = {
@@ -69,6 +72,8 @@ def _process_file_worker(file_path: str, config: ProcessingConfig) -> Dict[str,
         'error': None
     }
     
+    timer = timer or StageTimer()
+    
     try:
         # 导入所需模块 (在工作进程中重新导入)
         import os
@@ -76,7 +81,8 @@ def _process_file_worker(file_path: str, config: ProcessingConfig) -> Dict[str,
         import gzip
         
         # 读取并检查文件
-        file_content = _extract_ogg_content_worker(file_path)
+        with timer.span("read"):
+            file_content = _extract_ogg_content_worker(file_path)
         if not file_content:
             result['error'] = "无法提取内容"
             return result
@@ -86,18 +92,21 @@ def _process_file_worker(file_path: str, config: ProcessingConfig) -> Dict[str,
             result['error'] = "无效的音频格式"
             return result
             
-        # 计算内容哈希
-        content_hash = hashlib.md5(file_content[:8192]).hexdigest()
-        result['content_hash'] = content_hash
-        
-        # 计算文件哈希
-        file_hash = _get_file_hash_worker(file_path)
-        result['file_hash'] = file_hash
+        with timer.span("hash"):
+            # 计算内容哈希
+            content_hash = hashlib.md5(file_content[:8192]).hexdigest()
+            result['content_hash'] = content_hash
+            
+            # 计算文件哈希
+            file_hash = _get_file_hash_worker(file_path)
+            result['file_hash'] = file_hash
         
         # 文件已经预处理去重，直接保存
-        success, error_message = _save_ogg_file_worker(file_path, file_content, config)
+        with timer.span("write", bytes=len(file_content)):
+            success, error_message, output_path = _save_ogg_file_worker(file_path, file_content, config)
         if success:
             result['success'] = True
+            result['output_path'] = output_path
         else:
             result['success'] = False
             result['error'] = error_message
@@ -209,11 +218,11 @@ def _get_file_hash_worker(file_path: str) -> str:
     return hasher.hexdigest()
 
 
-def _save_ogg_file_worker(file_path: str, file_content: bytes, config: ProcessingConfig) -> Tuple[bool, Optional[str]]:
+def _save_ogg_file_worker(file_path: str, file_content: bytes, config: ProcessingConfig) -> Tuple[bool, Optional[str], Optional[str]]:
     """工作进程中的文件保存
     
     Returns:
-        (success, error_message): 成功标志和错误信息
+        (success, error_message, output_path): 成功标志、错误信息和保存路径
     """
     try:
         import os
@@ -242,7 +251,7 @@ def _save_ogg_file_worker(file_path: str, file_content: bytes, config: Processin
         try:
             os.makedirs(category_dir, exist_ok=True)
         except Exception as e:
-            return False, f"无法创建目录 {category_dir}: {str(e)}"
+            return False, f"无法创建目录 {category_dir}: {str(e)}", None
         
         output_path = os.path.join(category_dir, output_filename)
         
@@ -251,24 +260,24 @@ def _save_ogg_file_worker(file_path: str, file_content: bytes, config: Processin
             with open(output_path, 'wb') as f:
                 f.write(file_content)
         except Exception as e:
-            return False, f"无法写入文件 {output_path}: {str(e)}"
+            return False, f"无法写入文件 {output_path}: {str(e)}", None
         
         # 验证文件是否成功写入
         if not os.path.exists(output_path):
-            return False, f"文件保存后不存在: {output_path}"
+            return False, f"文件保存后不存在: {output_path}", None
             
         # 验证文件大小
         try:
             saved_size = os.path.getsize(output_path)
             if saved_size != len(file_content):
-                return False, f"文件大小不匹配: 期望 {len(file_content)}, 实际 {saved_size}"
+                return False, f"文件大小不匹配: 期望 {len(file_content)}, 实际 {saved_size}", None
         except Exception as e:
-            return False, f"无法验证文件大小: {str(e)}"
+            return False, f"无法验证文件大小: {str(e)}", None
         
-        return True, None
+        return True, None, output_path
         
     except Exception as e:
-        return False, f"保存文件时发生未知错误: {str(e)}"
+        return False, f"保存文件时发生未知错误: {str(e)}", None
 
 
 def _get_category_worker(file_path: str, file_content: bytes, config: ProcessingConfig) -> str:
@@ -420,6 +429,13 @@ class RobloxAudioExtractor:
         self._cancel_check_fn = None  # 用于存储外部取消检查函数
         self.scan_db = scan_db  # 是否扫描数据库
         self.log_callback = log_callback  # 日志回调函数
+        self.saved_files: List[str] = []  # 本次运行保存的音频文件
+        self._saved_files_lock = threading.Lock()
+        # 每保存一个文件时调用(保存路径)，用于边提取边转换（仅多线程模式）
+        self.saved_callback: Optional[Callable[[str], None]] = None
+        # 设置后不写出OGG文件，而是调用content_sink(本应保存的路径, 数据, 完成回调)（仅多线程模式），
+        # 完成回调参数：成功为True，失败为False（改为保存OGG文件），取消为None
+        self.content_sink: Optional[Callable[[str, bytes, Callable[[Optional[bool]], None]], None]] = None
 
         # 初始化库相关属性
         self.gzip = None
@@ -452,6 +468,8 @@ class RobloxAudioExtractor:
         # 初始化处理对象
         self.stats = ProcessingStats()
         self.hash_cache = ContentHashCache()
+        # 各阶段耗时（每次process_files重新统计）
+        self.stage_timer = StageTimer()
         self.file_lock = threading.Lock()
 
         # 文件计数器，使用原子操作而不是锁
@@ -515,7 +533,7 @@ class RobloxAudioExtractor:
 
         # 使用新的import_utils模块
         from src.utils.import_utils import import_libs
-        modules = import_libs()
+        modules = import_libs(include_gui=False)
         
         # 保存引用
         self.gzip = modules.get('gzip')
@@ -543,12 +561,20 @@ class RobloxAudioExtractor:
 
         self._libs_imported = True
 
-    def find_files_to_process(self) -> List[str]:
-        """查找需要处理的文件 - 使用统一的缓存扫描器"""
+    def find_files_to_process(self, cache_items: Optional[List[CacheItem]] = None) -> List[str]:
+        """
+        查找需要处理的文件 - 使用统一的缓存扫描器
+
+        Args:
+            cache_items: 要处理的缓存项目，None表示扫描缓存（监视模式只传入新出现的项目）
+        """
         files_to_process = []
         output_path_norm = os.path.normpath(self.output_dir)
         audio_path_norm = os.path.normpath(self.audio_dir)
 
+        if cache_items is not None:
+            return self._cache_items_to_files(cache_items)
+
         # 如果扫描数据库被禁用，只扫描指定的base_dir文件系统
         if not self.scan_db:
             def scan_directory(dir_path):
@@ -610,25 +636,7 @@ class RobloxAudioExtractor:
                         self.cache_scanner.set_custom_path(self.base_dir, False, "")
                 
                 # 扫描缓存项
-                cache_items = self.cache_scanner.scan_cache()
-                
-                # 转换缓存项为文件路径
-                for item in cache_items:
-                    if item.cache_type == CacheType.DATABASE and item.data:
-                        # 数据库内容，创建临时文件
-                        import tempfile
-                        db_scan_time = int(time.time())
-                        db_temp_dir = os.path.join(self.output_dir, f"db_temp_{db_scan_time}")
-                        os.makedirs(db_temp_dir, exist_ok=True)
-                        
-                        temp_file_path = os.path.join(db_temp_dir, f"{item.hash_id}")
-                        with open(temp_file_path, 'wb') as f:
-                            f.write(item.data)
-                        files_to_process.append(temp_file_path)
-                    elif item.path and os.path.exists(item.path):
-                        # 文件系统文件，直接使用路径
-                        files_to_process.append(item.path)
-                        
+                files_to_process = self._cache_items_to_files(self.cache_scanner.scan_cache())
                 logger.info(f"通过缓存扫描器找到 {len(files_to_process)} 个文件")
                 
             except Exception as e:
@@ -636,6 +644,25 @@ class RobloxAudioExtractor:
                 print(f"! 缓存扫描失败: {e}")
             
         return files_to_process
+
+    def _cache_items_to_files(self, cache_items: List[CacheItem]) -> List[str]:
+        """转换缓存项为文件路径，数据库中的内容写入临时文件"""
+        files_to_process = []
+        for item in cache_items:
+            if item.cache_type == CacheType.DATABASE and item.data:
+                # 数据库内容，创建临时文件
+                db_scan_time = int(time.time())
+                db_temp_dir = os.path.join(self.output_dir, f"db_temp_{db_scan_time}")
+                os.makedirs(db_temp_dir, exist_ok=True)
+
+                temp_file_path = os.path.join(db_temp_dir, f"{item.hash_id}")
+                with open(temp_file_path, 'wb') as f:
+                    f.write(item.data)
+                files_to_process.append(temp_file_path)
+            elif item.path and os.path.exists(item.path):
+                # 文件系统文件，直接使用路径
+                files_to_process.append(item.path)
+        return files_to_process
         
     def _calculate_content_hash_fast(self, file_path: str) -> Optional[str]:
         """快速计算文件内容哈希（只读前8KB）"""
@@ -715,14 +742,21 @@ class RobloxAudioExtractor:
         
         return deduplicated_files
         
-    def process_files(self) -> Dict[str, Any]:
-        """处理目录中的文件"""
+    def process_files(self, cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
+        """
+        处理目录中的文件
+
+        Args:
+            cache_items: 要处理的缓存项目，None表示扫描缓存（监视模式只传入新出现的项目）
+        """
         # 扫描文件并记录开始时间
         start_time = time.time()
+        self.stage_timer.reset()
         print(f"\n• 正在扫描文件...")
 
         # 查找要处理的文件
-        files_to_process = self.find_files_to_process()
+        with self.stage_timer.span("scan"):
+            files_to_process = self.find_files_to_process(cache_items)
 
         scan_duration = time.time() - start_time
         print(f"✓ 找到 {len(files_to_process)} 个文件 (耗时 {scan_duration:.2f} 秒)")
@@ -736,7 +770,8 @@ class RobloxAudioExtractor:
                 "errors": 0,
                 "output_dir": self.output_dir,
                 "duration": 0,
-                "files_per_second": 0
+                "files_per_second": 0,
+                "stages": self.stage_timer.breakdown()
             }
 
         # 重置统计信息
@@ -744,6 +779,8 @@ class RobloxAudioExtractor:
         self.hash_cache.clear()
         self.processed_count = 0
         self.cancelled = False
+        with self._saved_files_lock:
+            self.saved_files = []
 
         # 处理文件
         processing_start = time.time()
@@ -760,7 +797,8 @@ class RobloxAudioExtractor:
 
         # 预处理去重步骤
         preprocessing_start = time.time()
-        files_to_process = self._preprocess_and_deduplicate_files(files_to_process)
+        with self.stage_timer.span("preprocess", files=len(files_to_process)):
+            files_to_process = self._preprocess_and_deduplicate_files(files_to_process)
         preprocessing_duration = time.time() - preprocessing_start
         
         # 如果预处理后没有文件需要处理
@@ -773,7 +811,8 @@ class RobloxAudioExtractor:
                 "errors": 0,
                 "output_dir": self.output_dir,
                 "duration": preprocessing_duration,
-                "files_per_second": 0
+                "files_per_second": 0,
+                "stages": self.stage_timer.breakdown()
             }
         
         print(f"• 预处理耗时 {preprocessing_duration:.2f} 秒，开始多进程处理...")
@@ -797,7 +836,8 @@ class RobloxAudioExtractor:
             num_processes=self.num_processes,
             conservative=self.conservative_multiprocessing,
             progress_callback=progress_callback,
-            cancel_check=lambda: self.is_cancelled()
+            cancel_check=lambda: self.is_cancelled(),
+            stage_timer=self.stage_timer
         )
 
         # 创建工作函数
@@ -805,14 +845,17 @@ class RobloxAudioExtractor:
 
         try:
             # 执行多进程处理
-            result = manager.process_items(
-                items=files_to_process,
-                worker_func=worker_func,
-                config=config
-            )
+            with self.stage_timer.span("process", files=len(files_to_process)):
+                result = manager.process_items(
+                    items=files_to_process,
+                    worker_func=worker_func,
+                    config=config
+                )
             
             result_stats = result.get('stats', {})
             processed_hashes = result.get('processed_hashes', [])
+            for output_path in result.get('results', []):
+                self._record_saved_file(output_path)
 
             # 批量添加成功处理的哈希到历史记录
             if self.download_history and processed_hashes:
@@ -821,7 +864,8 @@ class RobloxAudioExtractor:
                     self.download_history.add_hash(file_hash, 'audio')
                 
                 # 保存历史记录
-                self.download_history.save_history()
+                with self.stage_timer.span("history_save"):
+                    self.download_history.save_history()
                 print(f"✓ 已保存历史记录")
 
         except Exception as e:
@@ -829,7 +873,8 @@ class RobloxAudioExtractor:
             result_stats = {'processed_files': 0, 'duplicate_files': 0, 'error_files': 0, 'already_processed': 0}
 
         # 清理临时文件夹
-        self._cleanup_temp_directories()
+        with self.stage_timer.span("cleanup"):
+            self._cleanup_temp_directories()
 
         # 计算最终统计
         total_time = time.time() - processing_start
@@ -842,7 +887,8 @@ class RobloxAudioExtractor:
             "errors": result_stats.get('error_files', 0),
             "output_dir": self.output_dir,
             "duration": total_time,
-            "files_per_second": files_per_second
+            "files_per_second": files_per_second,
+            "stages": self.stage_timer.breakdown()
         }
 
     def _process_files_threading(self, files_to_process: List[str], processing_start: float) -> Dict[str, Any]:
@@ -874,27 +920,30 @@ class RobloxAudioExtractor:
                     # 确保任何一个任务的失败不会中断整个处理
                     pass
 
-        # 启动工作线程
-        threads = []
-        for _ in range(self.num_threads):
-            thread = threading.Thread(target=worker)
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
+        with self.stage_timer.span("process", files=len(files_to_process)):
+            # 启动工作线程
+            threads = []
+            for _ in range(self.num_threads):
+                thread = threading.Thread(target=worker)
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
 
-        # 等待所有工作完成
-        try:
-            work_queue.join()
-        except KeyboardInterrupt:
-            self.cancelled = True
-            print("\n操作被用户取消.")
+            # 等待所有工作完成
+            try:
+                work_queue.join()
+            except KeyboardInterrupt:
+                self.cancelled = True
+                print("\n操作被用户取消.")
 
         # 保存历史记录
         if self.download_history:
-            self.download_history.save_history()
+            with self.stage_timer.span("history_save"):
+                self.download_history.save_history()
 
         # 清理临时文件夹
-        self._cleanup_temp_directories()
+        with self.stage_timer.span("cleanup"):
+            self._cleanup_temp_directories()
 
         # 计算结果统计
         total_time = time.time() - processing_start
@@ -908,7 +957,8 @@ class RobloxAudioExtractor:
             "errors": stats['error_files'],
             "output_dir": self.output_dir,
             "duration": total_time,
-            "files_per_second": files_per_second
+            "files_per_second": files_per_second,
+            "stages": self.stage_timer.breakdown()
         }
 
     def _cleanup_temp_directories(self):
@@ -929,6 +979,18 @@ class RobloxAudioExtractor:
     def set_cancel_check(self, check_fn):
         """设置取消检查函数"""
         self._cancel_check_fn = check_fn
+    
+    def _record_saved_file(self, output_path: str):
+        """记录本次运行保存的音频文件"""
+        with self._saved_files_lock:
+            self.saved_files.append(output_path)
+        if self.saved_callback is not None:
+            self.saved_callback(output_path)
+    
+    def get_saved_files(self) -> List[str]:
+        """获取本次运行保存的音频文件路径"""
+        with self._saved_files_lock:
+            return list(self.saved_files)
         
     def is_cancelled(self):
         """检查是否应该取消处理"""
@@ -943,7 +1005,8 @@ class RobloxAudioExtractor:
 
         try:
             # 读取文件内容
-            file_content = self._extract_ogg_content(file_path)
+            with self.stage_timer.span("read"):
+                file_content = self._extract_ogg_content(file_path)
             if not file_content:
                 return False
 
@@ -952,7 +1015,8 @@ class RobloxAudioExtractor:
                 return False
                 
             # 计算内容哈希
-            content_hash = hashlib.md5(file_content[:8192]).hexdigest()
+            with self.stage_timer.span("hash"):
+                content_hash = hashlib.md5(file_content[:8192]).hexdigest()
             
             # 先检查内容是否已在历史记录中
             if self.download_history and self.download_history.is_content_processed(content_hash):
@@ -960,7 +1024,8 @@ class RobloxAudioExtractor:
                 return False
                 
             # 计算文件哈希（包含内容和路径信息）
-            file_hash = self._get_file_hash(file_path)
+            with self.stage_timer.span("hash"):
+                file_hash = self._get_file_hash(file_path)
             
             # 检查完整文件哈希是否已处理过
             if self.download_history and self.download_history.is_processed(file_hash):
@@ -972,16 +1037,15 @@ class RobloxAudioExtractor:
                 self.stats.increment('duplicate_files')
                 return False
 
+            # 交给content_sink（如转换器）时，转换完成后才记录为已提取
+            sink = self.content_sink
+            if sink is not None:
+                return self._submit_to_sink(sink, file_path, file_content, file_hash)
+
             # 保存文件
             output_path = self._save_ogg_file(file_path, file_content)
             if output_path:
-                # 成功保存文件，增加处理计数
-                self.stats.increment('processed_files')
-
-                # 如果可用，将哈希添加到提取历史记录
-                if self.download_history:
-                    self.download_history.add_hash(file_hash)
-
+                self._record_extracted(output_path, file_hash)
                 return True
 
             return False
@@ -993,6 +1057,49 @@ class RobloxAudioExtractor:
             self._log_error(file_path, str(e))
             return False
 
+    def _record_extracted(self, output_path: str, file_hash: str):
+        """记录一个已提取的音频：处理计数、本次保存的文件和提取历史"""
+        self.stats.increment('processed_files')
+        self._record_saved_file(output_path)
+        if self.download_history:
+            self.download_history.add_hash(file_hash)
+
+    def _submit_to_sink(self, sink: Callable, file_path: str, content: bytes, file_hash: str) -> bool:
+        """
+        把音频数据交给content_sink，完成回调报告成功后才记录为已提取
+
+        转换失败时改为保存OGG文件；取消时不记录，下次运行会重新提取。
+
+        Args:
+            sink: content_sink
+            file_path: 源缓存文件路径
+            content: 音频数据
+            file_hash: 文件哈希
+
+        Returns:
+            bool: 是否已提交
+        """
+        output_path = self._save_ogg_file(file_path, content, path_only=True)
+        if not output_path:
+            return False
+
+        def on_done(converted: Optional[bool]):
+            if converted:
+                self._record_extracted(output_path, file_hash)
+            elif converted is False:
+                try:
+                    with self.stage_timer.span("write", bytes=len(content)):
+                        with open(output_path, 'wb') as f:
+                            f.write(content)
+                except OSError as e:
+                    self.stats.increment('error_files')
+                    self._log_error(file_path, f"Failed to save file: {str(e)}")
+                    return
+                self._record_extracted(output_path, file_hash)
+
+        sink(output_path, content, on_done)
+        return True
+
     def _extract_ogg_content(self, file_path: str) -> Optional[bytes]:
         """提取文件中的OGG内容
         
@@ -1155,8 +1262,18 @@ class RobloxAudioExtractor:
         # 默认类别：如果没有匹配项，分配到第一个类别
         return next(iter(self.size_categories.keys()))
 
-    def _save_ogg_file(self, source_path: str, content: bytes) -> Optional[str]:
-        """保存提取的OGG文件 - 使用更高效的文件写入"""
+    def _save_ogg_file(self, source_path: str, content: bytes, path_only: bool = False) -> Optional[str]:
+        """
+        保存提取的OGG文件 - 使用更高效的文件写入
+
+        Args:
+            source_path: 源缓存文件路径
+            content: 音频数据
+            path_only: 只确定保存路径、不写出OGG文件（按时长分类时仍需临时文件）
+
+        Returns:
+            Optional[str]: 保存路径，失败时为None
+        """
         try:
             # 获取源文件的原始文件名
             base_name = os.path.basename(source_path)
@@ -1176,14 +1293,18 @@ class RobloxAudioExtractor:
             temp_name = f"temp_{base_name}.ogg"
             temp_path = os.path.join(self.output_dir, temp_name)
 
-            # 保存临时文件
-            with open(temp_path, 'wb', buffering=1024 * 8) as f:
-                f.write(content)
+            # 只确定路径时，只有按时长分类才需要临时文件
+            write_temp = not path_only or self.classification_method == ClassificationMethod.DURATION
+            if write_temp:
+                with self.stage_timer.span("write", bytes=len(content)):
+                    with open(temp_path, 'wb', buffering=1024 * 8) as f:
+                        f.write(content)
 
             # 确定分类类别和输出目录
             if self.classification_method == ClassificationMethod.DURATION:
                 # 按时长分类
-                category = self._get_duration_category(temp_path)
+                with self.stage_timer.span("ffprobe"):
+                    category = self._get_duration_category(temp_path)
                 output_dir = self.category_dirs[category]
             elif self.classification_method == ClassificationMethod.SIZE:
                 # 按大小分类
@@ -1203,8 +1324,14 @@ class RobloxAudioExtractor:
                 output_name = f"{base_name}_{timestamp}.ogg"
                 output_path = os.path.join(output_dir, output_name)
 
+            if path_only:
+                if write_temp:
+                    os.remove(temp_path)
+                return output_path
+
             # 移动文件到正确的类别目录
-            self.shutil.move(temp_path, output_path)
+            with self.stage_timer.span("move"):
+                self.shutil.move(temp_path, output_path)
 
             return output_path
 
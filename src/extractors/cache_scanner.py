@@ -11,6 +11,7 @@ import sqlite3
 import logging
 import threading
 import time
+from contextlib import closing
 from typing import List, Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -23,6 +24,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 增量扫描时等待未写完文件的最长时间（秒）
+PENDING_TIMEOUT = 300.0
+
 def get_text(key, default=""):
     """获取翻译文本"""
     if lang and hasattr(lang, 'get'):
@@ -56,6 +60,9 @@ class RobloxCacheScanner:
         self.target_is_database = False
         self.db_folder = ""
         self.known_items = set()  # 已知项目，避免重复处理
+        self._pending_items: Dict[str, float] = {}  # 尚未写完的项目 -> 首次发现时间
+        self._last_rowid = 0  # 增量扫描数据库时已处理的最大rowid
+        self._use_rowid = True
         self._lock = threading.Lock()
         self._has_fallback_warned = False  # 避免重复警告
         self.log_callback = log_callback  # 日志回调函数
@@ -147,6 +154,21 @@ class RobloxCacheScanner:
     
 
     
+    def set_cache_path(self, path: str):
+        """
+        根据路径自动判断缓存模式并设置为自定义缓存路径
+
+        Args:
+            path: .db数据库文件、rbx-storage文件夹（旁边有同名.db时按数据库处理）或缓存目录
+        """
+        folder = os.path.normpath(path)
+        if path.endswith('.db'):
+            self.set_custom_path(path, True, os.path.splitext(path)[0])
+        elif os.path.basename(folder) == 'rbx-storage' and os.path.isfile(folder + '.db'):
+            self.set_custom_path(folder + '.db', True, folder)
+        else:
+            self.set_custom_path(path, False, "")
+
     def scan_cache(self, callback: Optional[Callable[[CacheItem], None]] = None) -> List[CacheItem]:
         """
         扫描缓存并返回新发现的项目
@@ -314,44 +336,15 @@ class RobloxCacheScanner:
                     try:
                         # 处理ID字段
                         if row[0] is not None:
-                            if isinstance(row[0], bytes):
-                                hash_id = row[0].hex().lower()
-                            else:
-                                hash_id = str(row[0]).lower()
-                            
-
-                            
-                            cache_item = None
-                            
-                            # 检查是否有直接内容
-                            if row[1] is not None:
-                                # 有内容，直接使用
-                                cache_item = CacheItem(
-                                    path=hash_id,
-                                    data=row[1],
-                                    hash_id=hash_id,
-                                    cache_type=CacheType.DATABASE
-                                )
-                            else:
-                                # 没有内容，从文件夹获取
-                                byte1 = hash_id[:2]
-                                file_path = os.path.join(self.db_folder, byte1, hash_id)
-                                
-                                if os.path.exists(file_path):
-                                    cache_item = CacheItem(
-                                        path=file_path,
-                                        data=None,
-                                        hash_id=hash_id,
-                                        cache_type=CacheType.FILE_SYSTEM
-                                    )
-                                else:
-                                    logger.debug(f"无法找到哈希文件: {hash_id}")
-                                    continue
-                            
-                            if cache_item:
-                                new_items.append(cache_item)
-                                if callback:
-                                    callback(cache_item)
+                            hash_id = self._normalize_hash_id(row[0])
+                            cache_item = self._database_row_to_item(hash_id, row[1])
+                            if cache_item is None:
+                                logger.debug(f"无法找到哈希文件: {hash_id}")
+                                continue
+
+                            new_items.append(cache_item)
+                            if callback:
+                                callback(cache_item)
                                     
                     except Exception as e:
                         logger.error(f"处理数据库行时出错: {e}")
@@ -365,6 +358,44 @@ class RobloxCacheScanner:
             
         return new_items
     
+    @staticmethod
+    def _normalize_hash_id(raw_id) -> str:
+        """把数据库中的ID（可能是bytes）转换为小写十六进制字符串"""
+        if isinstance(raw_id, bytes):
+            return raw_id.hex().lower()
+        return str(raw_id).lower()
+
+    def _database_row_to_item(self, hash_id: str, content: Optional[bytes]) -> Optional[CacheItem]:
+        """
+        把数据库中的一行转换为缓存项目
+
+        Args:
+            hash_id: 项目哈希ID
+            content: 数据库中的内容，为None时内容保存在数据库文件夹中
+
+        Returns:
+            Optional[CacheItem]: 缓存项目，文件夹中找不到对应文件时返回None
+        """
+        if content is not None:
+            # 有内容，直接使用
+            return CacheItem(
+                path=hash_id,
+                data=content,
+                hash_id=hash_id,
+                cache_type=CacheType.DATABASE
+            )
+
+        # 没有内容，从文件夹获取
+        file_path = os.path.join(self.db_folder, hash_id[:2], hash_id)
+        if not os.path.exists(file_path):
+            return None
+        return CacheItem(
+            path=file_path,
+            data=None,
+            hash_id=hash_id,
+            cache_type=CacheType.FILE_SYSTEM
+        )
+
     def _scan_file_system(self, callback: Optional[Callable[[CacheItem], None]] = None) -> List[CacheItem]:
         """
         扫描文件系统缓存
@@ -411,7 +442,166 @@ class RobloxCacheScanner:
         """清空已知项目缓存"""
         with self._lock:
             self.known_items.clear()
+            self._pending_items.clear()
+            self._last_rowid = 0
         logger.info("已清空已知项目缓存")
+
+    def prime_known_items(self) -> int:
+        """
+        把缓存中当前存在的全部项目标记为已知，之后scan_new_items只返回新出现的项目
+
+        数据库模式只记录max(rowid)，不读取内容；表没有rowid时退化为记录全部ID。
+
+        Returns:
+            int: 已知项目数量
+        """
+        with self._lock:
+            self.known_items.clear()
+            self._pending_items.clear()
+            self._last_rowid = 0
+            self._use_rowid = True
+
+            if not self._validate_target_path():
+                return 0
+
+            try:
+                if self.target_is_database:
+                    with closing(sqlite3.connect(self.target_path, timeout=10.0)) as conn:
+                        try:
+                            self._last_rowid = conn.execute("SELECT max(rowid) FROM files").fetchone()[0] or 0
+                            return conn.execute("SELECT count(*) FROM files").fetchone()[0]
+                        except sqlite3.OperationalError:
+                            # WITHOUT ROWID表，改为比较ID集合
+                            self._use_rowid = False
+                            self.known_items.update(
+                                self._normalize_hash_id(row[0])
+                                for row in conn.execute("SELECT id FROM files") if row[0] is not None)
+                else:
+                    with os.scandir(self.target_path) as entries:
+                        self.known_items.update(entry.name for entry in entries if entry.is_file())
+            except (sqlite3.Error, OSError) as e:
+                logger.error(f"记录已知缓存项目失败: {e}")
+
+            return len(self.known_items)
+
+    def scan_new_items(self, settle_time: float = 0.0) -> List[CacheItem]:
+        """
+        增量扫描：只返回上次扫描（或prime_known_items）之后新出现的项目
+
+        数据库模式查询rowid大于上次最大值的行；文件系统模式与known_items比较。
+        修改时间距今不足settle_time秒（可能仍在写入）或文件还不存在的项目会暂缓，
+        在之后的扫描中再次检查。
+
+        Args:
+            settle_time: 文件最后修改后需要保持不变的秒数
+
+        Returns:
+            List[CacheItem]: 新出现且已写完的缓存项目
+        """
+        with self._lock:
+            if not self._validate_target_path():
+                return []
+            try:
+                if self.target_is_database:
+                    return self._scan_new_database_items(settle_time)
+                return self._scan_new_file_system_items(settle_time)
+            except (sqlite3.Error, OSError) as e:
+                logger.error(f"增量扫描缓存失败: {e}")
+                return []
+
+    def get_pending_count(self) -> int:
+        """获取暂缓处理（可能仍在写入）的项目数量"""
+        with self._lock:
+            return len(self._pending_items)
+
+    def _is_settled(self, path: str, settle_time: float, now: float) -> bool:
+        """文件是否存在且最后修改时间距今至少settle_time秒"""
+        try:
+            return now - os.stat(path).st_mtime >= settle_time
+        except OSError:
+            return False
+
+    def _take_settled(self, hash_id: str, item: Optional[CacheItem], settle_time: float,
+                      now: float, new_items: List[CacheItem]):
+        """已写完的项目加入结果并标记为已知，否则加入暂缓列表"""
+        if item is not None and (item.data is not None or self._is_settled(item.path, settle_time, now)):
+            self._pending_items.pop(hash_id, None)
+            self.known_items.add(hash_id)
+            new_items.append(item)
+        elif now - self._pending_items.setdefault(hash_id, now) > PENDING_TIMEOUT:
+            # 长时间没有出现的文件不再等待
+            logger.debug(f"放弃等待缓存文件: {hash_id}")
+            del self._pending_items[hash_id]
+            self.known_items.add(hash_id)
+
+    def _scan_new_database_items(self, settle_time: float) -> List[CacheItem]:
+        """增量扫描数据库缓存"""
+        new_items = []
+        now = time.time()
+
+        # 先重新检查暂缓的项目（内容在数据库文件夹中，之前还没写完）
+        for hash_id in list(self._pending_items):
+            self._take_settled(hash_id, self._database_row_to_item(hash_id, None), settle_time, now, new_items)
+
+        with closing(sqlite3.connect(self.target_path, timeout=10.0)) as conn:
+            if self._use_rowid:
+                max_rowid = conn.execute("SELECT max(rowid) FROM files").fetchone()[0] or 0
+                if max_rowid < self._last_rowid:
+                    # 缓存被清空后rowid重新开始
+                    self._last_rowid = 0
+                rows = conn.execute("SELECT rowid, id, content FROM files WHERE rowid > ? ORDER BY rowid",
+                                    (self._last_rowid,))
+                for rowid, raw_id, content in rows:
+                    self._last_rowid = rowid
+                    if raw_id is None:
+                        continue
+                    hash_id = self._normalize_hash_id(raw_id)
+                    if hash_id in self.known_items:
+                        continue
+                    self._take_settled(hash_id, self._database_row_to_item(hash_id, content),
+                                       settle_time, now, new_items)
+            else:
+                for (raw_id,) in conn.execute("SELECT id FROM files").fetchall():
+                    if raw_id is None:
+                        continue
+                    hash_id = self._normalize_hash_id(raw_id)
+                    if hash_id in self.known_items or hash_id in self._pending_items:
+                        continue
+                    row = conn.execute("SELECT content FROM files WHERE id = ?", (raw_id,)).fetchone()
+                    if row is not None:
+                        self._take_settled(hash_id, self._database_row_to_item(hash_id, row[0]),
+                                           settle_time, now, new_items)
+
+        return new_items
+
+    def _scan_new_file_system_items(self, settle_time: float) -> List[CacheItem]:
+        """增量扫描文件系统缓存"""
+        new_items = []
+        now = time.time()
+        names = set()
+
+        with os.scandir(self.target_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                names.add(entry.name)
+                if entry.name in self.known_items:
+                    continue
+                item = CacheItem(
+                    path=entry.path,
+                    data=None,
+                    hash_id=entry.name,
+                    cache_type=CacheType.FILE_SYSTEM
+                )
+                self._take_settled(entry.name, item, settle_time, now, new_items)
+
+        # 被删除的文件不再需要记录
+        self.known_items.intersection_update(names)
+        for hash_id in list(self._pending_items):
+            if hash_id not in names:
+                del self._pending_items[hash_id]
+
+        return new_items
     
     def get_known_items_count(self) -> int:
         """获取已知项目数量"""
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+缓存监视器 - 在后台等待Roblox缓存变化，只把新出现的缓存项目交给提取器
+Cache Watcher - Waits for Roblox cache changes in the background and hands only new cache items to extractors
+"""
+
+import os
+import sys
+import time
+import select
+import logging
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from .cache_scanner import RobloxCacheScanner, CacheItem
+
+logger = logging.getLogger(__name__)
+
+# Windows变更通知
+_FILE_NOTIFY_CHANGE_FILE_NAME = 0x001
+_FILE_NOTIFY_CHANGE_SIZE = 0x008
+_FILE_NOTIFY_CHANGE_LAST_WRITE = 0x010
+_WAIT_OBJECT_0 = 0
+_INVALID_HANDLE_VALUE = -1
+# 后台模式同时降低线程的CPU和I/O优先级
+_THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+
+# Linux inotify事件
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+# 有系统通知时，醒来检查停止标志的间隔，以及不依赖通知的兜底检查间隔（秒）
+_STOP_CHECK_INTERVAL = 1.0
+_NOTIFIED_POLL_INTERVAL = 10.0
+
+# 监视线程的nice增量（Linux）
+_WATCH_NICE_INCREMENT = 10
+
+
+def lower_current_thread_priority() -> bool:
+    """
+    降低当前线程的调度优先级
+
+    Windows使用线程后台模式（同时降低I/O优先级）；Linux上nice值按线程生效，
+    之后由该线程创建的线程也会继承。其他系统上nice作用于整个进程，因此不做修改。
+
+    Returns:
+        bool: 是否成功降低优先级
+    """
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_MODE_BACKGROUND_BEGIN))
+        if sys.platform.startswith('linux') and hasattr(threading, 'get_native_id'):
+            thread_id = threading.get_native_id()
+            nice = os.getpriority(os.PRIO_PROCESS, thread_id)
+            os.setpriority(os.PRIO_PROCESS, thread_id, min(19, nice + _WATCH_NICE_INCREMENT))
+            return True
+    except (OSError, AttributeError) as e:
+        logger.debug(f"降低监视线程优先级失败: {e}")
+    return False
+
+
+def create_watch_scanner(cache_path: Optional[str] = None) -> RobloxCacheScanner:
+    """
+    为监视模式创建独立的扫描器，不影响提取器使用的全局扫描器
+
+    Args:
+        cache_path: 缓存路径（.db数据库、rbx-storage文件夹或缓存目录），None表示自动检测
+
+    Returns:
+        RobloxCacheScanner: 扫描器
+    """
+    scanner = RobloxCacheScanner()
+    if cache_path:
+        scanner.set_cache_path(cache_path)
+    return scanner
+
+
+class _ChangeNotifier:
+    """目录变更通知：Windows使用FindFirstChangeNotificationW，Linux使用inotify，其他系统不可用"""
+
+    def __init__(self, directory: str):
+        self._handle = None
+        self._inotify_fd = None
+        try:
+            if sys.platform == 'win32':
+                self._open_windows(directory)
+            elif sys.platform.startswith('linux'):
+                self._open_inotify(directory)
+        except (OSError, AttributeError) as e:
+            logger.debug(f"无法监听目录变更，改用定时检查: {e}")
+            self.close()
+
+    @property
+    def available(self) -> bool:
+        """是否有系统变更通知"""
+        return self._handle is not None or self._inotify_fd is not None
+
+    def _open_windows(self, directory: str):
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+        kernel32.FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+        kernel32.FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+        handle = kernel32.FindFirstChangeNotificationW(
+            directory, False,
+            _FILE_NOTIFY_CHANGE_FILE_NAME | _FILE_NOTIFY_CHANGE_SIZE | _FILE_NOTIFY_CHANGE_LAST_WRITE)
+        if handle is None or handle == ctypes.c_void_p(_INVALID_HANDLE_VALUE).value:
+            raise OSError(ctypes.get_last_error(), "FindFirstChangeNotificationW失败")
+        self._kernel32 = kernel32
+        self._handle = handle
+
+    def _open_inotify(self, directory: str):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1失败")
+        mask = _IN_CREATE | _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, "inotify_add_watch失败")
+        self._inotify_fd = fd
+
+    def wait(self, timeout: float) -> bool:
+        """
+        等待目录变化
+
+        Args:
+            timeout: 最长等待秒数
+
+        Returns:
+            bool: 可能有变化时返回True
+        """
+        if self._handle is not None:
+            if self._kernel32.WaitForSingleObject(self._handle, int(timeout * 1000)) != _WAIT_OBJECT_0:
+                return False
+            self._kernel32.FindNextChangeNotification(self._handle)
+            return True
+        if self._inotify_fd is not None:
+            readable, _, _ = select.select([self._inotify_fd], [], [], timeout)
+            if not readable:
+                return False
+            # 只关心是否有事件，读空队列即可
+            try:
+                while os.read(self._inotify_fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+            return True
+        return False
+
+    def close(self):
+        """释放通知句柄"""
+        if self._handle is not None:
+            self._kernel32.FindCloseChangeNotification(self._handle)
+            self._handle = None
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+
+class CacheWatcher:
+    """
+    缓存监视器 - 在低优先级线程中等待缓存变化，防抖后增量扫描并分批交给回调处理
+
+    数据库模式通过max(rowid)只读取新插入的行，文件系统模式与已知文件集合比较；
+    启动时已存在的缓存项目不会被处理。
+    """
+
+    def __init__(self,
+                 scanner: RobloxCacheScanner,
+                 batch_callback: Callable[[List[CacheItem]], None],
+                 poll_interval: float = 2.0,
+                 debounce: float = 1.5,
+                 max_batch_delay: float = 15.0,
+                 log_callback: Optional[Callable] = None):
+        """
+        初始化缓存监视器
+
+        Args:
+            scanner: 缓存扫描器（应为监视器独占，见create_watch_scanner）
+            batch_callback: 处理一批新缓存项目的回调，在监视线程中同步调用
+            poll_interval: 没有系统变更通知时检查缓存的间隔（秒）
+            debounce: 缓存停止变化多少秒后才开始提取；新文件也需要保持这么久不变
+            max_batch_delay: 缓存持续变化时，最多推迟多少秒开始提取
+            log_callback: 日志回调函数
+        """
+        self.scanner = scanner
+        self.batch_callback = batch_callback
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.max_batch_delay = max_batch_delay
+        self.log_callback = log_callback
+
+        self.batches = 0
+        self.items_processed = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def send_log(self, message_key: str, log_type: str, *args):
+        """发送日志消息到界面"""
+        if self.log_callback:
+            self.log_callback(message_key, log_type, *args)
+
+    def start(self):
+        """在后台守护线程中开始监视"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name="CacheWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = False):
+        """
+        停止监视（正在处理的一批会先完成）
+
+        Args:
+            wait: 是否等待监视线程结束
+        """
+        self._stop_event.set()
+        if wait and self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    @property
+    def is_stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def _watched_directory(self) -> str:
+        """需要监听变更的目录：数据库所在目录或缓存目录本身"""
+        if self.scanner.target_is_database:
+            return os.path.dirname(os.path.abspath(self.scanner.target_path))
+        return self.scanner.target_path
+
+    def _signature(self) -> Tuple:
+        """缓存状态签名：数据库及其WAL文件，或缓存目录的修改时间和大小"""
+        if self.scanner.target_is_database:
+            paths = (self.scanner.target_path, self.scanner.target_path + '-wal')
+        else:
+            paths = (self.scanner.target_path,)
+        signature = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _settle(self, signature: Tuple) -> Tuple:
+        """防抖：等待缓存在debounce秒内不再变化，最多等待max_batch_delay秒"""
+        deadline = time.monotonic() + self.max_batch_delay
+        while not self._stop_event.wait(self.debounce):
+            current = self._signature()
+            if current == signature or time.monotonic() >= deadline:
+                return current
+            signature = current
+        return signature
+
+    def run(self):
+        """监视循环，直到stop()被调用（阻塞当前线程）"""
+        lower_current_thread_priority()
+
+        if not self.scanner.get_cache_info()["path_exists"]:
+            self.send_log("cache_path_not_found", "error")
+            return
+
+        known = self.scanner.prime_known_items()
+        last_signature = self._signature()
+        last_check = time.monotonic()
+        notifier = _ChangeNotifier(self._watched_directory())
+        # 系统通知可能漏报（如Windows延迟更新修改时间），仍然定期比较签名
+        check_interval = _NOTIFIED_POLL_INTERVAL if notifier.available else self.poll_interval
+        logger.info(f"开始监视缓存: {self.scanner.target_path}，系统通知: {notifier.available}")
+        self.send_log("watch_started", "info", known)
+
+        try:
+            while not self._stop_event.is_set():
+                if notifier.available:
+                    changed = notifier.wait(_STOP_CHECK_INTERVAL)
+                else:
+                    changed = False
+                    self._stop_event.wait(self.poll_interval)
+                if self._stop_event.is_set():
+                    break
+
+                pending = self.scanner.get_pending_count()
+                if not changed and not pending and time.monotonic() - last_check < check_interval:
+                    continue
+                last_check = time.monotonic()
+
+                signature = self._signature()
+                if signature == last_signature and not pending:
+                    continue
+
+                signature = self._settle(signature)
+                if self._stop_event.is_set():
+                    break
+                last_signature = signature
+
+                items = self.scanner.scan_new_items(self.debounce)
+                if items:
+                    self._dispatch(items)
+        finally:
+            notifier.close()
+            logger.info(f"停止监视缓存，共处理 {self.batches} 批 {self.items_processed} 个项目")
+            self.send_log("watch_stopped", "info", self.items_processed)
+
+    def _dispatch(self, items: List[CacheItem]):
+        """把一批新项目交给回调处理"""
+        self.batches += 1
+        self.items_processed += len(items)
+        self.send_log("watch_new_items", "info", len(items))
+        try:
+            self.batch_callback(items)
+        except Exception as e:
+            logger.error(f"处理新缓存项目失败: {e}")
+            self.send_log("watch_batch_failed", "error", str(e))
@@ -5,7 +5,7 @@
 Content Identifier - Implements Roblox content identification functionality
 """
 
-import struct
+import re
 import logging
 from enum import Enum, auto
 from typing import Tuple, Optional
@@ -40,8 +40,41 @@ class IdentifiedContent:
         self.type_name = type_name
         self.category = category
 
+# 签名匹配方式
+_CONTAINS = 0   # 开头部分包含签名
+_PREFIX = 1     # 开头部分以签名开头
+_MAGIC = 2      # 完整内容以魔术字节开头（不受开头长度限制）
+_CUSTOM = 3     # 自定义检查函数 (content, begin_size) -> bool
+
+# 识别内容时检查的开头长度
+_BEGIN_SIZE = 48
+
+
+def _is_mp3_frame_sync(content: bytes, begin_size: int) -> bool:
+    """MP3帧同步字（无ID3标签的MP3）"""
+    # 命中"包含"类签名时会跳过首字节分组完整检查规则表，因此这里必须自行检查首字节
+    return len(content) > 2 and content[0] == 0xFF and (content[1] & 0xE0) == 0xE0
+
+
+def _is_riff_webp(content: bytes, begin_size: int) -> bool:
+    """RIFF容器中的WebP图片"""
+    return content.startswith(b"RIFF", 0, begin_size) and content.find(b"WEBP", 0, begin_size) != -1
+
+
+def _is_riff_webm(content: bytes, begin_size: int) -> bool:
+    """RIFF容器中的WebM视频（不区分大小写）"""
+    return content.startswith(b"RIFF", 0, begin_size) and b"WEBM" in content[:begin_size].upper()
+
+
 class ContentIdentifier:
-    """内容识别器 - 识别Roblox内容类型"""
+    """
+    内容识别器 - 识别Roblox内容类型
+    
+    签名按优先级预先编译为规则表。所有"包含"类签名合并为一个正则表达式，
+    在开头部分上一次扫描；没有命中时（大多数二进制资源）只需检查按首字节
+    分组的文件头规则，命中时按原有优先级完整检查一遍。匹配直接在原始字节上
+    用带范围的search/startswith完成，不解码、不切片，结果使用预先创建的实例。
+    """
     
     def __init__(self, block_avatar_images: bool = True):
         """
@@ -51,129 +84,117 @@ class ContentIdentifier:
             block_avatar_images: 是否阻止头像图片
         """
         self.block_avatar_images = block_avatar_images
+        self._empty = IdentifiedContent(AssetType.Unknown, "", "empty content", "")
+        self._unknown = IdentifiedContent(AssetType.Unknown, "", "", "")
+        
+        self._rules = tuple(self._build_rules())
+        self._contains_pattern = re.compile(b"|".join(
+            re.escape(signature) for match_type, signature, _, _ in self._rules if match_type == _CONTAINS
+        ))
+        # 下标为首字节，只包含可能匹配该首字节的文件头规则
+        self._header_rules = tuple(
+            tuple(rule for rule in self._rules
+                  if rule[0] != _CONTAINS and (rule[3] is None or rule[3] == first_byte))
+            for first_byte in range(256)
+        )
     
-    def identify_content(self, content: bytes) -> IdentifiedContent:
+    def _build_rules(self) -> list:
         """
-        识别内容类型
+        按Roblox内容格式的识别优先级构建签名规则
         
-        Args:
-            content: 内容字节数据
-            
         Returns:
-            IdentifiedContent: 识别结果
+            list: [(匹配方式, 签名或检查函数, 识别结果, 要求的首字节或None), ...]
         """
-        if len(content) == 0:
-            return IdentifiedContent(AssetType.Unknown, "", "empty content", "")
-        
-        # 获取内容开头部分用于匹配
-        begin_size = min(48, len(content) - 1) if len(content) > 1 else len(content)
-        begin = content[:begin_size].decode('utf-8', errors='ignore')
-        
-        # 获取魔术字节
-        magic = struct.unpack('<I', content[:4])[0] if len(content) >= 4 else 0
-        
-        # 按照Roblox内容格式进行识别
-        return self._match_content_type(begin, content, magic)
+        webp_type = AssetType.WebP if self.block_avatar_images else AssetType.NoConvert
+        rules = [
+            # Roblox模型文件
+            (_CONTAINS, b"<roblox!", IdentifiedContent(AssetType.NoConvert, "rbxm", "RBXM", "RBXM")),
+            # 不支持的XML格式
+            (_CONTAINS, b"<roblox xml", IdentifiedContent(AssetType.Ignored, "", "unsupported XML", "")),
+            # 网格文件
+            (_PREFIX, b"version", IdentifiedContent(AssetType.Mesh, "", "", "")),
+            # 翻译列表JSON（忽略）
+            (_PREFIX, b"{\"translations", IdentifiedContent(AssetType.Ignored, "", "translation list JSON", "")),
+            # 翻译文件
+            (_CONTAINS, b"{\"locale\":\"", IdentifiedContent(AssetType.Translation, "", "", "")),
+            # PNG图片
+            (_CONTAINS, b"PNG\r\n", IdentifiedContent(AssetType.NoConvert, "png", "PNG", "Textures")),
+            # GIF图片
+            (_PREFIX, b"GIF87a", IdentifiedContent(AssetType.NoConvert, "gif", "GIF", "Textures")),
+            (_PREFIX, b"GIF89a", IdentifiedContent(AssetType.NoConvert, "gif", "GIF", "Textures")),
+            # JPEG图片
+            (_CONTAINS, b"JFIF", IdentifiedContent(AssetType.NoConvert, "jfif", "JFIF", "Textures")),
+            (_CONTAINS, b"Exif", IdentifiedContent(AssetType.NoConvert, "jfif", "JFIF", "Textures")),
+            # WebP图片
+            (_CUSTOM, _is_riff_webp, IdentifiedContent(webp_type, "webp", "WebP", "Textures"), ord("R")),
+            # OGG音频
+            (_PREFIX, b"OggS", IdentifiedContent(AssetType.NoConvert, "ogg", "OGG", "Sounds")),
+            # MP3音频
+            (_PREFIX, b"ID3", IdentifiedContent(AssetType.NoConvert, "mp3", "MP3", "Sounds")),
+            (_CUSTOM, _is_mp3_frame_sync, IdentifiedContent(AssetType.NoConvert, "mp3", "MP3", "Sounds"), 0xFF),
+            # KTX纹理
+            (_CONTAINS, b"KTX 11", IdentifiedContent(AssetType.Khronos, "", "", "")),
+            # M3U播放列表
+            (_PREFIX, b"#EXTM3U", IdentifiedContent(AssetType.EXTM3U, "", "", "")),
+            # 字体列表
+            (_CONTAINS, b"\"name\": \"", IdentifiedContent(AssetType.FontList, "", "", "")),
+            # 应用程序设置JSON（忽略）
+            (_CONTAINS, b"{\"applicationSettings", IdentifiedContent(AssetType.Ignored, "", "FFlags JSON", "")),
+            # 客户端版本JSON（忽略）
+            (_CONTAINS, b"{\"version", IdentifiedContent(AssetType.Ignored, "", "client version JSON", "")),
+            # OpenType/TrueType字体（忽略）
+            (_CONTAINS, b"GDEF", IdentifiedContent(AssetType.Ignored, "", "OpenType/TrueType font", "")),
+            (_CONTAINS, b"GPOS", IdentifiedContent(AssetType.Ignored, "", "OpenType/TrueType font", "")),
+            (_CONTAINS, b"GSUB", IdentifiedContent(AssetType.Ignored, "", "OpenType/TrueType font", "")),
+            # Zstandard压缩数据（可能是FFlags），魔术字节0xFD2FB528（小端）
+            (_MAGIC, b"\x28\xb5\x2f\xfd",
+             IdentifiedContent(AssetType.Ignored, "", "Zstandard compressed data (likely FFlags)", "")),
+            # VideoFrame段 - EBML头，识别为视频类型
+            (_MAGIC, b"\x1a\x45\xdf\xa3", IdentifiedContent(AssetType.Video, "webm", "VideoFrame", "Videos")),
+            # WebM视频文件
+            (_CUSTOM, _is_riff_webm, IdentifiedContent(AssetType.Video, "webm", "WebM", "Videos"), ord("R")),
+        ]
+        # 文件头类规则的首字节即签名的首字节
+        return [rule if len(rule) == 4 else rule + ((rule[1][0] if rule[0] in (_PREFIX, _MAGIC) else None),)
+                for rule in rules]
     
-    def _match_content_type(self, begin: str, content: bytes, magic: int) -> IdentifiedContent:
+    def identify_content(self, content: bytes) -> IdentifiedContent:
         """
-        匹配内容类型
+        识别内容类型
         
         Args:
-            begin: 内容开头字符串
-            content: 完整内容字节
-            magic: 魔术字节
+            content: 内容字节数据
             
         Returns:
-            IdentifiedContent: 识别结果
+            IdentifiedContent: 识别结果（同类内容共享同一个实例，不应修改）
         """
-        # Roblox模型文件
-        if "<roblox!" in begin:
-            return IdentifiedContent(AssetType.NoConvert, "rbxm", "RBXM", "RBXM")
-        
-        # 不支持的XML格式
-        if "<roblox xml" in begin:
-            return IdentifiedContent(AssetType.Ignored, "", "unsupported XML", "")
-        
-        # 网格文件
-        if not begin.startswith("\"version") and begin.startswith("version"):
-            return IdentifiedContent(AssetType.Mesh, "", "", "")
-        
-        # 翻译列表JSON（忽略）
-        if begin.startswith("{\"translations"):
-            return IdentifiedContent(AssetType.Ignored, "", "translation list JSON", "")
-        
-        # 翻译文件
-        if "{\"locale\":\"" in begin:
-            return IdentifiedContent(AssetType.Translation, "", "", "")
-        
-        # PNG图片
-        if "PNG\r\n" in begin:
-            return IdentifiedContent(AssetType.NoConvert, "png", "PNG", "Textures")
-        
-        # GIF图片
-        if begin.startswith("GIF87a") or begin.startswith("GIF89a"):
-            return IdentifiedContent(AssetType.NoConvert, "gif", "GIF", "Textures")
-        
-        # JPEG图片
-        if "JFIF" in begin or "Exif" in begin:
-            return IdentifiedContent(AssetType.NoConvert, "jfif", "JFIF", "Textures")
+        length = len(content)
+        if length == 0:
+            return self._empty
         
-        # WebP图片
-        if begin.startswith("RIFF") and "WEBP" in begin:
-            if self.block_avatar_images:
-                return IdentifiedContent(AssetType.WebP, "webp", "WebP", "Textures")
-            else:
-                return IdentifiedContent(AssetType.NoConvert, "webp", "WebP", "Textures")
+        # 只匹配内容开头部分
+        begin_size = min(_BEGIN_SIZE, length - 1) if length > 1 else length
         
-        # OGG音频
-        if begin.startswith("OggS"):
-            return IdentifiedContent(AssetType.NoConvert, "ogg", "OGG", "Sounds")
-        
-        # MP3音频
-        if (begin.startswith("ID3") or 
-            (len(content) > 2 and (content[0] & 0xFF) == 0xFF and (content[1] & 0xE0) == 0xE0)):
-            return IdentifiedContent(AssetType.NoConvert, "mp3", "MP3", "Sounds")
-        
-        # KTX纹理
-        if "KTX 11" in begin:
-            return IdentifiedContent(AssetType.Khronos, "", "", "")
-        
-        # M3U播放列表
-        if begin.startswith("#EXTM3U"):
-            return IdentifiedContent(AssetType.EXTM3U, "", "", "")
-        
-        # 字体列表 - 这是我们主要关注的类型
-        if "\"name\": \"" in begin:
-            return IdentifiedContent(AssetType.FontList, "", "", "")
-        
-        # 应用程序设置JSON（忽略）
-        if "{\"applicationSettings" in begin:
-            return IdentifiedContent(AssetType.Ignored, "", "FFlags JSON", "")
-        
-        # 客户端版本JSON（忽略）
-        if "{\"version" in begin:
-            return IdentifiedContent(AssetType.Ignored, "", "client version JSON", "")
-        
-        # OpenType/TrueType字体（忽略）
-        if "GDEF" in begin or "GPOS" in begin or "GSUB" in begin:
-            return IdentifiedContent(AssetType.Ignored, "", "OpenType/TrueType font", "")
-        
-        # Zstandard压缩数据（可能是FFlags）
-        if magic == 0xFD2FB528:
-            return IdentifiedContent(AssetType.Ignored, "", "Zstandard compressed data (likely FFlags)", "")
-        
-        # VideoFrame段 - 改为识别为视频类型
-        if (len(content) >= 4 and content[0] == 0x1A and content[1] == 0x45 and 
-            content[2] == 0xDF and content[3] == 0xA3):
-            return IdentifiedContent(AssetType.Video, "webm", "VideoFrame", "Videos")
+        if self._contains_pattern.search(content, 0, begin_size) is None:
+            rules = self._header_rules[content[0]]
+        else:
+            rules = self._rules
         
-        # WebM视频文件
-        if begin.startswith("RIFF") and "WEBM" in begin.upper():
-            return IdentifiedContent(AssetType.Video, "webm", "WebM", "Videos")
+        for match_type, signature, result, _ in rules:
+            if match_type == _CONTAINS:
+                if content.find(signature, 0, begin_size) != -1:
+                    return result
+            elif match_type == _PREFIX:
+                if content.startswith(signature, 0, begin_size):
+                    return result
+            elif match_type == _MAGIC:
+                if content.startswith(signature):
+                    return result
+            elif signature(content, begin_size):
+                return result
         
         # 未知类型
-        return IdentifiedContent(AssetType.Unknown, begin, "", "")
+        return self._unknown
     
     def is_fontlist(self, content: bytes) -> bool:
         """
@@ -185,13 +206,8 @@ class ContentIdentifier:
         Returns:
             bool: 是否为字体列表
         """
-        try:
-            # 检查是否包含字体列表的关键标识
-            text_content = content.decode('utf-8', errors='ignore')
-            return ('"name": "' in text_content and 
-                    '"faces":' in text_content)
-        except Exception:
-            return False
+        # 直接在字节上查找字体列表的关键标识，无需解码
+        return b'"name": "' in content and b'"faces":' in content
     
     def get_texture_format(self, internal_format: int) -> str:
         """
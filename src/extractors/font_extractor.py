@@ -12,7 +12,6 @@ import logging
 import threading
 import queue
 import time
-import requests
 import traceback
 import multiprocessing
 from typing import Dict, List, Any, Optional, Callable
@@ -21,11 +20,14 @@ from dataclasses import dataclass
 
 # 导入历史管理器
 from src.utils.history_manager import ExtractedHistory, ContentHashCache
+from src.utils.download_manager import DownloadManager, DownloadStats, SingleFlight, get_download_manager
+from src.utils.stage_timer import StageTimer
 
 # 导入Roblox字体提取模块
 from .rbxh_parser import RBXHParser, ParsedCache, parse_cache_file, parse_cache_data
 from .content_identifier import ContentIdentifier, AssetType, IdentifiedContent, identify_content
 from .cache_scanner import RobloxCacheScanner, CacheItem, CacheType, scan_roblox_cache
+from .asset_index import AssetCacheIndex, ASSET_DELIVERY_URL
 
 # 导入多进程工具
 from src.utils.multiprocessing_utils import (
@@ -71,73 +73,58 @@ class FontProcessingStats:
             return self.stats.copy()
 
 # 多进程工作函数
-def _process_cache_item_worker(cache_item: CacheItem, config: 'FontProcessingConfig') -> Dict[str, Any]:
+def _identify_fontlists_worker(cache_items: List[CacheItem], config: 'FontProcessingConfig', cancelled) -> Dict[str, Any]:
     """
-    多进程字体缓存项处理工作函数
+    多进程字体缓存项识别工作函数
+    
+    工作进程只解析缓存并识别字体列表，字体文件统一由主进程的下载线程池下载，
+    因此同一个资源ID在所有进程中只会下载一次。
     
     Args:
-        cache_item: 缓存项
+        cache_items: 分配给当前进程的缓存项
         config: 处理配置
+        cancelled: 共享的取消标志
         
     Returns:
-        Dict[str, Any]: 处理结果
+        Dict[str, Any]: 统计信息、识别出的字体列表 [(缓存哈希, 字体列表内容), ...] 和阶段统计
     """
-    result = {
-        'success': False,
-        'fontlist_processed': 0,
-        'fonts_downloaded': 0,
-        'errors': [],
-        'processed_hashes': [] # 新增：收集成功处理的哈希
+    stats = {
+        'processed_caches': 0,
+        'processing_errors': 0
     }
+    fontlists = []
+    timer = StageTimer()
     
-    try:
-        # 创建处理器实例
-        rbxh_parser = RBXHParser()
-        content_identifier = ContentIdentifier(config.block_avatar_images)
-        
-        # 解析缓存内容
-        if cache_item.data:
-            parsed_cache = rbxh_parser.parse_cache_data(cache_item.data)
-        else:
-            parsed_cache = rbxh_parser.parse_cache_file(cache_item.path)
-        
-        if not parsed_cache.success:
-            return result
-        
-        # 识别内容类型
-        identified = content_identifier.identify_content(parsed_cache.content)
+    rbxh_parser = RBXHParser()
+    content_identifier = ContentIdentifier(config.block_avatar_images)
+    
+    for cache_item in cache_items:
+        if cancelled.value:
+            break
         
-        # 只处理字体列表
-        if identified.asset_type == AssetType.FontList:
-            result['fontlist_processed'] = 1
-            
-            # 创建字体处理器 - 多进程模式下每个进程使用少量下载线程
-            download_threads = min(2, max(1, multiprocessing.cpu_count() // 4))
-            font_processor = FontListProcessor(
-                config.fonts_dir, 
-                config.classification_method,
-                download_threads,
-                download_history,
-                collect_hashes=True  # 多进程模式下启用哈希收集
-            )
+        try:
+            # 解析缓存内容
+            with timer.span("parse"):
+                if cache_item.data:
+                    parsed_cache = rbxh_parser.parse_cache_data(cache_item.data)
+                else:
+                    parsed_cache = rbxh_parser.parse_cache_file(cache_item.path)
             
-            # 处理字体列表
-            process_result = font_processor.process_fontlist(
-                cache_item.hash_id, 
-                parsed_cache.content
-            )
+            if not parsed_cache.success:
+                continue
             
-            if process_result["success"]:
-                result['fonts_downloaded'] = process_result["downloaded_count"]
-                result['processed_hashes'] = process_result.get("processed_hashes", [])
-                result['success'] = True
-            else:
-                result['errors'].extend(process_result.get("errors", []))
-        
-    except Exception as e:
-        result['errors'].append(f"处理缓存项 {cache_item.hash_id} 失败: {str(e)}")
+            stats['processed_caches'] += 1
+            
+            # 只收集字体列表
+            with timer.span("identify"):
+                identified = content_identifier.identify_content(parsed_cache.content)
+            if identified.asset_type == AssetType.FontList:
+                fontlists.append((cache_item.hash_id, parsed_cache.content))
+        except Exception as e:
+            stats['processing_errors'] += 1
+            logger.error(f"处理缓存项 {cache_item.hash_id} 失败: {e}")
     
-    return result
+    return {'stats': stats, 'processed_hashes': [], 'results': fontlists, 'stages': timer.breakdown()}
 
 @dataclass
 class FontProcessingConfig:
@@ -147,33 +134,130 @@ class FontProcessingConfig:
     block_avatar_images: bool = True
     history_file: Optional[str] = None # 新增历史文件路径参数
 
+class FontDownloadPool:
+    """
+    字体下载线程池 - 整个提取过程共用
+    
+    所有字体列表的字体文件都提交到同一个队列，由固定数量的线程下载，
+    并发下载数不会随同时处理的字体列表数量增长。线程在第一次使用时启动。
+    """
+    
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self._queue = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+    
+    def map(self, func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        在线程池中对每一项执行func，阻塞直到全部完成
+        
+        Args:
+            func: 处理函数
+            items: 待处理的项
+            
+        Returns:
+            List[Any]: 按原顺序排列的结果，出错的项为异常对象
+        """
+        if not items:
+            return []
+        self._ensure_started()
+        
+        results = [None] * len(items)
+        remaining = len(items)
+        remaining_lock = threading.Lock()
+        done = threading.Event()
+        
+        def make_task(index, item):
+            def task():
+                nonlocal remaining
+                try:
+                    results[index] = func(item)
+                except Exception as e:
+                    results[index] = e
+                finally:
+                    with remaining_lock:
+                        remaining -= 1
+                        if remaining == 0:
+                            done.set()
+            return task
+        
+        for index, item in enumerate(items):
+            self._queue.put(make_task(index, item))
+        done.wait()
+        return results
+    
+    def shutdown(self):
+        """停止所有下载线程"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout=1)
+    
+    def _ensure_started(self):
+        """按需启动下载线程"""
+        with self._lock:
+            while len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._worker, name="FontDownload", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+    
+    def _worker(self):
+        """下载线程主循环"""
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            task()
+
 class FontListProcessor:
     """字体列表处理器 - 处理Roblox字体列表"""
     
-    def __init__(self, output_dir: str, classification_method: FontClassificationMethod = FontClassificationMethod.FAMILY, max_download_threads: int = 4, download_history: Optional['ExtractedHistory'] = None, collect_hashes: bool = False):
+    def __init__(self, output_dir: str, classification_method: FontClassificationMethod = FontClassificationMethod.FAMILY, max_download_threads: int = 4, download_history: Optional['ExtractedHistory'] = None, collect_hashes: bool = False,
+                 downloader: Optional[DownloadManager] = None, download_stats: Optional[DownloadStats] = None,
+                 asset_index: Optional[AssetCacheIndex] = None, stage_timer: Optional[StageTimer] = None):
         """
         初始化字体列表处理器
         
         Args:
             output_dir: 输出目录
             classification_method: 分类方法
-            max_download_threads: 最大下载线程数
+            max_download_threads: 最大下载线程数（所有字体列表共用）
             download_history: 下载历史管理器，用于避免重复处理文件
             collect_hashes: 是否收集处理过的哈希
+            downloader: 下载管理器，默认使用全局共享实例
+            download_stats: 下载统计（字节数、重试次数、带宽）
+            asset_index: 本地缓存资源索引，命中时不再从网络下载
+            stage_timer: 阶段计时器（本地读取、下载、写入）
         """
         self.output_dir = output_dir
         self.classification_method = classification_method
         self.max_download_threads = max_download_threads
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'RobloxAudioExtractor/1.0'
-        })
+        # 共享的连接池下载器，连接复用、按主机限流和退避重试由其统一处理
+        self.downloader = downloader or get_download_manager()
+        self.download_stats = download_stats or DownloadStats()
+        self.asset_index = asset_index
+        self.stage_timer = stage_timer or StageTimer()
+        # 所有字体列表共用的下载线程池和按资源ID合并下载的登记表
+        self.download_pool = FontDownloadPool(max_download_threads) if max_download_threads > 1 else None
+        self.download_registry = SingleFlight()
         self._cancel_check_fn = None  # 取消检查函数
         self._log_callback = None  # 日志回调函数
         self.download_history = download_history
         self.collect_hashes = collect_hashes
         self.processed_hashes = []  # 成功处理的哈希列表（用于多进程模式）
     
+    def begin_run(self):
+        """开始新的提取，重置本次运行的资源ID登记表"""
+        self.download_registry = SingleFlight()
+    
+    def end_run(self):
+        """结束提取，停止下载线程"""
+        if self.download_pool:
+            self.download_pool.shutdown()
+    
     def set_cancel_check(self, cancel_check_fn: Callable[[], bool]):
         """设置取消检查函数"""
         self._cancel_check_fn = cancel_check_fn
@@ -254,6 +338,7 @@ class FontListProcessor:
             "faces_count": 0,
             "downloaded_count": 0,
             "already_processed_count": 0,  # 新增：已处理过的字体计数
+            "duplicate_count": 0,  # 本次运行中已由其他字体列表下载的字体
             "errors": []
         }
         
@@ -284,34 +369,38 @@ class FontListProcessor:
             with open(json_path, 'w', encoding='utf-8') as f:
                 json.dump(font_data, f, indent=2, ensure_ascii=False)
             
-            # 下载字体文件 - 支持多线程
-            if len(faces) > 1 and self.max_download_threads > 1:
-                # 使用多线程下载
-                downloaded_count, already_processed_count = self._download_fonts_multithreaded(font_name, faces, result["errors"])
+            # 下载字体文件 - 提交到共用的下载线程池
+            if len(faces) > 1 and self.download_pool:
+                outcomes = self.download_pool.map(lambda face: self._download_font_face_task(font_name, face), faces)
             else:
                 # 串行下载（单个字体或线程数为1）
-                downloaded_count = 0
-                already_processed_count = 0
+                outcomes = []
                 for face in faces:
                     # 检查是否已取消
                     if self.is_cancelled():
                         logger.debug("字体下载被用户取消")
                         self.send_log("font_download_cancelled", "warning")
                         break
-                    
-                    try:
-                        download_result = self._download_font_face(font_name, face)
-                        if download_result == "downloaded":
-                            downloaded_count += 1
-                        elif download_result == "already_processed":
-                            already_processed_count += 1
-                    except Exception as e:
-                        error_msg = f"下载字体 {font_name}-{face.get('name', 'Unknown')} 失败: {e}"
-                        logger.error(error_msg)
-                        result["errors"].append(error_msg)
+                    outcomes.append(self._download_font_face_task(font_name, face))
+            
+            downloaded_count = 0
+            already_processed_count = 0
+            duplicate_count = 0
+            for face, outcome in zip(faces, outcomes):
+                if isinstance(outcome, Exception):
+                    error_msg = f"下载字体 {font_name}-{face.get('name', 'Unknown')} 失败: {outcome}"
+                    logger.error(error_msg)
+                    result["errors"].append(error_msg)
+                elif outcome == "downloaded":
+                    downloaded_count += 1
+                elif outcome == "already_processed":
+                    already_processed_count += 1
+                elif outcome == "duplicate":
+                    duplicate_count += 1
             
             result["downloaded_count"] = downloaded_count
             result["already_processed_count"] = already_processed_count
+            result["duplicate_count"] = duplicate_count
             result["success"] = True
             
             logger.debug(f"字体列表处理完成: {font_name}, 成功下载 {downloaded_count}/{len(faces)} 个字体")
@@ -328,72 +417,19 @@ class FontListProcessor:
         
         return result
     
-    def _download_fonts_multithreaded(self, font_name: str, faces: List[Dict[str, Any]], errors: List[str]) -> tuple[int, int]:
+    def _download_font_face_task(self, font_name: str, face: Dict[str, Any]):
         """
-        多线程下载字体文件
+        下载单个字体文件（供下载线程池调用）
         
-        Args:
-            font_name: 字体家族名称
-            faces: 字体面列表
-            errors: 错误列表
-            
         Returns:
-            tuple[int, int]: (成功下载的字体数量, 已处理过的字体数量)
+            下载结果，出错时返回异常对象
         """
-        downloaded_count = 0
-        already_processed_count = 0
-        download_lock = threading.Lock()
-        
-        # 创建工作队列
-        work_queue = queue.Queue()
-        for face in faces:
-            work_queue.put(face)
-        
-        def download_worker():
-            nonlocal downloaded_count, already_processed_count
-            while not self.is_cancelled():
-                try:
-                    face = work_queue.get(timeout=2)
-                    try:
-                        result = self._download_font_face(font_name, face)
-                        with download_lock:
-                            if result == "downloaded":
-                                downloaded_count += 1
-                            elif result == "already_processed":
-                                already_processed_count += 1
-                    except Exception as e:
-                        error_msg = f"下载字体 {font_name}-{face.get('name', 'Unknown')} 失败: {e}"
-                        logger.error(error_msg)
-                        with download_lock:
-                            errors.append(error_msg)
-                    finally:
-                        work_queue.task_done()
-                except queue.Empty:
-                    break
-                except Exception as e:
-                    logger.error(f"字体下载工作线程出错: {e}")
-        
-        # 启动下载线程
-        threads = []
-        thread_count = min(self.max_download_threads, len(faces))
-        for _ in range(thread_count):
-            thread = threading.Thread(target=download_worker)
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-        
-        # 等待所有下载完成
+        if self.is_cancelled():
+            return "failed"
         try:
-            work_queue.join()
-        except KeyboardInterrupt:
-            logger.debug("多线程字体下载被用户取消")
-            self.send_log("multithread_download_cancelled", "warning")
-        
-        # 等待所有线程结束
-        for thread in threads:
-            thread.join(timeout=1)
-        
-        return downloaded_count, already_processed_count
+            return self._download_font_face(font_name, face)
+        except Exception as e:
+            return e
     
     def _get_font_category(self, font_name: str, face_name: str, file_size: int) -> str:
         """
@@ -481,7 +517,7 @@ class FontListProcessor:
             face: 字体面信息
             
         Returns:
-            str: 下载结果 ("downloaded", "already_processed", "failed")
+            str: 下载结果 ("downloaded", "already_processed", "duplicate", "failed")
         """
         try:
             face_name = face.get("name", "Regular")
@@ -502,7 +538,33 @@ class FontListProcessor:
                 return "failed"
             
             asset_id_num = split_result[1]
-            download_url = f"https://assetdelivery.roblox.com/v1/asset?id={asset_id_num}"
+            
+            # 同一资源ID在本次运行中只下载一次，其他字体列表等待并共享结果
+            outcome, shared = self.download_registry.do(
+                asset_id_num, lambda: self._fetch_font_face(font_name, face_name, asset_id_num))
+            if shared and outcome != "failed":
+                logger.debug(f"跳过本次运行中已下载的字体资源 (Asset ID: {asset_id_num}): {font_name}-{face_name}.ttf")
+                return "duplicate"
+            return outcome or "failed"
+            
+        except Exception as e:
+            logger.error(f"下载字体文件时出错: {e}")
+            return "failed"
+    
+    def _fetch_font_face(self, font_name: str, face_name: str, asset_id_num: str) -> str:
+        """
+        获取并保存单个字体文件（优先本地缓存，其次网络）
+        
+        Args:
+            font_name: 字体家族名称
+            face_name: 字体面名称
+            asset_id_num: 资源ID
+            
+        Returns:
+            str: 下载结果 ("downloaded", "already_processed", "failed")
+        """
+        try:
+            download_url = ASSET_DELIVERY_URL.format(asset_id_num)
             
             # 使用asset_id作为唯一标识符进行历史记录检查
             asset_id_hash = f"font_asset_{asset_id_num}"
@@ -516,29 +578,31 @@ class FontListProcessor:
             logger.debug(f"正在下载字体: {font_name}-{face_name}.ttf...")
             self.send_log("downloading_font", "info", f"{font_name}-{face_name}.ttf")
             
-            # 下载字体文件，支持重试
+            # 优先读取本地缓存中的字体文件，未命中时再下载
             font_data = None
-            max_retries = 3
+            if self.asset_index:
+                with self.stage_timer.span("cache_read"):
+                    font_data = self.asset_index.load(asset_id_num)
+            if font_data:
+                logger.debug(f"从本地缓存读取字体: {font_name}-{face_name}.ttf (Asset ID: {asset_id_num})")
             
-            for attempt in range(max_retries):
-                # 检查是否已取消
-                if self.is_cancelled():
-                    logger.debug("字体下载被用户取消")
-                    self.send_log("font_download_cancelled", "warning")
-                    return "failed"
-                
-                try:
-                    response = self.session.get(download_url, timeout=30)
-                    if response.status_code == 200:
-                        font_data = response.content
-                        break
-                    else:
-                        logger.warning(f"下载失败 (状态码: {response.status_code}), 重试中...")
-                except Exception as e:
-                    logger.warning(f"下载失败 (错误: {e}), 重试中...")
-                
-                if attempt < max_retries - 1:
-                    time.sleep(1)  # 等待1秒后重试
+            # 下载字体文件，重试和退避由下载管理器处理
+            max_retries = 3
+            if not font_data:
+                with self.stage_timer.span("download") as counters:
+                    font_data = self.downloader.fetch(
+                        download_url,
+                        cancel_check=self.is_cancelled,
+                        max_retries=max_retries,
+                        timeout=30,
+                        stats=self.download_stats
+                    )
+                    counters["bytes"] = len(font_data or b"")
+            
+            if font_data is None and self.is_cancelled():
+                logger.debug("字体下载被用户取消")
+                self.send_log("font_download_cancelled", "warning")
+                return "failed"
             
             if font_data:
                 # 计算内容哈希
@@ -578,8 +642,9 @@ class FontListProcessor:
                 
                 # 保存字体文件
                 try:
-                    with open(font_path, 'wb') as f:
-                        f.write(font_data)
+                    with self.stage_timer.span("write", bytes=len(font_data)):
+                        with open(font_path, 'wb') as f:
+                            f.write(font_data)
                     logger.debug(f"成功下载字体: {category}/{font_filename}")
                     self.send_log("font_download_success", "info", f"{category}/{font_filename}")
                     
@@ -670,9 +735,13 @@ class RobloxFontExtractor:
         self.fonts_dir = os.path.join(self.output_dir, "Fonts")
         os.makedirs(self.fonts_dir, exist_ok=True)
         
-        # 字体处理器 - 每个字体家族使用少量线程进行下载
-        download_threads = min(4, max(1, (self.num_threads if not self.use_multiprocessing else self.num_processes) // 2))
-        self.font_processor = FontListProcessor(self.fonts_dir, classification_method, download_threads, download_history)
+        # 字体处理器 - 所有字体家族共用一个有界的下载线程池
+        download_threads = min(8, max(2, self.num_threads if not self.use_multiprocessing else self.num_processes))
+        self.download_stats = DownloadStats()
+        # 各阶段耗时（每次extract_fonts重新统计）
+        self.stage_timer = StageTimer()
+        self.font_processor = FontListProcessor(self.fonts_dir, classification_method, download_threads, download_history,
+                                                download_stats=self.download_stats, stage_timer=self.stage_timer)
         # 传递日志回调到字体处理器
         if self.log_callback:
             self.font_processor.set_log_callback(self.log_callback)
@@ -718,13 +787,15 @@ class RobloxFontExtractor:
     
     def extract_fonts(self, 
                      progress_callback: Optional[Callable[[int, int, str], None]] = None,
-                     custom_cache_path: Optional[str] = None) -> Dict[str, Any]:
+                     custom_cache_path: Optional[str] = None,
+                     cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
         """
         提取字体文件
         
         Args:
             progress_callback: 进度回调函数 (当前, 总数, 消息)
             custom_cache_path: 自定义缓存路径
+            cache_items: 要处理的缓存项目，None表示扫描整个缓存（监视模式只传入新出现的项目）
             
         Returns:
             Dict[str, Any]: 提取结果
@@ -737,6 +808,10 @@ class RobloxFontExtractor:
         
         # 重置统计
         self.stats = FontProcessingStats()
+        self.download_stats = DownloadStats()
+        self.font_processor.download_stats = self.download_stats
+        self.font_processor.begin_run()
+        self.stage_timer.reset()
         self.cancelled = False
         
         # 确保字体处理器也有取消检查函数
@@ -764,17 +839,19 @@ class RobloxFontExtractor:
                     "cache_info": cache_info
                 }
             
-            # 扫描缓存
-            cache_items = []
-            
-            def cache_callback(item: CacheItem):
-                cache_items.append(item)
-                if progress_callback:
-                    progress_callback(len(cache_items), 0, f"扫描缓存: 发现 {len(cache_items)} 项...")
-            
-            logger.debug("开始扫描Roblox缓存...")
-            self.send_log("scanning_cache", "info")
-            cache_items = self.cache_scanner.scan_cache(cache_callback)
+            # 扫描缓存（监视模式直接传入新出现的项目）
+            if cache_items is None:
+                scanned_items = []
+
+                def cache_callback(item: CacheItem):
+                    scanned_items.append(item)
+                    if progress_callback:
+                        progress_callback(len(scanned_items), 0, f"扫描缓存: 发现 {len(scanned_items)} 项...")
+
+                logger.debug("开始扫描Roblox缓存...")
+                self.send_log("scanning_cache", "info")
+                with self.stage_timer.span("scan"):
+                    cache_items = self.cache_scanner.scan_cache(cache_callback)
             
             if not cache_items:
                 self.send_log("no_cache_items_found", "warning")
@@ -782,20 +859,29 @@ class RobloxFontExtractor:
                     "success": True,
                     "message": "未发现新的缓存项目",
                     "stats": {},
-                    "cache_info": cache_info
+                    "cache_info": cache_info,
+                    "stages": self.stage_timer.breakdown()
                 }
             
             logger.debug(f"缓存扫描完成，发现 {len(cache_items)} 个项目")
             self.send_log("cache_scan_complete", "info", len(cache_items))
             
+            # 根据缓存头部链接建立资源索引，字体文件可直接从本地缓存读取
+            asset_index = AssetCacheIndex()
+            with self.stage_timer.span("index"):
+                indexed = asset_index.add_cache_items(cache_items)
+            self.font_processor.asset_index = asset_index
+            logger.debug(f"本地资源索引完成，共 {indexed} 个资源")
+            
             # 处理缓存项目 - 支持多线程/多进程
             logger.debug(f"开始处理缓存项目，总数: {len(cache_items)}")
             processing_start = time.time()
             
-            if self.use_multiprocessing:
-                result = self._process_cache_items_multiprocessing(cache_items, progress_callback)
-            else:
-                result = self._process_cache_items_threading(cache_items, progress_callback)
+            with self.stage_timer.span("process", items=len(cache_items)):
+                if self.use_multiprocessing:
+                    result = self._process_cache_items_multiprocessing(cache_items, progress_callback)
+                else:
+                    result = self._process_cache_items_threading(cache_items, progress_callback)
             
             processed = result.get('processed', 0)
             
@@ -814,6 +900,8 @@ class RobloxFontExtractor:
                     'download_failed': stats_dict.get('download_failed', 0),
                     'processing_errors': stats_dict.get('processing_errors', 0)
                 },
+                "download_stats": self.download_stats.get_all(),
+                "asset_index": asset_index.get_stats(),
                 "cache_info": cache_info,
                 "duration": duration,
                 "output_dir": self.fonts_dir
@@ -825,8 +913,10 @@ class RobloxFontExtractor:
             if self.download_history:
                 logger.debug("保存字体提取历史记录...")
                 self.send_log("saving_font_history", "info")
-                self.download_history.save_history()
+                with self.stage_timer.span("history_save"):
+                    self.download_history.save_history()
                 logger.debug("✓ 字体提取历史记录已保存")
+            result["stages"] = self.stage_timer.breakdown()
             
             # 发送完成日志
             stats = result['stats']
@@ -849,6 +939,8 @@ class RobloxFontExtractor:
                 "error": str(e),
                 "stats": self.stats.get_all() if hasattr(self.stats, 'get_all') else {}
             }
+        finally:
+            self.font_processor.end_run()
 
     def _process_cache_items_multiprocessing(self, cache_items: List[CacheItem], progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
         """使用多进程处理缓存项目"""
@@ -873,54 +965,30 @@ class RobloxFontExtractor:
             num_processes=self.num_processes,
             conservative=self.conservative_multiprocessing,
             progress_callback=progress_callback_wrapper,
-            cancel_check=lambda: self.is_cancelled()
+            cancel_check=lambda: self.is_cancelled(),
+            stage_timer=self.stage_timer
         )
         
-        # 创建工作函数
-        worker_func = create_worker_function(_process_cache_item_worker)
-        
         try:
-            # 执行多进程处理
+            # 工作进程只识别字体列表，下载在主进程中统一进行
             result = manager.process_items(
                 items=cache_items,
-                worker_func=worker_func,
+                worker_func=_identify_fontlists_worker,
                 config=config
             )
             
-            # 统计结果
-            processed_results = result.get('results', [])
-            processed = len([r for r in processed_results if r.get('success', False)])
-            
-            total_fontlist = sum(r.get('fontlist_processed', 0) for r in processed_results)
-            total_downloaded = sum(r.get('fonts_downloaded', 0) for r in processed_results)
-            
-            # 收集所有成功处理的哈希
-            all_processed_hashes = []
-            for result_item in processed_results:
-                if result_item.get('success', False):
-                    hashes = result_item.get('processed_hashes', [])
-                    all_processed_hashes.extend(hashes)
-            
-            # 批量添加哈希到主进程的历史记录
-            if self.download_history and all_processed_hashes:
-                logger.debug(f"批量添加 {len(all_processed_hashes)} 个字体哈希到历史记录...")
-                for file_hash in all_processed_hashes:
-                    self.download_history.add_hash(file_hash, 'font')
-                
-                # 强制保存历史记录 - 修复：确保多进程模式下历史记录能够保存
-                logger.debug("强制保存字体提取历史记录...")
-                self.download_history.save_history()
-                logger.debug("✓ 多进程模式下字体提取历史记录已保存")
+            process_stats = result.get('stats', {})
+            fontlists = result.get('results', [])
+            self.stats.increment('processed_caches', process_stats.get('processed_caches', 0))
+            self.stats.increment('processing_errors', process_stats.get('processing_errors', 0))
             
-            # 更新统计
-            self.stats.increment('processed_caches', processed)
-            self.stats.increment('fontlist_found', total_fontlist)
-            self.stats.increment('fonts_downloaded', total_downloaded)
+            self._process_fontlists_threading(fontlists)
             
+            stats_dict = self.stats.get_all()
             return {
-                'processed': processed,
-                'fontlist_found': total_fontlist,
-                'fonts_downloaded': total_downloaded
+                'processed': stats_dict.get('processed_caches', 0),
+                'fontlist_found': stats_dict.get('fontlist_found', 0),
+                'fonts_downloaded': stats_dict.get('fonts_downloaded', 0)
             }
             
         except Exception as e:
@@ -932,6 +1000,42 @@ class RobloxFontExtractor:
                 'error': str(e)
             }
     
+    def _process_fontlists_threading(self, fontlists: List[tuple]):
+        """
+        并行处理多进程识别出的字体列表
+        
+        Args:
+            fontlists: [(缓存哈希, 字体列表内容), ...]
+        """
+        if not fontlists:
+            return
+        
+        work_queue = queue.Queue()
+        for fontlist in fontlists:
+            work_queue.put(fontlist)
+        
+        def worker():
+            while not self.is_cancelled():
+                try:
+                    hash_id, content = work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    self._process_fontlist(hash_id, content)
+                except Exception as e:
+                    logger.error(f"处理字体列表失败: {e}")
+                    self.stats.increment('processing_errors')
+        
+        threads = []
+        for _ in range(min(self.num_processes, len(fontlists))):
+            thread = threading.Thread(target=worker)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        
+        for thread in threads:
+            thread.join()
+    
     def _process_cache_items_threading(self, cache_items: List[CacheItem], progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
         """使用多线程处理缓存项目"""
         logger.debug(f"使用 {self.num_threads} 个线程处理缓存项目...")
@@ -999,37 +1103,43 @@ class RobloxFontExtractor:
         """线程安全的缓存项处理方法"""
         try:
             # 解析缓存内容
-            if cache_item.data:
-                parsed_cache = self.rbxh_parser.parse_cache_data(cache_item.data)
-            else:
-                parsed_cache = self.rbxh_parser.parse_cache_file(cache_item.path)
+            with self.stage_timer.span("parse"):
+                if cache_item.data:
+                    parsed_cache = self.rbxh_parser.parse_cache_data(cache_item.data)
+                else:
+                    parsed_cache = self.rbxh_parser.parse_cache_file(cache_item.path)
             
             if not parsed_cache.success:
                 return
             
             # 识别内容类型
-            identified = self.content_identifier.identify_content(parsed_cache.content)
+            with self.stage_timer.span("identify"):
+                identified = self.content_identifier.identify_content(parsed_cache.content)
             
             # 更新统计
             self.stats.increment('processed_caches')
             
             # 只处理字体列表
             if identified.asset_type == AssetType.FontList:
-                self.stats.increment('fontlist_found')
-                
-                # 处理字体列表
-                result = self.font_processor.process_fontlist(cache_item.hash_id, parsed_cache.content)
-                
-                if result["success"]:
-                    self.stats.increment('fonts_downloaded', result["downloaded_count"])
-                    self.stats.increment('already_processed', result.get("already_processed_count", 0))
-                else:
-                    self.stats.increment('download_failed')
+                self._process_fontlist(cache_item.hash_id, parsed_cache.content)
                     
         except Exception as e:
             logger.error(f"处理缓存项失败: {e}")
             self.stats.increment('processing_errors')
     
+    def _process_fontlist(self, hash_id: str, content: bytes):
+        """处理一个字体列表并更新统计"""
+        self.stats.increment('fontlist_found')
+        
+        result = self.font_processor.process_fontlist(hash_id, content)
+        
+        if result["success"]:
+            self.stats.increment('fonts_downloaded', result["downloaded_count"])
+            self.stats.increment('already_processed', result.get("already_processed_count", 0))
+            self.stats.increment('duplicate_skipped', result.get("duplicate_count", 0))
+        else:
+            self.stats.increment('download_failed')
+    
     def _process_cache_item(self, cache_item: CacheItem):
         """
         处理单个缓存项目
@@ -1054,16 +1164,7 @@ class RobloxFontExtractor:
             
             # 只处理字体列表
             if identified.asset_type == AssetType.FontList:
-                self.stats.increment('fontlist_found')
-                
-                # 处理字体列表
-                result = self.font_processor.process_fontlist(cache_item.hash_id, parsed_cache.content)
-                
-                if result["success"]:
-                    self.stats.increment('fonts_downloaded', result["downloaded_count"])
-                    self.stats.increment('already_processed', result.get("already_processed_count", 0))
-                else:
-                    self.stats.increment('download_failed')
+                self._process_fontlist(cache_item.hash_id, parsed_cache.content)
                     
             elif identified.asset_type == AssetType.Unknown:
                 logger.debug(f"未知内容类型: {identified.type_name}")
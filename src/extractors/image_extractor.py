@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图像提取器模块 - 从Roblox缓存中提取PNG、GIF、JPEG和WebP图片
+Image Extractor Module - Extracts PNG, GIF, JPEG and WebP images from the Roblox cache
+"""
+
+import os
+import struct
+import logging
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from enum import Enum, auto
+
+# 导入历史管理器
+from src.utils.history_manager import ExtractedHistory
+
+# 导入Roblox提取模块
+from .content_identifier import AssetType
+from .cache_scanner import CacheItem
+from .staged_extractor import (StagedCacheExtractor, StagedProcessingStats,
+                               get_process_identifier, stage_cache_content)
+
+logger = logging.getLogger(__name__)
+
+# 按最长边分类 (像素)
+_DIMENSION_CATEGORIES = (
+    ("tiny_0-64px", 64),
+    ("small_65-256px", 256),
+    ("medium_257-512px", 512),
+    ("large_513-1024px", 1024),
+    ("huge_1025px+", float('inf')),
+)
+_UNKNOWN_DIMENSION_CATEGORY = "unknown_size"
+
+
+class ImageClassificationMethod(Enum):
+    """图像分类方法枚举"""
+    DIMENSIONS = auto()  # 按尺寸分类
+    FORMAT = auto()      # 按图片格式分类
+    NONE = auto()        # 无分类
+
+
+class ImageProcessingStats(StagedProcessingStats):
+    """图像处理统计类 - 线程安全"""
+
+    def __init__(self):
+        super().__init__('images', formats_discovered=set())
+
+
+def read_image_size(head: bytes, extension: str) -> Optional[Tuple[int, int]]:
+    """
+    只读取图片文件头获取尺寸，不解码图片
+
+    Args:
+        head: 图片内容的开头部分
+        extension: 识别出的扩展名（png、gif、jfif、webp）
+
+    Returns:
+        Optional[Tuple[int, int]]: (宽, 高)，无法读取时返回None
+    """
+    try:
+        if extension == "png":
+            # IHDR块紧跟在8字节签名之后
+            start = head.find(b"PNG\r\n\x1a\n")
+            if start == -1 or head[start + 11:start + 15] != b"IHDR":
+                return None
+            return struct.unpack(">II", head[start + 15:start + 23])
+
+        if extension == "gif":
+            return struct.unpack("<HH", head[6:10])
+
+        if extension == "jfif":
+            return _read_jpeg_size(head)
+
+        if extension == "webp":
+            chunk = head[12:16]
+            if chunk == b"VP8 ":
+                width, height = struct.unpack("<HH", head[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L":
+                b0, b1, b2, b3 = head[21:25]
+                return (1 + (((b1 & 0x3F) << 8) | b0),
+                        1 + (((b3 & 0x0F) << 10) | (b2 << 2) | ((b1 & 0xC0) >> 6)))
+            if chunk == b"VP8X":
+                return (1 + int.from_bytes(head[24:27], "little"),
+                        1 + int.from_bytes(head[27:30], "little"))
+    except (struct.error, ValueError):
+        pass
+    return None
+
+
+def _read_jpeg_size(head: bytes) -> Optional[Tuple[int, int]]:
+    """遍历JPEG段直到帧头(SOFn)，读取其中的尺寸"""
+    if not head.startswith(b"\xff\xd8"):
+        return None
+    pos = 2
+    while pos + 9 <= len(head):
+        if head[pos] != 0xFF:
+            return None
+        marker = head[pos + 1]
+        if marker == 0xFF:
+            # 填充字节
+            pos += 1
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">HH", head[pos + 5:pos + 9])
+            return width, height
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # 没有长度字段的标记
+            pos += 2
+            continue
+        pos += 2 + struct.unpack(">H", head[pos + 2:pos + 4])[0]
+    return None
+
+
+def get_dimension_category(size: Optional[Tuple[int, int]]) -> str:
+    """
+    根据图片最长边确定类别
+
+    Args:
+        size: (宽, 高)，未知时为None
+
+    Returns:
+        str: 类别目录名
+    """
+    if not size or not all(size):
+        return _UNKNOWN_DIMENSION_CATEGORY
+    longest = max(size)
+    for category, max_side in _DIMENSION_CATEGORIES:
+        if longest <= max_side:
+            return category
+    return _DIMENSION_CATEGORIES[-1][0]
+
+
+def stage_image(path: str, data: Optional[bytes], hash_id: str, staging_dir: str,
+                block_avatar_images: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    识别缓存项中的图片并写入暂存文件（不依赖提取器状态，可在工作进程中执行）
+
+    Args:
+        path: 缓存文件路径（data为None时使用）
+        data: 直接从数据库获取的缓存数据
+        hash_id: 缓存项哈希ID，用作暂存文件名
+        staging_dir: 暂存目录（需已存在）
+        block_avatar_images: 是否阻止头像图片（WebP）
+
+    Returns:
+        Optional[Dict[str, Any]]: 不是图片时返回None，否则为
+            {'hash_id', 'link', 'extension', 'type_name', 'content_hash', 'size', 'width', 'height', 'temp_path'}
+
+    Raises:
+        OSError: 读取缓存或写入暂存文件失败
+        ValueError: 缓存内容被截断
+    """
+    identifier = get_process_identifier(block_avatar_images)
+
+    def accept(head: bytes) -> Optional[Dict[str, Any]]:
+        identified = identifier.identify_content(head)
+        if identified.asset_type != AssetType.NoConvert or identified.category != "Textures":
+            return None
+        size = read_image_size(head, identified.extension) or (0, 0)
+        return {
+            'extension': identified.extension,
+            'type_name': identified.type_name,
+            'width': size[0],
+            'height': size[1]
+        }
+
+    return stage_cache_content(path, data, hash_id, staging_dir, accept)
+
+
+class RobloxImageExtractor(StagedCacheExtractor):
+    """Roblox图像提取器"""
+
+    OUTPUT_DIR_NAME = "Images"
+    ASSET_TYPE = "image"
+    ASSET_LABEL = "图像"
+    STATS_PREFIX = "images"
+    STAGE_FUNCTION = staticmethod(stage_image)
+
+    def __init__(self,
+                 output_dir: Optional[str] = None,
+                 classification_method: ImageClassificationMethod = ImageClassificationMethod.DIMENSIONS,
+                 block_avatar_images: bool = True,
+                 num_threads: int = 1,
+                 use_multiprocessing: bool = False,
+                 conservative_multiprocessing: bool = True,
+                 log_callback: Optional[Callable[[str, str], None]] = None,
+                 download_history: Optional[ExtractedHistory] = None):
+        """
+        初始化图像提取器
+
+        Args:
+            output_dir: 输出目录
+            classification_method: 分类方法
+            block_avatar_images: 是否阻止头像图片（WebP）
+            num_threads: 线程数量
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+            log_callback: 日志回调函数(message, log_type)
+            download_history: 下载历史管理器，用于避免重复处理文件
+        """
+        self.block_avatar_images = block_avatar_images
+        super().__init__(output_dir, classification_method, num_threads, use_multiprocessing,
+                         conservative_multiprocessing, log_callback, download_history)
+
+    def _create_stats(self) -> ImageProcessingStats:
+        return ImageProcessingStats()
+
+    def _stage_args(self) -> tuple:
+        return (self.block_avatar_images,)
+
+    def extract_images(self,
+                       progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                       custom_cache_path: Optional[str] = None,
+                       cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
+        """提取图像，参数和返回值见StagedCacheExtractor.extract()"""
+        return self.extract(progress_callback, custom_cache_path, cache_items)
+
+    def _on_saved(self, output_path: str, staged: Dict[str, Any]):
+        self.stats.add_item('formats_discovered', staged['type_name'])
+
+    def get_output_dir(self, staged: Dict[str, Any]) -> str:
+        """
+        根据分类方法获取输出目录（不创建目录）
+
+        Args:
+            staged: stage_image()的结果
+
+        Returns:
+            str: 输出目录
+        """
+        if self.classification_method == ImageClassificationMethod.DIMENSIONS:
+            return os.path.join(self.asset_dir, get_dimension_category((staged['width'], staged['height'])))
+        elif self.classification_method == ImageClassificationMethod.FORMAT:
+            return os.path.join(self.asset_dir, staged['type_name'])
+        else:  # NONE
+            return self.asset_dir
+
+
+# 便捷函数
+def extract_roblox_images(output_dir: Optional[str] = None,
+                          cache_path: Optional[str] = None,
+                          progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                          num_threads: int = 1,
+                          use_multiprocessing: bool = False,
+                          conservative_multiprocessing: bool = True,
+                          log_callback: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+    """
+    Roblox图像提取的便捷函数
+
+    Args:
+        output_dir: 输出目录
+        cache_path: 自定义缓存路径
+        progress_callback: 进度回调函数
+        num_threads: 线程数量
+        use_multiprocessing: 是否使用多进程
+        conservative_multiprocessing: 是否使用保守的多进程策略
+        log_callback: 日志回调函数
+
+    Returns:
+        Dict[str, Any]: 提取结果
+    """
+    extractor = RobloxImageExtractor(
+        output_dir=output_dir,
+        num_threads=num_threads,
+        use_multiprocessing=use_multiprocessing,
+        conservative_multiprocessing=conservative_multiprocessing,
+        log_callback=log_callback
+    )
+    return extractor.extract_images(progress_callback, cache_path)
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KTX纹理模块 - 解析KTX 1.1文件头，并用NumPy按块向量化解码BCn纹理为PNG
+KTX Texture Module - Parses KTX 1.1 headers and decodes BCn textures to PNG with NumPy block vectorization
+"""
+
+import zlib
+import struct
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+# NumPy为可选依赖，未安装时只能提取原始KTX文件
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+KTX_IDENTIFIER = b"\xabKTX 11\xbb\r\n\x1a\n"
+KTX_HEADER_SIZE = 64
+
+# PNG压缩级别，纹理解码的主要开销之一，6是zlib默认的速度和体积平衡
+_PNG_COMPRESSION_LEVEL = 6
+
+# glInternalFormat -> (格式名称, 块字节数)，块字节数为0表示未压缩
+_FORMATS = {
+    0x83F0: ("BC1", 8),    # GL_COMPRESSED_RGB_S3TC_DXT1_EXT
+    0x83F1: ("BC1", 8),    # GL_COMPRESSED_RGBA_S3TC_DXT1_EXT
+    0x83F2: ("BC2", 16),   # GL_COMPRESSED_RGBA_S3TC_DXT3_EXT
+    0x83F3: ("BC3", 16),   # GL_COMPRESSED_RGBA_S3TC_DXT5_EXT
+    0x8C4C: ("BC1", 8),    # GL_COMPRESSED_SRGB_S3TC_DXT1_EXT
+    0x8C4D: ("BC1", 8),    # GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT
+    0x8C4E: ("BC2", 16),   # GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT
+    0x8C4F: ("BC3", 16),   # GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT
+    0x8DBB: ("BC4", 8),    # GL_COMPRESSED_RED_RGTC1
+    0x8DBD: ("BC5", 16),   # GL_COMPRESSED_RG_RGTC2
+    0x8E8C: ("BC7", 16),   # GL_COMPRESSED_RGBA_BPTC_UNORM
+    0x8E8D: ("BC7", 16),   # GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM
+    0x8058: ("RGBA8", 0),  # GL_RGBA8
+    0x1908: ("RGBA8", 0),  # GL_RGBA
+    0x8051: ("RGB8", 0),   # GL_RGB8
+    0x1907: ("RGB8", 0),   # GL_RGB
+}
+
+# 不透明的BC1格式（三色模式下索引3为不透明黑色）
+_OPAQUE_BC1 = (0x83F0, 0x8C4C)
+
+
+@dataclass
+class KTXHeader:
+    """KTX 1.1文件头"""
+    endian: str
+    gl_type: int
+    gl_format: int
+    gl_internal_format: int
+    width: int
+    height: int
+    depth: int
+    array_elements: int
+    faces: int
+    mip_levels: int
+    key_value_bytes: int
+
+    @property
+    def format_name(self) -> str:
+        """纹理格式名称，如BC1、BC3、ASTC"""
+        known = _FORMATS.get(self.gl_internal_format)
+        if known:
+            return known[0]
+        if (self.gl_internal_format & 0xFF00) in (0x9200, 0x9300):
+            return "ASTC"
+        return f"0x{self.gl_internal_format:04X}"
+
+    @property
+    def data_offset(self) -> int:
+        """第一个Mip级别（imageSize字段）在文件中的偏移"""
+        return KTX_HEADER_SIZE + self.key_value_bytes
+
+
+def parse_ktx_header(head: bytes) -> Optional[KTXHeader]:
+    """
+    解析KTX 1.1文件头
+
+    Args:
+        head: 文件开头（至少64字节）
+
+    Returns:
+        Optional[KTXHeader]: 文件头，不是KTX 1.1文件时返回None
+    """
+    if len(head) < KTX_HEADER_SIZE or not head.startswith(KTX_IDENTIFIER):
+        return None
+    endianness = head[12:16]
+    if endianness == b"\x01\x02\x03\x04":
+        endian = "<"
+    elif endianness == b"\x04\x03\x02\x01":
+        endian = ">"
+    else:
+        return None
+    fields = struct.unpack(endian + "12I", head[16:KTX_HEADER_SIZE])
+    return KTXHeader(
+        endian=endian,
+        gl_type=fields[0],
+        gl_format=fields[2],
+        gl_internal_format=fields[3],
+        width=fields[5],
+        height=fields[6],
+        depth=fields[7],
+        array_elements=fields[8],
+        faces=fields[9],
+        mip_levels=fields[10],
+        key_value_bytes=fields[11]
+    )
+
+
+def is_decode_available() -> bool:
+    """是否可以把纹理解码为PNG（需要NumPy）"""
+    return np is not None
+
+
+def can_decode(header: KTXHeader) -> bool:
+    """是否支持解码该纹理格式"""
+    return np is not None and header.gl_internal_format in _DECODERS
+
+
+def _image_size(header: KTXHeader, width: int, height: int) -> int:
+    """一个面（一个数组元素）在该尺寸下的数据字节数"""
+    block_bytes = _FORMATS[header.gl_internal_format][1]
+    if block_bytes:
+        return ((width + 3) // 4) * ((height + 3) // 4) * block_bytes
+    channels = 4 if _FORMATS[header.gl_internal_format][0] == "RGBA8" else 3
+    return ((width * channels + 3) & ~3) * height
+
+
+def _blocks(data: bytes, width: int, height: int, block_bytes: int):
+    """把压缩数据按4x4块排列为 (块行, 块列, 块字节数) 数组"""
+    blocks_x = (width + 3) // 4
+    blocks_y = (height + 3) // 4
+    return np.frombuffer(data, dtype=np.uint8, count=blocks_x * blocks_y * block_bytes).reshape(
+        blocks_y, blocks_x, block_bytes)
+
+
+def _assemble(pixels, width: int, height: int):
+    """把 (块行, 块列, 16, 通道) 的块像素拼成 (高, 宽, 通道) 图像并裁掉补齐部分"""
+    blocks_y, blocks_x, _, channels = pixels.shape
+    image = pixels.reshape(blocks_y, blocks_x, 4, 4, channels).transpose(0, 2, 1, 3, 4)
+    return image.reshape(blocks_y * 4, blocks_x * 4, channels)[:height, :width]
+
+
+def _expand_565(color):
+    """RGB565转为8位RGB，返回 (..., 3) 的int32数组"""
+    red = (color >> 11) & 0x1F
+    green = (color >> 5) & 0x3F
+    blue = color & 0x1F
+    return np.stack(((red * 527 + 23) >> 6, (green * 259 + 33) >> 6, (blue * 527 + 23) >> 6), axis=-1)
+
+
+def _decode_color_blocks(blocks, three_color_mode: bool, punchthrough_alpha: bool):
+    """
+    解码BC1颜色块
+
+    Args:
+        blocks: (块行, 块列, 8) 的颜色块
+        three_color_mode: color0 <= color1 时是否使用三色模式（只有BC1使用）
+        punchthrough_alpha: 三色模式下索引3是否透明
+
+    Returns:
+        (块行, 块列, 16, 4) 的RGBA像素
+    """
+    color0 = blocks[..., 0].astype(np.int32) | (blocks[..., 1].astype(np.int32) << 8)
+    color1 = blocks[..., 2].astype(np.int32) | (blocks[..., 3].astype(np.int32) << 8)
+    rgb0 = _expand_565(color0)
+    rgb1 = _expand_565(color1)
+
+    four_color = color0 > color1 if three_color_mode else np.ones(color0.shape, dtype=bool)
+    four = four_color[..., None]
+    rgb2 = np.where(four, (2 * rgb0 + rgb1) // 3, (rgb0 + rgb1) // 2)
+    rgb3 = np.where(four, (rgb0 + 2 * rgb1) // 3, 0)
+
+    palette = np.empty(color0.shape + (4, 4), dtype=np.uint8)
+    palette[..., 0, :3] = rgb0
+    palette[..., 1, :3] = rgb1
+    palette[..., 2, :3] = rgb2
+    palette[..., 3, :3] = rgb3
+    palette[..., :3, 3] = 255
+    palette[..., 3, 3] = np.where(four_color | (not punchthrough_alpha), 255, 0)
+
+    bits = np.ascontiguousarray(blocks[..., 4:8]).view("<u4")[..., 0]
+    indices = (bits[..., None] >> np.arange(0, 32, 2, dtype=np.uint32)) & 3
+    return np.take_along_axis(palette, indices[..., None].astype(np.intp), axis=2)
+
+
+def _decode_alpha_blocks(blocks):
+    """
+    解码BC3/BC4的8字节插值通道块
+
+    Args:
+        blocks: (块行, 块列, 8) 的通道块
+
+    Returns:
+        (块行, 块列, 16) 的通道值
+    """
+    value0 = blocks[..., 0].astype(np.int32)[..., None]
+    value1 = blocks[..., 1].astype(np.int32)[..., None]
+    steps = np.arange(1, 7, dtype=np.int32)
+    eight = (value0 > value1)
+
+    palette = np.empty(blocks.shape[:2] + (8,), dtype=np.int32)
+    palette[..., 0:1] = value0
+    palette[..., 1:2] = value1
+    interpolated8 = ((7 - steps) * value0 + steps * value1) // 7
+    interpolated6 = ((5 - steps[:4]) * value0 + steps[:4] * value1) // 5
+    palette[..., 2:8] = np.where(eight, interpolated8,
+                                 np.concatenate((interpolated6, np.zeros_like(value0), np.full_like(value0, 255)),
+                                                axis=-1))
+
+    index_bytes = np.zeros(blocks.shape[:2] + (8,), dtype=np.uint8)
+    index_bytes[..., :6] = blocks[..., 2:8]
+    bits = index_bytes.view("<u8")[..., 0]
+    indices = (bits[..., None] >> np.arange(0, 48, 3, dtype=np.uint64)) & 7
+    return np.take_along_axis(palette, indices.astype(np.intp), axis=2).astype(np.uint8)
+
+
+def _decode_bc1(header: KTXHeader, data: bytes, width: int, height: int):
+    """解码BC1 (DXT1)"""
+    pixels = _decode_color_blocks(_blocks(data, width, height, 8), True,
+                                  header.gl_internal_format not in _OPAQUE_BC1)
+    return _assemble(pixels, width, height)
+
+
+def _decode_bc2(header: KTXHeader, data: bytes, width: int, height: int):
+    """解码BC2 (DXT3)，4位显式透明度"""
+    blocks = _blocks(data, width, height, 16)
+    pixels = _decode_color_blocks(blocks[..., 8:], False, False)
+    alpha_bytes = blocks[..., :8]
+    alpha = np.stack((alpha_bytes & 0x0F, alpha_bytes >> 4), axis=-1).reshape(blocks.shape[:2] + (16,))
+    pixels[..., 3] = alpha * 17
+    return _assemble(pixels, width, height)
+
+
+def _decode_bc3(header: KTXHeader, data: bytes, width: int, height: int):
+    """解码BC3 (DXT5)，插值透明度"""
+    blocks = _blocks(data, width, height, 16)
+    pixels = _decode_color_blocks(blocks[..., 8:], False, False)
+    pixels[..., 3] = _decode_alpha_blocks(blocks[..., :8])
+    return _assemble(pixels, width, height)
+
+
+def _decode_bc4(header: KTXHeader, data: bytes, width: int, height: int):
+    """解码BC4单通道纹理为灰度图"""
+    red = _decode_alpha_blocks(_blocks(data, width, height, 8))
+    pixels = np.empty(red.shape + (4,), dtype=np.uint8)
+    pixels[..., :3] = red[..., None]
+    pixels[..., 3] = 255
+    return _assemble(pixels, width, height)
+
+
+def _decode_bc5(header: KTXHeader, data: bytes, width: int, height: int):
+    """解码BC5双通道纹理（通常是法线贴图），蓝色通道为0"""
+    blocks = _blocks(data, width, height, 16)
+    pixels = np.zeros(blocks.shape[:2] + (16, 4), dtype=np.uint8)
+    pixels[..., 0] = _decode_alpha_blocks(blocks[..., :8])
+    pixels[..., 1] = _decode_alpha_blocks(blocks[..., 8:])
+    pixels[..., 3] = 255
+    return _assemble(pixels, width, height)
+
+
+def _decode_uncompressed(header: KTXHeader, data: bytes, width: int, height: int):
+    """读取未压缩的RGBA8/RGB8纹理（每行按4字节对齐）"""
+    channels = 4 if _FORMATS[header.gl_internal_format][0] == "RGBA8" else 3
+    row_bytes = (width * channels + 3) & ~3
+    rows = np.frombuffer(data, dtype=np.uint8, count=row_bytes * height).reshape(height, row_bytes)
+    return rows[:, :width * channels].reshape(height, width, channels)
+
+
+_DECODERS: Dict[int, Callable] = {
+    0x83F0: _decode_bc1, 0x83F1: _decode_bc1, 0x8C4C: _decode_bc1, 0x8C4D: _decode_bc1,
+    0x83F2: _decode_bc2, 0x8C4E: _decode_bc2,
+    0x83F3: _decode_bc3, 0x8C4F: _decode_bc3,
+    0x8DBB: _decode_bc4,
+    0x8DBD: _decode_bc5,
+    0x8058: _decode_uncompressed, 0x1908: _decode_uncompressed,
+    0x8051: _decode_uncompressed, 0x1907: _decode_uncompressed,
+}
+
+
+def write_png(path: str, image) -> None:
+    """
+    把 (高, 宽, 3或4) 的uint8图像写为PNG（只使用zlib，不依赖图像库）
+
+    Args:
+        path: 输出路径
+        image: NumPy图像数组
+    """
+    height, width, channels = image.shape
+    raw = np.zeros((height, width * channels + 1), dtype=np.uint8)  # 每行开头的过滤类型0
+    raw[:, 1:] = image.reshape(height, width * channels)
+
+    def chunk(tag: bytes, body: bytes) -> bytes:
+        return struct.pack(">I", len(body)) + tag + body + struct.pack(">I", zlib.crc32(tag + body) & 0xFFFFFFFF)
+
+    color_type = 6 if channels == 4 else 2
+    png = b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)),
+        chunk(b"IDAT", zlib.compress(raw.tobytes(), _PNG_COMPRESSION_LEVEL)),
+        chunk(b"IEND", b"")
+    ))
+    with open(path, "wb") as f:
+        f.write(png)
+
+
+def decode_ktx_file(ktx_path: str, output_base: str, mip_levels: int = 1) -> List[str]:
+    """
+    把KTX文件解码为PNG，只读取需要的Mip级别
+
+    立方体贴图和纹理数组只解码第一个面（第一个元素）。
+
+    Args:
+        ktx_path: KTX文件路径
+        output_base: 输出路径（不含扩展名），Mip级别n>0输出为 <output_base>_mip<n>.png
+        mip_levels: 解码的Mip级别数，默认只解码级别0
+
+    Returns:
+        List[str]: 写出的PNG路径
+
+    Raises:
+        ValueError: 不是KTX文件、格式不支持或数据被截断
+        RuntimeError: 未安装NumPy
+    """
+    if np is None:
+        raise RuntimeError("NumPy is not installed")
+
+    with open(ktx_path, "rb") as f:
+        header = parse_ktx_header(f.read(KTX_HEADER_SIZE))
+        if header is None:
+            raise ValueError("不是有效的KTX 1.1文件")
+        decoder = _DECODERS.get(header.gl_internal_format)
+        if decoder is None:
+            raise ValueError(f"不支持解码的纹理格式: {header.format_name}")
+
+        written = []
+        offset = header.data_offset
+        for level in range(min(max(1, mip_levels), max(1, header.mip_levels))):
+            width = max(1, header.width >> level)
+            height = max(1, header.height >> level)
+            f.seek(offset)
+            size_field = f.read(4)
+            if len(size_field) != 4:
+                break
+            image_size = struct.unpack(header.endian + "I", size_field)[0]
+            needed = _image_size(header, width, height)
+            data = f.read(needed)
+            if len(data) != needed:
+                raise ValueError(f"纹理数据被截断（Mip级别{level}）")
+
+            output_path = output_base + (".png" if level == 0 else f"_mip{level}.png")
+            write_png(output_path, decoder(header, data, width, height))
+            written.append(output_path)
+
+            # 非数组立方体贴图的imageSize是单个面的大小，每个面按4字节对齐
+            padded = (image_size + 3) & ~3
+            level_bytes = padded * 6 if header.faces == 6 and header.array_elements == 0 else padded
+            offset += 4 + level_bytes
+    return written
+
+
+# 多进程工作函数
+def _decode_ktx_worker(ktx_path: str, output_base: str, mip_levels: int) -> Tuple[str, object]:
+    """
+    进程池工作函数 - 解码单个KTX文件
+
+    Returns:
+        tuple: (KTX路径, 写出的PNG路径列表)，失败时为 (KTX路径, {'error': 错误信息})
+    """
+    try:
+        return ktx_path, decode_ktx_file(ktx_path, output_base, mip_levels)
+    except Exception as e:
+        return ktx_path, {'error': str(e)}
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+网格提取器模块 - 从Roblox缓存中提取网格，并可选地转换为OBJ
+Mesh Extractor Module - Extracts meshes from the Roblox cache and optionally converts them to OBJ
+"""
+
+import os
+import logging
+from typing import Dict, List, Any, Optional, Callable
+from enum import Enum, auto
+
+# 导入历史管理器
+from src.utils.history_manager import ExtractedHistory
+
+# 导入Roblox提取模块
+from .content_identifier import AssetType
+from .cache_scanner import CacheItem
+from .roblox_mesh import read_mesh_version, CONVERTIBLE_VERSIONS, _convert_mesh_worker
+from .staged_extractor import (StagedCacheExtractor, StagedProcessingStats,
+                               get_process_identifier, stage_cache_content)
+
+logger = logging.getLogger(__name__)
+
+
+class MeshClassificationMethod(Enum):
+    """网格分类方法枚举"""
+    VERSION = auto()  # 按网格版本分类
+    NONE = auto()     # 无分类
+
+
+class MeshProcessingStats(StagedProcessingStats):
+    """网格处理统计类 - 线程安全"""
+
+    def __init__(self):
+        super().__init__('meshes', meshes_converted=0, conversion_errors=0, versions_discovered=set())
+
+
+def _accept_mesh(head: bytes) -> Optional[Dict[str, Any]]:
+    """识别内容开头是否为网格，是则只从版本行读取版本号"""
+    if get_process_identifier().identify_content(head).asset_type != AssetType.Mesh:
+        return None
+    version = read_mesh_version(head)
+    if version is None:
+        return None
+    return {
+        'extension': "mesh",
+        'version': version,
+        'convertible': version in CONVERTIBLE_VERSIONS
+    }
+
+
+def stage_mesh(path: str, data: Optional[bytes], hash_id: str, staging_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    识别缓存项中的网格并写入暂存文件（不依赖提取器状态，可在工作进程中执行）
+
+    Args:
+        path: 缓存文件路径（data为None时使用）
+        data: 直接从数据库获取的缓存数据
+        hash_id: 缓存项哈希ID，用作暂存文件名
+        staging_dir: 暂存目录（需已存在）
+
+    Returns:
+        Optional[Dict[str, Any]]: 不是网格时返回None，否则为
+            {'hash_id', 'link', 'extension', 'version', 'convertible', 'content_hash', 'size', 'temp_path'}
+
+    Raises:
+        OSError: 读取缓存或写入暂存文件失败
+        ValueError: 缓存内容被截断
+    """
+    return stage_cache_content(path, data, hash_id, staging_dir, _accept_mesh)
+
+
+class RobloxMeshExtractor(StagedCacheExtractor):
+    """Roblox网格提取器"""
+
+    OUTPUT_DIR_NAME = "Meshes"
+    ASSET_TYPE = "mesh"
+    ASSET_LABEL = "网格"
+    STATS_PREFIX = "meshes"
+    STAGE_FUNCTION = staticmethod(stage_mesh)
+
+    POST_PROCESS_LOG_KEY = "converting_meshes"
+    POST_PROCESS_STATS = ("meshes_converted", "conversion_errors")
+    POST_PROCESS_LABEL = "转换网格"
+
+    def __init__(self,
+                 output_dir: Optional[str] = None,
+                 classification_method: MeshClassificationMethod = MeshClassificationMethod.VERSION,
+                 convert_obj: bool = False,
+                 num_threads: int = 1,
+                 use_multiprocessing: bool = False,
+                 conservative_multiprocessing: bool = True,
+                 log_callback: Optional[Callable[[str, str], None]] = None,
+                 download_history: Optional[ExtractedHistory] = None):
+        """
+        初始化网格提取器
+
+        Args:
+            output_dir: 输出目录
+            classification_method: 分类方法
+            convert_obj: 是否把v1.00-v5.00网格转换为OBJ
+            num_threads: 线程数量
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+            log_callback: 日志回调函数(message, log_type)
+            download_history: 下载历史管理器，用于避免重复处理文件
+        """
+        self.convert_obj = convert_obj
+        super().__init__(output_dir, classification_method, num_threads, use_multiprocessing,
+                         conservative_multiprocessing, log_callback, download_history)
+
+    def _create_stats(self) -> MeshProcessingStats:
+        return MeshProcessingStats()
+
+    def _uses_post_pool(self) -> bool:
+        return self.convert_obj
+
+    def extract_meshes(self,
+                       progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                       custom_cache_path: Optional[str] = None,
+                       cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
+        """提取网格，参数和返回值见StagedCacheExtractor.extract()"""
+        return self.extract(progress_callback, custom_cache_path, cache_items)
+
+    def _on_saved(self, output_path: str, staged: Dict[str, Any]):
+        self.stats.add_item('versions_discovered', staged['version'])
+
+        # OBJ写在网格文件旁边，转换在进程池中进行，不阻塞提取
+        if self._post_pool is not None and staged['convertible']:
+            self._submit_post_process(
+                _convert_mesh_worker, (output_path, os.path.splitext(output_path)[0] + ".obj"))
+
+    def get_output_dir(self, staged: Dict[str, Any]) -> str:
+        """
+        根据分类方法获取输出目录（不创建目录）
+
+        Args:
+            staged: stage_mesh()的结果
+
+        Returns:
+            str: 输出目录
+        """
+        if self.classification_method == MeshClassificationMethod.VERSION:
+            return os.path.join(self.asset_dir, f"v{staged['version']}")
+        else:  # NONE
+            return self.asset_dir
+
+
+# 便捷函数
+def extract_roblox_meshes(output_dir: Optional[str] = None,
+                          cache_path: Optional[str] = None,
+                          progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                          convert_obj: bool = False,
+                          num_threads: int = 1,
+                          use_multiprocessing: bool = False,
+                          conservative_multiprocessing: bool = True,
+                          log_callback: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+    """
+    Roblox网格提取的便捷函数
+
+    Args:
+        output_dir: 输出目录
+        cache_path: 自定义缓存路径
+        progress_callback: 进度回调函数
+        convert_obj: 是否转换为OBJ
+        num_threads: 线程数量
+        use_multiprocessing: 是否使用多进程
+        conservative_multiprocessing: 是否使用保守的多进程策略
+        log_callback: 日志回调函数
+
+    Returns:
+        Dict[str, Any]: 提取结果
+    """
+    extractor = RobloxMeshExtractor(
+        output_dir=output_dir,
+        convert_obj=convert_obj,
+        num_threads=num_threads,
+        use_multiprocessing=use_multiprocessing,
+        conservative_multiprocessing=conservative_multiprocessing,
+        log_callback=log_callback
+    )
+    return extractor.extract_meshes(progress_callback, cache_path)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模型提取器模块 - 从Roblox缓存中提取二进制RBXM模型，并建立轻量的块索引
+Model Extractor Module - Extracts binary RBXM models from the Roblox cache and builds a lightweight chunk index
+"""
+
+import os
+import json
+import logging
+from typing import Dict, List, Any, Optional, Callable
+from enum import Enum, auto
+
+# 导入历史管理器
+from src.utils.history_manager import ExtractedHistory
+
+# 导入Roblox提取模块
+from .content_identifier import AssetType
+from .cache_scanner import CacheItem
+from .rbxm_index import index_rbxm_file
+from .staged_extractor import (StagedCacheExtractor, StagedProcessingStats,
+                               get_process_identifier, stage_cache_content)
+
+logger = logging.getLogger(__name__)
+
+# 无法读取实例类型时使用的分类目录
+_UNKNOWN_CLASS_CATEGORY = "Unknown"
+
+
+class ModelClassificationMethod(Enum):
+    """模型分类方法枚举"""
+    MAIN_CLASS = auto()  # 按实例最多的类分类
+    NONE = auto()        # 无分类
+
+
+class ModelProcessingStats(StagedProcessingStats):
+    """模型处理统计类 - 线程安全"""
+
+    def __init__(self):
+        super().__init__('models', instances_indexed=0, index_errors=0, class_counts={})
+
+    def add_classes(self, classes: Dict[str, int]):
+        """累加各实例类型的数量"""
+        with self._lock:
+            class_counts = self.stats['class_counts']
+            for class_name, count in classes.items():
+                class_counts[class_name] = class_counts.get(class_name, 0) + count
+
+    def get_all(self) -> Dict[str, Any]:
+        """获取所有统计信息的副本，class_counts按数量从多到少排序"""
+        stats_copy = super().get_all()
+        stats_copy['class_counts'] = dict(sorted(stats_copy['class_counts'].items(),
+                                                 key=lambda item: (-item[1], item[0])))
+        return stats_copy
+
+
+def _accept_model(head: bytes) -> Optional[Dict[str, Any]]:
+    """识别内容开头是否为二进制模型"""
+    identified = get_process_identifier().identify_content(head)
+    if identified.asset_type != AssetType.NoConvert or identified.extension != "rbxm":
+        return None
+    return {'extension': identified.extension}
+
+
+def stage_model(path: str, data: Optional[bytes], hash_id: str, staging_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    识别缓存项中的模型，写入暂存文件并建立块索引（不依赖提取器状态，可在工作进程中执行）
+
+    Args:
+        path: 缓存文件路径（data为None时使用）
+        data: 直接从数据库获取的缓存数据
+        hash_id: 缓存项哈希ID，用作暂存文件名
+        staging_dir: 暂存目录（需已存在）
+
+    Returns:
+        Optional[Dict[str, Any]]: 不是模型时返回None，否则为
+            {'hash_id', 'link', 'extension', 'content_hash', 'size', 'temp_path', 'index', 'main_class'}，
+            无法建立索引时index为None并带有'index_error'
+
+    Raises:
+        OSError: 读取缓存或写入暂存文件失败
+        ValueError: 缓存内容被截断
+    """
+    staged = stage_cache_content(path, data, hash_id, staging_dir, _accept_model)
+    if staged is None:
+        return None
+    try:
+        index = index_rbxm_file(staged['temp_path'])
+        staged['index'] = index.to_dict()
+        staged['main_class'] = index.main_class
+    except ValueError as e:
+        staged['index'] = None
+        staged['main_class'] = None
+        staged['index_error'] = str(e)
+    return staged
+
+
+class RobloxModelExtractor(StagedCacheExtractor):
+    """Roblox模型提取器"""
+
+    OUTPUT_DIR_NAME = "Models"
+    ASSET_TYPE = "model"
+    ASSET_LABEL = "模型"
+    STATS_PREFIX = "models"
+    STAGE_FUNCTION = staticmethod(stage_model)
+    INDEX_FILE_NAME = "model_index.json"
+
+    def __init__(self,
+                 output_dir: Optional[str] = None,
+                 classification_method: ModelClassificationMethod = ModelClassificationMethod.MAIN_CLASS,
+                 write_index: bool = True,
+                 num_threads: int = 1,
+                 use_multiprocessing: bool = False,
+                 conservative_multiprocessing: bool = True,
+                 log_callback: Optional[Callable[[str, str], None]] = None,
+                 download_history: Optional[ExtractedHistory] = None):
+        """
+        初始化模型提取器
+
+        Args:
+            output_dir: 输出目录
+            classification_method: 分类方法
+            write_index: 是否把块索引写入Models/model_index.json
+            num_threads: 线程数量
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+            log_callback: 日志回调函数(message, log_type)
+            download_history: 下载历史管理器，用于避免重复处理文件
+        """
+        self.write_index = write_index
+        self._index_entries = {}  # 本次保存的模型相对路径 -> 块索引
+        super().__init__(output_dir, classification_method, num_threads, use_multiprocessing,
+                         conservative_multiprocessing, log_callback, download_history)
+        self.index_path = os.path.join(self.asset_dir, self.INDEX_FILE_NAME)
+
+    def _create_stats(self) -> ModelProcessingStats:
+        return ModelProcessingStats()
+
+    def _reset_run_state(self):
+        self._index_entries = {}
+
+    def extract_models(self,
+                       progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                       custom_cache_path: Optional[str] = None,
+                       cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
+        """提取模型，参数和返回值见StagedCacheExtractor.extract()，结果另含index_path"""
+        return self.extract(progress_callback, custom_cache_path, cache_items)
+
+    def _after_processing(self) -> Dict[str, Any]:
+        # 写入块索引
+        if self.write_index and self._index_entries:
+            self._save_index()
+        return {"index_path": self.index_path if self.write_index else ""}
+
+    def _on_saved(self, output_path: str, staged: Dict[str, Any]):
+        index = staged['index']
+        if index is None:
+            self.stats.increment('index_errors')
+            logger.warning(f"无法为模型 {output_path} 建立块索引: {staged['index_error']}")
+            return
+        self.stats.increment('instances_indexed', sum(index['classes'].values()))
+        self.stats.add_classes(index['classes'])
+        relative_path = os.path.relpath(output_path, self.asset_dir).replace(os.sep, "/")
+        with self._lock:
+            self._index_entries[relative_path] = dict(index, link=staged['link'], size=staged['size'])
+
+    def _save_index(self):
+        """把本次的块索引合并到索引文件（保留以前运行记录的模型）"""
+        entries = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get("models", {})
+        except (OSError, ValueError):
+            pass
+
+        # 只保留仍然存在的模型
+        entries = {path: entry for path, entry in entries.items()
+                   if os.path.exists(os.path.join(self.asset_dir, path))}
+        entries.update(self._index_entries)
+
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "models": dict(sorted(entries.items()))}, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.index_path)
+        self.send_log("model_index_saved", "info", len(entries))
+
+    def get_output_dir(self, staged: Dict[str, Any]) -> str:
+        """
+        根据分类方法获取输出目录（不创建目录）
+
+        Args:
+            staged: stage_model()的结果
+
+        Returns:
+            str: 输出目录
+        """
+        if self.classification_method == ModelClassificationMethod.MAIN_CLASS:
+            return os.path.join(self.asset_dir, staged['main_class'] or _UNKNOWN_CLASS_CATEGORY)
+        else:  # NONE
+            return self.asset_dir
+
+
+# 便捷函数
+def extract_roblox_models(output_dir: Optional[str] = None,
+                          cache_path: Optional[str] = None,
+                          progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                          num_threads: int = 1,
+                          use_multiprocessing: bool = False,
+                          conservative_multiprocessing: bool = True,
+                          log_callback: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+    """
+    Roblox模型提取的便捷函数
+
+    Args:
+        output_dir: 输出目录
+        cache_path: 自定义缓存路径
+        progress_callback: 进度回调函数
+        num_threads: 线程数量
+        use_multiprocessing: 是否使用多进程
+        conservative_multiprocessing: 是否使用保守的多进程策略
+        log_callback: 日志回调函数
+
+    Returns:
+        Dict[str, Any]: 提取结果
+    """
+    extractor = RobloxModelExtractor(
+        output_dir=output_dir,
+        num_threads=num_threads,
+        use_multiprocessing=use_multiprocessing,
+        conservative_multiprocessing=conservative_multiprocessing,
+        log_callback=log_callback
+    )
+    return extractor.extract_models(progress_callback, cache_path)
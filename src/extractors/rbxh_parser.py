@@ -5,6 +5,7 @@ RBXH缓存格式解析器 - 实现Roblox缓存文件解析功能
 RBXH Cache Format Parser - Implements Roblox cache file parsing functionality
 """
 
+import io
 import os
 import struct
 import logging
@@ -172,6 +173,76 @@ class RBXHParser:
             logger.error(f"解析RBXH流失败: {e}")
             return ParsedCache(success=False, error_message=str(e))
     
+    def read_link_file(self, file_path: str) -> Optional[str]:
+        """
+        只读取缓存文件头部的链接（不读取内容，不影响已知链接记录）
+        
+        Args:
+            file_path: 缓存文件路径
+            
+        Returns:
+            Optional[str]: 状态码为成功时返回链接，否则返回None
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                return self._read_link(f)
+        except OSError:
+            return None
+    
+    def read_link_data(self, data: bytes) -> Optional[str]:
+        """
+        只读取缓存数据头部的链接（不读取内容，不影响已知链接记录）
+        
+        Args:
+            data: 缓存数据字节
+            
+        Returns:
+            Optional[str]: 状态码为成功时返回链接，否则返回None
+        """
+        return self._read_link(io.BytesIO(data))
+
+    def read_content_header(self, stream) -> Optional[Tuple[str, int]]:
+        """
+        读取RBXH头部并把数据流定位到内容开头（不读取内容，不影响已知链接记录）
+
+        调用方可以随后从数据流中分块读取内容，不必把整个内容载入内存。
+
+        Args:
+            stream: 可定位的二进制数据流
+
+        Returns:
+            Optional[Tuple[str, int]]: (链接, 内容长度)，非RBXH格式、截断或状态码不成功时返回None
+        """
+        link = self._read_link(stream)
+        if link is None:
+            return None
+        # 头部长度、XXHash摘要、内容长度
+        fields = stream.read(12)
+        if len(fields) != 12:
+            return None
+        header_len, _, content_len = struct.unpack('<III', fields)
+        # 跳过XXHash摘要、保留字节和头部
+        stream.seek(8 + header_len, io.SEEK_CUR)
+        return link, content_len
+
+    def _read_link(self, stream) -> Optional[str]:
+        """读取RBXH头部中的链接和状态码"""
+        if stream.read(4) != b'RBXH':
+            return None
+        stream.read(4)
+        link_len_bytes = stream.read(4)
+        if len(link_len_bytes) != 4:
+            return None
+        link_len = struct.unpack('<I', link_len_bytes)[0]
+        link_bytes = stream.read(link_len)
+        if len(link_bytes) != link_len:
+            return None
+        stream.read(1)
+        status_bytes = stream.read(4)
+        if len(status_bytes) != 4 or struct.unpack('<I', status_bytes)[0] >= 300:
+            return None
+        return link_bytes.decode('utf-8', errors='ignore')
+    
     def clear_known_links(self):
         """清空已知链接缓存"""
         self.known_links.clear()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RBXM索引模块 - 只扫描二进制模型的块头建立块索引，按需解压INST块开头统计实例类型
+RBXM Index Module - Builds a chunk index of binary models from chunk headers, decompressing only INST chunk prefixes
+"""
+
+import struct
+import logging
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RBXM_MAGIC = b"<roblox!\x89\xff\r\n\x1a\n"
+
+# 文件头: 魔数(14) + 版本(2) + 类数量(4) + 实例数量(4) + 保留(8)
+_FILE_HEADER = struct.Struct("<14sHii8x")
+# 块头: 名称(4) + 压缩长度(4) + 解压长度(4) + 保留(4)
+_CHUNK_HEADER = struct.Struct("<4sII4x")
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# 解压INST块时需要的开头长度: 类ID(4) + 类名长度(4) + 类名 + 是否服务(1) + 实例数量(4)
+_INST_PREFIX_SIZE = 256
+
+# 索引中记录偏移的块类型
+INDEXED_CHUNKS = ("INST", "PROP", "PRNT")
+
+
+@dataclass
+class RBXMChunk:
+    """一个块的位置信息（offset指向块头）"""
+    name: str
+    offset: int
+    compressed_size: int
+    size: int
+
+
+@dataclass
+class RBXMIndex:
+    """二进制模型的块索引"""
+    class_count: int
+    instance_count: int
+    chunks: List[RBXMChunk] = field(default_factory=list)
+    classes: Dict[str, int] = field(default_factory=dict)  # 类名 -> 实例数量
+    unreadable_classes: int = 0  # 无法解压（如ZSTD压缩）的INST块数量
+
+    @property
+    def main_class(self) -> Optional[str]:
+        """实例最多的类，没有可读的INST块时为None"""
+        if not self.classes:
+            return None
+        return max(sorted(self.classes), key=self.classes.get)
+
+    def to_dict(self) -> Dict:
+        """转换为可写入JSON的字典，块偏移按INST/PROP/PRNT分组"""
+        offsets = {name: [] for name in INDEXED_CHUNKS}
+        for chunk in self.chunks:
+            if chunk.name in offsets:
+                offsets[chunk.name].append(chunk.offset)
+        return {
+            "class_count": self.class_count,
+            "instance_count": self.instance_count,
+            "classes": dict(sorted(self.classes.items())),
+            "chunk_offsets": offsets
+        }
+
+
+def lz4_block_decompress(data: bytes, limit: Optional[int] = None) -> bytes:
+    """
+    解压LZ4块格式数据（不含帧头）
+
+    Args:
+        data: 压缩数据
+        limit: 输出达到该长度后停止，None表示全部解压
+
+    Returns:
+        bytes: 解压结果（指定limit时可能超出limit几个字节）
+
+    Raises:
+        ValueError: 数据损坏
+    """
+    output = bytearray()
+    pos = 0
+    end = len(data)
+    while pos < end:
+        token = data[pos]
+        pos += 1
+
+        literal_length = token >> 4
+        if literal_length == 15:
+            while True:
+                extra = data[pos]
+                pos += 1
+                literal_length += extra
+                if extra != 255:
+                    break
+        output += data[pos:pos + literal_length]
+        pos += literal_length
+        if pos >= end or (limit is not None and len(output) >= limit):
+            break
+
+        match_offset = data[pos] | (data[pos + 1] << 8)
+        pos += 2
+        if match_offset == 0 or match_offset > len(output):
+            raise ValueError("LZ4数据损坏: 无效的匹配偏移")
+        match_length = (token & 0x0F) + 4
+        if match_length == 19:
+            while True:
+                extra = data[pos]
+                pos += 1
+                match_length += extra
+                if extra != 255:
+                    break
+
+        start = len(output) - match_offset
+        if match_length <= match_offset:
+            output += output[start:start + match_length]
+        else:
+            # 重叠匹配，按偏移长度重复
+            pattern = output[start:]
+            repeats, remainder = divmod(match_length, match_offset)
+            output += pattern * repeats + pattern[:remainder]
+        if limit is not None and len(output) >= limit:
+            break
+    return bytes(output)
+
+
+def _read_instance_class(payload: bytes, compressed_size: int, size: int) -> Optional[Tuple[str, int]]:
+    """
+    从INST块内容的开头读取类名和实例数量
+
+    Returns:
+        Optional[Tuple[str, int]]: (类名, 实例数量)，无法解压时返回None
+    """
+    if compressed_size:
+        if payload.startswith(_ZSTD_MAGIC):
+            return None
+        prefix = lz4_block_decompress(payload, _INST_PREFIX_SIZE)
+        name_length = struct.unpack_from("<I", prefix, 4)[0]
+        if 8 + name_length + 5 > len(prefix):
+            prefix = lz4_block_decompress(payload)
+    else:
+        prefix = payload
+    name_length = struct.unpack_from("<I", prefix, 4)[0]
+    class_name = prefix[8:8 + name_length].decode("utf-8", errors="replace")
+    instance_count = struct.unpack_from("<I", prefix, 8 + name_length + 1)[0]
+    return class_name, instance_count
+
+
+def index_rbxm(stream: BinaryIO) -> RBXMIndex:
+    """
+    扫描二进制模型的块头建立索引
+
+    只读取每个块的16字节块头并跳过内容；INST块只解压开头读取类名和实例数量，
+    PROP和PRNT块不解压。
+
+    Args:
+        stream: 定位在模型开头的可seek二进制流
+
+    Returns:
+        RBXMIndex: 块索引
+
+    Raises:
+        ValueError: 不是二进制模型或块结构损坏
+    """
+    base = stream.tell()
+    header = stream.read(_FILE_HEADER.size)
+    if len(header) != _FILE_HEADER.size or not header.startswith(RBXM_MAGIC):
+        raise ValueError("不是二进制RBXM模型")
+    _, _, class_count, instance_count = _FILE_HEADER.unpack(header)
+    index = RBXMIndex(class_count, instance_count)
+
+    offset = _FILE_HEADER.size
+    while True:
+        chunk_header = stream.read(_CHUNK_HEADER.size)
+        if len(chunk_header) != _CHUNK_HEADER.size:
+            raise ValueError("模型被截断: 缺少END块")
+        raw_name, compressed_size, size = _CHUNK_HEADER.unpack(chunk_header)
+        name = raw_name.rstrip(b"\x00").decode("ascii", errors="replace")
+        payload_size = compressed_size or size
+        index.chunks.append(RBXMChunk(name, offset, compressed_size, size))
+        if name == "END":
+            break
+
+        if name == "INST":
+            payload = stream.read(payload_size)
+            if len(payload) != payload_size:
+                raise ValueError("模型被截断: INST块不完整")
+            try:
+                instance_class = _read_instance_class(payload, compressed_size, size)
+            except (ValueError, struct.error, IndexError) as e:
+                raise ValueError(f"INST块损坏: {e}")
+            if instance_class is None:
+                index.unreadable_classes += 1
+            else:
+                class_name, count = instance_class
+                index.classes[class_name] = index.classes.get(class_name, 0) + count
+        else:
+            stream.seek(payload_size, 1)
+        offset += _CHUNK_HEADER.size + payload_size
+
+    stream.seek(base)
+    return index
+
+
+def index_rbxm_file(path: str) -> RBXMIndex:
+    """
+    为模型文件建立块索引
+
+    Args:
+        path: 模型文件路径
+
+    Returns:
+        RBXMIndex: 块索引
+
+    Raises:
+        ValueError: 不是二进制模型或块结构损坏
+    """
+    with open(path, "rb") as f:
+        return index_rbxm(f)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Roblox网格模块 - 读取网格版本头，并把v1.00-v5.00网格转换为OBJ
+Roblox Mesh Module - Reads mesh version headers and converts v1.00-v5.00 meshes to OBJ
+"""
+
+import re
+import sys
+import struct
+import logging
+from array import array
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 可以转换为OBJ的网格版本
+CONVERTIBLE_VERSIONS = ("1.00", "1.01", "2.00", "3.00", "3.01", "4.00", "4.01", "5.00")
+
+_VERSION_PATTERN = re.compile(rb"^version (\d+\.\d+)\r?\n")
+# 文本网格中数值之间的分隔符
+_TEXT_SEPARATORS = re.compile(rb"[\[\],\s]+")
+
+# 二进制网格头部格式（紧跟在版本行之后）
+_HEADER_V2 = struct.Struct("<HBBII")          # 头部大小, 顶点大小, 面大小, 顶点数, 面数
+_HEADER_V3 = struct.Struct("<HBBHHII")        # 头部大小, 顶点大小, 面大小, LOD大小, LOD数, 顶点数, 面数
+_HEADER_V4 = struct.Struct("<HHIIHHIHBB")     # 头部大小, LOD类型, 顶点数, 面数, LOD数, 骨骼数, 骨骼名长度, 子集数, 高质量LOD数, 保留
+_V4_VERTEX_SIZE = 40
+_BONE_WEIGHTS_SIZE = 8  # 每个顶点的骨骼索引和权重
+
+
+@dataclass
+class MeshData:
+    """
+    网格几何数据
+
+    vertices按顶点交错存放，每个顶点stride个float：位置(0-2)、法线(3-5)、UV(6-7)；
+    faces是展开的顶点索引，每3个为一个三角形。
+    """
+    version: str
+    vertices: array
+    stride: int
+    faces: array
+    position_scale: float = 1.0
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices) // self.stride
+
+    @property
+    def face_count(self) -> int:
+        return len(self.faces) // 3
+
+
+def read_mesh_version(head: bytes) -> Optional[str]:
+    """
+    只读取网格的版本行
+
+    Args:
+        head: 网格内容的开头部分
+
+    Returns:
+        Optional[str]: 版本号，如 "2.00"，不是网格时返回None
+    """
+    match = _VERSION_PATTERN.match(head[:32])
+    return match.group(1).decode("ascii") if match else None
+
+
+def _unpack(typecode: str, data) -> array:
+    """把小端字节批量解包为数组"""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _slice(data: bytes, offset: int, size: int, what: str) -> memoryview:
+    """截取一段数据，长度不足时抛出ValueError"""
+    if offset + size > len(data):
+        raise ValueError(f"网格数据被截断（{what}）")
+    return memoryview(data)[offset:offset + size]
+
+
+def _parse_text_mesh(version: str, body: bytes) -> MeshData:
+    """解析v1.xx文本网格：面数一行，随后每个顶点为 [位置][法线][UV] 三组"""
+    _, _, vertex_text = body.partition(b"\n")
+    values = array("f", map(float, filter(None, _TEXT_SEPARATORS.split(vertex_text))))
+    vertex_count = len(values) // 9
+    # 文本网格没有索引，每三个顶点组成一个三角形
+    faces = array("I", range(vertex_count - vertex_count % 3))
+    return MeshData(version, values[:vertex_count * 9], 9, faces, 0.5 if version == "1.00" else 1.0)
+
+
+def _lod0_faces(faces: array, lods: array) -> array:
+    """只保留最高细节级别(LOD0)的面"""
+    if len(lods) >= 2 and lods[1] > lods[0]:
+        return faces[lods[0] * 3:lods[1] * 3]
+    return faces
+
+
+def parse_mesh(data: bytes) -> MeshData:
+    """
+    解析v1.00-v5.00网格，顶点和面用数组批量解包
+
+    Args:
+        data: 完整的网格文件内容
+
+    Returns:
+        MeshData: 网格数据（多LOD网格只包含LOD0的面）
+
+    Raises:
+        ValueError: 不是网格、版本不支持或数据被截断
+    """
+    match = _VERSION_PATTERN.match(data)
+    if not match:
+        raise ValueError("不是Roblox网格文件")
+    version = match.group(1).decode("ascii")
+    if version not in CONVERTIBLE_VERSIONS:
+        raise ValueError(f"不支持的网格版本: {version}")
+
+    offset = match.end()
+    if version.startswith("1."):
+        return _parse_text_mesh(version, data[offset:])
+
+    num_bones = 0
+    num_lods = 0
+    lod_size = 4
+    if version == "2.00":
+        header_size, vertex_size, face_size, num_verts, num_faces = \
+            _HEADER_V2.unpack(_slice(data, offset, _HEADER_V2.size, "header"))
+    elif version.startswith("3."):
+        header_size, vertex_size, face_size, lod_size, num_lods, num_verts, num_faces = \
+            _HEADER_V3.unpack(_slice(data, offset, _HEADER_V3.size, "header"))
+    else:
+        header = _HEADER_V4.unpack(_slice(data, offset, _HEADER_V4.size, "header"))
+        header_size, _, num_verts, num_faces, num_lods, num_bones = header[:6]
+        vertex_size, face_size = _V4_VERTEX_SIZE, 12
+
+    if vertex_size % 4 or vertex_size < 32 or face_size != 12 or lod_size != 4:
+        raise ValueError(f"不支持的网格布局: 顶点{vertex_size}字节, 面{face_size}字节")
+
+    offset += header_size
+    vertices = _unpack("f", _slice(data, offset, num_verts * vertex_size, "vertices"))
+    offset += num_verts * vertex_size
+    if num_bones:
+        offset += num_verts * _BONE_WEIGHTS_SIZE
+    faces = _unpack("I", _slice(data, offset, num_faces * 12, "faces"))
+    offset += num_faces * 12
+    if num_lods:
+        lods = _unpack("I", _slice(data, offset, num_lods * 4, "LODs"))
+        faces = _lod0_faces(faces, lods)
+
+    if faces and max(faces) >= num_verts:
+        raise ValueError("网格面索引超出顶点范围")
+
+    return MeshData(version, vertices, vertex_size // 4, faces)
+
+
+def write_obj(path: str, mesh: MeshData) -> None:
+    """
+    把网格写为Wavefront OBJ（位置、法线、UV共用同一索引）
+
+    Args:
+        path: 输出路径
+        mesh: 网格数据
+    """
+    stride = mesh.stride
+    vertices = mesh.vertices
+    xs, ys, zs = vertices[0::stride], vertices[1::stride], vertices[2::stride]
+    if mesh.position_scale != 1.0:
+        scale = mesh.position_scale
+        xs, ys, zs = ([value * scale for value in axis] for axis in (xs, ys, zs))
+    # Roblox的V坐标从上往下，OBJ从下往上
+    vs = [1.0 - value for value in vertices[7::stride]]
+    corners = [index + 1 for index in mesh.faces]
+
+    with open(path, "w", encoding="ascii", newline="\n") as f:
+        f.write(f"# Roblox mesh v{mesh.version}: {mesh.vertex_count} vertices, {mesh.face_count} faces\n")
+        f.writelines(map("v {:.6g} {:.6g} {:.6g}\n".format, xs, ys, zs))
+        f.writelines(map("vn {:.6g} {:.6g} {:.6g}\n".format,
+                         vertices[3::stride], vertices[4::stride], vertices[5::stride]))
+        f.writelines(map("vt {:.6g} {:.6g}\n".format, vertices[6::stride], vs))
+        f.writelines(map("f {0}/{0}/{0} {1}/{1}/{1} {2}/{2}/{2}\n".format,
+                         corners[0::3], corners[1::3], corners[2::3]))
+
+
+def convert_mesh_file(mesh_path: str, obj_path: str) -> Tuple[int, int]:
+    """
+    把网格文件转换为OBJ
+
+    Args:
+        mesh_path: 网格文件路径
+        obj_path: OBJ输出路径
+
+    Returns:
+        Tuple[int, int]: (顶点数, 面数)
+
+    Raises:
+        ValueError: 网格无法解析
+    """
+    with open(mesh_path, "rb") as f:
+        mesh = parse_mesh(f.read())
+    write_obj(obj_path, mesh)
+    return mesh.vertex_count, mesh.face_count
+
+
+# 多进程工作函数
+def _convert_mesh_worker(mesh_path: str, obj_path: str) -> Tuple[str, object]:
+    """
+    进程池工作函数 - 转换单个网格
+
+    Returns:
+        tuple: (网格路径, (顶点数, 面数))，失败时为 (网格路径, {'error': 错误信息})
+    """
+    try:
+        return mesh_path, convert_mesh_file(mesh_path, obj_path)
+    except Exception as e:
+        return mesh_path, {'error': str(e)}
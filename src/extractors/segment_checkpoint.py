@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+视频片段断点续传模块 - 保存已完成的视频片段，下次运行时跳过
+Segment Checkpoint Module - Keeps completed video segments so later runs can skip them
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class SegmentCheckpoint:
+    """
+    视频片段检查点
+
+    每个片段播放列表对应一个目录，以播放列表哈希命名；已完成的片段按片段名
+    保存在该目录中，并追加记录到segments.jsonl清单。只有清单中记录且文件大小
+    与记录一致的片段才被视为已完成，写入中断的片段会重新下载。
+    """
+
+    MANIFEST_NAME = "segments.jsonl"
+
+    def __init__(self, root_dir: str, playlist_key: str):
+        """
+        初始化片段检查点
+
+        Args:
+            root_dir: 检查点根目录
+            playlist_key: 播放列表哈希
+        """
+        self.playlist_key = playlist_key
+        self.directory = os.path.join(root_dir, playlist_key)
+        self._manifest_path = os.path.join(self.directory, self.MANIFEST_NAME)
+        self._lock = threading.Lock()
+        self._records: Dict[str, int] = {}
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_manifest()
+
+    @staticmethod
+    def make_key(video_hash: str, stream_url: str, segments: List[Tuple[str, Optional[float]]]) -> str:
+        """
+        根据视频哈希、流地址路径和片段列表计算播放列表哈希
+
+        查询参数（如签名令牌）不参与计算，因此同一视频重新签名后仍能续传；
+        视频哈希参与计算，避免引用同一流的两个缓存项同时使用一个检查点目录。
+
+        Args:
+            video_hash: 视频（缓存项）哈希
+            stream_url: 片段播放列表URL
+            segments: [(片段文件名, 时长), ...]
+
+        Returns:
+            str: 播放列表哈希
+        """
+        hasher = hashlib.sha256(f"{video_hash}\n{urlparse(stream_url).path}".encode('utf-8'))
+        for segment, duration in segments:
+            hasher.update(f"\n{segment}|{duration}".encode('utf-8'))
+        return hasher.hexdigest()[:32]
+
+    def path_for(self, segment: str) -> str:
+        """获取片段在检查点目录中的路径"""
+        return os.path.join(self.directory, segment)
+
+    def is_complete(self, segment: str) -> bool:
+        """检查片段是否已完整下载"""
+        with self._lock:
+            size = self._records.get(segment)
+        if size is None:
+            return False
+        try:
+            return os.path.getsize(self.path_for(segment)) == size
+        except OSError:
+            return False
+
+    def load(self, segment: str) -> Optional[bytes]:
+        """读取已完成的片段，不存在或大小不符时返回None"""
+        if not self.is_complete(segment):
+            return None
+        try:
+            with open(self.path_for(segment), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        with self._lock:
+            if len(data) != self._records.get(segment):
+                return None
+        return data
+
+    def save(self, segment: str, data: bytes):
+        """保存片段数据（先写临时文件再替换）并记录为已完成"""
+        path = self.path_for(segment)
+        part_path = path + ".part"
+        with open(part_path, 'wb') as f:
+            f.write(data)
+        os.replace(part_path, path)
+        self.commit(segment, len(data))
+
+    def commit(self, segment: str, size: int):
+        """记录片段已完整写入"""
+        line = json.dumps({"segment": segment, "size": size}, ensure_ascii=False)
+        with self._lock:
+            with open(self._manifest_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+            self._records[segment] = size
+
+    def completed_count(self) -> int:
+        """已记录的片段数量"""
+        with self._lock:
+            return len(self._records)
+
+    def remove(self):
+        """删除整个检查点目录"""
+        try:
+            shutil.rmtree(self.directory)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"清理片段检查点失败: {e}")
+
+    def _load_manifest(self):
+        """加载清单，忽略写入中断的最后一行"""
+        if not os.path.exists(self._manifest_path):
+            return
+        try:
+            with open(self._manifest_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self._records[record["segment"]] = int(record["size"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError as e:
+            logger.warning(f"读取片段检查点清单失败: {e}")
+
+    @staticmethod
+    def prune(root_dir: str, max_age: float) -> int:
+        """
+        删除长时间未更新的检查点目录
+
+        Args:
+            root_dir: 检查点根目录
+            max_age: 最大保留时间（秒）
+
+        Returns:
+            int: 删除的目录数量
+        """
+        if not os.path.isdir(root_dir):
+            return 0
+
+        removed = 0
+        cutoff = time.time() - max_age
+        for name in os.listdir(root_dir):
+            directory = os.path.join(root_dir, name)
+            if not os.path.isdir(directory):
+                continue
+            manifest = os.path.join(directory, SegmentCheckpoint.MANIFEST_NAME)
+            try:
+                last_update = os.path.getmtime(manifest if os.path.exists(manifest) else directory)
+                if last_update < cutoff:
+                    shutil.rmtree(directory)
+                    removed += 1
+            except Exception as e:
+                logger.warning(f"清理过期片段检查点失败 {directory}: {e}")
+        return removed
@@ -0,0 +1,683 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+暂存式提取器基类 - 图像、纹理、网格和模型提取器共用的扫描、暂存、去重、并行处理和历史记录流程
+Staged Extractor Base - Shared scan, staging, dedup, thread/process pool and history flow
+for the image, texture, mesh and model extractors
+"""
+
+import io
+import os
+import queue
+import shutil
+import hashlib
+import logging
+import threading
+import time
+import traceback
+import multiprocessing
+from typing import Dict, List, Any, Optional, Callable
+
+# 导入历史管理器
+from src.utils.history_manager import ExtractedHistory, ContentHashCache
+
+# 导入Roblox提取模块
+from .rbxh_parser import get_parser
+from .content_identifier import ContentIdentifier
+from .cache_scanner import CacheItem
+from .asset_index import extract_asset_id
+
+# 导入多进程工具
+from src.utils.multiprocessing_utils import get_optimal_process_count
+
+logger = logging.getLogger(__name__)
+
+# 识别内容和读取文件头时读取的开头长度（足以覆盖JPEG的EXIF段）
+_HEAD_SIZE = 64 * 1024
+# 写入内容时每次读取的块大小
+_CHUNK_SIZE = 1024 * 1024
+
+# 各进程（或线程共享）的内容识别器，按是否阻止头像图片区分
+_identifiers: Dict[bool, ContentIdentifier] = {}
+
+
+def get_process_identifier(block_avatar_images: bool = True) -> ContentIdentifier:
+    """获取当前进程的内容识别器（工作进程中各自创建）"""
+    identifier = _identifiers.get(block_avatar_images)
+    if identifier is None:
+        identifier = _identifiers.setdefault(block_avatar_images, ContentIdentifier(block_avatar_images))
+    return identifier
+
+
+def stage_cache_content(path: str, data: Optional[bytes], hash_id: str, staging_dir: str,
+                        accept: Callable[[bytes], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """
+    读取缓存项的RBXH头部和内容开头，accept接受时把内容分块写入暂存文件
+
+    不被接受的缓存项不会读取其余内容；内容一边写入暂存文件一边计算哈希，
+    不需要整体载入内存。
+
+    Args:
+        path: 缓存文件路径（data为None时使用）
+        data: 直接从数据库获取的缓存数据
+        hash_id: 缓存项哈希ID，用作暂存文件名
+        staging_dir: 暂存目录（需已存在）
+        accept: 检查内容开头的函数，返回要加入结果的信息，返回None表示跳过
+
+    Returns:
+        Optional[Dict[str, Any]]: 跳过时返回None，否则为accept返回的信息加上
+            {'hash_id', 'link', 'content_hash', 'size', 'temp_path'}
+
+    Raises:
+        OSError: 读取缓存或写入暂存文件失败
+        ValueError: 缓存内容被截断
+    """
+    with (io.BytesIO(data) if data is not None else open(path, 'rb')) as stream:
+        header = get_parser().read_content_header(stream)
+        if header is None:
+            return None
+        link, content_len = header
+
+        head = stream.read(min(content_len, _HEAD_SIZE))
+        if not head:
+            return None
+        info = accept(head)
+        if info is None:
+            return None
+
+        temp_path = os.path.join(staging_dir, f"{hash_id}.part")
+        hasher = hashlib.sha256(head)
+        remaining = content_len - len(head)
+        with open(temp_path, 'wb') as output:
+            output.write(head)
+            while remaining > 0:
+                chunk = stream.read(min(_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                output.write(chunk)
+                remaining -= len(chunk)
+
+    if remaining > 0:
+        os.remove(temp_path)
+        raise ValueError("文件截断：无法读取完整内容")
+
+    info.update({
+        'hash_id': hash_id,
+        'link': link,
+        'content_hash': hasher.hexdigest(),
+        'size': content_len,
+        'temp_path': temp_path
+    })
+    return info
+
+
+# 多进程工作函数
+def _stage_worker(args: tuple) -> tuple:
+    """
+    进程池工作函数 - 用提取器的暂存函数识别并暂存单个缓存项
+
+    Args:
+        args: (暂存函数, 缓存文件路径, 缓存数据, 哈希ID, 暂存目录, 暂存函数的其他参数...)
+
+    Returns:
+        tuple: (哈希ID, 暂存函数的结果)，失败时结果为 {'error': 错误信息}
+    """
+    stage_function, path, data, hash_id, staging_dir, *extra_args = args
+    try:
+        return hash_id, stage_function(path, data, hash_id, staging_dir, *extra_args)
+    except Exception as e:
+        return hash_id, {'error': str(e)}
+
+
+class StagedProcessingStats:
+    """暂存式提取的处理统计 - 线程安全"""
+
+    def __init__(self, prefix: str, **extra_stats):
+        """
+        初始化统计
+
+        Args:
+            prefix: 资源计数的前缀，如images对应images_found和images_saved
+            **extra_stats: 该资源类型特有的统计及其初始值（计数为0，集合类为set()）
+        """
+        self._lock = threading.Lock()
+        self.stats = {f'{prefix}_found': 0, f'{prefix}_saved': 0}
+        self.stats.update({key: value for key, value in extra_stats.items() if not isinstance(value, (set, dict))})
+        self.stats.update({
+            'already_processed': 0,
+            'duplicate_skipped': 0,
+            'processing_errors': 0,
+            'bytes_saved': 0
+        })
+        self.stats.update({key: value for key, value in extra_stats.items() if isinstance(value, (set, dict))})
+
+    def increment(self, key: str, value: int = 1):
+        """线程安全地增加统计值"""
+        with self._lock:
+            if key in self.stats:
+                self.stats[key] += value
+
+    def add_item(self, key: str, value: str):
+        """把值加入集合类统计（如发现的格式）"""
+        with self._lock:
+            self.stats[key].add(value)
+
+    def get_all(self) -> Dict[str, Any]:
+        """获取所有统计信息的副本，集合类统计转换为排序后的列表"""
+        with self._lock:
+            stats_copy = self.stats.copy()
+            for key, value in stats_copy.items():
+                if isinstance(value, set):
+                    stats_copy[key] = sorted(value)
+                elif isinstance(value, dict):
+                    stats_copy[key] = dict(value)
+            return stats_copy
+
+
+class StagedCacheExtractor:
+    """
+    暂存式提取器基类
+
+    工作线程或工作进程读取缓存、识别资源并把内容写入暂存文件，主线程只负责
+    去重和把暂存文件重命名到最终位置，内容不经过进程间管道。子类提供：
+
+    - STAGE_FUNCTION: 模块级暂存函数 (path, data, hash_id, staging_dir, *_stage_args()) -> 暂存信息
+    - _create_stats(): 处理统计
+    - get_output_dir(staged): 分类输出目录
+    - _on_saved(output_path, staged): 保存后的处理（统计格式、提交后处理任务等）
+
+    需要CPU密集的后处理（纹理解码、OBJ转换）的子类重写_uses_post_pool()，
+    在_on_saved中通过_submit_post_process()提交到进程池。
+    """
+
+    STAGING_DIR_NAME = ".staging"
+    OUTPUT_DIR_NAME = ""       # 输出子目录，如Images
+    ASSET_TYPE = ""            # 历史记录类型和日志键中的名称，如image
+    ASSET_LABEL = ""           # 日志中的资源名称，如图像
+    STATS_PREFIX = ""          # 资源计数统计键的前缀，如images
+    STAGE_FUNCTION: Optional[Callable[..., Optional[Dict[str, Any]]]] = None
+
+    POST_PROCESS_LOG_KEY = ""            # 等待后处理任务时的日志键
+    POST_PROCESS_STATS = ("", "")        # 后处理的(成功计数, 失败计数)统计键
+    POST_PROCESS_LABEL = ""              # 后处理失败时日志中的操作名称
+
+    def __init__(self,
+                 output_dir: Optional[str] = None,
+                 classification_method=None,
+                 num_threads: int = 1,
+                 use_multiprocessing: bool = False,
+                 conservative_multiprocessing: bool = True,
+                 log_callback: Optional[Callable[[str, str], None]] = None,
+                 download_history: Optional[ExtractedHistory] = None):
+        """
+        初始化提取器
+
+        Args:
+            output_dir: 输出目录
+            classification_method: 分类方法
+            num_threads: 线程数量
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+            log_callback: 日志回调函数(message, log_type)
+            download_history: 下载历史管理器，用于避免重复处理文件
+        """
+        # 多线程/多进程配置
+        self.use_multiprocessing = use_multiprocessing
+        self.conservative_multiprocessing = conservative_multiprocessing
+        self.log_callback = log_callback
+        self.download_history = download_history
+
+        # 根据多进程配置调整线程/进程数量
+        if self.use_multiprocessing:
+            self.num_processes = get_optimal_process_count(
+                max_processes=num_threads if num_threads > 1 else None,
+                conservative=conservative_multiprocessing
+            )
+        else:
+            self.num_threads = num_threads or min(32, multiprocessing.cpu_count() * 2)
+
+        # 初始化组件
+        from .cache_scanner import get_scanner
+        self.cache_scanner = get_scanner(log_callback)
+
+        # 配置
+        self.classification_method = classification_method
+
+        # 输出目录
+        if output_dir and os.path.isdir(output_dir):
+            self.output_dir = os.path.abspath(output_dir)
+        else:
+            self.output_dir = os.path.join(os.getcwd(), "extracted")
+
+        self.asset_dir = os.path.join(self.output_dir, self.OUTPUT_DIR_NAME)
+        # 暂存目录与输出目录在同一文件系统上，暂存文件可以直接重命名到最终位置
+        self.staging_dir = os.path.join(self.asset_dir, self.STAGING_DIR_NAME)
+        os.makedirs(self.asset_dir, exist_ok=True)
+
+        # 统计和状态
+        self.stats = self._create_stats()
+        self.hash_cache = ContentHashCache()
+        self._created_dirs = set()  # 已创建的输出目录
+        self._post_pool = None  # 后处理进程池
+        self._pending_post = []  # 已提交的后处理任务
+        self.processed_count = 0
+        self.cancelled = False
+        self._cancel_check_fn = None
+        self._lock = threading.Lock()
+
+        processing_mode = "多进程" if self.use_multiprocessing else "多线程"
+        thread_count = self.num_processes if self.use_multiprocessing else self.num_threads
+        logger.debug(f"Roblox{self.ASSET_LABEL}提取器已初始化，输出目录: {self.asset_dir}, "
+                     f"处理模式: {processing_mode}({thread_count})")
+
+        # 发送初始化日志到界面
+        self.send_log(f"initializing_{self.ASSET_TYPE}_extractor", "info")
+
+    def _create_stats(self) -> StagedProcessingStats:
+        """创建处理统计"""
+        raise NotImplementedError
+
+    def _stage_args(self) -> tuple:
+        """暂存函数在暂存目录之后的额外参数（需可在进程间传递）"""
+        return ()
+
+    def _uses_post_pool(self) -> bool:
+        """是否需要后处理进程池"""
+        return False
+
+    def _reset_run_state(self):
+        """每次提取开始时重置子类的状态"""
+
+    def _after_processing(self) -> Dict[str, Any]:
+        """
+        所有缓存项处理完成后调用（如写入索引）
+
+        Returns:
+            Dict[str, Any]: 要加入提取结果的字段
+        """
+        return {}
+
+    def _on_saved(self, output_path: str, staged: Dict[str, Any]):
+        """
+        一个资源保存到最终位置并加入历史记录后调用
+
+        Args:
+            output_path: 输出路径
+            staged: 暂存函数的结果
+        """
+
+    def get_output_dir(self, staged: Dict[str, Any]) -> str:
+        """
+        根据分类方法获取输出目录（不创建目录）
+
+        Args:
+            staged: 暂存函数的结果
+
+        Returns:
+            str: 输出目录
+        """
+        raise NotImplementedError
+
+    def send_log(self, message_key: str, log_type: str, *args):
+        """发送日志消息到界面"""
+        if self.log_callback:
+            # message_key将由界面层处理翻译
+            self.log_callback(message_key, log_type, *args)
+
+    def set_cancel_check(self, cancel_check_fn: Callable[[], bool]):
+        """设置取消检查函数"""
+        self._cancel_check_fn = cancel_check_fn
+
+    def is_cancelled(self) -> bool:
+        """检查是否已取消"""
+        if self._cancel_check_fn:
+            return self._cancel_check_fn()
+        return self.cancelled
+
+    def extract(self,
+                progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                custom_cache_path: Optional[str] = None,
+                cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
+        """
+        提取资源
+
+        Args:
+            progress_callback: 进度回调函数
+            custom_cache_path: 自定义缓存路径
+            cache_items: 要处理的缓存项目，None表示扫描整个缓存（监视模式只传入新出现的项目）
+
+        Returns:
+            Dict[str, Any]: 提取结果
+        """
+        start_time = time.time()
+
+        try:
+            # 重置状态
+            self.cancelled = False
+            self.processed_count = 0
+            self.stats = self._create_stats()
+            self.hash_cache.clear()
+            self._pending_post = []
+            self._reset_run_state()
+
+            self.send_log(f"starting_{self.ASSET_TYPE}_extraction", "info")
+
+            # 设置自定义缓存路径
+            if custom_cache_path:
+                is_database = custom_cache_path.endswith('.db')
+                db_folder = ""
+                if is_database:
+                    db_folder = os.path.dirname(custom_cache_path).replace('-storage.db', '-storage')
+                self.cache_scanner.set_custom_path(custom_cache_path, is_database, db_folder)
+
+            # 获取缓存信息并检查路径
+            cache_info = self.cache_scanner.get_cache_info()
+
+            if not cache_info["path_exists"]:
+                self.send_log("cache_path_not_found", "error")
+                return {
+                    "success": False,
+                    "error": "Roblox缓存路径不存在或无法访问",
+                    "processed_caches": 0,
+                    "stats": self.stats.get_all(),
+                    "cache_info": cache_info,
+                    "duration": time.time() - start_time,
+                    "output_dir": self.asset_dir
+                }
+
+            # 扫描缓存（监视模式直接传入新出现的项目）
+            if cache_items is None:
+                self.send_log("scanning_cache", "info")
+                cache_items = self.cache_scanner.scan_cache()
+
+            if not cache_items:
+                self.send_log("no_cache_items_found", "warning")
+                return {
+                    "success": False,
+                    "error": "未发现缓存项目",
+                    "processed_caches": 0,
+                    "stats": self.stats.get_all(),
+                    "cache_info": cache_info,
+                    "duration": time.time() - start_time,
+                    "output_dir": self.asset_dir
+                }
+
+            self.send_log("cache_scan_complete", "info", len(cache_items))
+
+            # 处理缓存项目 - 支持多线程/多进程
+            logger.debug(f"开始处理缓存项目，总数: {len(cache_items)}")
+            os.makedirs(self.staging_dir, exist_ok=True)
+
+            if self.use_multiprocessing:
+                processed = self._process_cache_items_multiprocessing(cache_items, progress_callback)
+            else:
+                processed = self._process_cache_items_threading(cache_items, progress_callback)
+
+            extra_result = self._after_processing()
+
+            duration = time.time() - start_time
+            stats = self.stats.get_all()
+
+            result = {
+                "success": True,
+                "processed_caches": processed,
+                "stats": stats,
+                "cache_info": cache_info,
+                "duration": duration,
+                "bytes_per_second": stats['bytes_saved'] / duration if duration > 0 else 0,
+                "output_dir": self.asset_dir
+            }
+            result.update(extra_result)
+
+            logger.debug(f"{self.ASSET_LABEL}提取完成! 统计: {stats}")
+
+            # 保存历史记录
+            if self.download_history:
+                self.send_log(f"saving_{self.ASSET_TYPE}_history", "info")
+                self.download_history.save_history()
+
+            self.send_log(f"{self.ASSET_TYPE}_extraction_complete", "success",
+                          stats[f'{self.STATS_PREFIX}_found'], stats[f'{self.STATS_PREFIX}_saved'], duration)
+
+            return result
+
+        except Exception as e:
+            error_msg = f"{self.ASSET_LABEL}提取失败: {str(e)}"
+            logger.error(error_msg)
+            logger.error(traceback.format_exc())
+            self.send_log(f"{self.ASSET_TYPE}_extraction_failed", "error", str(e))
+            return {
+                "success": False,
+                "error": error_msg,
+                "processed_caches": self.processed_count,
+                "stats": self.stats.get_all(),
+                "cache_info": self.cache_scanner.get_cache_info(),
+                "duration": time.time() - start_time,
+                "output_dir": self.asset_dir
+            }
+        finally:
+            # 取消或出错时留下的暂存文件不再需要
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def _process_cache_items_threading(self, cache_items: List[CacheItem],
+                                       progress_callback: Optional[Callable[[int, int, str], None]] = None) -> int:
+        """
+        使用多线程处理缓存项目，识别、写入和归档都在工作线程中完成
+
+        后处理是CPU密集的运算，即使在多线程模式下也交给独立的进程池。
+        """
+        total_items = len(cache_items)
+        stage_args = self._stage_args()
+
+        def worker():
+            while True:
+                try:
+                    cache_item = item_queue.get(timeout=1)
+                    if cache_item is None:
+                        break
+
+                    if self.is_cancelled():
+                        # 取消后继续取出剩余项目，否则item_queue.join()会一直等待
+                        item_queue.task_done()
+                        continue
+
+                    try:
+                        staged = self.STAGE_FUNCTION(cache_item.path, cache_item.data, cache_item.hash_id,
+                                                     self.staging_dir, *stage_args)
+                    except Exception as e:
+                        staged = {'error': str(e)}
+                    self._handle_staged(cache_item.hash_id, staged)
+                    self._report_progress(total_items, progress_callback)
+
+                    item_queue.task_done()
+
+                except queue.Empty:
+                    break
+                except Exception as e:
+                    logger.error(f"处理缓存项目时出错: {e}")
+                    item_queue.task_done()
+
+        # 创建队列和线程
+        item_queue = queue.Queue()
+        for item in cache_items:
+            item_queue.put(item)
+
+        if self._uses_post_pool():
+            self._post_pool = multiprocessing.Pool(
+                processes=get_optimal_process_count(conservative=self.conservative_multiprocessing))
+
+        try:
+            threads = []
+            for _ in range(max(1, self.num_threads)):
+                thread = threading.Thread(target=worker)
+                thread.start()
+                threads.append(thread)
+
+            # 等待所有任务完成
+            item_queue.join()
+
+            for _ in threads:
+                item_queue.put(None)
+            for thread in threads:
+                thread.join()
+
+            self._finish_post_processing()
+        finally:
+            self._close_post_pool()
+
+        return self.processed_count
+
+    def _process_cache_items_multiprocessing(self, cache_items: List[CacheItem],
+                                             progress_callback: Optional[Callable[[int, int, str], None]] = None) -> int:
+        """
+        使用多进程处理缓存项目
+
+        工作进程读取缓存、识别资源并把内容写入暂存文件，主进程只负责去重和
+        把暂存文件重命名到最终位置；后处理任务提交到同一个进程池。
+        """
+        if not cache_items:
+            return 0
+
+        total_items = len(cache_items)
+        stage_args = self._stage_args()
+        tasks = ((self.STAGE_FUNCTION, item.path, item.data, item.hash_id, self.staging_dir, *stage_args)
+                 for item in cache_items)
+
+        pool = multiprocessing.Pool(processes=self.num_processes)
+        if self._uses_post_pool():
+            self._post_pool = pool
+        completed = False
+        try:
+            for hash_id, staged in pool.imap_unordered(_stage_worker, tasks, chunksize=16):
+                if self.is_cancelled():
+                    break
+                self._handle_staged(hash_id, staged)
+                self._report_progress(total_items, progress_callback)
+            self._finish_post_processing()
+            completed = not self.is_cancelled()
+        finally:
+            self._post_pool = None
+            if completed:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
+
+        return self.processed_count
+
+    def _submit_post_process(self, function: Callable, args: tuple):
+        """
+        把后处理任务提交到进程池，不阻塞提取
+
+        Args:
+            function: 模块级函数，返回(输出路径, 结果)，失败时结果为 {'error': 错误信息}
+            args: 函数参数
+        """
+        pending = self._post_pool.apply_async(function, args)
+        with self._lock:
+            self._pending_post.append(pending)
+
+    def _finish_post_processing(self):
+        """等待已提交的后处理任务完成并统计结果"""
+        if not self._pending_post:
+            return
+        self.send_log(self.POST_PROCESS_LOG_KEY, "info", len(self._pending_post))
+        done_key, error_key = self.POST_PROCESS_STATS
+        for pending in self._pending_post:
+            if self.is_cancelled():
+                return
+            path, result = pending.get()
+            if isinstance(result, dict):
+                self.stats.increment(error_key)
+                logger.warning(f"{self.POST_PROCESS_LABEL} {path} 失败: {result['error']}")
+            else:
+                self.stats.increment(done_key)
+        self._pending_post = []
+
+    def _close_post_pool(self):
+        """关闭后处理进程池，取消时直接终止未完成的任务"""
+        pool = self._post_pool
+        self._post_pool = None
+        if pool is None:
+            return
+        if self.is_cancelled():
+            pool.terminate()
+        else:
+            pool.close()
+        pool.join()
+
+    def _report_progress(self, total_items: int, progress_callback: Optional[Callable[[int, int, str], None]]):
+        """更新已处理数量并报告进度"""
+        with self._lock:
+            self.processed_count += 1
+            processed_count = self.processed_count
+        if progress_callback:
+            progress_callback(processed_count, total_items, f"处理{self.ASSET_LABEL} {processed_count}/{total_items}")
+
+    def _handle_staged(self, hash_id: str, staged: Optional[Dict[str, Any]]):
+        """
+        处理一个暂存的资源：去重后移动到分类目录，重复的资源删除暂存文件
+
+        Args:
+            hash_id: 缓存项哈希ID
+            staged: 暂存函数的结果，不是该类资源时为None
+        """
+        if staged is None:
+            return
+        if 'error' in staged:
+            self.stats.increment('processing_errors')
+            logger.error(f"处理缓存项目 {hash_id} 时出错: {staged['error']}")
+            return
+
+        self.stats.increment(f'{self.STATS_PREFIX}_found')
+        temp_path = staged['temp_path']
+        content_hash = staged['content_hash']
+        file_hash = f"{content_hash}_{hash_id}"
+
+        try:
+            if self.hash_cache.is_duplicate(content_hash):
+                self.stats.increment('duplicate_skipped')
+                os.remove(temp_path)
+                return
+
+            if self.download_history and (
+                    self.download_history.is_content_processed(content_hash, self.ASSET_TYPE) or
+                    self.download_history.is_processed(file_hash, self.ASSET_TYPE)):
+                self.stats.increment('already_processed')
+                os.remove(temp_path)
+                return
+
+            output_path = self._get_output_path(staged)
+            os.replace(temp_path, output_path)
+        except OSError as e:
+            self.stats.increment('processing_errors')
+            logger.error(f"保存{self.ASSET_LABEL} {hash_id} 时出错: {e}")
+            return
+
+        logger.debug(f"成功保存{self.ASSET_LABEL}: {output_path}")
+        self.stats.increment(f'{self.STATS_PREFIX}_saved')
+        self.stats.increment('bytes_saved', staged['size'])
+        if self.download_history:
+            self.download_history.add_hash(file_hash, self.ASSET_TYPE)
+
+        self._on_saved(output_path, staged)
+
+    def _get_output_path(self, staged: Dict[str, Any]) -> str:
+        """获取输出路径，文件名为资源ID加缓存哈希前8位，无法识别资源ID时为缓存哈希"""
+        category_dir = self.get_output_dir(staged)
+        with self._lock:
+            created = category_dir in self._created_dirs
+        if not created:
+            os.makedirs(category_dir, exist_ok=True)
+            with self._lock:
+                self._created_dirs.add(category_dir)
+
+        # 同一资源的不同版本可能同时在缓存中，加上缓存哈希避免互相覆盖
+        asset_id = extract_asset_id(staged['link'])
+        name = f"{asset_id}_{staged['hash_id'][:8]}" if asset_id else staged['hash_id']
+        return os.path.join(category_dir, f"{name}.{staged['extension']}")
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """获取缓存信息"""
+        return self.cache_scanner.get_cache_info()
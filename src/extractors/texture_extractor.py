@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+纹理提取器模块 - 从Roblox缓存中提取KTX纹理，并可选地解码为PNG
+Texture Extractor Module - Extracts KTX textures from the Roblox cache and optionally decodes them to PNG
+"""
+
+import os
+import logging
+from typing import Dict, List, Any, Optional, Callable
+from enum import Enum, auto
+
+# 导入历史管理器
+from src.utils.history_manager import ExtractedHistory
+
+# 导入Roblox提取模块
+from .content_identifier import AssetType
+from .cache_scanner import CacheItem
+from .image_extractor import get_dimension_category
+from .ktx_texture import parse_ktx_header, can_decode, is_decode_available, _decode_ktx_worker
+from .staged_extractor import (StagedCacheExtractor, StagedProcessingStats,
+                               get_process_identifier, stage_cache_content)
+
+logger = logging.getLogger(__name__)
+
+
+class TextureClassificationMethod(Enum):
+    """纹理分类方法枚举"""
+    FORMAT = auto()      # 按压缩格式分类
+    DIMENSIONS = auto()  # 按尺寸分类
+    NONE = auto()        # 无分类
+
+
+class TextureProcessingStats(StagedProcessingStats):
+    """纹理处理统计类 - 线程安全"""
+
+    def __init__(self):
+        super().__init__('textures', textures_decoded=0, decode_errors=0, formats_discovered=set())
+
+
+def _accept_texture(head: bytes) -> Optional[Dict[str, Any]]:
+    """识别内容开头是否为KTX纹理，是则返回格式和尺寸"""
+    if get_process_identifier().identify_content(head).asset_type != AssetType.Khronos:
+        return None
+    header = parse_ktx_header(head)
+    if header is None:
+        return None
+    return {
+        'extension': "ktx",
+        'type_name': header.format_name,
+        'width': header.width,
+        'height': header.height,
+        'decodable': can_decode(header)
+    }
+
+
+def stage_texture(path: str, data: Optional[bytes], hash_id: str, staging_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    识别缓存项中的KTX纹理并写入暂存文件（不依赖提取器状态，可在工作进程中执行）
+
+    Args:
+        path: 缓存文件路径（data为None时使用）
+        data: 直接从数据库获取的缓存数据
+        hash_id: 缓存项哈希ID，用作暂存文件名
+        staging_dir: 暂存目录（需已存在）
+
+    Returns:
+        Optional[Dict[str, Any]]: 不是KTX纹理时返回None，否则为
+            {'hash_id', 'link', 'extension', 'type_name', 'width', 'height', 'decodable',
+             'content_hash', 'size', 'temp_path'}
+
+    Raises:
+        OSError: 读取缓存或写入暂存文件失败
+        ValueError: 缓存内容被截断
+    """
+    return stage_cache_content(path, data, hash_id, staging_dir, _accept_texture)
+
+
+class RobloxTextureExtractor(StagedCacheExtractor):
+    """Roblox纹理提取器"""
+
+    OUTPUT_DIR_NAME = "Textures"
+    ASSET_TYPE = "texture"
+    ASSET_LABEL = "纹理"
+    STATS_PREFIX = "textures"
+    STAGE_FUNCTION = staticmethod(stage_texture)
+
+    POST_PROCESS_LOG_KEY = "decoding_textures"
+    POST_PROCESS_STATS = ("textures_decoded", "decode_errors")
+    POST_PROCESS_LABEL = "解码纹理"
+
+    def __init__(self,
+                 output_dir: Optional[str] = None,
+                 classification_method: TextureClassificationMethod = TextureClassificationMethod.FORMAT,
+                 decode_png: bool = False,
+                 decode_mip_levels: int = 1,
+                 num_threads: int = 1,
+                 use_multiprocessing: bool = False,
+                 conservative_multiprocessing: bool = True,
+                 log_callback: Optional[Callable[[str, str], None]] = None,
+                 download_history: Optional[ExtractedHistory] = None):
+        """
+        初始化纹理提取器
+
+        Args:
+            output_dir: 输出目录
+            classification_method: 分类方法
+            decode_png: 是否把支持的BCn/未压缩纹理解码为PNG（需要NumPy）
+            decode_mip_levels: 解码的Mip级别数，默认只解码级别0
+            num_threads: 线程数量
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+            log_callback: 日志回调函数(message, log_type)
+            download_history: 下载历史管理器，用于避免重复处理文件
+        """
+        self.decode_png = decode_png and is_decode_available()
+        self.decode_mip_levels = max(1, decode_mip_levels)
+        if decode_png and not self.decode_png:
+            logger.warning("未安装NumPy，纹理将只保存为KTX文件")
+
+        super().__init__(output_dir, classification_method, num_threads, use_multiprocessing,
+                         conservative_multiprocessing, log_callback, download_history)
+
+        if decode_png and not self.decode_png:
+            self.send_log("texture_decode_unavailable", "warning")
+
+    def _create_stats(self) -> TextureProcessingStats:
+        return TextureProcessingStats()
+
+    def _uses_post_pool(self) -> bool:
+        return self.decode_png
+
+    def extract_textures(self,
+                         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                         custom_cache_path: Optional[str] = None,
+                         cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
+        """提取纹理，参数和返回值见StagedCacheExtractor.extract()"""
+        return self.extract(progress_callback, custom_cache_path, cache_items)
+
+    def _on_saved(self, output_path: str, staged: Dict[str, Any]):
+        self.stats.add_item('formats_discovered', staged['type_name'])
+
+        # PNG写在KTX文件旁边，解码在进程池中进行，不阻塞提取
+        if self._post_pool is not None and staged['decodable']:
+            self._submit_post_process(
+                _decode_ktx_worker, (output_path, os.path.splitext(output_path)[0], self.decode_mip_levels))
+
+    def get_output_dir(self, staged: Dict[str, Any]) -> str:
+        """
+        根据分类方法获取输出目录（不创建目录）
+
+        Args:
+            staged: stage_texture()的结果
+
+        Returns:
+            str: 输出目录
+        """
+        if self.classification_method == TextureClassificationMethod.FORMAT:
+            return os.path.join(self.asset_dir, staged['type_name'])
+        elif self.classification_method == TextureClassificationMethod.DIMENSIONS:
+            return os.path.join(self.asset_dir, get_dimension_category((staged['width'], staged['height'])))
+        else:  # NONE
+            return self.asset_dir
+
+
+# 便捷函数
+def extract_roblox_textures(output_dir: Optional[str] = None,
+                            cache_path: Optional[str] = None,
+                            progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                            decode_png: bool = False,
+                            num_threads: int = 1,
+                            use_multiprocessing: bool = False,
+                            conservative_multiprocessing: bool = True,
+                            log_callback: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+    """
+    Roblox纹理提取的便捷函数
+
+    Args:
+        output_dir: 输出目录
+        cache_path: 自定义缓存路径
+        progress_callback: 进度回调函数
+        decode_png: 是否解码为PNG
+        num_threads: 线程数量
+        use_multiprocessing: 是否使用多进程
+        conservative_multiprocessing: 是否使用保守的多进程策略
+        log_callback: 日志回调函数
+
+    Returns:
+        Dict[str, Any]: 提取结果
+    """
+    extractor = RobloxTextureExtractor(
+        output_dir=output_dir,
+        decode_png=decode_png,
+        num_threads=num_threads,
+        use_multiprocessing=use_multiprocessing,
+        conservative_multiprocessing=conservative_multiprocessing,
+        log_callback=log_callback
+    )
+    return extractor.extract_textures(progress_callback, cache_path)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+翻译合并包模块 - 把所有翻译条目按(语言区域, 键)合并到一个SQLite数据库中
+Translation Bundle Module - Merges all translation entries into one SQLite database keyed by (locale, key)
+"""
+
+import os
+import json
+import time
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    locale TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    content_type TEXT,
+    source TEXT,
+    PRIMARY KEY (locale, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    locale TEXT,
+    content_type TEXT,
+    content_hash TEXT,
+    entry_count INTEGER,
+    updated REAL
+);
+"""
+
+
+def iter_translation_entries(entries: Any) -> Iterable[Tuple[str, str]]:
+    """
+    遍历翻译条目，值不是字符串时保存为JSON文本
+
+    支持 {"键": 值} 形式，以及 [{"key": 键, ...}, ...] 形式的条目列表。
+
+    Args:
+        entries: 翻译文件中的entries字段
+
+    Returns:
+        Iterable[Tuple[str, str]]: (键, 值)
+    """
+    if isinstance(entries, dict):
+        items = entries.items()
+    elif isinstance(entries, list):
+        items = ((item.get("key", item.get("Key")), item) for item in entries if isinstance(item, dict))
+    else:
+        return
+    for key, value in items:
+        if key is None:
+            continue
+        if not isinstance(value, str):
+            value = json.dumps(value, ensure_ascii=False)
+        yield str(key), value
+
+
+class TranslationBundle:
+    """
+    翻译合并包
+
+    每个语言区域的全部条目保存在同一张表中，以(语言区域, 键)为主键，
+    后续运行中新的翻译文件直接覆盖同名键，因此合并包可以增量更新；
+    sources表记录每个条目来自哪个转储文件及其内容哈希，合并包模式据此跳过
+    已合并过的翻译文件，与单独保存JSON文件时的提取历史互不影响。写入按批次
+    在一个事务中完成。
+    """
+
+    FILE_NAME = "translations.db"
+
+    def __init__(self, path: str):
+        """
+        初始化翻译合并包
+
+        Args:
+            path: 数据库文件路径
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._content_hashes: Set[str] = set()  # sources表中已合并的内容哈希
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库（调用方持有锁）"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._content_hashes = {row[0] for row in conn.execute("SELECT content_hash FROM sources")}
+            self._conn = conn
+        return self._conn
+
+    def is_merged(self, content_hash: str) -> bool:
+        """
+        检查内容相同的翻译文件是否已合并过（sources表中已有该内容哈希）
+
+        Args:
+            content_hash: 原始内容的SHA256哈希
+
+        Returns:
+            bool: 是否已合并过
+        """
+        with self._lock:
+            self._connect()
+            return content_hash in self._content_hashes
+
+    def write(self, tables: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        在一个事务中写入一批翻译文件
+
+        Args:
+            tables: [(转储名称, analyze_translation()的结果), ...]，结果中需包含entries
+
+        Returns:
+            int: 写入的条目数
+        """
+        now = time.time()
+        written = 0
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for dump_name, analysis in tables:
+                    locale = analysis["locale"]
+                    content_type = analysis["content_type"]
+                    rows = [(locale, key, value, content_type, dump_name)
+                            for key, value in iter_translation_entries(analysis.get("entries"))]
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO entries (locale, key, value, content_type, source) "
+                        "VALUES (?, ?, ?, ?, ?)", rows)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO sources (source, locale, content_type, content_hash, entry_count, updated) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (dump_name, locale, content_type, analysis["content_hash"], len(rows), now))
+                    written += len(rows)
+            # 事务提交后再记录已合并的内容
+            self._content_hashes.update(analysis["content_hash"] for _, analysis in tables)
+        return written
+
+    def lookup(self, locale: str, key: str) -> Optional[str]:
+        """查找某个语言区域中键对应的翻译"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM entries WHERE locale = ? AND key = ?", (locale, key)).fetchone()
+        return row[0] if row else None
+
+    def get_locale_entries(self, locale: str) -> Dict[str, str]:
+        """获取某个语言区域的全部条目"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key, value FROM entries WHERE locale = ?", (locale,)).fetchall()
+        return dict(rows)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取合并包中的语言区域、条目和来源数量"""
+        with self._lock:
+            conn = self._connect()
+            locales = conn.execute("SELECT COUNT(DISTINCT locale) FROM entries").fetchone()[0]
+            entries = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            sources = conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+        return {'path': self.path, 'locales': locales, 'entries': entries, 'sources': sources}
+
+    def close(self):
+        """关闭数据库连接，之后的调用会重新打开"""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"关闭翻译合并包失败: {e}")
+                self._conn = None
+                self._content_hashes = set()
@@ -20,11 +20,13 @@ from dataclasses import dataclass
 
 # 导入历史管理器
 from src.utils.history_manager import ExtractedHistory, ContentHashCache
+from src.utils.stage_timer import StageTimer
 
 # 导入Roblox提取模块
 from .rbxh_parser import RBXHParser, ParsedCache, parse_cache_file, parse_cache_data
 from .content_identifier import ContentIdentifier, AssetType, IdentifiedContent, identify_content
 from .cache_scanner import RobloxCacheScanner, CacheItem, CacheType, scan_roblox_cache
+from .translation_bundle import TranslationBundle
 
 # 导入多进程工具
 from src.utils.multiprocessing_utils import (
@@ -88,79 +90,102 @@ class TranslationProcessingStats:
             stats_copy['content_types_discovered'] = list(self.stats['content_types_discovered'])
             return stats_copy
 
-# 多进程工作函数
-def _process_cache_item_worker(cache_item: CacheItem, config: 'TranslationProcessingConfig') -> Dict[str, Any]:
+# 内容类型检测使用的翻译键模式
+_UI_PATTERNS = ('ui.', 'button.', 'menu.', 'dialog.', 'window.', 'tab.', 'label.')
+_ERROR_PATTERNS = ('error.', 'warning.', 'exception.', 'fail.', 'invalid.')
+_GAME_PATTERNS = ('game.', 'player.', 'item.', 'action.', 'feature.', 'avatar.')
+
+
+def detect_translation_content_type(translation_data: Dict[str, Any]) -> str:
     """
-    多进程工作函数 - 处理单个缓存项目
+    根据翻译键的模式检测翻译内容的类型
     
     Args:
-        cache_item: 缓存项目
-        config: 处理配置
+        translation_data: 翻译数据
         
     Returns:
-        Dict: 处理结果
+        str: 内容类型
     """
-    result = {
-        'success': False,
-        'translation_processed': 0,
-        'translation_saved': 0,
-        'processed_hashes': [],
-        'errors': []
-    }
+    entries = translation_data.get("entries", {})
+    if not entries:
+        return "Unknown"
     
-    try:
-        # 初始化组件
-        rbxh_parser = RBXHParser()
-        content_identifier = ContentIdentifier(config.block_avatar_images)
-        
-        # 初始化历史记录管理器
-        download_history = None
-        if config.history_file and os.path.exists(config.history_file):
-            download_history = ExtractedHistory(config.history_file)
-        
-        # 解析缓存内容
-        if cache_item.data:
-            # 直接从数据库获取的内容
-            parsed_cache = rbxh_parser.parse_cache_data(cache_item.data)
-        else:
-            # 从文件读取的内容
-            parsed_cache = rbxh_parser.parse_cache_file(cache_item.path)
-        
-        if not parsed_cache.success:
-            return result
-        
-        # 识别内容类型
-        identified = content_identifier.identify_content(parsed_cache.content)
+    ui_count = error_count = game_count = 0
+    for key in entries:
+        key = key.lower()
+        if any(pattern in key for pattern in _UI_PATTERNS):
+            ui_count += 1
+        if any(pattern in key for pattern in _ERROR_PATTERNS):
+            error_count += 1
+        if any(pattern in key for pattern in _GAME_PATTERNS):
+            game_count += 1
+    
+    total = len(entries)
+    if ui_count / total > 0.3:
+        return "UI"
+    elif error_count / total > 0.3:
+        return "Errors"
+    elif game_count / total > 0.3:
+        return "GameContent"
+    else:
+        return "General"
+
+
+def analyze_translation(content: bytes, pretty_print: bool = True, keep_entries: bool = False,
+                        content_hash: Optional[str] = None) -> Dict[str, Any]:
+    """
+    解析翻译文件并生成要写入的数据（不访问文件系统，可在工作进程中执行）
+    
+    Args:
+        content: 翻译文件内容
+        pretty_print: 是否重新格式化为缩进JSON，否则直接写入原始字节
+        keep_entries: 是否在结果中保留翻译条目（写入合并包时需要）
+        content_hash: 已计算的内容哈希，为None时重新计算
         
-        # 只处理翻译文件
-        if identified.asset_type == AssetType.Translation:
-            result['translation_processed'] = 1
-            
-            # 创建翻译处理器
-            translation_processor = TranslationProcessor(
-                config.translations_dir, 
-                config.classification_method,
-                download_history,
-                collect_hashes=True  # 多进程模式下启用哈希收集
-            )
-            
-            # 处理翻译文件
-            process_result = translation_processor.process_translation(
-                cache_item.hash_id, 
-                parsed_cache.content
-            )
-            
-            if process_result["success"]:
-                result['translation_saved'] = process_result["saved_count"]
-                result['processed_hashes'] = process_result.get("processed_hashes", [])
-                result['success'] = True
-            else:
-                result['errors'].extend(process_result.get("errors", []))
+    Returns:
+        Dict[str, Any]: {'locale', 'content_type', 'content_hash', 'data'}，keep_entries时另有'entries'
         
-    except Exception as e:
-        result['errors'].append(f"处理缓存项 {cache_item.hash_id} 失败: {str(e)}")
+    Raises:
+        ValueError: 内容不是有效的JSON
+    """
+    translation_data = json.loads(content.decode('utf-8', errors='ignore'))
     
-    return result
+    if pretty_print:
+        data = json.dumps(translation_data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        # 原始内容本身就是JSON，无需重新序列化
+        data = content
+    
+    analysis = {
+        'locale': translation_data.get("locale", "unknown"),
+        'content_type': detect_translation_content_type(translation_data),
+        'content_hash': content_hash or hashlib.sha256(content).hexdigest(),
+        'data': data
+    }
+    if keep_entries:
+        analysis['entries'] = translation_data.get("entries", {})
+    return analysis
+
+
+# 多进程工作函数
+def _analyze_translation_worker(dump_name: str, content: bytes, pretty_print: bool, keep_entries: bool = False,
+                                content_hash: Optional[str] = None) -> tuple:
+    """
+    进程池工作函数 - 解析并格式化单个翻译文件
+    
+    Returns:
+        tuple: (转储名称, 解析结果, 解析耗时)，失败时解析结果为 {'error': 错误信息}；
+            不重新格式化时解析结果中的data为None，由主进程补回原始内容
+    """
+    start = time.perf_counter()
+    try:
+        analysis = analyze_translation(content, pretty_print, keep_entries, content_hash)
+        if not pretty_print:
+            # 主进程已持有原始内容，不再通过管道传回
+            analysis['data'] = None
+        return dump_name, analysis, time.perf_counter() - start
+    except Exception as e:
+        return dump_name, {'error': str(e)}, time.perf_counter() - start
 
 @dataclass
 class TranslationProcessingConfig:
@@ -173,7 +198,9 @@ class TranslationProcessingConfig:
 class TranslationProcessor:
     """翻译文件处理器 - 处理Roblox翻译文件"""
     
-    def __init__(self, output_dir: str, classification_method: TranslationClassificationMethod = TranslationClassificationMethod.LOCALE, download_history: Optional['ExtractedHistory'] = None, collect_hashes: bool = False):
+    def __init__(self, output_dir: str, classification_method: TranslationClassificationMethod = TranslationClassificationMethod.LOCALE, download_history: Optional['ExtractedHistory'] = None, collect_hashes: bool = False,
+                 pretty_print: bool = True, bundle: Optional[TranslationBundle] = None,
+                 stage_timer: Optional[StageTimer] = None):
         """
         初始化翻译文件处理器
         
@@ -182,9 +209,17 @@ class TranslationProcessor:
             classification_method: 分类方法
             download_history: 下载历史管理器，用于避免重复处理文件
             collect_hashes: 是否收集处理过的哈希
+            pretty_print: 是否重新格式化JSON，否则直接写入原始内容
+            bundle: 翻译合并包，设置后条目写入合并包而不是单独的JSON文件
+            stage_timer: 阶段计时器（写入）
         """
         self.output_dir = output_dir
         self.classification_method = classification_method
+        self.pretty_print = pretty_print
+        self.bundle = bundle
+        self.stage_timer = stage_timer or StageTimer()
+        self._created_dirs = set()  # 已创建的输出目录
+        self._dirs_lock = threading.Lock()
         self._cancel_check_fn = None  # 取消检查函数
         self._log_callback = None  # 日志回调函数
         self.download_history = download_history
@@ -220,60 +255,55 @@ class TranslationProcessor:
         Returns:
             str: 内容类型
         """
-        entries = translation_data.get("entries", {})
-        if not entries:
-            return "Unknown"
-        
-        # 分析翻译键的模式来确定内容类型
-        keys = list(entries.keys())
-        
-        # UI相关的键
-        ui_patterns = ['ui.', 'button.', 'menu.', 'dialog.', 'window.', 'tab.', 'label.']
-        # 错误相关的键
-        error_patterns = ['error.', 'warning.', 'exception.', 'fail.', 'invalid.']
-        # 游戏内容相关的键
-        game_patterns = ['game.', 'player.', 'item.', 'action.', 'feature.', 'avatar.']
-        
-        ui_count = sum(1 for key in keys if any(pattern in key.lower() for pattern in ui_patterns))
-        error_count = sum(1 for key in keys if any(pattern in key.lower() for pattern in error_patterns))
-        game_count = sum(1 for key in keys if any(pattern in key.lower() for pattern in game_patterns))
-        
-        total = len(keys)
-        if ui_count / total > 0.3:
-            return "UI"
-        elif error_count / total > 0.3:
-            return "Errors"
-        elif game_count / total > 0.3:
-            return "GameContent"
-        else:
-            return "General"
+        return detect_translation_content_type(translation_data)
     
-    def _get_output_path(self, locale: str, content_type: str, filename: str) -> str:
+    def get_output_dir(self, locale: str, content_type: str) -> str:
         """
-        根据分类方法获取输出路径
+        根据分类方法获取输出目录（不创建目录）
         
         Args:
             locale: 语言区域
             content_type: 内容类型
-            filename: 文件名
             
         Returns:
-            str: 输出路径
+            str: 输出目录
         """
         if self.classification_method == TranslationClassificationMethod.LOCALE:
             # 按语言分类：Translations/zh-cn/filename.json
-            category_dir = os.path.join(self.output_dir, locale)
+            return os.path.join(self.output_dir, locale)
         elif self.classification_method == TranslationClassificationMethod.CONTENT_TYPE:
             # 按内容类型分类：Translations/UI/filename.json
-            category_dir = os.path.join(self.output_dir, content_type)
+            return os.path.join(self.output_dir, content_type)
         elif self.classification_method == TranslationClassificationMethod.COMBINED:
             # 组合分类：Translations/zh-cn/UI/filename.json
-            category_dir = os.path.join(self.output_dir, locale, content_type)
+            return os.path.join(self.output_dir, locale, content_type)
         else:  # NONE
             # 无分类：Translations/filename.json
-            category_dir = self.output_dir
+            return self.output_dir
+    
+    def _ensure_dir(self, directory: str):
+        """创建输出目录，每个目录只创建一次"""
+        with self._dirs_lock:
+            if directory in self._created_dirs:
+                return
+        os.makedirs(directory, exist_ok=True)
+        with self._dirs_lock:
+            self._created_dirs.add(directory)
+    
+    def _get_output_path(self, locale: str, content_type: str, filename: str) -> str:
+        """
+        根据分类方法获取输出路径
         
-        os.makedirs(category_dir, exist_ok=True)
+        Args:
+            locale: 语言区域
+            content_type: 内容类型
+            filename: 文件名
+            
+        Returns:
+            str: 输出路径
+        """
+        category_dir = self.get_output_dir(locale, content_type)
+        self._ensure_dir(category_dir)
         return os.path.join(category_dir, filename)
     
     def process_translation(self, dump_name: str, content: bytes) -> Dict[str, Any]:
@@ -287,67 +317,140 @@ class TranslationProcessor:
         Returns:
             Dict: 处理结果
         """
-        result = {
-            "success": False,
-            "locale": "",
-            "content_type": "",
-            "saved_count": 0,
-            "processed_hashes": [],  # 新增：已处理过的翻译计数
-            "errors": []
-        }
+        # 先用原始字节的哈希检查历史记录，已处理过的文件无需解码和解析
+        content_hash = hashlib.sha256(content).hexdigest()
+        if self.is_translation_processed(dump_name, content_hash):
+            logger.debug(f"翻译文件已处理过，跳过: {dump_name}")
+            return {
+                "success": True,
+                "locale": "",
+                "content_type": "",
+                "saved_count": 0,
+                "processed_hashes": [],
+                "errors": []
+            }
         
         try:
-            # 检查是否已取消
-            if self.is_cancelled():
-                result["errors"].append("操作已取消")
-                return result
-            
-            # 确保输出目录存在
-            os.makedirs(self.output_dir, exist_ok=True)
-            
-            # 解析JSON
-            content_str = content.decode('utf-8', errors='ignore')
-            translation_data = json.loads(content_str)
-            
-            locale = translation_data.get("locale", "unknown")
-            result["locale"] = locale
-            
-            # 检测内容类型
-            content_type = self._detect_content_type(translation_data)
-            result["content_type"] = content_type
-            
-            logger.debug(f"处理翻译文件: {locale} ({content_type})")
-            self.send_log("processing_translation", "info", locale, content_type)
-            
-            # 生成内容哈希用于去重
-            content_hash = hashlib.sha256(content).hexdigest()
-            
-            # 检查内容是否已处理过（与音频提取器保持一致的双重检查）
-            if self.download_history and self.download_history.is_content_processed(content_hash, 'translation'):
-                logger.debug(f"翻译文件内容已处理过，跳过: {locale}")
-                result["success"] = True
-                result["saved_count"] = 0  # 已处理，不算新保存
-                return result
+            analysis = analyze_translation(content, self.pretty_print, keep_entries=self.bundle is not None,
+                                           content_hash=content_hash)
+        except Exception as e:
+            error_msg = f"处理翻译文件时出错: {e}"
+            logger.error(error_msg)
+            return {
+                "success": False,
+                "locale": "",
+                "content_type": "",
+                "saved_count": 0,
+                "processed_hashes": [],
+                "errors": [error_msg]
+            }
+        return self.save_translations([(dump_name, analysis)])[0]
+    
+    def is_translation_processed(self, dump_name: str, content_hash: str) -> bool:
+        """
+        检查翻译文件是否已处理过，只需要原始字节的哈希，不需要解析JSON
+        
+        合并包模式只看合并包的sources表，单独保存JSON文件时只看提取历史，
+        两种模式的处理记录互不影响。
+        
+        Args:
+            dump_name: 转储文件名
+            content_hash: 原始内容的SHA256哈希
             
-            # 生成包含转储名称的文件哈希
-            file_hash = f"{content_hash}_{dump_name}"
+        Returns:
+            bool: 内容或该转储文件是否已处理过
+        """
+        if self.bundle is not None:
+            return self.bundle.is_merged(content_hash)
+        if not self.download_history:
+            return False
+        return (self.download_history.is_content_processed(content_hash, 'translation') or
+                self.download_history.is_processed(f"{content_hash}_{dump_name}", 'translation'))
+    
+    def save_translations(self, batch: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        保存一批已解析的翻译文件
+        
+        合并包模式下整批条目在一个事务中写入，否则逐个写入JSON文件。
+        
+        Args:
+            batch: [(转储名称, analyze_translation()的结果), ...]
             
-            # 检查完整文件哈希是否已处理过
-            if self.download_history and self.download_history.is_processed(file_hash, 'translation'):
-                logger.debug(f"翻译文件已处理过，跳过: {locale}")
+        Returns:
+            List[Dict]: 每个文件的处理结果
+        """
+        with self.stage_timer.span("write", files=len(batch)) as counters:
+            results = self._save_translations(batch)
+            counters["bytes"] = sum(len(analysis["data"]) for (_, analysis), result in zip(batch, results)
+                                    if result.get("success"))
+            return results
+    
+    def _save_translations(self, batch: List[tuple]) -> List[Dict[str, Any]]:
+        """保存一批已解析的翻译文件（见save_translations）"""
+        if self.bundle is None:
+            return [self.save_translation(dump_name, analysis) for dump_name, analysis in batch]
+        
+        results = []
+        pending = []
+        pending_hashes = set()  # 同一批中内容相同的文件只合并一次
+        for dump_name, analysis in batch:
+            result, file_hash = self._prepare_save(dump_name, analysis)
+            results.append(result)
+            if file_hash is None:
+                continue
+            if analysis["content_hash"] in pending_hashes:
                 result["success"] = True
-                result["saved_count"] = 0  # 已处理，不算新保存
-                return result
+                continue
+            pending_hashes.add(analysis["content_hash"])
+            pending.append((dump_name, analysis, result))
+        
+        if not pending:
+            return results
+        
+        try:
+            self.bundle.write([(dump_name, analysis) for dump_name, analysis, _ in pending])
+        except Exception as e:
+            error_msg = f"写入翻译合并包时出错: {e}"
+            logger.error(error_msg)
+            for _, _, result in pending:
+                result["errors"].append(error_msg)
+            return results
+        
+        # 合并包的sources表就是处理记录，不写入提取历史
+        for dump_name, analysis, result in pending:
+            logger.debug(f"成功写入翻译合并包: {analysis['locale']} ({dump_name})")
+            self.send_log("translation_save_success", "info", f"{self.bundle.path} [{analysis['locale']}]")
+            result["success"] = True
+            result["saved_count"] = 1
+        return results
+    
+    def save_translation(self, dump_name: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        保存已解析的翻译文件
+        
+        Args:
+            dump_name: 转储文件名
+            analysis: analyze_translation()的结果
             
+        Returns:
+            Dict: 处理结果
+        """
+        result, file_hash = self._prepare_save(dump_name, analysis)
+        if file_hash is None:
+            return result
+        
+        locale = analysis["locale"]
+        content_type = analysis["content_type"]
+        try:
             # 生成文件名
             filename = f"{locale}_{content_type}_{dump_name[:8]}.json"
             
             # 获取输出路径
             output_path = self._get_output_path(locale, content_type, filename)
             
-            # 保存翻译文件
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(translation_data, f, indent=2, ensure_ascii=False)
+            # 保存翻译文件（已是UTF-8编码的JSON字节）
+            with open(output_path, 'wb') as f:
+                f.write(analysis["data"])
             
             logger.debug(f"成功保存翻译文件: {output_path}")
             self.send_log("translation_save_success", "info", output_path)
@@ -365,6 +468,49 @@ class TranslationProcessor:
     
         return result
     
+    def _prepare_save(self, dump_name: str, analysis: Dict[str, Any]) -> tuple:
+        """
+        检查翻译文件是否需要保存
+        
+        Args:
+            dump_name: 转储文件名
+            analysis: analyze_translation()的结果
+            
+        Returns:
+            tuple: (处理结果, 文件哈希)，不需要保存时文件哈希为None
+        """
+        locale = analysis["locale"]
+        content_type = analysis["content_type"]
+        result = {
+            "success": False,
+            "locale": locale,
+            "content_type": content_type,
+            "saved_count": 0,
+            "processed_hashes": [],  # 新增：已处理过的翻译计数
+            "errors": []
+        }
+        
+        # 检查是否已取消
+        if self.is_cancelled():
+            result["errors"].append("操作已取消")
+            return result, None
+        
+        logger.debug(f"处理翻译文件: {locale} ({content_type})")
+        self.send_log("processing_translation", "info", locale, content_type)
+        
+        # 内容哈希用于去重
+        content_hash = analysis["content_hash"]
+        
+        # 检查内容或该转储文件是否已处理过（与音频提取器保持一致的双重检查）
+        if self.is_translation_processed(dump_name, content_hash):
+            logger.debug(f"翻译文件已处理过，跳过: {locale}")
+            result["success"] = True
+            result["saved_count"] = 0  # 已处理，不算新保存
+            return result, None
+        
+        # 生成包含转储名称的文件哈希
+        return result, f"{content_hash}_{dump_name}"
+    
     def _add_translation_hash_to_history(self, file_hash: str):
         """添加翻译文件哈希到历史记录的统一方法
         
@@ -378,6 +524,79 @@ class TranslationProcessor:
             # 单线程/多线程模式：立即添加到历史记录
             self.download_history.add_hash(file_hash, 'translation')
 
+class TranslationBatchWriter:
+    """
+    翻译文件批量写入器
+    
+    解析结果按输出目录（语言区域）分组缓存，某个目录攒够一批或缓存的数据
+    超过上限时，把该目录的文件集中连续写入。同一目录的批次串行写入，
+    保证同一内容不会被两个线程同时保存。
+    """
+    
+    def __init__(self, processor: TranslationProcessor, on_result: Callable[[Dict[str, Any]], None],
+                 batch_size: int = 64, max_pending_bytes: int = 32 * 1024 * 1024):
+        """
+        初始化批量写入器
+        
+        Args:
+            processor: 翻译文件处理器，负责去重检查和写入
+            on_result: 每个文件处理完成后的回调，参数为save_translation()的结果
+            batch_size: 每个目录一批的文件数
+            max_pending_bytes: 所有目录缓存数据的上限（字节）
+        """
+        self.processor = processor
+        self.on_result = on_result
+        self.batch_size = max(1, batch_size)
+        self.max_pending_bytes = max_pending_bytes
+        self._pending: Dict[str, List[tuple]] = {}
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+        self._dir_locks: Dict[str, threading.Lock] = {}
+    
+    def add(self, dump_name: str, analysis: Dict[str, Any]):
+        """
+        添加一个已解析的翻译文件
+        
+        Args:
+            dump_name: 转储文件名
+            analysis: analyze_translation()的结果
+        """
+        directory = self.processor.get_output_dir(analysis["locale"], analysis["content_type"])
+        with self._lock:
+            batch = self._pending.setdefault(directory, [])
+            batch.append((dump_name, analysis))
+            self._pending_bytes += len(analysis["data"])
+            if len(batch) >= self.batch_size:
+                batches = [self._take(directory)]
+            elif self._pending_bytes >= self.max_pending_bytes:
+                batches = [self._take(d) for d in list(self._pending)]
+            else:
+                batches = []
+        
+        for directory, batch in batches:
+            self._write(directory, batch)
+    
+    def flush(self):
+        """写入所有缓存的文件"""
+        with self._lock:
+            batches = [self._take(d) for d in list(self._pending)]
+        for directory, batch in batches:
+            self._write(directory, batch)
+    
+    def _take(self, directory: str) -> tuple:
+        """取出某个目录缓存的批次（调用方持有锁）"""
+        batch = self._pending.pop(directory)
+        self._pending_bytes -= sum(len(analysis["data"]) for _, analysis in batch)
+        return directory, batch
+    
+    def _write(self, directory: str, batch: List[tuple]):
+        """连续写入同一目录的一批文件"""
+        with self._lock:
+            dir_lock = self._dir_locks.setdefault(directory, threading.Lock())
+        with dir_lock:
+            for result in self.processor.save_translations(batch):
+                self.on_result(result)
+
 class RobloxTranslationExtractor:
     """Roblox翻译文件提取器"""
     
@@ -389,7 +608,9 @@ class RobloxTranslationExtractor:
                  use_multiprocessing: bool = False,
                  conservative_multiprocessing: bool = True,
                  log_callback: Optional[Callable[[str, str], None]] = None,
-                 download_history: Optional[ExtractedHistory] = None):
+                 download_history: Optional[ExtractedHistory] = None,
+                 pretty_print: bool = True,
+                 bundle: bool = False):
         """
         初始化翻译文件提取器
         
@@ -402,6 +623,8 @@ class RobloxTranslationExtractor:
             conservative_multiprocessing: 是否使用保守的多进程策略
             log_callback: 日志回调函数(message, log_type)
             download_history: 下载历史管理器，用于避免重复处理文件
+            pretty_print: 是否重新格式化JSON，为False时按缓存中的原始内容写入
+            bundle: 是否把所有条目合并写入Translations/translations.db，而不是每个翻译文件单独保存
         """
         # 多线程/多进程配置
         self.use_multiprocessing = use_multiprocessing
@@ -427,6 +650,7 @@ class RobloxTranslationExtractor:
         # 配置
         self.classification_method = classification_method
         self.block_avatar_images = block_avatar_images
+        self.pretty_print = pretty_print
         
         # 输出目录
         if output_dir and os.path.isdir(output_dir):
@@ -438,7 +662,17 @@ class RobloxTranslationExtractor:
         os.makedirs(self.translations_dir, exist_ok=True)
         
         # 翻译文件处理器
-        self.translation_processor = TranslationProcessor(self.translations_dir, classification_method, download_history)
+        # 翻译合并包（可选）
+        self.bundle = TranslationBundle(os.path.join(self.translations_dir, TranslationBundle.FILE_NAME)) if bundle else None
+        # 合并包只需要条目，不需要格式化后的JSON
+        if self.bundle is not None:
+            self.pretty_print = False
+        
+        # 各阶段耗时（每次extract_translations重新统计）
+        self.stage_timer = StageTimer()
+        self.translation_processor = TranslationProcessor(self.translations_dir, classification_method, download_history,
+                                                          pretty_print=self.pretty_print, bundle=self.bundle,
+                                                          stage_timer=self.stage_timer)
         # 传递日志回调到翻译处理器
         if self.log_callback:
             self.translation_processor.set_log_callback(self.log_callback)
@@ -477,13 +711,15 @@ class RobloxTranslationExtractor:
     
     def extract_translations(self, 
                            progress_callback: Optional[Callable[[int, int, str], None]] = None,
-                           custom_cache_path: Optional[str] = None) -> Dict[str, Any]:
+                           custom_cache_path: Optional[str] = None,
+                           cache_items: Optional[List[CacheItem]] = None) -> Dict[str, Any]:
         """
         提取翻译文件
         
         Args:
             progress_callback: 进度回调函数
             custom_cache_path: 自定义缓存路径
+            cache_items: 要处理的缓存项目，None表示扫描整个缓存（监视模式只传入新出现的项目）
             
         Returns:
             Dict[str, Any]: 提取结果
@@ -495,6 +731,7 @@ class RobloxTranslationExtractor:
             self.cancelled = False
             self.processed_count = 0
             self.stats = TranslationProcessingStats()
+            self.stage_timer.reset()
             
             self.send_log("starting_translation_extraction", "info")
             
@@ -518,12 +755,15 @@ class RobloxTranslationExtractor:
                     "stats": self.stats.get_all(),
                     "cache_info": cache_info,
                     "duration": time.time() - start_time,
-                    "output_dir": self.translations_dir
+                    "output_dir": self.translations_dir,
+                    "stages": self.stage_timer.breakdown()
                 }
             
-            # 扫描缓存
-            self.send_log("scanning_cache", "info")
-            cache_items = self.cache_scanner.scan_cache()
+            # 扫描缓存（监视模式直接传入新出现的项目）
+            if cache_items is None:
+                self.send_log("scanning_cache", "info")
+                with self.stage_timer.span("scan"):
+                    cache_items = self.cache_scanner.scan_cache()
             
             if not cache_items:
                 self.send_log("no_cache_items_found", "warning")
@@ -534,7 +774,8 @@ class RobloxTranslationExtractor:
                     "stats": self.stats.get_all(),
                     "cache_info": cache_info,
                     "duration": time.time() - start_time,
-                    "output_dir": self.translations_dir
+                    "output_dir": self.translations_dir,
+                    "stages": self.stage_timer.breakdown()
                 }
             
             self.send_log("cache_scan_complete", "info", len(cache_items))
@@ -543,10 +784,11 @@ class RobloxTranslationExtractor:
             logger.debug(f"开始处理缓存项目，总数: {len(cache_items)}")
             processing_start = time.time()
             
-            if self.use_multiprocessing:
-                result = self._process_cache_items_multiprocessing(cache_items, progress_callback)
-            else:
-                result = self._process_cache_items_threading(cache_items, progress_callback)
+            with self.stage_timer.span("process", items=len(cache_items)):
+                if self.use_multiprocessing:
+                    result = self._process_cache_items_multiprocessing(cache_items, progress_callback)
+                else:
+                    result = self._process_cache_items_threading(cache_items, progress_callback)
             
             processed = result.get('processed', 0)
             
@@ -570,6 +812,8 @@ class RobloxTranslationExtractor:
                 "duration": duration,
                 "output_dir": self.translations_dir
             }
+            if self.bundle is not None:
+                result["bundle"] = self.bundle.get_stats()
             
             logger.debug(f"翻译文件提取完成! 统计: {result['stats']}")
             
@@ -577,8 +821,10 @@ class RobloxTranslationExtractor:
             if self.download_history:
                 logger.debug("保存翻译文件提取历史记录...")
                 self.send_log("saving_translation_history", "info")
-                self.download_history.save_history()
+                with self.stage_timer.span("history_save"):
+                    self.download_history.save_history()
                 logger.debug("✓ 翻译文件提取历史记录已保存")
+            result["stages"] = self.stage_timer.breakdown()
             
             # 发送完成日志
             stats = result['stats']
@@ -599,11 +845,126 @@ class RobloxTranslationExtractor:
                 "stats": self.stats.get_all(),
                 "cache_info": self.cache_scanner.get_cache_info(),
                 "duration": time.time() - start_time,
-                "output_dir": self.translations_dir
+                "output_dir": self.translations_dir,
+                "stages": self.stage_timer.breakdown()
             }
+        finally:
+            if self.bundle is not None:
+                self.bundle.close()
     
     def _process_cache_items_threading(self, cache_items: List[CacheItem], progress_callback: Optional[Callable[[int, int, str], None]] = None) -> Dict[str, Any]:
-        """使用多线程处理缓存项目"""
+        """使用多线程处理缓存项目，解析、格式化和写入都在工作线程中完成"""
+        writer = TranslationBatchWriter(self.translation_processor, self._record_translation_result)
+        pretty_print = self.pretty_print
+        keep_entries = self.bundle is not None
+        
+        def handle_translation(dump_name: str, content: bytes, content_hash: str):
+            try:
+                with self.stage_timer.span("analyze"):
+                    analysis = analyze_translation(content, pretty_print, keep_entries, content_hash)
+            except Exception as e:
+                self._record_translation_error(f"处理翻译文件时出错: {e}")
+                return
+            writer.add(dump_name, analysis)
+        
+        processed_count = self._dispatch_cache_items(cache_items, self.num_threads, handle_translation, progress_callback)
+        
+        if not self.is_cancelled():
+            writer.flush()
+        
+        return {'processed': processed_count}
+    
+    def _process_cache_items_multiprocessing(self, cache_items: List[CacheItem], progress_callback: Optional[Callable[[int, int, str], None]] = None) -> Dict[str, Any]:
+        """
+        使用多进程处理缓存项目
+        
+        工作线程读取缓存并识别翻译文件，JSON解析和格式化提交到进程池执行，
+        结果由写入线程按输出目录分批保存。同时在途的任务数有上限，避免缓存
+        读取速度远快于解析时占用大量内存。
+        """
+        if not cache_items:
+            return {'processed': 0}
+        
+        writer = TranslationBatchWriter(self.translation_processor, self._record_translation_result)
+        pretty_print = self.pretty_print
+        keep_entries = self.bundle is not None
+        result_queue = queue.Queue()
+        in_flight = threading.BoundedSemaphore(self.num_processes * 8)
+        pool = multiprocessing.Pool(processes=self.num_processes)
+        
+        def handle_translation(dump_name: str, content: bytes, content_hash: str):
+            while not in_flight.acquire(timeout=0.5):
+                if self.is_cancelled():
+                    return
+            
+            def on_done(result):
+                in_flight.release()
+                _, analysis, seconds = result
+                # 解析在工作进程中执行，耗时由工作进程测量
+                self.stage_timer.add("analyze", seconds)
+                if 'error' not in analysis and analysis['data'] is None:
+                    analysis['data'] = content
+                result_queue.put((dump_name, analysis))
+            
+            def on_error(error):
+                in_flight.release()
+                result_queue.put((dump_name, {'error': str(error)}))
+            
+            pool.apply_async(_analyze_translation_worker, (dump_name, content, pretty_print, keep_entries, content_hash),
+                             callback=on_done, error_callback=on_error)
+        
+        def write_results():
+            while True:
+                item = result_queue.get()
+                if item is None:
+                    break
+                dump_name, analysis = item
+                if 'error' in analysis:
+                    self._record_translation_error(f"处理翻译文件时出错: {analysis['error']}")
+                    continue
+                try:
+                    writer.add(dump_name, analysis)
+                except Exception as e:
+                    self._record_translation_error(f"保存翻译文件时出错: {e}")
+        
+        writer_thread = threading.Thread(target=write_results, name="TranslationWriter", daemon=True)
+        writer_thread.start()
+        
+        completed = False
+        try:
+            # 读取缓存是I/O密集型，读取线程数可以多于进程数
+            processed_count = self._dispatch_cache_items(cache_items, min(32, self.num_processes * 2),
+                                                         handle_translation, progress_callback)
+            completed = not self.is_cancelled()
+        finally:
+            if completed:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
+            result_queue.put(None)
+            writer_thread.join()
+        
+        if not self.is_cancelled():
+            writer.flush()
+        
+        return {'processed': processed_count}
+    
+    def _dispatch_cache_items(self, cache_items: List[CacheItem], num_threads: int,
+                              handle_translation: Callable[[str, bytes, str], None],
+                              progress_callback: Optional[Callable[[int, int, str], None]] = None) -> int:
+        """
+        用工作线程读取缓存项目并识别翻译文件
+        
+        Args:
+            cache_items: 缓存项目列表
+            num_threads: 工作线程数
+            handle_translation: 处理翻译文件的函数(转储名称, 内容, 内容哈希)
+            progress_callback: 进度回调函数
+            
+        Returns:
+            int: 处理的缓存项目数
+        """
         total_items = len(cache_items)
         processed_count = 0
         
@@ -616,11 +977,12 @@ class RobloxTranslationExtractor:
                         break
                     
                     if self.is_cancelled():
+                        # 取消后继续取出剩余项目，否则item_queue.join()会一直等待
                         item_queue.task_done()
-                        break
+                        continue
                     
                     # 处理单个项目
-                    self._process_single_cache_item(cache_item)
+                    self._process_single_cache_item(cache_item, handle_translation)
                     
                     with self._lock:
                         processed_count += 1
@@ -642,7 +1004,7 @@ class RobloxTranslationExtractor:
         
         # 启动工作线程
         threads = []
-        for _ in range(self.num_threads):
+        for _ in range(max(1, num_threads)):
             thread = threading.Thread(target=worker)
             thread.start()
             threads.append(thread)
@@ -657,125 +1019,66 @@ class RobloxTranslationExtractor:
         for thread in threads:
             thread.join()
         
-        return {'processed': processed_count}
-    
-    def _process_cache_items_multiprocessing(self, cache_items: List[CacheItem], progress_callback: Optional[Callable[[int, int, str], None]] = None) -> Dict[str, Any]:
-        """使用多进程处理缓存项目"""
-        if not cache_items:
-            return {'processed': 0}
-        
-        # 创建配置对象
-        config = TranslationProcessingConfig(
-            translations_dir=self.translations_dir,
-            classification_method=self.classification_method,
-            block_avatar_images=self.block_avatar_images,
-            history_file=self.download_history.history_file if self.download_history else None
-        )
-        
-        # 创建多进程管理器
-        mp_manager = MultiprocessingManager(
-            worker_function=_process_cache_item_worker,
-            num_processes=self.num_processes,
-            config=config
-        )
-        
-        processed_count = 0
-        all_processed_hashes = []
-        
-        try:
-            # 处理任务
-            for i, result in enumerate(mp_manager.process_tasks(cache_items)):
-                if self.is_cancelled():
-                    break
-                
-                processed_count += 1
-                
-                # 更新统计
-                if result.get('success'):
-                    translation_processed = result.get('translation_processed', 0)
-                    translation_saved = result.get('translation_saved', 0)
-                    
-                    if translation_processed > 0:
-                        self.stats.increment('translation_found', translation_processed)
-                        
-                        if translation_saved > 0:
-                            self.stats.increment('translation_saved', translation_saved)
-                        else:
-                            # 发现了翻译文件但没有保存（已处理过）
-                            self.stats.increment('already_processed', translation_processed)
-                    
-                    # 收集处理过的哈希
-                    processed_hashes = result.get('processed_hashes', [])
-                    all_processed_hashes.extend(processed_hashes)
-                
-                # 处理错误
-                errors = result.get('errors', [])
-                if errors:
-                    self.stats.increment('processing_errors', len(errors))
-                    for error in errors:
-                        logger.warning(f"多进程处理错误: {error}")
-                
-                # 更新进度
-                if progress_callback:
-                    progress_callback(processed_count, len(cache_items), f"处理翻译文件 {processed_count}/{len(cache_items)}")
-        
-        finally:
-            mp_manager.cleanup()
-        
-        # 批量添加处理过的哈希到历史记录
-        if all_processed_hashes and self.download_history:
-            logger.debug(f"批量添加 {len(all_processed_hashes)} 个翻译文件哈希到历史记录")
-            for file_hash in all_processed_hashes:
-                self.download_history.add_hash(file_hash, 'translation')
-        
-        return {'processed': processed_count}
+        return processed_count
     
-    def _process_single_cache_item(self, cache_item: CacheItem):
-        """处理单个缓存项目"""
+    def _process_single_cache_item(self, cache_item: CacheItem, handle_translation: Callable[[str, bytes, str], None]):
+        """处理单个缓存项目，识别出的未处理过的翻译文件交给handle_translation处理"""
         try:
             # 解析缓存内容
-            if cache_item.data:
-                # 直接从数据库获取的内容
-                parsed_cache = self.rbxh_parser.parse_cache_data(cache_item.data)
-            else:
-                # 从文件读取的内容
-                parsed_cache = self.rbxh_parser.parse_cache_file(cache_item.path)
+            with self.stage_timer.span("parse"):
+                if cache_item.data:
+                    # 直接从数据库获取的内容
+                    parsed_cache = self.rbxh_parser.parse_cache_data(cache_item.data)
+                else:
+                    # 从文件读取的内容
+                    parsed_cache = self.rbxh_parser.parse_cache_file(cache_item.path)
             
             if not parsed_cache.success:
                 return
             
             # 识别内容类型
-            identified = self.content_identifier.identify_content(parsed_cache.content)
+            with self.stage_timer.span("identify"):
+                identified = self.content_identifier.identify_content(parsed_cache.content)
             
             # 只处理翻译文件
             if identified.asset_type == AssetType.Translation:
                 self.stats.increment('translation_found')
                 
-                # 处理翻译文件
-                process_result = self.translation_processor.process_translation(
-                    cache_item.hash_id, 
-                    parsed_cache.content
-                )
+                # 先检查历史记录，已处理过的文件不再解码和解析
+                with self.stage_timer.span("hash"):
+                    content_hash = hashlib.sha256(parsed_cache.content).hexdigest()
+                if self.translation_processor.is_translation_processed(cache_item.hash_id, content_hash):
+                    self.stats.increment('already_processed')
+                    return
                 
-                if process_result["success"]:
-                    if process_result["saved_count"] > 0:
-                        self.stats.increment('translation_saved', process_result["saved_count"])
-                        # 记录发现的语言和内容类型
-                        if process_result["locale"]:
-                            self.stats.add_locale(process_result["locale"])
-                        if process_result["content_type"]:
-                            self.stats.add_content_type(process_result["content_type"])
-                    else:
-                        self.stats.increment('already_processed')
-                else:
-                    self.stats.increment('processing_errors')
-                    for error in process_result.get("errors", []):
-                        logger.warning(f"翻译文件处理错误: {error}")
+                handle_translation(cache_item.hash_id, parsed_cache.content, content_hash)
         
         except Exception as e:
             self.stats.increment('processing_errors')
             logger.error(f"处理缓存项目 {cache_item.hash_id} 时出错: {e}")
     
+    def _record_translation_result(self, process_result: Dict[str, Any]):
+        """根据保存结果更新统计"""
+        if process_result["success"]:
+            if process_result["saved_count"] > 0:
+                self.stats.increment('translation_saved', process_result["saved_count"])
+                # 记录发现的语言和内容类型
+                if process_result["locale"]:
+                    self.stats.add_locale(process_result["locale"])
+                if process_result["content_type"]:
+                    self.stats.add_content_type(process_result["content_type"])
+            else:
+                self.stats.increment('already_processed')
+        else:
+            self.stats.increment('processing_errors')
+            for error in process_result.get("errors", []):
+                logger.warning(f"翻译文件处理错误: {error}")
+    
+    def _record_translation_error(self, error_msg: str):
+        """记录解析失败的翻译文件"""
+        self.stats.increment('processing_errors')
+        logger.error(error_msg)
+    
     def get_cache_info(self) -> Dict[str, Any]:
         """获取缓存信息"""
         return self.cache_scanner.get_cache_info()
@@ -8,7 +8,6 @@ Video Extractor Module - Provides functionality for extracting videos from Roblo
 import os
 import re
 import json
-import requests
 import hashlib
 import logging
 import threading
@@ -17,6 +16,7 @@ import time
 import traceback
 import multiprocessing
 import subprocess
+import contextlib
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from enum import Enum, auto
 from dataclasses import dataclass
@@ -24,9 +24,13 @@ from urllib.parse import urljoin, urlparse
 
 # 导入历史管理器
 from src.utils.history_manager import ExtractedHistory, ContentHashCache
+from src.utils.download_manager import DownloadManager, DownloadStats, get_download_manager
+from src.utils.stage_timer import StageTimer
 
 # 导入Roblox提取模块
 from .rbxh_parser import RBXHParser, ParsedCache, parse_cache_file, parse_cache_data
+from .webm_stream import WebMStreamSplicer, WebMParseError
+from .segment_checkpoint import SegmentCheckpoint
 from .content_identifier import ContentIdentifier, AssetType, IdentifiedContent, identify_content
 from .cache_scanner import RobloxCacheScanner, CacheItem, CacheType, scan_roblox_cache
 
@@ -68,7 +72,8 @@ class VideoProcessingStats:
             'already_processed': 0,
             'error_videos': 0,
             'download_failures': 0,
-            'merge_failures': 0
+            'merge_failures': 0,
+            'resumed_segments': 0
         }
     
     def increment(self, stat_name: str, count: int = 1):
@@ -93,7 +98,16 @@ class VideoProcessor:
     def __init__(self, output_dir: str, classification_method: VideoClassificationMethod = VideoClassificationMethod.RESOLUTION,
                  ffmpeg_path: str = None, max_retries: int = 3, segment_timeout: int = 30,
                  quality_preference: VideoQualityPreference = VideoQualityPreference.AUTO,
-                 timestamp_repair: bool = True):
+                 timestamp_repair: bool = True, concurrent_downloads: bool = True,
+                 max_concurrent_segments: int = 4,
+                 connection_limiter: Optional[threading.Semaphore] = None,
+                 ffmpeg_limiter: Optional[threading.Semaphore] = None,
+                 stream_limiter: Optional[threading.Semaphore] = None,
+                 single_pass_repair: bool = True, stream_merge: bool = True,
+                 resume_downloads: bool = False, auto_cleanup: bool = True,
+                 downloader: Optional[DownloadManager] = None,
+                 download_stats: Optional[DownloadStats] = None,
+                 stage_timer: Optional[StageTimer] = None):
         """
         初始化视频处理器
         
@@ -103,6 +117,21 @@ class VideoProcessor:
             ffmpeg_path: FFmpeg可执行文件路径
             max_retries: 最大重试次数
             segment_timeout: 片段下载超时时间（秒）
+            concurrent_downloads: 是否并发下载片段
+            max_concurrent_segments: 并发下载片段的最大线程数
+            connection_limiter: 多个视频共享的网络连接配额（信号量）
+            ffmpeg_limiter: 多个视频共享的FFmpeg进程配额（信号量），用于CPU密集的修复与合并
+            stream_limiter: 多个视频共享的流式合并配额（信号量）。流式合并是 -c copy 重封装，
+                            大部分时间在等待网络送入管道，因此不占用FFmpeg进程配额
+            single_pass_repair: 是否在合并时一次性修复时间戳（失败时回退到逐片段修复）
+            stream_merge: 是否把下载的片段直接通过管道送入单个FFmpeg进程合并，
+                          不经过临时目录（失败时回退到临时目录合并）
+            resume_downloads: 是否保存已完成的片段，中断后下次运行时跳过这些片段。
+                              流式合并时每个片段会额外写入磁盘一次，因此默认关闭
+            auto_cleanup: 视频合并成功后是否删除其片段检查点
+            downloader: 下载管理器，默认使用全局共享实例
+            download_stats: 下载统计（字节数、重试次数、带宽）
+            stage_timer: 阶段计时器（播放列表、片段下载、FFmpeg修复与合并）
         """
         self.output_dir = output_dir
         self.classification_method = classification_method
@@ -111,13 +140,22 @@ class VideoProcessor:
         self.segment_timeout = segment_timeout
         self.quality_preference = quality_preference
         self.timestamp_repair = timestamp_repair
-        self.session = requests.Session()
+        self.concurrent_downloads = concurrent_downloads
+        self.max_concurrent_segments = max(1, max_concurrent_segments)
+        self.connection_limiter = connection_limiter or contextlib.nullcontext()
+        self.ffmpeg_limiter = ffmpeg_limiter or contextlib.nullcontext()
+        self.stream_limiter = stream_limiter or contextlib.nullcontext()
+        self.single_pass_repair = single_pass_repair
+        self.stream_merge = stream_merge
+        self.resume_downloads = resume_downloads
+        self.auto_cleanup = auto_cleanup
+        self.checkpoint_dir = os.path.join(output_dir, "temp", "VideoSegments")
         self._cancel_check_fn = None
         
-        # 设置请求会话
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # 共享的连接池下载器，连接复用、按主机限流和退避重试由其统一处理
+        self.downloader = downloader or get_download_manager()
+        self.download_stats = download_stats or DownloadStats()
+        self.stage_timer = stage_timer or StageTimer()
         
     def _find_ffmpeg(self) -> Optional[str]:
         """查找FFmpeg可执行文件"""
@@ -229,7 +267,7 @@ class VideoProcessor:
             
             return best_stream
     
-    def _download_segment_playlist(self, stream_url: str) -> List[str]:
+    def _download_segment_playlist(self, stream_url: str) -> List[Tuple[str, Optional[float]]]:
         """
         下载片段播放列表
         
@@ -237,23 +275,30 @@ class VideoProcessor:
             stream_url: 流URL
             
         Returns:
-            List[str]: 片段文件名列表
+            List[Tuple[str, Optional[float]]]: (片段文件名, #EXTINF时长) 列表
         """
         try:
-            response = self.session.get(stream_url, timeout=self.segment_timeout)
-            response.raise_for_status()
+            data = self.downloader.fetch(stream_url, **self._download_options())
+            if data is None:
+                raise IOError(f"无法下载 {stream_url}")
+            content = data.decode('utf-8', errors='ignore')
             
-            content = response.text
             segments = []
+            pending_duration = None
             next_is_segment = False
             
             for line in content.split('\n'):
                 line = line.strip()
                 if next_is_segment and line and not line.startswith('#'):
-                    segments.append(line)
+                    segments.append((line, pending_duration))
                     next_is_segment = False
                 elif line.startswith('#EXTINF:'):
                     next_is_segment = True
+                    # 解析片段时长，如 "#EXTINF:2.002,"
+                    try:
+                        pending_duration = float(line[len('#EXTINF:'):].split(',', 1)[0])
+                    except ValueError:
+                        pending_duration = None
             
             return segments
             
@@ -261,9 +306,19 @@ class VideoProcessor:
             logger.error(f"下载片段播放列表失败: {e}")
             return []
     
+    def _download_options(self) -> Dict[str, Any]:
+        """下载管理器的调用参数：取消检查、共享连接配额、重试次数、超时和统计"""
+        return {
+            'cancel_check': self.is_cancelled,
+            'limiter': self.connection_limiter,
+            'max_retries': self.max_retries,
+            'timeout': self.segment_timeout,
+            'stats': self.download_stats,
+        }
+    
     def _download_video_segment(self, segment_url: str, output_path: str) -> bool:
         """
-        下载视频片段
+        流式下载视频片段到文件
         
         Args:
             segment_url: 片段URL
@@ -272,29 +327,23 @@ class VideoProcessor:
         Returns:
             bool: 是否下载成功
         """
-        for attempt in range(self.max_retries):
-            if self.is_cancelled():
-                return False
-                
-            try:
-                response = self.session.get(segment_url, timeout=self.segment_timeout, stream=True)
-                response.raise_for_status()
-                
-                with open(output_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if self.is_cancelled():
-                            return False
-                        if chunk:
-                            f.write(chunk)
-                
-                return True
-                
-            except Exception as e:
-                logger.warning(f"片段下载失败 (尝试 {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(1)  # 重试前等待
+        with self.stage_timer.span("download"):
+            return self.downloader.download_to_file(segment_url, output_path, **self._download_options())
+    
+    def _download_segment_bytes(self, segment_url: str) -> Optional[bytes]:
+        """
+        下载视频片段到内存
         
-        return False
+        Args:
+            segment_url: 片段URL
+            
+        Returns:
+            Optional[bytes]: 片段数据，失败时返回None
+        """
+        with self.stage_timer.span("download") as counters:
+            data = self.downloader.fetch(segment_url, **self._download_options())
+            counters["bytes"] = len(data or b"")
+        return data
     
     def _repair_video_segment(self, input_path: str, output_path: str) -> bool:
         """
@@ -321,7 +370,8 @@ class VideoProcessor:
                 '-y'  # 覆盖输出文件
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            with self.ffmpeg_limiter, self.stage_timer.span("repair"):
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
             
             if result.returncode == 0 and os.path.exists(output_path):
                 return True
@@ -336,13 +386,19 @@ class VideoProcessor:
             logger.error(f"FFmpeg修复出错: {e}")
             return False
     
-    def _merge_video_segments(self, segment_list_file: str, output_path: str) -> bool:
+    def _merge_video_segments(self, segment_list_file: str, output_path: str,
+                              repair_timestamps: bool = False) -> bool:
         """
         合并视频片段
         
+        concat分离器会把每个输入文件的起始时间对齐到前面片段的累计时长
+        （片段列表中带有播放列表的duration指令时以其为准），因此只需在合并后的
+        流上应用一次setts过滤器，即可完成原本需要逐片段启动FFmpeg的时间戳修复。
+        
         Args:
             segment_list_file: 片段列表文件路径
             output_path: 输出视频路径
+            repair_timestamps: 是否在合并时修复时间戳
             
         Returns:
             bool: 是否合并成功
@@ -357,12 +413,14 @@ class VideoProcessor:
                 '-f', 'concat',
                 '-safe', '0',
                 '-i', segment_list_file,
-                '-c', 'copy',
-                output_path,
-                '-y'
+                '-c', 'copy'
             ]
+            if repair_timestamps:
+                cmd.extend(['-bsf:v', 'setts=ts=PTS-STARTPTS'])
+            cmd.extend([output_path, '-y'])
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            with self.ffmpeg_limiter, self.stage_timer.span("merge"):
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
             
             if result.returncode == 0 and os.path.exists(output_path):
                 return True
@@ -377,6 +435,337 @@ class VideoProcessor:
             logger.error(f"视频合并出错: {e}")
             return False
     
+    def _fetch_segment(self, segment_url: str, segment_path: str, repaired_path: str,
+                       stats: VideoProcessingStats,
+                       checkpoint: Optional[SegmentCheckpoint] = None) -> Optional[str]:
+        """
+        下载单个片段，关闭单次合并修复时逐片段修复时间戳
+        
+        Args:
+            segment_url: 片段URL
+            segment_path: 下载路径
+            repaired_path: 逐片段修复时的输出路径
+            stats: 统计对象
+            checkpoint: 片段检查点，已完成的片段不再下载
+            
+        Returns:
+            Optional[str]: 用于合并的片段文件名，失败时返回None
+        """
+        segment = os.path.basename(segment_path)
+        
+        if checkpoint is not None and checkpoint.is_complete(segment):
+            # 上次运行已完整下载
+            stats.increment('resumed_segments')
+        else:
+            # 下载片段
+            if not self._download_video_segment(segment_url, segment_path):
+                if not self.is_cancelled():
+                    logger.error(f"片段下载失败: {segment}")
+                    stats.increment('download_failures')
+                return None
+            stats.increment('downloaded_segments')
+            if checkpoint is not None:
+                checkpoint.commit(segment, os.path.getsize(segment_path))
+        
+        # 单次合并修复模式下，时间戳在合并时统一修复
+        if not self._repair_per_segment():
+            return segment
+        
+        # 修复片段时间戳
+        logger.info(f"修复视频片段: {segment}")
+        if not self._repair_video_segment(segment_path, repaired_path):
+            logger.error(f"片段修复失败: {segment}")
+            stats.increment('error_videos')
+            return None
+        # 删除原始片段（保存检查点时保留，供下次运行续传）
+        if checkpoint is None:
+            try:
+                os.remove(segment_path)
+            except:
+                pass
+        return os.path.basename(repaired_path)
+    
+    def _repair_per_segment(self) -> bool:
+        """是否需要逐片段启动FFmpeg修复时间戳"""
+        return bool(self.timestamp_repair and self.ffmpeg_path and not self.single_pass_repair)
+    
+    def _repair_segments_individually(self, segment_files: List[str], temp_dir: str) -> Optional[List[str]]:
+        """
+        逐片段修复时间戳（单次合并修复失败时的回退方案）
+        
+        Args:
+            segment_files: 片段文件名列表
+            temp_dir: 临时目录
+            
+        Returns:
+            Optional[List[str]]: 修复后的片段文件名列表，失败时返回None
+        """
+        repaired_files = []
+        for segment in segment_files:
+            if self.is_cancelled():
+                return None
+            repaired = segment.replace('.webm', '-repaired.webm')
+            if repaired == segment:
+                repaired = f"repaired-{segment}"
+            logger.info(f"修复视频片段: {segment}")
+            if not self._repair_video_segment(os.path.join(temp_dir, segment), os.path.join(temp_dir, repaired)):
+                logger.error(f"片段修复失败: {segment}")
+                return None
+            repaired_files.append(repaired)
+        return repaired_files
+    
+    def _write_segment_list(self, segment_files: List[str], temp_dir: str,
+                            durations: Optional[List[Optional[float]]] = None) -> str:
+        """
+        写入FFmpeg concat片段列表文件并返回其路径
+        
+        Args:
+            segment_files: 片段文件名列表
+            temp_dir: 临时目录
+            durations: 与片段一一对应的播放列表时长；全部已知时写入duration指令，
+                       让concat分离器按播放列表时长而不是容器中的时长排列片段
+        """
+        use_durations = durations is not None and all(duration for duration in durations)
+        lines = []
+        for index, segment in enumerate(segment_files):
+            lines.append(f"file '{segment}'")
+            if use_durations:
+                lines.append(f"duration {durations[index]}")
+        
+        segment_list_file = os.path.join(temp_dir, "videos.txt")
+        with open(segment_list_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+        return segment_list_file
+    
+    def _fetch_segments(self, segments: List[str], segment_base_url: str, temp_dir: str,
+                        stats: VideoProcessingStats,
+                        checkpoint: Optional[SegmentCheckpoint] = None) -> Optional[List[str]]:
+        """
+        下载（并修复）所有片段，启用并发下载时使用有界线程池
+        
+        逐片段修复模式下，每个线程下载完一个片段后立即修复它，因此后续片段的
+        下载与前面片段的修复是重叠进行的。结果按播放列表顺序返回。
+        
+        Args:
+            segments: 片段文件名列表
+            segment_base_url: 片段基础URL
+            temp_dir: 临时目录
+            stats: 统计对象
+            checkpoint: 片段检查点
+            
+        Returns:
+            Optional[List[str]]: 按顺序排列的片段文件名，任一片段失败或取消时返回None
+        """
+        total = len(segments)
+        results: List[Optional[str]] = [None] * total
+        failed = threading.Event()
+        
+        work_queue = queue.Queue()
+        for index, segment in enumerate(segments):
+            work_queue.put((index, segment))
+        
+        def worker():
+            while not failed.is_set() and not self.is_cancelled():
+                try:
+                    index, segment = work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                
+                logger.info(f"下载片段 {index + 1}/{total}: {segment}")
+                segment_url = urljoin(segment_base_url, segment)
+                segment_path = os.path.join(temp_dir, segment)
+                repaired_path = os.path.join(temp_dir, segment.replace('.webm', '-repaired.webm'))
+                try:
+                    entry = self._fetch_segment(segment_url, segment_path, repaired_path, stats, checkpoint)
+                except Exception as e:
+                    logger.error(f"处理片段时出错 {segment}: {e}")
+                    stats.increment('error_videos')
+                    entry = None
+                
+                if entry is None:
+                    # 任一片段失败即停止其余下载
+                    failed.set()
+                    break
+                results[index] = entry
+        
+        thread_count = min(self.max_concurrent_segments, total) if self.concurrent_downloads else 1
+        if thread_count <= 1:
+            worker()
+        else:
+            threads = []
+            for _ in range(thread_count):
+                thread = threading.Thread(target=worker)
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
+            for thread in threads:
+                thread.join()
+        
+        if failed.is_set() or self.is_cancelled():
+            return None
+        return results
+    
+    def _can_stream_merge(self, durations: List[Optional[float]]) -> bool:
+        """是否可以使用流式合并（需要FFmpeg和完整的#EXTINF时长）"""
+        return bool(self.stream_merge and self.ffmpeg_path and durations and all(durations))
+    
+    def _stream_merge_segments(self, segments: List[str], durations: List[float], segment_base_url: str,
+                               output_path: str, stats: VideoProcessingStats,
+                               checkpoint: Optional[SegmentCheckpoint] = None) -> Optional[bool]:
+        """
+        流式合并：并发下载片段到内存，按顺序拼接后通过管道送入单个FFmpeg进程
+        
+        未启用检查点时，片段数据只在最终输出时写入磁盘一次；启用时每个新下载的
+        片段额外保存一份到检查点，已完成的片段直接从检查点读取。下载线程最多
+        领先写入位置2倍并发数个片段，限制内存占用。
+        
+        Args:
+            segments: 片段文件名列表
+            durations: 片段的#EXTINF时长列表
+            segment_base_url: 片段基础URL
+            output_path: 输出视频路径
+            stats: 统计对象
+            checkpoint: 片段检查点
+            
+        Returns:
+            Optional[bool]: 成功返回True；下载失败或取消返回False；
+                            片段无法流式拼接或FFmpeg出错返回None（应回退到临时目录合并）
+        """
+        total = len(segments)
+        results: Dict[int, bytes] = {}
+        failed = threading.Event()
+        stopped = threading.Event()
+        condition = threading.Condition()
+        thread_count = min(self.max_concurrent_segments, total) if self.concurrent_downloads else 1
+        window = threading.BoundedSemaphore(thread_count * 2)
+        
+        work_queue = queue.Queue()
+        for index, segment in enumerate(segments):
+            work_queue.put((index, segment))
+        
+        def worker():
+            while not stopped.is_set() and not self.is_cancelled():
+                # 按顺序领取片段，领先写入位置太多时等待
+                while not window.acquire(timeout=0.1):
+                    if stopped.is_set() or self.is_cancelled():
+                        return
+                try:
+                    index, segment = work_queue.get_nowait()
+                except queue.Empty:
+                    window.release()
+                    break
+                
+                data = checkpoint.load(segment) if checkpoint is not None else None
+                resumed = data is not None
+                if not resumed:
+                    logger.info(f"下载片段 {index + 1}/{total}: {segment}")
+                    try:
+                        data = self._download_segment_bytes(urljoin(segment_base_url, segment))
+                        if data is not None and checkpoint is not None:
+                            checkpoint.save(segment, data)
+                    except Exception as e:
+                        logger.error(f"处理片段时出错 {segment}: {e}")
+                        data = None
+                
+                with condition:
+                    if data is None:
+                        if not self.is_cancelled():
+                            logger.error(f"片段下载失败: {segment}")
+                            stats.increment('download_failures')
+                        failed.set()
+                    else:
+                        stats.increment('resumed_segments' if resumed else 'downloaded_segments')
+                        results[index] = data
+                    condition.notify_all()
+                if data is None:
+                    break
+        
+        threads = []
+        for _ in range(thread_count):
+            thread = threading.Thread(target=worker)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        
+        splicer = WebMStreamSplicer()
+        cmd = [
+            self.ffmpeg_path,
+            '-hide_banner', '-nostats', '-loglevel', 'error',
+            '-f', 'webm',
+            '-i', 'pipe:0',
+            '-c', 'copy',
+            output_path,
+            '-y'
+        ]
+        status: Optional[bool] = None
+        
+        try:
+            with self.stream_limiter:
+                process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.PIPE)
+                # 在后台读取错误输出，避免管道写满阻塞FFmpeg
+                stderr_chunks = []
+                stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()))
+                stderr_thread.daemon = True
+                stderr_thread.start()
+                
+                start_seconds = 0.0
+                try:
+                    for index in range(total):
+                        with condition:
+                            while index not in results and not failed.is_set() and not self.is_cancelled():
+                                condition.wait(0.1)
+                            data = results.pop(index, None)
+                        if data is None:
+                            status = False
+                            break
+                        window.release()
+                        
+                        try:
+                            process.stdin.write(splicer.splice(data, start_seconds))
+                        except WebMParseError as e:
+                            logger.warning(f"片段无法流式拼接 {segments[index]}: {e}")
+                            break
+                        except (BrokenPipeError, OSError) as e:
+                            logger.error(f"写入FFmpeg管道失败: {e}")
+                            break
+                        start_seconds += durations[index]
+                    else:
+                        status = True
+                finally:
+                    try:
+                        process.stdin.close()
+                    except OSError:
+                        pass
+                    if status is not True:
+                        process.kill()
+                    process.wait()
+                    stderr_thread.join(5)
+                
+                if status is True and (process.returncode != 0 or not os.path.exists(output_path)):
+                    stderr = b''.join(chunk for chunk in stderr_chunks if chunk).decode('utf-8', 'replace')
+                    logger.error(f"视频流式合并失败: {stderr}")
+                    status = None
+        except Exception as e:
+            logger.error(f"视频流式合并出错: {e}")
+            status = None
+        finally:
+            stopped.set()
+            for thread in threads:
+                thread.join()
+        
+        if self.is_cancelled():
+            return False
+        return status
+    
+    def _remove_partial_output(self, output_path: str):
+        """删除不完整的输出，避免下次运行时被当作已存在的视频跳过"""
+        if os.path.exists(output_path):
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+    
     def _get_output_directory(self, resolution: str) -> str:
         """
         根据分类方法获取输出目录
@@ -446,98 +835,135 @@ class VideoProcessor:
                 return True
             
             # 下载片段播放列表
-            segments = self._download_segment_playlist(stream_url)
+            with self.stage_timer.span("playlist"):
+                playlist_segments = self._download_segment_playlist(stream_url)
+            segments = [segment for segment, _ in playlist_segments]
+            durations = [duration for _, duration in playlist_segments]
             if not segments:
                 logger.error("无法获取视频片段列表")
                 stats.increment('download_failures')
                 return False
             
-            # 创建临时目录
+            segment_base_url = stream_url.rsplit('/', 1)[0] + '/'
+            
+            # 片段检查点，按播放列表哈希保存已完成的片段
+            checkpoint = None
+            if self.resume_downloads:
+                checkpoint = SegmentCheckpoint(
+                    self.checkpoint_dir, SegmentCheckpoint.make_key(video_hash, stream_url, playlist_segments)
+                )
+                if checkpoint.completed_count():
+                    logger.info(f"从检查点续传: {video_hash}, 已完成 {checkpoint.completed_count()}/{len(segments)} 个片段")
+            
+            success = False
+            try:
+                success = self._download_and_merge(segments, durations, segment_base_url, final_video_path,
+                                                   video_hash, stats, checkpoint)
+                return success
+            finally:
+                # 检查点清理策略：成功且启用自动清理时删除；失败或取消时保留以便续传
+                if checkpoint is not None and success and self.auto_cleanup:
+                    checkpoint.remove()
+            
+        except Exception as e:
+            logger.error(f"处理M3U8内容时出错: {e}")
+            stats.increment('error_videos')
+            return False
+    
+    def _download_and_merge(self, segments: List[str], durations: List[Optional[float]], segment_base_url: str,
+                            final_video_path: str, video_hash: str, stats: VideoProcessingStats,
+                            checkpoint: Optional[SegmentCheckpoint] = None) -> bool:
+        """
+        下载所有片段并合并为最终视频
+        
+        Args:
+            segments: 片段文件名列表
+            durations: 片段的#EXTINF时长列表
+            segment_base_url: 片段基础URL
+            final_video_path: 输出视频路径
+            video_hash: 视频哈希
+            stats: 统计对象
+            checkpoint: 片段检查点，为None时使用临时目录并在结束后删除
+            
+        Returns:
+            bool: 是否处理成功
+        """
+        # 流式合并：片段直接送入FFmpeg，不经过临时目录
+        if self._can_stream_merge(durations):
+            logger.info(f"流式合并视频片段: {video_hash}")
+            # 流式合并时下载与FFmpeg重叠进行，整体计为一个阶段
+            with self.stage_timer.span("stream_merge", segments=len(segments)):
+                streamed = self._stream_merge_segments(segments, durations, segment_base_url,
+                                                       final_video_path, stats, checkpoint)
+            if streamed:
+                stats.increment('merged_videos')
+                stats.increment('processed_videos')
+                logger.info(f"视频处理成功: {final_video_path}")
+                return True
+            
+            self._remove_partial_output(final_video_path)
+            if streamed is False:
+                return False
+            logger.warning(f"流式合并失败，回退到临时目录合并: {video_hash}")
+        
+        # 创建临时目录，启用检查点时直接使用检查点目录
+        if checkpoint is not None:
+            temp_dir = checkpoint.directory
+        else:
             temp_dir = os.path.join(self.output_dir, "temp", f"VideoFrame-{video_hash}")
             os.makedirs(temp_dir, exist_ok=True)
+        
+        try:
+            # 下载和修复所有片段（保持播放列表顺序）
+            segment_files = self._fetch_segments(segments, segment_base_url, temp_dir, stats, checkpoint)
+            if segment_files is None:
+                return False
             
-            try:
-                # 下载和修复所有片段
-                segment_base_url = stream_url.rsplit('/', 1)[0] + '/'
-                repaired_segments = []
-                
-                for i, segment in enumerate(segments):
-                    if self.is_cancelled():
-                        return False
-                    
-                    segment_url = urljoin(segment_base_url, segment)
-                    segment_path = os.path.join(temp_dir, segment)
-                    repaired_path = os.path.join(temp_dir, segment.replace('.webm', '-repaired.webm'))
-                    
-                    logger.info(f"下载片段 {i+1}/{len(segments)}: {segment}")
-                    
-                    # 下载片段
-                    if self._download_video_segment(segment_url, segment_path):
-                        stats.increment('downloaded_segments')
-                        
-                        # 根据设置决定是否修复片段
-                        if self.timestamp_repair and self.ffmpeg_path:
-                            # 修复片段时间戳
-                            logger.info(f"修复视频片段: {segment}")
-                            if self._repair_video_segment(segment_path, repaired_path):
-                                repaired_segments.append(f"file '{os.path.basename(repaired_path)}'")
-                                # 删除原始片段
-                                try:
-                                    os.remove(segment_path)
-                                except:
-                                    pass
-                            else:
-                                logger.error(f"片段修复失败: {segment}")
-                                stats.increment('error_videos')
-                                return False
-                        else:
-                            # 不修复，直接使用原始片段
-                            repaired_segments.append(f"file '{os.path.basename(segment_path)}'")
-                            # 重命名为repaired_path以保持一致性
-                            try:
-                                os.rename(segment_path, repaired_path)
-                            except:
-                                pass
-                    else:
-                        logger.error(f"片段下载失败: {segment}")
-                        stats.increment('download_failures')
-                        return False
-                
-                if self.is_cancelled():
-                    return False
-                
-                # 创建片段列表文件
-                segment_list_file = os.path.join(temp_dir, "videos.txt")
-                with open(segment_list_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(repaired_segments))
+            if self.is_cancelled():
+                return False
+            
+            # 创建片段列表文件
+            repair_in_merge = bool(self.timestamp_repair and self.ffmpeg_path and self.single_pass_repair)
+            segment_list_file = self._write_segment_list(
+                segment_files, temp_dir, durations if repair_in_merge else None
+            )
+            
+            # 合并视频片段，单次合并修复模式下在同一个FFmpeg进程中修复时间戳
+            logger.info(f"合并视频片段: {video_hash}")
+            merged = self._merge_video_segments(segment_list_file, final_video_path, repair_in_merge)
+            
+            if not merged and repair_in_merge and not self.is_cancelled():
+                # 回退到逐片段修复后再合并
+                logger.warning(f"单次合并修复失败，回退到逐片段修复: {video_hash}")
+                fallback_segments = self._repair_segments_individually(segment_files, temp_dir)
+                if fallback_segments is not None:
+                    segment_list_file = self._write_segment_list(fallback_segments, temp_dir)
+                    merged = self._merge_video_segments(segment_list_file, final_video_path)
+            
+            if merged:
+                stats.increment('merged_videos')
+                stats.increment('processed_videos')
+                logger.info(f"视频处理成功: {final_video_path}")
+                return True
+            else:
+                stats.increment('merge_failures')
+                self._remove_partial_output(final_video_path)
+                return False
                 
-                # 合并视频片段
-                logger.info(f"合并视频片段: {video_hash}")
-                if self._merge_video_segments(segment_list_file, final_video_path):
-                    stats.increment('merged_videos')
-                    stats.increment('processed_videos')
-                    logger.info(f"视频处理成功: {final_video_path}")
-                    return True
-                else:
-                    stats.increment('merge_failures')
-                    return False
-                    
-            finally:
-                # 清理临时目录
+        finally:
+            # 清理临时目录（检查点目录由调用方按清理策略处理）
+            if checkpoint is None:
                 try:
                     import shutil
                     shutil.rmtree(temp_dir)
                 except Exception as e:
                     logger.warning(f"清理临时目录失败: {e}")
-            
-        except Exception as e:
-            logger.error(f"处理M3U8内容时出错: {e}")
-            stats.increment('error_videos')
-            return False
 
 class RobloxVideoExtractor:
     """从Roblox缓存中提取视频的主类"""
     
+    CHECKPOINT_MAX_AGE = 7 * 24 * 3600  # 未完成片段检查点的最长保留时间（秒）
+    
     def __init__(self, base_dir: str, num_threads: int = 1,
                  download_history: Optional[ExtractedHistory] = None,
                  classification_method: VideoClassificationMethod = VideoClassificationMethod.RESOLUTION,
@@ -547,7 +973,10 @@ class RobloxVideoExtractor:
                  conservative_multiprocessing: bool = True,
                  ffmpeg_path: str = None,
                  quality_preference: VideoQualityPreference = VideoQualityPreference.AUTO,
-                 timestamp_repair: bool = True):
+                 timestamp_repair: bool = True,
+                 concurrent_downloads: bool = True,
+                 auto_cleanup: bool = True,
+                 resume_downloads: bool = False):
         """初始化视频提取器"""
         self.base_dir = os.path.abspath(base_dir)
         self.use_multiprocessing = use_multiprocessing
@@ -570,6 +999,9 @@ class RobloxVideoExtractor:
         self.ffmpeg_path = ffmpeg_path
         self.quality_preference = quality_preference
         self.timestamp_repair = timestamp_repair
+        self.concurrent_downloads = concurrent_downloads
+        self.auto_cleanup = auto_cleanup
+        self.resume_downloads = resume_downloads
         
         # 输出目录
         if custom_output_dir and os.path.isabs(custom_output_dir):
@@ -604,7 +1036,10 @@ class RobloxVideoExtractor:
         
         self.content_identifier = ContentIdentifier(block_avatar_images=True)
         self.stats = VideoProcessingStats()
+        self.download_stats = DownloadStats()
         self.hash_cache = ContentHashCache()
+        # 各阶段耗时（每次extract_videos重新统计）
+        self.stage_timer = StageTimer()
         
         # 创建输出目录
         os.makedirs(self.output_dir, exist_ok=True)
@@ -634,11 +1069,13 @@ class RobloxVideoExtractor:
             Dict[str, Any]: 提取结果统计
         """
         start_time = time.time()
+        self.stage_timer.reset()
         
         try:
             # 扫描缓存
             logger.info("Starting video cache scan...")
-            cache_items = self.cache_scanner.scan_cache()
+            with self.stage_timer.span("scan"):
+                cache_items = self.cache_scanner.scan_cache()
             
             if not cache_items:
                 logger.info("No cache items found")
@@ -654,14 +1091,16 @@ class RobloxVideoExtractor:
                     
                 try:
                     # 解析缓存内容
-                    if item.cache_type == CacheType.DATABASE:
-                        parsed = parse_cache_data(item.data)
-                    else:
-                        parsed = parse_cache_file(item.path)
+                    with self.stage_timer.span("parse"):
+                        if item.cache_type == CacheType.DATABASE:
+                            parsed = parse_cache_data(item.data)
+                        else:
+                            parsed = parse_cache_file(item.path)
                     
                     if parsed and parsed.success:
                         # 识别内容类型
-                        identified = self.content_identifier.identify_content(parsed.content)
+                        with self.stage_timer.span("identify"):
+                            identified = self.content_identifier.identify_content(parsed.content)
                         
                         # 检查是否为M3U8播放列表
                         if identified.asset_type == AssetType.EXTM3U:
@@ -679,47 +1118,74 @@ class RobloxVideoExtractor:
                 logger.info("No video content found")
                 return self._create_result_dict(start_time)
             
-            # 处理视频
+            # 处理视频：多个播放列表并行处理，共享网络连接配额和FFmpeg进程配额
+            connection_budget = self._get_connection_budget()
+            ffmpeg_budget = self._get_ffmpeg_budget()
+            stream_budget = self._get_video_concurrency()
             processor = VideoProcessor(
                 output_dir=self.output_dir,
                 classification_method=self.classification_method,
                 ffmpeg_path=self.ffmpeg_path,
                 quality_preference=self.quality_preference,
-                timestamp_repair=self.timestamp_repair
+                timestamp_repair=self.timestamp_repair,
+                concurrent_downloads=self.concurrent_downloads,
+                max_concurrent_segments=self._get_segment_concurrency(),
+                connection_limiter=threading.BoundedSemaphore(connection_budget),
+                ffmpeg_limiter=threading.BoundedSemaphore(ffmpeg_budget),
+                stream_limiter=threading.BoundedSemaphore(stream_budget),
+                resume_downloads=self.resume_downloads,
+                auto_cleanup=self.auto_cleanup,
+                download_stats=self.download_stats,
+                stage_timer=self.stage_timer
             )
+            
+            # 自动清理时删除长时间未完成的片段检查点
+            if self.auto_cleanup:
+                pruned = SegmentCheckpoint.prune(processor.checkpoint_dir, self.CHECKPOINT_MAX_AGE)
+                if pruned:
+                    logger.info(f"已清理 {pruned} 个过期的片段检查点")
             processor.set_cancel_check_function(self.is_cancelled)
             
             total_videos = len(video_items)
+            video_workers = min(self._get_video_concurrency(), total_videos)
+            logger.info(f"并行处理 {video_workers} 个视频 (连接配额: {connection_budget}, FFmpeg配额: {ffmpeg_budget}, 流式合并配额: {stream_budget})")
+            
             processed_count = 0
+            progress_lock = threading.Lock()
             
-            for i, (cache_item, content_bytes, content_str) in enumerate(video_items):
-                if self.is_cancelled():
-                    break
-                
-                try:
-                    # 生成视频哈希
-                    video_hash = hashlib.md5(content_bytes).hexdigest()
-                    
-                    # 检查是否已处理
-                    if self.download_history and self.download_history.is_processed(video_hash):
-                        self.stats.increment('already_processed')
-                        continue
-                    
-                    # 处理视频
-                    if processor.process_m3u8_content(content_str, video_hash, self.stats):
-                        # 添加到历史记录
-                        if self.download_history:
-                            self.download_history.add_hash(video_hash, 'video')
+            work_queue = queue.Queue()
+            for video_item in video_items:
+                work_queue.put(video_item)
+            
+            def worker():
+                nonlocal processed_count
+                while not self.is_cancelled():
+                    try:
+                        cache_item, content_bytes, content_str = work_queue.get_nowait()
+                    except queue.Empty:
+                        break
                     
-                    processed_count += 1
+                    try:
+                        self._process_video_item(processor, content_bytes, content_str)
+                    except Exception as e:
+                        logger.error(f"处理视频时出错: {e}")
+                        self.stats.increment('error_videos')
                     
                     # 更新进度
-                    if progress_callback:
-                        progress_callback(processed_count, total_videos)
-                        
-                except Exception as e:
-                    logger.error(f"处理视频时出错: {e}")
-                    self.stats.increment('error_videos')
+                    with progress_lock:
+                        processed_count += 1
+                        if progress_callback:
+                            progress_callback(processed_count, total_videos)
+            
+            with self.stage_timer.span("process", videos=total_videos):
+                threads = []
+                for _ in range(video_workers):
+                    thread = threading.Thread(target=worker)
+                    thread.daemon = True
+                    thread.start()
+                    threads.append(thread)
+                for thread in threads:
+                    thread.join()
             
             return self._create_result_dict(start_time)
             
@@ -727,19 +1193,73 @@ class RobloxVideoExtractor:
             logger.error(f"视频提取过程中发生错误: {e}")
             raise
     
+    def _process_video_item(self, processor: VideoProcessor, content_bytes: bytes, content_str: str):
+        """
+        处理单个视频播放列表
+        
+        Args:
+            processor: 共享的视频处理器
+            content_bytes: 播放列表原始内容
+            content_str: 播放列表文本
+        """
+        # 生成视频哈希
+        video_hash = hashlib.md5(content_bytes).hexdigest()
+        
+        # 检查是否已处理
+        if self.download_history and self.download_history.is_processed(video_hash, 'video'):
+            self.stats.increment('already_processed')
+            return
+        
+        # 同一轮中内容相同的播放列表只处理一次，避免并行写入同一输出文件
+        if self.hash_cache.is_duplicate(video_hash):
+            self.stats.increment('duplicate_videos')
+            return
+        
+        # 处理视频
+        if processor.process_m3u8_content(content_str, video_hash, self.stats):
+            # 添加到历史记录
+            if self.download_history:
+                self.download_history.add_hash(video_hash, 'video')
+    
+    def _get_worker_count(self) -> int:
+        """获取用户设置的线程数（多进程模式下为进程数）"""
+        return getattr(self, 'num_threads', None) or getattr(self, 'num_processes', 1)
+    
+    def _get_video_concurrency(self) -> int:
+        """获取同时处理的视频数量"""
+        return max(1, min(4, self._get_worker_count()))
+    
+    def _get_connection_budget(self) -> int:
+        """获取所有视频共享的最大并发连接数"""
+        return max(2, min(16, self._get_worker_count() * 2))
+    
+    def _get_ffmpeg_budget(self) -> int:
+        """获取所有视频共享的最大FFmpeg进程数"""
+        return max(1, min(4, multiprocessing.cpu_count() // 2))
+    
+    def _get_segment_concurrency(self) -> int:
+        """获取单个视频的片段并发下载数"""
+        return max(1, min(8, self._get_worker_count()))
+    
     def _create_result_dict(self, start_time: float) -> Dict[str, Any]:
         """创建结果字典"""
         end_time = time.time()
         duration = end_time - start_time
         
         stats = self.stats.get_all()
+        download_stats = self.download_stats.get_all()
+        if download_stats['requests']:
+            logger.info(f"下载统计: {download_stats['requests']} 个请求, {download_stats['bytes_downloaded']} 字节, "
+                        f"{download_stats['bytes_per_second'] / 1024:.1f} KB/s, 重试 {download_stats['retries']} 次")
         
         return {
             'success': True,
             'duration': duration,
             'stats': stats,
+            'download_stats': download_stats,
             'output_dir': self.output_dir,
-            'cancelled': self.is_cancelled()
+            'cancelled': self.is_cancelled(),
+            'stages': self.stage_timer.breakdown()
         }
 
 # 导出函数
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebM流拼接模块 - 把多个独立的WebM片段拼接为一条连续的WebM流
+WebM Stream Module - Splices standalone WebM segments into one continuous WebM stream
+"""
+
+from typing import List, Optional, Tuple
+
+# EBML/Matroska元素ID
+EBML_HEADER_ID = 0x1A45DFA3
+SEGMENT_ID = 0x18538067
+INFO_ID = 0x1549A966
+TRACKS_ID = 0x1654AE6B
+CLUSTER_ID = 0x1F43B675
+TIMESTAMP_ID = 0xE7
+TIMESTAMP_SCALE_ID = 0x2AD7B1
+
+# Cluster中允许出现的子元素（遇到其他ID说明未知大小的Cluster已结束）
+_CLUSTER_CHILD_IDS = {
+    0xE7,    # Timestamp
+    0x5854,  # SilentTracks
+    0xA7,    # Position
+    0xAB,    # PrevSize
+    0xA3,    # SimpleBlock
+    0xA0,    # BlockGroup
+    0xAF,    # EncryptedBlock
+    0xEC,    # Void
+    0xBF,    # CRC-32
+}
+
+# 未知大小的Segment，输出为流时无需预先知道总长度
+_UNKNOWN_SEGMENT_HEADER = b'\x18\x53\x80\x67\x01\xff\xff\xff\xff\xff\xff\xff'
+
+_DEFAULT_TIMESTAMP_SCALE = 1000000  # 纳秒/单位，即毫秒
+
+
+class WebMParseError(ValueError):
+    """WebM数据无法解析"""
+    pass
+
+
+def _read_id(data: bytes, pos: int) -> Tuple[int, int]:
+    """读取元素ID，返回(ID, 新位置)"""
+    if pos >= len(data):
+        raise WebMParseError("unexpected end of data while reading element id")
+    first = data[pos]
+    length = 1
+    mask = 0x80
+    while length <= 4 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 4 or pos + length > len(data):
+        raise WebMParseError(f"invalid element id at offset {pos}")
+    return int.from_bytes(data[pos:pos + length], 'big'), pos + length
+
+
+def _read_size(data: bytes, pos: int) -> Tuple[Optional[int], int]:
+    """读取元素大小，未知大小返回None，返回(大小, 新位置)"""
+    if pos >= len(data):
+        raise WebMParseError("unexpected end of data while reading element size")
+    first = data[pos]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 8 or pos + length > len(data):
+        raise WebMParseError(f"invalid element size at offset {pos}")
+    value = first & (mask - 1)
+    for byte in data[pos + 1:pos + length]:
+        value = (value << 8) | byte
+    if value == (1 << (7 * length)) - 1:
+        value = None  # 全1表示未知大小
+    return value, pos + length
+
+
+def _encode_size(value: int) -> bytes:
+    """编码元素大小（固定8字节）"""
+    return (value | (1 << 56)).to_bytes(8, 'big')
+
+
+def _encode_uint_element(element_id: int, value: int) -> bytes:
+    """编码无符号整数元素"""
+    payload = value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big')
+    return _encode_id(element_id) + bytes([0x80 | len(payload)]) + payload
+
+
+def _encode_id(element_id: int) -> bytes:
+    """编码元素ID"""
+    return element_id.to_bytes((element_id.bit_length() + 7) // 8, 'big')
+
+
+class WebMStreamSplicer:
+    """
+    WebM片段拼接器
+
+    第一个片段输出EBML头、未知大小的Segment、Info和Tracks；之后每个片段只输出
+    Cluster。每个片段的Cluster时间戳被平移到调用方给出的起始时间（通常是播放列表
+    中前面片段#EXTINF时长之和），因此拼接后的流时间戳从0开始且连续，效果与逐片段
+    setts=ts=PTS-STARTPTS修复后再concat相同。SeekHead、Cues和Tags中的偏移和时长
+    只对单个片段有效，会被丢弃，由下游的FFmpeg重新生成。
+    """
+
+    def __init__(self):
+        self.timestamp_scale = _DEFAULT_TIMESTAMP_SCALE
+        self._header_written = False
+
+    def splice(self, data: bytes, start_seconds: float) -> bytes:
+        """
+        转换一个WebM片段
+
+        Args:
+            data: 完整的WebM片段数据
+            start_seconds: 该片段在输出流中的起始时间（秒）
+
+        Returns:
+            bytes: 追加到输出流的数据
+        """
+        pos = 0
+        header = b''
+        segment_start = segment_end = None
+
+        # 顶层元素: EBML头和Segment
+        while pos < len(data):
+            element_start = pos
+            element_id, pos = _read_id(data, pos)
+            size, pos = _read_size(data, pos)
+            if element_id == EBML_HEADER_ID:
+                if size is None:
+                    raise WebMParseError("EBML header with unknown size")
+                header = data[element_start:pos + size]
+                pos += size
+            elif element_id == SEGMENT_ID:
+                segment_start = pos
+                segment_end = len(data) if size is None else min(len(data), pos + size)
+                break
+            else:
+                if size is None:
+                    raise WebMParseError(f"top-level element 0x{element_id:X} with unknown size")
+                pos += size
+
+        if not header or segment_start is None:
+            raise WebMParseError("not a WebM segment")
+
+        output: List[bytes] = []
+        if not self._header_written:
+            output.append(header)
+            output.append(_UNKNOWN_SEGMENT_HEADER)
+
+        start_units = round(start_seconds * 1e9 / self.timestamp_scale)
+        first_timestamp = None
+        found_cluster = False
+
+        pos = segment_start
+        while pos < segment_end:
+            element_start = pos
+            element_id, pos = _read_id(data, pos)
+            size, pos = _read_size(data, pos)
+
+            if element_id == CLUSTER_ID:
+                children, pos = self._read_cluster_children(data, pos, size, segment_end)
+                timestamp, body = self._split_cluster_timestamp(children)
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                new_timestamp = max(0, timestamp - first_timestamp + start_units)
+                cluster_body = _encode_uint_element(TIMESTAMP_ID, new_timestamp) + body
+                output.append(_encode_id(CLUSTER_ID) + _encode_size(len(cluster_body)) + cluster_body)
+                found_cluster = True
+                continue
+
+            if size is None:
+                raise WebMParseError(f"segment child 0x{element_id:X} with unknown size")
+            element_end = pos + size
+            if element_end > segment_end:
+                raise WebMParseError(f"truncated element 0x{element_id:X}")
+
+            if not self._header_written:
+                if element_id == INFO_ID:
+                    self.timestamp_scale = self._read_timestamp_scale(data, pos, element_end)
+                    start_units = round(start_seconds * 1e9 / self.timestamp_scale)
+                    output.append(data[element_start:element_end])
+                elif element_id == TRACKS_ID:
+                    output.append(data[element_start:element_end])
+            pos = element_end
+
+        if not found_cluster:
+            raise WebMParseError("segment contains no clusters")
+
+        self._header_written = True
+        return b''.join(output)
+
+    def _read_cluster_children(self, data: bytes, pos: int, size: Optional[int],
+                               segment_end: int) -> Tuple[List[Tuple[int, bytes]], int]:
+        """读取Cluster的子元素，返回([(ID, 原始字节)], 结束位置)"""
+        end = segment_end if size is None else pos + size
+        if end > segment_end:
+            raise WebMParseError("truncated cluster")
+
+        children = []
+        while pos < end:
+            child_start = pos
+            child_id, child_pos = _read_id(data, pos)
+            if size is None and child_id not in _CLUSTER_CHILD_IDS:
+                break  # 未知大小的Cluster在下一个Segment级元素处结束
+            child_size, child_pos = _read_size(data, child_pos)
+            if child_size is None or child_pos + child_size > end:
+                raise WebMParseError("invalid cluster child")
+            pos = child_pos + child_size
+            children.append((child_id, data[child_start:pos]))
+        return children, pos
+
+    def _split_cluster_timestamp(self, children: List[Tuple[int, bytes]]) -> Tuple[int, bytes]:
+        """取出Cluster时间戳，返回(时间戳, 其余子元素字节)"""
+        timestamp = None
+        body = []
+        for child_id, raw in children:
+            if child_id == TIMESTAMP_ID and timestamp is None:
+                _, value_pos = _read_id(raw, 0)
+                _, value_pos = _read_size(raw, value_pos)
+                timestamp = int.from_bytes(raw[value_pos:], 'big')
+            elif child_id not in (0xA7, 0xAB):
+                # Position和PrevSize在拼接后失效，直接丢弃
+                body.append(raw)
+        if timestamp is None:
+            raise WebMParseError("cluster without timestamp")
+        return timestamp, b''.join(body)
+
+    def _read_timestamp_scale(self, data: bytes, pos: int, end: int) -> int:
+        """从Info元素中读取TimestampScale"""
+        while pos < end:
+            child_id, pos = _read_id(data, pos)
+            size, pos = _read_size(data, pos)
+            if size is None:
+                break
+            if child_id == TIMESTAMP_SCALE_ID:
+                return int.from_bytes(data[pos:pos + size], 'big') or _DEFAULT_TIMESTAMP_SCALE
+            pos += size
+        return _DEFAULT_TIMESTAMP_SCALE
@@ -9,6 +9,8 @@ from src.interfaces.home_interface import HomeInterface
 from src.interfaces.about_interface import AboutInterface
 from src.interfaces.extract_images_interface import ExtractImagesInterface
 from src.interfaces.extract_textures_interface import ExtractTexturesInterface
+from src.interfaces.extract_meshes_interface import ExtractMeshesInterface
+from src.interfaces.extract_models_interface import ExtractModelsInterface
 from src.interfaces.clear_cache_interface import ClearCacheInterface
 from src.interfaces.history_interface import HistoryInterface
 from src.interfaces.extract_audio_interface import ExtractAudioInterface
@@ -23,6 +25,8 @@ __all__ = [
     'AboutInterface', 
     'ExtractImagesInterface', 
     'ExtractTexturesInterface', 
+    'ExtractMeshesInterface',
+    'ExtractModelsInterface',
     'ClearCacheInterface',
     'HistoryInterface',
     'ExtractAudioInterface',
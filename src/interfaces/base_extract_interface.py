@@ -7,7 +7,7 @@ Base Extract Interface - Contains common logic for audio and font extraction int
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QButtonGroup,
-    QSizePolicy, QFileDialog
+    QSizePolicy, QFileDialog, QApplication
 )
 from PyQt5.QtCore import Qt, QTimer, QPoint
 
@@ -28,6 +28,7 @@ from functools import partial
 from abc import ABCMeta, abstractmethod
 
 from src.utils.log_utils import LogHandler
+from src.workers.cache_watch_worker import CacheWatchWorker
 
 from src.management.theme_management.interface_theme_mixin import InterfaceThemeMixin
 
@@ -45,6 +46,15 @@ except ImportError:
     LogControlCard = None
 
 
+# 各提取类型的输出子目录：(子目录, 目录名称键, 默认目录名称, 类别名称键, 默认类别名称)
+_OUTPUT_FOLDERS = {
+    "audio": ("Audio", "audio_folder", "Audio folder", "ogg_category", "Audio files"),
+    "font": ("Fonts", "fonts_folder", "Fonts folder", "fonts_category", "Font files"),
+    "translation": ("Translations", "translations_folder", "Translations folder",
+                    "translations_category", "Translation files"),
+}
+
+
 class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
     """基础提取界面类 - 抽象基类"""
     
@@ -64,6 +74,7 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
         
         # 初始化工作线程
         self.extraction_worker = None
+        self.watch_worker = None
         self.update_timer = None
         
         # 确保语言对象存在，否则创建空的语言处理函数
@@ -117,6 +128,24 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
     def getExtractionParameters(self):
         """获取提取参数（子类实现）"""
         pass
+
+    def supportsWatchMode(self) -> bool:
+        """是否支持监视缓存模式（子类可覆盖）"""
+        return True
+
+    def getWatchCachePath(self, input_dir, scan_db):
+        """
+        获取监视模式要监视的缓存路径，应与提取时扫描的路径相同（子类可覆盖）
+
+        Args:
+            input_dir: 有效输入路径
+            scan_db: 是否启用数据库扫描
+
+        Returns:
+            str: 缓存路径，None表示自动检测Roblox缓存
+        """
+        # 启用数据库扫描时提取器自动检测Roblox缓存，否则扫描用户指定的目录
+        return None if scan_db else input_dir
         
     def initUI(self):
         """初始化界面"""
@@ -331,6 +360,15 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
         self.extractButton.setIcon(FluentIcon.DOWNLOAD)
         self.extractButton.setFixedSize(130, 35)
         self.extractButton.clicked.connect(self.startExtraction)
+
+        # 监视缓存按钮
+        self.watchButton = PushButton(self.get_text("watch_cache", "Watch"))
+        self.watchButton.setIcon(FluentIcon.SYNC)
+        self.watchButton.setFixedSize(130, 35)
+        self.watchButton.setToolTip(self.get_text("watch_cache_tooltip", "Extract new cache entries automatically while playing"))
+        self.watchButton.clicked.connect(self.toggleWatch)
+        self.watchButton.setVisible(self.supportsWatchMode())
+        button_layout.addWidget(self.watchButton)
         button_layout.addWidget(self.extractButton)
 
         control_layout.addLayout(button_layout)
@@ -402,8 +440,8 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
         if directory:
             self.path_edit.setText(directory)
 
-    def startExtraction(self):
-        """开始提取（模板方法）"""
+    def _validateInputPath(self):
+        """获取并检查有效输入路径，无效时提示错误并返回None"""
         # 获取有效输入路径
         input_dir = self._getEffectiveInputPath()
         
@@ -424,6 +462,13 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
                 duration=3000,
                 parent=self
             )
+            return None
+        return input_dir
+
+    def startExtraction(self):
+        """开始提取（模板方法）"""
+        input_dir = self._validateInputPath()
+        if input_dir is None:
             return
 
         # 保存配置
@@ -448,7 +493,9 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
         self.extraction_worker.progressUpdated.connect(self.updateExtractionProgress)
         self.extraction_worker.finished.connect(self.extractionFinished)
         self.extraction_worker.logMessage.connect(self.handleExtractionLog)
-        
+        if hasattr(self.extraction_worker, 'logBatch'):
+            self.extraction_worker.logBatch.connect(self.handleExtractionLogBatch)
+
         # 创建左上角进度通知
         extraction_type = self.getExtractionType()
         task_running_text = self.get_text("task_running", "Task Running")
@@ -470,6 +517,82 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
         # 启动工作线程
         self.extraction_worker.start()
 
+    def toggleWatch(self):
+        """开始或停止监视缓存"""
+        if self.watch_worker:
+            self.stopWatch()
+        else:
+            self.startWatch()
+
+    def startWatch(self):
+        """开始监视缓存：之后出现的新缓存项目会用当前设置自动提取"""
+        input_dir = self._validateInputPath()
+        if input_dir is None:
+            return
+
+        self.saveConfiguration(input_dir)
+
+        cache_path = self.getWatchCachePath(input_dir, self.db_scan_card.isChecked())
+        self.watch_worker = CacheWatchWorker(self.getWorkerClass(), self.getExtractionParameters(), cache_path)
+        self.watch_worker.progressUpdated.connect(self.updateExtractionProgress)
+        self.watch_worker.logMessage.connect(self.handleExtractionLog)
+        self.watch_worker.logBatch.connect(self.handleExtractionLogBatch)
+        self.watch_worker.batchFinished.connect(self.watchBatchFinished)
+        self.watch_worker.finished.connect(self.watchStopped)
+
+        # 退出程序前停止监视线程
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.stopWatchAndWait)
+
+        # 监视期间不能手动提取
+        self.extractButton.setEnabled(False)
+        self.watchButton.setText(self.get_text("stop_watching", "Stop watching"))
+        self.watchButton.setIcon(FluentIcon.PAUSE)
+        self.updateProgressLabel(self.get_text("watching_cache", "Watching cache for new assets..."))
+
+        self.watch_worker.start()
+
+    def stopWatch(self):
+        """停止监视缓存（正在处理的一批会被取消）"""
+        if self.watch_worker and self.watch_worker.isRunning():
+            self.watch_worker.stop()
+            self.watchButton.setEnabled(False)
+            self.updateProgressLabel(self.get_text("cancelling", "Cancelling..."))
+
+    def stopWatchAndWait(self):
+        """程序退出时停止监视并等待线程结束"""
+        if self.watch_worker and self.watch_worker.isRunning():
+            self.watch_worker.stop()
+            self.watch_worker.wait(5000)
+
+    def watchBatchFinished(self, result):
+        """监视模式处理完一批新缓存项目"""
+        self.progressBar.setValue(100)
+        if result.get("success", False):
+            self.updateProgressLabel(self.get_text("watch_batch_label", "Watching - last batch: {} new items").format(
+                result.get("watch_items", 0)))
+        else:
+            error_msg = result.get("error", self.get_text("unknown_error", "Unknown error"))
+            self.extractLogHandler.error(f"{self.get_text('extraction_failed', 'Extraction failed')}: {error_msg}")
+
+    def watchStopped(self):
+        """监视线程结束后恢复界面"""
+        app = QApplication.instance()
+        if app:
+            try:
+                app.aboutToQuit.disconnect(self.stopWatchAndWait)
+            except TypeError:
+                pass
+
+        self.watch_worker = None
+        self.extractButton.setEnabled(True)
+        self.watchButton.setEnabled(True)
+        self.watchButton.setText(self.get_text("watch_cache", "Watch"))
+        self.watchButton.setIcon(FluentIcon.SYNC)
+        self.updateProgressBar(0)
+        self.updateProgressLabel(self.get_text("ready", "Ready"))
+
     def updateThreadsValue(self):
         """更新线程数设置值（从配置中同步）"""
         if self.config_manager and hasattr(self, 'threads_spin'):
@@ -632,6 +755,19 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
         # 清理工作线程
         self.extraction_worker = None
     
+    def getOutputFolder(self):
+        """
+        获取自动打开时使用的输出子目录（子类可以重写）
+
+        Returns:
+            tuple: (子目录, 子目录存在时的名称, 子目录不存在时的名称)，没有子目录时为None
+        """
+        folder = _OUTPUT_FOLDERS.get(self.getExtractionType())
+        if folder is None:
+            return None
+        subfolder, folder_key, folder_default, category_key, category_default = folder
+        return subfolder, self.get_text(folder_key, folder_default), self.get_text(category_key, category_default)
+
     def _handleAutoOpenOutputDir(self, result, extraction_type):
         """处理自动打开输出目录功能"""
         # 检查是否启用了自动打开输出目录设置
@@ -646,31 +782,17 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
         # 根据提取类型确定要打开的子目录
         target_dir = final_dir
         subfolder_name = ""
-        
-        if extraction_type == "audio":
-            audio_dir = os.path.join(final_dir, "Audio")
-            if os.path.exists(audio_dir):
-                target_dir = audio_dir
-                subfolder_name = self.get_text("audio_folder", "Audio folder")
-            else:
-                subfolder_name = self.get_text("ogg_category", "Audio files")
-                
-        elif extraction_type == "font":
-            fonts_dir = os.path.join(final_dir, "Fonts")
-            if os.path.exists(fonts_dir):
-                target_dir = fonts_dir
-                subfolder_name = self.get_text("fonts_folder", "Fonts folder")
-            else:
-                subfolder_name = self.get_text("fonts_category", "Font files")
-                
-        elif extraction_type == "translation":
-            translations_dir = os.path.join(final_dir, "Translations")
-            if os.path.exists(translations_dir):
-                target_dir = translations_dir
-                subfolder_name = self.get_text("translations_folder", "Translations folder")
+
+        output_folder = self.getOutputFolder()
+        if output_folder:
+            folder, folder_name, category_name = output_folder
+            subfolder_dir = os.path.join(final_dir, folder)
+            if os.path.exists(subfolder_dir):
+                target_dir = subfolder_dir
+                subfolder_name = folder_name
             else:
-                subfolder_name = self.get_text("translations_category", "Translation files")
-        
+                subfolder_name = category_name
+
         # 尝试打开目录
         open_success = open_directory(target_dir)
         if open_success:
@@ -771,27 +893,39 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
                 self.extractLogHandler.info(self.get_text("output_dir", "Output directory: {}").format(output_path))
             else:
                 self.extractLogHandler.warning(self.get_text("no_files_processed", "No files were processed"))
+                
         else:
-            # 其他提取类型的通用统计信息
-            self.extractLogHandler.success(self.get_text("extraction_completed", "Extraction completed"))
-            if 'duration' in result:
-                duration = result.get('duration', 0)
-                self.extractLogHandler.info(self.get_text("time_spent", "Time spent: {:.2f} seconds").format(duration))
-            if 'output_dir' in result:
-                output_path = result.get('output_dir', '')
-                self.extractLogHandler.info(self.get_text("output_dir", "Output directory: {}").format(output_path))
+            self.showExtractionStats(result)
+        
+        # 各阶段耗时
+        self._showStageBreakdown(result)
+
+    def showExtractionStats(self, result):
+        """显示其他提取类型的统计信息（子类可以重写）"""
+        self.extractLogHandler.success(self.get_text("extraction_completed", "Extraction completed"))
+        if 'duration' in result:
+            duration = result.get('duration', 0)
+            self.extractLogHandler.info(self.get_text("time_spent", "Time spent: {:.2f} seconds").format(duration))
+        if 'output_dir' in result:
+            output_path = result.get('output_dir', '')
+            self.extractLogHandler.info(self.get_text("output_dir", "Output directory: {}").format(output_path))
+
+    def _showStageBreakdown(self, result):
+        """显示提取结果中的各阶段耗时"""
+        stages = result.get('stages')
+        if not stages:
+            return
+        self.extractLogHandler.info(self.get_text("stage_breakdown", "Stage timings (per-item stages are summed across workers):"))
+        for name, stage in stages.items():
+            self.extractLogHandler.info(self.get_text("stage_timing", "  {}: {:.2f} s ({} times)").format(
+                name, stage.get('seconds', 0), stage.get('count', 0)))
 
     def handleExtractionLog(self, message, log_type):
         """处理提取日志"""
         # 处理翻译键和格式化消息
         translated_message = self._translate_log_message(message)
         
-        # 添加到日志输出区域
-        timestamp = time.strftime("%H:%M:%S", time.localtime())
-        formatted_message = f"[{timestamp}] {translated_message}"
-        self.logTextEdit.append(formatted_message)
-        
-        # 发送到日志系统
+        # 发送到日志系统（日志视图直接显示中央日志）
         if log_type == "error":
             self.extractLogHandler.error(translated_message)
         elif log_type == "warning":
@@ -800,7 +934,20 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
             self.extractLogHandler.info(translated_message)
         else:
             self.extractLogHandler.info(translated_message)
-    
+
+    def handleExtractionLogBatch(self, entries):
+        """处理工作线程合并发送的一批日志"""
+        translated_entries = []
+        for message, log_type in entries:
+            translated_message = self._translate_log_message(message)
+            # 与单条日志处理保持一致：成功消息按普通信息记录
+            if log_type not in ("error", "warning"):
+                log_type = "info"
+            translated_entries.append((translated_message, log_type))
+
+        # 整批发送到日志系统，日志视图只更新一次
+        self.extractLogHandler.batch(translated_entries)
+
     def _translate_log_message(self, message):
         """翻译日志消息"""
         # 检查是否包含参数分隔符
@@ -887,11 +1034,12 @@ class BaseExtractInterface(QWidget, InterfaceThemeMixin, metaclass=QWidgetMeta):
         return default_translations.get(message_key, message_key)
 
     def showExtractButton(self, show):
-        """显示/隐藏提取按钮"""
+        """显示/隐藏提取按钮（监视按钮随之显示/隐藏）"""
         if show:
             self.extractButton.show()
         else:
             self.extractButton.hide()
+        self.watchButton.setVisible(show and self.supportsWatchMode())
 
     def showCancelButton(self, show):
         """显示/隐藏取消按钮"""
@@ -93,6 +93,10 @@ class ExtractAudioInterface(BaseExtractInterface):
             self.format_card.setEnabled(isChecked)
         if hasattr(self, 'format_combo'):
             self.format_combo.setEnabled(isChecked)
+        if hasattr(self, 'stream_convert_card'):
+            self.stream_convert_card.setEnabled(isChecked)
+        if hasattr(self, 'keep_source_card'):
+            self.keep_source_card.setEnabled(isChecked)
             
         # 记录状态变化（可选）
         if hasattr(self, 'extractLogHandler'):
@@ -138,6 +142,26 @@ class ExtractAudioInterface(BaseExtractInterface):
         self.format_card.hBoxLayout.addWidget(format_widget)
         settings_group.addSettingCard(self.format_card)
         
+        # 边提取边转换
+        self.stream_convert_card = SwitchSettingCard(
+            FluentIcon.SYNC,
+            self.get_text("convert_while_extracting", "边提取边转换"),
+            self.get_text("convert_while_extracting_info", "提取的同时转换音频，不必等待提取完成（仅多线程模式）")
+        )
+        self.stream_convert_card.setChecked(
+            self.config_manager.get("convert_while_extracting", True) if self.config_manager else True)
+        settings_group.addSettingCard(self.stream_convert_card)
+        
+        # 保留OGG源文件
+        self.keep_source_card = SwitchSettingCard(
+            FluentIcon.SAVE,
+            self.get_text("keep_source_audio", "保留OGG文件"),
+            self.get_text("keep_source_audio_info", "转换后保留原始OGG文件；关闭时边提取边转换不再写出OGG文件")
+        )
+        self.keep_source_card.setChecked(
+            self.config_manager.get("keep_source_audio", True) if self.config_manager else True)
+        settings_group.addSettingCard(self.keep_source_card)
+        
     def loadClassificationMethod(self):
         """加载分类方法设置"""
         saved_method = "duration"
@@ -184,6 +208,8 @@ class ExtractAudioInterface(BaseExtractInterface):
         convert_format = "MP3"
         if hasattr(self, 'format_combo'):
             convert_format = self.format_combo.currentText()
+        convert_while_extracting = self.stream_convert_card.isChecked() if hasattr(self, 'stream_convert_card') else True
+        keep_source_audio = self.keep_source_card.isChecked() if hasattr(self, 'keep_source_card') else True
         
         # 获取自定义输出目录
         custom_output_dir = None
@@ -209,9 +235,16 @@ class ExtractAudioInterface(BaseExtractInterface):
             convert_enabled,
             convert_format,
             use_multiprocessing,
-            conservative_multiprocessing
+            conservative_multiprocessing,
+            convert_while_extracting,
+            keep_source_audio
         )
         
+    def getWatchCachePath(self, input_dir, scan_db):
+        """获取监视模式要监视的缓存路径"""
+        # 音频提取器启用数据库扫描时同样扫描指定的.db数据库、rbx-storage文件夹或缓存目录
+        return input_dir or None
+        
     def saveConfiguration(self, input_dir):
         """保存配置"""
         super().saveConfiguration(input_dir)
@@ -227,4 +260,8 @@ class ExtractAudioInterface(BaseExtractInterface):
                 self.config_manager.set("convert_enabled", self.convert_card.isChecked())
             if hasattr(self, 'format_combo'):
                 self.config_manager.set("convert_format", self.format_combo.currentText())
+            if hasattr(self, 'stream_convert_card'):
+                self.config_manager.set("convert_while_extracting", self.stream_convert_card.isChecked())
+            if hasattr(self, 'keep_source_card'):
+                self.config_manager.set("keep_source_audio", self.keep_source_card.isChecked())
 
@@ -143,6 +143,11 @@ class ExtractFontsInterface(BaseExtractInterface):
             conservative_multiprocessing
         )
         
+    def getWatchCachePath(self, input_dir, scan_db):
+        """获取监视模式要监视的缓存路径"""
+        # 字体提取始终使用自动检测的Roblox缓存路径
+        return None
+        
     def saveConfiguration(self, input_dir):
         """保存配置"""
         super().saveConfiguration(input_dir)
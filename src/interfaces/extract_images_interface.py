@@ -1,89 +1,48 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QFrame, QSizePolicy
-)
-from PyQt5.QtCore import Qt
+from qfluentwidgets import SwitchSettingCard, FluentIcon
 
-from qfluentwidgets import (
-    CardWidget, BodyLabel, SubtitleLabel, 
-    ScrollArea
-)
+from src.interfaces.staged_extract_interface import StagedExtractInterface
+from src.extractors.image_extractor import ImageClassificationMethod
+from src.workers.image_extraction_worker import ImageExtractionWorker
 
 
-class ExtractImagesInterface(QWidget):
+class ExtractImagesInterface(StagedExtractInterface):
     """图像提取界面类"""
-    
-    def __init__(self, parent=None, config_manager=None, lang=None):
-        super().__init__(parent)
+
+    WORKER_CLASS = ImageExtractionWorker
+    CLASSIFICATION_METHODS = (
+        ("dimensions", ImageClassificationMethod.DIMENSIONS, "by_dimensions", "按尺寸",
+         "info_dimensions_classification", "图像将按最长边尺寸分类存储，如 0-64px、257-512px"),
+        ("format", ImageClassificationMethod.FORMAT, "by_image_format", "按图片格式",
+         "info_image_format_classification", "图像将按格式分类存储，如 PNG、JFIF、GIF"),
+        ("none", ImageClassificationMethod.NONE, "no_classification", "无分类",
+         "info_image_no_classification", "图像将直接输出到主目录，无需分类"),
+    )
+
+    def __init__(self, parent=None, config_manager=None, lang=None, default_dir=None, download_history=None):
+        super().__init__(parent, config_manager, lang, default_dir, download_history)
         self.setObjectName("extractImagesInterface")
-        self.config_manager = config_manager
-        self.lang = lang
-        
-        # 确保语言对象存在，否则创建空的语言处理函数
-        if self.lang is None:
-            self.get_text = lambda key, default="": default
+
+    def createOptionCards(self, settings_group):
+        """创建图像特定的设置卡片"""
+        # 阻止头像图片（WebP）开关
+        self.block_avatar_card = SwitchSettingCard(
+            FluentIcon.PEOPLE,
+            self.get_text("block_avatar_images", "跳过头像图片"),
+            self.get_text("block_avatar_images_info", "不提取WebP格式的头像和缩略图")
+        )
+        if self.config_manager:
+            self.block_avatar_card.setChecked(self.config_manager.get("image_block_avatar_images", True))
         else:
-            self.get_text = self.lang.get
-        
-        # 初始化界面
-        self.initUI()
-        
-    def initUI(self):
-        """初始化界面"""
-        # 创建滚动区域
-        scroll = ScrollArea(self)
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+            self.block_avatar_card.setChecked(True)
+        settings_group.addSettingCard(self.block_avatar_card)
 
-        # 主内容容器
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(20, 20, 20, 20)
-        content_layout.setSpacing(15)
+    def getOptionParameters(self) -> tuple:
+        """获取图像特定的工作线程参数"""
+        return (self.block_avatar_card.isChecked(),)
 
-        # 添加占位内容
-        placeholder = CardWidget()
-        placeholder_layout = QVBoxLayout(placeholder)
-        placeholder_layout.setContentsMargins(20, 20, 20, 20)
-        
-        title = SubtitleLabel(self.get_text("extract_images", "提取图像"))
-        title.setObjectName("extractImagesTitle")
-        placeholder_layout.addWidget(title)
-        
-        desc = BodyLabel(self.get_text("extract_images_placeholder", "这是提取图像的功能界面占位符，将在后续版本中实现。"))
-        desc.setWordWrap(True)
-        placeholder_layout.addWidget(desc)
-        
-        content_layout.addWidget(placeholder)
-        
-        # 添加伸缩空间，确保内容顶部对齐
-        content_layout.addStretch()
-        
-        scroll.setWidget(content_widget)
-        
-        # 创建布局
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(scroll)
-        
-        # 设置为响应式
-        self.setResponsiveContentWidget(scroll)
-        
-    def setResponsiveContentWidget(self, scroll_area):
-        """为滚动区域内的内容容器应用响应式布局设置，防止卡片间距异常"""
-        if not scroll_area:
-            return
-            
-        content_widget = scroll_area.widget()
-        if not content_widget:
-            return
-            
-        # 设置垂直大小策略为最小值，防止垂直方向上不必要的扩展
-        content_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.MinimumExpanding)
-        
-        # 确保布局设置了顶部对齐
-        if content_widget.layout():
-            content_widget.layout().setAlignment(Qt.AlignTop) 
\ No newline at end of file
+    def saveOptions(self):
+        """保存图像特定配置"""
+        self.config_manager.set("image_block_avatar_images", self.block_avatar_card.isChecked())
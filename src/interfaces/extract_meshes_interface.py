@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from qfluentwidgets import SwitchSettingCard, FluentIcon
+
+from src.interfaces.staged_extract_interface import StagedExtractInterface
+from src.extractors.mesh_extractor import MeshClassificationMethod
+from src.workers.mesh_extraction_worker import MeshExtractionWorker
+
+
+class ExtractMeshesInterface(StagedExtractInterface):
+    """网格提取界面类"""
+
+    WORKER_CLASS = MeshExtractionWorker
+    CLASSIFICATION_METHODS = (
+        ("version", MeshClassificationMethod.VERSION, "by_mesh_version", "按网格版本",
+         "info_mesh_version_classification", "网格将按版本分类存储，如 v2.00、v4.00"),
+        ("none", MeshClassificationMethod.NONE, "no_classification", "无分类",
+         "info_mesh_no_classification", "网格将直接输出到主目录，无需分类"),
+    )
+
+    def __init__(self, parent=None, config_manager=None, lang=None, default_dir=None, download_history=None):
+        super().__init__(parent, config_manager, lang, default_dir, download_history)
+        self.setObjectName("extractMeshesInterface")
+
+    def createOptionCards(self, settings_group):
+        """创建网格特定的设置卡片"""
+        # 转换为OBJ开关
+        self.convert_obj_card = SwitchSettingCard(
+            FluentIcon.SYNC,
+            self.get_text("convert_meshes_obj", "转换为OBJ"),
+            self.get_text("convert_meshes_obj_info", "同时把v1.00-v5.00网格转换为OBJ，保存在网格文件旁边")
+        )
+        self.convert_obj_card.setChecked(
+            self.config_manager.get("mesh_convert_obj", False) if self.config_manager else False)
+        settings_group.addSettingCard(self.convert_obj_card)
+
+    def getOptionParameters(self) -> tuple:
+        """获取网格特定的工作线程参数"""
+        return (self.convert_obj_card.isChecked(),)
+
+    def saveOptions(self):
+        """保存网格特定配置"""
+        self.config_manager.set("mesh_convert_obj", self.convert_obj_card.isChecked())
+
+    def getExtraStatsLines(self, stats) -> list:
+        """OBJ转换统计"""
+        if not (stats.get('meshes_converted', 0) or stats.get('conversion_errors', 0)):
+            return []
+        return [
+            f"{self.get_text('meshes_converted', 'Meshes converted to OBJ')}: {stats.get('meshes_converted', 0)}",
+            f"{self.get_text('mesh_conversion_errors', 'Conversion errors')}: {stats.get('conversion_errors', 0)}"
+        ]
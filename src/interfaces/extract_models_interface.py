@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from qfluentwidgets import SwitchSettingCard, FluentIcon
+
+from src.interfaces.staged_extract_interface import StagedExtractInterface
+from src.extractors.model_extractor import ModelClassificationMethod
+from src.workers.model_extraction_worker import ModelExtractionWorker
+
+
+class ExtractModelsInterface(StagedExtractInterface):
+    """模型提取界面类"""
+
+    WORKER_CLASS = ModelExtractionWorker
+    CLASSIFICATION_METHODS = (
+        ("main_class", ModelClassificationMethod.MAIN_CLASS, "by_main_class", "按主要实例类型",
+         "info_main_class_classification", "模型将按实例最多的类分类存储，如 Part、MeshPart"),
+        ("none", ModelClassificationMethod.NONE, "no_classification", "无分类",
+         "info_model_no_classification", "模型将直接输出到主目录，无需分类"),
+    )
+
+    def __init__(self, parent=None, config_manager=None, lang=None, default_dir=None, download_history=None):
+        super().__init__(parent, config_manager, lang, default_dir, download_history)
+        self.setObjectName("extractModelsInterface")
+
+    def createOptionCards(self, settings_group):
+        """创建模型特定的设置卡片"""
+        # 写入块索引开关
+        self.write_index_card = SwitchSettingCard(
+            FluentIcon.DOCUMENT,
+            self.get_text("write_model_index", "写入模型索引"),
+            self.get_text("write_model_index_info", "把每个模型的实例类型数量和块位置写入 model_index.json")
+        )
+        self.write_index_card.setChecked(
+            self.config_manager.get("model_write_index", True) if self.config_manager else True)
+        settings_group.addSettingCard(self.write_index_card)
+
+    def getOptionParameters(self) -> tuple:
+        """获取模型特定的工作线程参数"""
+        return (self.write_index_card.isChecked(),)
+
+    def saveOptions(self):
+        """保存模型特定配置"""
+        self.config_manager.set("model_write_index", self.write_index_card.isChecked())
+
+    def getExtraStatsLines(self, stats) -> list:
+        """块索引统计"""
+        lines = [f"{self.get_text('instances_indexed', 'Instances indexed')}: {stats.get('instances_indexed', 0)}"]
+        # 实例最多的几个类
+        class_counts = stats.get('class_counts', {})
+        if class_counts:
+            top_classes = ", ".join(f"{name} {count}" for name, count in list(class_counts.items())[:8])
+            lines.append(f"{self.get_text('top_instance_classes', 'Top instance classes')}: {top_classes}")
+        index_errors = stats.get('index_errors', 0)
+        if index_errors:
+            lines.append(f"{self.get_text('model_index_errors', 'Models without index')}: {index_errors}")
+        return lines
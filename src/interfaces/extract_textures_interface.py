@@ -1,89 +1,78 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QFrame, QSizePolicy
-)
-from PyQt5.QtCore import Qt
+from qfluentwidgets import SwitchSettingCard, FluentIcon
 
-from qfluentwidgets import (
-    CardWidget, BodyLabel, SubtitleLabel, 
-    ScrollArea
-)
+from src.interfaces.staged_extract_interface import StagedExtractInterface
+from src.extractors.texture_extractor import TextureClassificationMethod
+from src.extractors.ktx_texture import is_decode_available
+from src.workers.texture_extraction_worker import TextureExtractionWorker
 
 
-class ExtractTexturesInterface(QWidget):
+class ExtractTexturesInterface(StagedExtractInterface):
     """纹理提取界面类"""
-    
-    def __init__(self, parent=None, config_manager=None, lang=None):
-        super().__init__(parent)
+
+    WORKER_CLASS = TextureExtractionWorker
+    CLASSIFICATION_METHODS = (
+        ("format", TextureClassificationMethod.FORMAT, "by_texture_format", "按压缩格式",
+         "info_texture_format_classification", "纹理将按压缩格式分类存储，如 BC1、BC3、ASTC"),
+        ("dimensions", TextureClassificationMethod.DIMENSIONS, "by_dimensions", "按尺寸",
+         "info_texture_dimensions_classification", "纹理将按最长边尺寸分类存储，如 0-64px、257-512px"),
+        ("none", TextureClassificationMethod.NONE, "no_classification", "无分类",
+         "info_texture_no_classification", "纹理将直接输出到主目录，无需分类"),
+    )
+
+    def __init__(self, parent=None, config_manager=None, lang=None, default_dir=None, download_history=None):
+        super().__init__(parent, config_manager, lang, default_dir, download_history)
         self.setObjectName("extractTexturesInterface")
-        self.config_manager = config_manager
-        self.lang = lang
-        
-        # 确保语言对象存在，否则创建空的语言处理函数
-        if self.lang is None:
-            self.get_text = lambda key, default="": default
-        else:
-            self.get_text = self.lang.get
-        
-        # 初始化界面
-        self.initUI()
-        
-    def initUI(self):
-        """初始化界面"""
-        # 创建滚动区域
-        scroll = ScrollArea(self)
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-        # 主内容容器
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(20, 20, 20, 20)
-        content_layout.setSpacing(15)
+    def createOptionCards(self, settings_group):
+        """创建纹理特定的设置卡片"""
+        # 解码为PNG开关（需要NumPy）
+        decode_available = is_decode_available()
+        self.decode_png_card = SwitchSettingCard(
+            FluentIcon.PHOTO,
+            self.get_text("decode_textures_png", "解码为PNG"),
+            self.get_text("decode_textures_png_info", "同时把BC1-BC5和未压缩纹理解码为PNG，保存在KTX文件旁边")
+            if decode_available else
+            self.get_text("decode_textures_unavailable_info", "需要安装NumPy，当前只保存KTX文件")
+        )
+        decode_png = self.config_manager.get("texture_decode_png", False) if self.config_manager else False
+        self.decode_png_card.setChecked(decode_png and decode_available)
+        self.decode_png_card.setEnabled(decode_available)
+        self.decode_png_card.checkedChanged.connect(self.onDecodeToggled)
+        settings_group.addSettingCard(self.decode_png_card)
+
+        # 解码所有Mip级别开关
+        self.decode_all_mips_card = SwitchSettingCard(
+            FluentIcon.ZOOM,
+            self.get_text("decode_all_mips", "解码所有Mip级别"),
+            self.get_text("decode_all_mips_info", "为每个Mip级别输出PNG，而不是只输出原始尺寸")
+        )
+        self.decode_all_mips_card.setChecked(
+            self.config_manager.get("texture_decode_all_mips", False) if self.config_manager else False)
+        settings_group.addSettingCard(self.decode_all_mips_card)
+        self.onDecodeToggled(self.decode_png_card.isChecked())
+
+    def onDecodeToggled(self, isChecked):
+        """解码开关变化事件"""
+        if hasattr(self, 'decode_all_mips_card'):
+            self.decode_all_mips_card.setEnabled(isChecked)
+
+    def getOptionParameters(self) -> tuple:
+        """获取纹理特定的工作线程参数"""
+        return self.decode_png_card.isChecked(), self.decode_all_mips_card.isChecked()
+
+    def saveOptions(self):
+        """保存纹理特定配置"""
+        self.config_manager.set("texture_decode_png", self.decode_png_card.isChecked())
+        self.config_manager.set("texture_decode_all_mips", self.decode_all_mips_card.isChecked())
 
-        # 添加占位内容
-        placeholder = CardWidget()
-        placeholder_layout = QVBoxLayout(placeholder)
-        placeholder_layout.setContentsMargins(20, 20, 20, 20)
-        
-        title = SubtitleLabel(self.get_text("extract_textures", "提取纹理"))
-        title.setObjectName("extractTexturesTitle")
-        placeholder_layout.addWidget(title)
-        
-        desc = BodyLabel(self.get_text("extract_textures_placeholder", "这是提取纹理的功能界面占位符，将在后续版本中实现。"))
-        desc.setWordWrap(True)
-        placeholder_layout.addWidget(desc)
-        
-        content_layout.addWidget(placeholder)
-        
-        # 添加伸缩空间，确保内容顶部对齐
-        content_layout.addStretch()
-        
-        scroll.setWidget(content_widget)
-        
-        # 创建布局
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(scroll)
-        
-        # 设置为响应式
-        self.setResponsiveContentWidget(scroll)
-        
-    def setResponsiveContentWidget(self, scroll_area):
-        """为滚动区域内的内容容器应用响应式布局设置，防止卡片间距异常"""
-        if not scroll_area:
-            return
-            
-        content_widget = scroll_area.widget()
-        if not content_widget:
-            return
-            
-        # 设置垂直大小策略为最小值，防止垂直方向上不必要的扩展
-        content_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.MinimumExpanding)
-        
-        # 确保布局设置了顶部对齐
-        if content_widget.layout():
-            content_widget.layout().setAlignment(Qt.AlignTop) 
\ No newline at end of file
+    def getExtraStatsLines(self, stats) -> list:
+        """纹理解码统计"""
+        if not (stats.get('textures_decoded', 0) or stats.get('decode_errors', 0)):
+            return []
+        return [
+            f"{self.get_text('textures_decoded', 'Textures decoded to PNG')}: {stats.get('textures_decoded', 0)}",
+            f"{self.get_text('texture_decode_errors', 'Decode errors')}: {stats.get('decode_errors', 0)}"
+        ]
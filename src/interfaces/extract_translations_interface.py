@@ -73,12 +73,42 @@ class ExtractTranslationsInterface(BaseExtractInterface):
         
         settings_group.addSettingCard(self.convert_card)
         
+        # 保留原始格式开关（不重新格式化JSON）
+        self.keep_original_card = SwitchSettingCard(
+            FluentIcon.SAVE,
+            self.get_text("translation_keep_original", "保留原始格式"),
+            self.get_text("translation_keep_original_info", "按缓存中的原始内容写入翻译文件，不重新格式化JSON（更快）")
+        )
+        if self.config_manager:
+            self.keep_original_card.setChecked(self.config_manager.get("translation_output_format", "json") == "raw")
+        else:
+            self.keep_original_card.setChecked(False)
+        settings_group.addSettingCard(self.keep_original_card)
+        
+        # 合并包开关（所有条目写入一个按语言区域和键索引的数据库）
+        self.bundle_card = SwitchSettingCard(
+            FluentIcon.LIBRARY,
+            self.get_text("translation_bundle", "合并为翻译包"),
+            self.get_text("translation_bundle_info", "把所有翻译条目按语言区域合并到 translations.db，后续运行增量更新")
+        )
+        if self.config_manager:
+            self.bundle_card.setChecked(self.config_manager.get("translation_bundle_enabled", False))
+        else:
+            self.bundle_card.setChecked(False)
+        self.bundle_card.checkedChanged.connect(self.onBundleToggled)
+        settings_group.addSettingCard(self.bundle_card)
+        self.onBundleToggled(self.bundle_card.isChecked())
+        
         # 连接分类方法变更信号
         if hasattr(self, 'classification_combo'):
             self.classification_combo.currentIndexChanged.connect(self.updateClassificationInfo)
             # 初始更新
             self.updateClassificationInfo()
     
+    def onBundleToggled(self, checked):
+        """合并包模式下不写入单独的JSON文件，保留原始格式选项无效"""
+        self.keep_original_card.setEnabled(not checked)
+    
     def loadClassificationMethod(self):
         """加载分类方法设置"""
         saved_method = "locale"
@@ -139,6 +169,14 @@ class ExtractTranslationsInterface(BaseExtractInterface):
         # 获取翻译文件处理选项
         convert_enabled = self.convert_card.isChecked()
         
+        # 获取输出格式：BUNDLE合并到翻译包，RAW按原始内容写入，JSON重新格式化
+        if self.bundle_card.isChecked():
+            convert_format = "BUNDLE"
+        elif self.keep_original_card.isChecked():
+            convert_format = "RAW"
+        else:
+            convert_format = "JSON"
+        
         # 获取自定义输出目录
         custom_output_dir = None
         if self.config_manager:
@@ -161,7 +199,7 @@ class ExtractTranslationsInterface(BaseExtractInterface):
             custom_output_dir,
             scan_db,
             convert_enabled,
-            "JSON",  # convert_format (保留以兼容接口)
+            convert_format,
             use_multiprocessing,
             conservative_multiprocessing
         )
@@ -174,6 +212,8 @@ class ExtractTranslationsInterface(BaseExtractInterface):
             
             # 保存翻译文件特定配置
             self.config_manager.set("translation_processing_enabled", self.convert_card.isChecked())
+            self.config_manager.set("translation_output_format", "raw" if self.keep_original_card.isChecked() else "json")
+            self.config_manager.set("translation_bundle_enabled", self.bundle_card.isChecked())
             self.config_manager.save_config()
 
  
\ No newline at end of file
@@ -33,7 +33,11 @@ class ExtractVideosInterface(BaseExtractInterface):
     def getWorkerClass(self):
         """获取工作线程类"""
         return VideoExtractionWorker
-        
+
+    def supportsWatchMode(self) -> bool:
+        """视频需要同一次扫描中的全部分段才能合并，不支持监视模式"""
+        return False
+
     def getClassificationMethods(self) -> list:
         """获取分类方法列表"""
         return [
@@ -225,6 +229,20 @@ class ExtractVideosInterface(BaseExtractInterface):
         self.auto_cleanup_card.checkedChanged.connect(self.onAutoCleanupChanged)
         
         storage_group.addSettingCard(self.auto_cleanup_card)
+        
+        # 断点续传（保存已完成的片段）
+        self.resume_downloads_card = SwitchSettingCard(
+            FluentIcon.HISTORY,
+            self.get_text("resume_downloads", "Resume Interrupted Downloads"),
+            self.get_text("resume_downloads_desc", "Keep downloaded segments on disk so interrupted videos can resume (writes every segment twice)"),
+            configItem=None,
+            parent=storage_group
+        )
+        current_resume = self.config_manager.get("video_resume_downloads", False) if self.config_manager else False
+        self.resume_downloads_card.setChecked(current_resume)
+        self.resume_downloads_card.checkedChanged.connect(self.onResumeDownloadsChanged)
+        
+        storage_group.addSettingCard(self.resume_downloads_card)
         parent_group.addSettingCard(storage_group)
     
     def createFormatConversionCard(self, parent_group):
@@ -381,6 +399,26 @@ class ExtractVideosInterface(BaseExtractInterface):
             parent=self
         )
     
+    def onResumeDownloadsChanged(self, checked):
+        """处理断点续传设置变更"""
+        if self.config_manager:
+            self.config_manager.set("video_resume_downloads", checked)
+        
+        if checked:
+            message = self.get_text("resume_downloads_enabled", "Resume downloads enabled")
+        else:
+            message = self.get_text("resume_downloads_disabled", "Resume downloads disabled")
+        
+        InfoBar.success(
+            title=self.get_text("settings_updated", "Settings Updated"),
+            content=message,
+            orient=Qt.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP,
+            duration=2000,
+            parent=self
+        )
+    
     def onVideoQualityChanged(self, index: int):
         """处理视频质量设置变更"""
         if self.config_manager:
@@ -464,6 +502,7 @@ class ExtractVideosInterface(BaseExtractInterface):
         # 获取视频特定配置
         concurrent_downloads = self.config_manager.get("video_concurrent_downloads", True) if self.config_manager else True
         auto_cleanup = self.config_manager.get("video_auto_cleanup", True) if self.config_manager else True
+        resume_downloads = self.config_manager.get("video_resume_downloads", False) if self.config_manager else False
         ffmpeg_path = self.config_manager.get("ffmpeg_path", None) if self.config_manager else None
         
         # 获取视频质量偏好
@@ -496,7 +535,8 @@ class ExtractVideosInterface(BaseExtractInterface):
             quality_preference,
             timestamp_repair,
             convert_enabled,
-            convert_format
+            convert_format,
+            resume_downloads
         )
     
     def getSelectedClassificationMethod(self):
@@ -568,6 +608,9 @@ class ExtractVideosInterface(BaseExtractInterface):
         messages.append(f"{self.get_text('segments_downloaded', 'Segments downloaded')}: {stats.get('downloaded_segments', 0)}")
         messages.append(f"{self.get_text('videos_merged', 'Videos merged')}: {stats.get('merged_videos', 0)}")
         
+        if stats.get('resumed_segments', 0) > 0:
+            messages.append(f"{self.get_text('segments_resumed', 'Segments resumed')}: {stats.get('resumed_segments', 0)}")
+        
         if stats.get('duplicate_videos', 0) > 0:
             messages.append(f"{self.get_text('duplicate_videos', 'Duplicate videos skipped')}: {stats.get('duplicate_videos', 0)}")
         
@@ -632,6 +675,10 @@ class ExtractVideosInterface(BaseExtractInterface):
             if hasattr(self, 'auto_cleanup_card'):
                 self.config_manager.set("video_auto_cleanup", self.auto_cleanup_card.isChecked())
             
+            # 保存断点续传设置
+            if hasattr(self, 'resume_downloads_card'):
+                self.config_manager.set("video_resume_downloads", self.resume_downloads_card.isChecked())
+            
             # 保存格式转换设置
             if hasattr(self, 'convert_card'):
                 self.config_manager.set("convert_video_enabled", self.convert_card.isChecked())
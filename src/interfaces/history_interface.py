@@ -523,6 +523,7 @@ class HistoryInterface(QWidget, InterfaceThemeMixin):
                                 'video': self.get_text("video_history", "视频文件"),
                                 'image': self.get_text("image_history", "图片文件"),
                                 'texture': self.get_text("texture_history", "纹理文件"),
+                                'mesh': self.get_text("mesh_history", "网格文件"),
                                 'model': self.get_text("model_history", "模型文件"),
                                 'other': self.get_text("other_history", "其他文件")
                             }
@@ -595,6 +596,7 @@ class HistoryInterface(QWidget, InterfaceThemeMixin):
                             'translation': self.get_text("translation_history", "翻译文件"),
                             'image': self.get_text("image_history", "图片文件"),
                             'texture': self.get_text("texture_history", "纹理文件"),
+                            'mesh': self.get_text("mesh_history", "网格文件"),
                             'model': self.get_text("model_history", "模型文件"),
                             'other': self.get_text("other_history", "其他文件")
                         }
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+暂存式提取界面基类 - 图像、纹理、网格和模型提取界面的共同逻辑
+Staged Extract Interface - Common logic for the image, texture, mesh and model extraction interfaces
+"""
+
+from qfluentwidgets import SwitchSettingCard, FluentIcon
+
+import os
+
+from src.interfaces.base_extract_interface import BaseExtractInterface
+
+
+class StagedExtractInterface(BaseExtractInterface):
+    """
+    暂存式提取界面基类
+
+    子类设置WORKER_CLASS和CLASSIFICATION_METHODS，并通过以下钩子提供该资源类型特有的内容：
+
+    - createOptionCards(settings_group): 特有的设置卡片
+    - getOptionParameters(): 追加在工作线程通用参数之后的特有参数
+    - saveOptions(): 保存特有的设置
+    - getExtraStatsLines(stats): 统计信息中特有的行
+    """
+
+    WORKER_CLASS = None  # StagedExtractionWorker的子类
+
+    # 分类方法，按下拉框顺序：(配置值, 分类方法, 名称键, 默认名称, 说明键, 默认说明)
+    CLASSIFICATION_METHODS = ()
+
+    @property
+    def extractor_class(self):
+        """工作线程使用的提取器类"""
+        return self.WORKER_CLASS.EXTRACTOR_CLASS
+
+    def getExtractionType(self) -> str:
+        """获取提取类型"""
+        return self.extractor_class.ASSET_TYPE
+
+    def getWorkerClass(self):
+        """获取工作线程类"""
+        return self.WORKER_CLASS
+
+    def getClassificationMethods(self) -> list:
+        """获取分类方法列表"""
+        return [self.get_text(name_key, name) for _, _, name_key, name, _, _ in self.CLASSIFICATION_METHODS]
+
+    def getClassificationMethodKey(self) -> str:
+        """获取分类方法配置键"""
+        return f"{self.getExtractionType()}_classification_method"
+
+    def getThreadsConfigKey(self) -> str:
+        """获取线程数配置键"""
+        return "threads"
+
+    def getOutputFolder(self):
+        """获取输出子目录及其在日志中的名称"""
+        prefix = self.extractor_class.STATS_PREFIX
+        folder_name = self.extractor_class.OUTPUT_DIR_NAME
+        return (folder_name,
+                self.get_text(f"{prefix}_folder", f"{folder_name} folder"),
+                self.get_text(f"{prefix}_category", f"{self.getExtractionType().capitalize()} files"))
+
+    def createSpecificSettingCards(self, settings_group):
+        """创建该资源类型的设置卡片"""
+        # 数据库扫描选项卡片
+        self.db_scan_card = SwitchSettingCard(
+            FluentIcon.COMMAND_PROMPT,
+            self.get_text("scan_database", "扫描数据库"),
+            self.get_text("scan_database_info", f"同时扫描SQLite数据库中的{self.extractor_class.ASSET_LABEL}")
+        )
+        self.db_scan_card.setChecked(True)  # 默认启用
+        settings_group.addSettingCard(self.db_scan_card)
+
+        self.createOptionCards(settings_group)
+
+        # 初始更新分类说明
+        if hasattr(self, 'classification_combo'):
+            self.updateClassificationInfo()
+
+    def createOptionCards(self, settings_group):
+        """创建该资源类型特有的设置卡片（子类实现）"""
+
+    def loadClassificationMethod(self):
+        """加载分类方法设置"""
+        saved_method = self.CLASSIFICATION_METHODS[0][0]
+        if self.config_manager:
+            saved_method = self.config_manager.get(self.getClassificationMethodKey(), saved_method)
+        values = [value for value, *_ in self.CLASSIFICATION_METHODS]
+        self.classification_combo.setCurrentIndex(values.index(saved_method) if saved_method in values else 0)
+
+    def updateClassificationInfo(self):
+        """更新分类方法信息"""
+        if not hasattr(self, 'classification_card'):
+            return
+
+        _, _, _, _, info_key, info = self.CLASSIFICATION_METHODS[self.classification_combo.currentIndex()]
+        self.classification_card.contentLabel.setText(self.get_text(info_key, info))
+
+    def getExtractionParameters(self):
+        """获取提取参数"""
+        # 获取有效输入路径
+        input_dir = self._getEffectiveInputPath()
+
+        # 获取分类方法
+        classification_method = self.CLASSIFICATION_METHODS[self.classification_combo.currentIndex()][1]
+
+        # 获取线程数
+        num_threads = self.threads_spin.value()
+
+        # 获取数据库扫描选项
+        scan_db = self.db_scan_card.isChecked()
+
+        # 获取自定义输出目录
+        custom_output_dir = None
+        if self.config_manager:
+            custom_dir = self.config_manager.get("custom_output_dir", "")
+            if custom_dir and os.path.isdir(custom_dir):
+                custom_output_dir = custom_dir
+                self.extractLogHandler.info(f"{self.get_text('using_custom_output_dir', '使用自定义输出目录')}: {custom_output_dir}")
+            else:
+                self.extractLogHandler.info(self.get_text("using_default_output_dir", "使用默认输出目录"))
+
+        # 获取多进程配置
+        use_multiprocessing = self.config_manager.get("useMultiprocessing", False) if self.config_manager else False
+        conservative_multiprocessing = self.config_manager.get("conservativeMultiprocessing", True) if self.config_manager else True
+
+        return (
+            input_dir,
+            num_threads,
+            self.download_history,
+            classification_method,
+            custom_output_dir,
+            scan_db,
+            use_multiprocessing,
+            conservative_multiprocessing,
+            *self.getOptionParameters()
+        )
+
+    def getOptionParameters(self) -> tuple:
+        """获取该资源类型特有的工作线程参数，顺序与工作线程的参数一致"""
+        return ()
+
+    def saveConfiguration(self, input_dir):
+        """保存配置"""
+        if self.config_manager:
+            # 保存通用配置
+            super().saveConfiguration(input_dir)
+
+            # 保存该资源类型的配置
+            self.config_manager.set(self.getClassificationMethodKey(),
+                                    self.CLASSIFICATION_METHODS[self.classification_combo.currentIndex()][0])
+            self.saveOptions()
+            self.config_manager.save_config()
+
+    def saveOptions(self):
+        """保存该资源类型特有的设置（子类实现）"""
+
+    def showExtractionStats(self, result):
+        """显示提取统计信息"""
+        stats = result.get('stats', {})
+        prefix = self.extractor_class.STATS_PREFIX
+        noun = self.extractor_class.OUTPUT_DIR_NAME
+        saved = stats.get(f'{prefix}_saved', 0)
+
+        if saved <= 0:
+            self.extractLogHandler.warning(self.get_text("no_files_processed", "No files were processed"))
+            return
+
+        self.extractLogHandler.success(self.get_text("extraction_complete", "Extraction completed successfully!"))
+        self.extractLogHandler.info(f"{self.get_text(f'{prefix}_found', f'{noun} found')}: {stats.get(f'{prefix}_found', 0)}")
+        self.extractLogHandler.info(f"{self.get_text(f'{prefix}_saved', f'{noun} saved')}: {saved}")
+        for line in self.getExtraStatsLines(stats):
+            self.extractLogHandler.info(line)
+        already_processed = stats.get('already_processed', 0)
+        self.extractLogHandler.info(self.get_text("skipped_already_processed", "Skipped already processed: {} files").format(already_processed))
+        duplicate_skipped = stats.get('duplicate_skipped', 0)
+        self.extractLogHandler.info(self.get_text("skipped_duplicates", "Skipped duplicates: {} files").format(duplicate_skipped))
+        processing_errors = stats.get('processing_errors', 0)
+        self.extractLogHandler.info(self.get_text("errors", "Errors: {} files").format(processing_errors))
+        duration = result.get('duration', 0)
+        self.extractLogHandler.info(self.get_text("time_spent", "Time spent: {:.2f} seconds").format(duration))
+        self.extractLogHandler.info(f"{self.get_text('write_speed', 'Write speed')}: {result.get('bytes_per_second', 0) / (1024 * 1024):.1f} MB/s")
+        output_path = result.get('output_dir', '')
+        self.extractLogHandler.info(self.get_text("output_dir", "Output directory: {}").format(output_path))
+
+    def getExtraStatsLines(self, stats) -> list:
+        """获取该资源类型特有的统计行，显示在保存数量之后"""
+        return []
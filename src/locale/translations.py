@@ -552,6 +552,22 @@ def get_translations():
                 ENGLISH: "Select audio output format",
                 CHINESE: "选择音频输出格式"
             },
+            "convert_while_extracting": {
+                ENGLISH: "Convert While Extracting",
+                CHINESE: "边提取边转换"
+            },
+            "convert_while_extracting_info": {
+                ENGLISH: "Convert audio as it is extracted instead of waiting for extraction to finish (threading mode only)",
+                CHINESE: "提取的同时转换音频，不必等待提取完成（仅多线程模式）"
+            },
+            "keep_source_audio": {
+                ENGLISH: "Keep OGG Files",
+                CHINESE: "保留OGG文件"
+            },
+            "keep_source_audio_info": {
+                ENGLISH: "Keep the original OGG files after conversion; when off, streaming conversion never writes them",
+                CHINESE: "转换后保留原始OGG文件；关闭时边提取边转换不再写出OGG文件"
+            },
             "extract_audio_title": {
                 ENGLISH: "Extract Audio Files",
                 CHINESE: "提取音频文件"
@@ -2336,6 +2352,22 @@ def get_translations():
                 ENGLISH: "Process and save discovered translation files",
                 CHINESE: "处理和保存发现的翻译文件"
             },
+            "translation_keep_original": {
+                ENGLISH: "Keep Original Formatting",
+                CHINESE: "保留原始格式"
+            },
+            "translation_keep_original_info": {
+                ENGLISH: "Write translation files exactly as cached instead of re-formatting the JSON (faster)",
+                CHINESE: "按缓存中的原始内容写入翻译文件，不重新格式化JSON（更快）"
+            },
+            "translation_bundle": {
+                ENGLISH: "Merge into Translation Bundle",
+                CHINESE: "合并为翻译包"
+            },
+            "translation_bundle_info": {
+                ENGLISH: "Merge all entries by locale into translations.db and update it incrementally on later runs",
+                CHINESE: "把所有翻译条目按语言区域合并到 translations.db，后续运行增量更新"
+            },
             # Translation分类说明相关
             "info_locale_classification": {
                 ENGLISH: "Translation files will be classified by language locale, such as zh-cn",
@@ -2433,6 +2465,396 @@ def get_translations():
                 ENGLISH: "Translation files saved",
                 CHINESE: "保存翻译文件"
             },
+            # 图像提取相关
+            "extract_image_title": {
+                ENGLISH: "Extract Images",
+                CHINESE: "提取图像"
+            },
+            "image_classification_method": {
+                ENGLISH: "Image Classification Method",
+                CHINESE: "图像分类方法"
+            },
+            "by_dimensions": {
+                ENGLISH: "By Dimensions",
+                CHINESE: "按尺寸"
+            },
+            "by_image_format": {
+                ENGLISH: "By Format",
+                CHINESE: "按图片格式"
+            },
+            "info_dimensions_classification": {
+                ENGLISH: "Images will be classified by their longest side, such as 0-64px or 257-512px",
+                CHINESE: "图像将按最长边尺寸分类存储，如 0-64px、257-512px"
+            },
+            "info_image_format_classification": {
+                ENGLISH: "Images will be classified by format, such as PNG, JFIF or GIF",
+                CHINESE: "图像将按格式分类存储，如 PNG、JFIF、GIF"
+            },
+            "info_image_no_classification": {
+                ENGLISH: "Images will be saved directly to the main directory without classification",
+                CHINESE: "图像将直接输出到主目录，无需分类"
+            },
+            "block_avatar_images": {
+                ENGLISH: "Skip Avatar Images",
+                CHINESE: "跳过头像图片"
+            },
+            "block_avatar_images_info": {
+                ENGLISH: "Do not extract WebP avatars and thumbnails",
+                CHINESE: "不提取WebP格式的头像和缩略图"
+            },
+            "images_folder": {
+                ENGLISH: "Images folder",
+                CHINESE: "图像总文件夹"
+            },
+            "images_category": {
+                ENGLISH: "Image files",
+                CHINESE: "图像文件"
+            },
+            "initializing_image_extractor": {
+                ENGLISH: "Initializing image extractor...",
+                CHINESE: "正在初始化图像提取器..."
+            },
+            "starting_image_extraction": {
+                ENGLISH: "Starting image extraction...",
+                CHINESE: "开始图像提取..."
+            },
+            "saving_image_history": {
+                ENGLISH: "Saving image extraction history...",
+                CHINESE: "正在保存图像提取历史记录..."
+            },
+            "image_extraction_complete": {
+                ENGLISH: "Image extraction complete! Found {} images, successfully saved {} files (took {:.1f} seconds)",
+                CHINESE: "图像提取完成! 发现{}个图像，成功保存{}个文件 (耗时{:.1f}秒)"
+            },
+            "image_extraction_failed": {
+                ENGLISH: "Image extraction failed: {}",
+                CHINESE: "图像提取失败: {}"
+            },
+            "images_found": {
+                ENGLISH: "Images found",
+                CHINESE: "发现图像"
+            },
+            "images_saved": {
+                ENGLISH: "Images saved",
+                CHINESE: "保存图像"
+            },
+            "write_speed": {
+                ENGLISH: "Write speed",
+                CHINESE: "写入速度"
+            },
+            # 纹理提取相关
+            "extract_texture_title": {
+                ENGLISH: "Extract Textures",
+                CHINESE: "提取纹理"
+            },
+            "texture_classification_method": {
+                ENGLISH: "Texture Classification Method",
+                CHINESE: "纹理分类方法"
+            },
+            "by_texture_format": {
+                ENGLISH: "By Compression Format",
+                CHINESE: "按压缩格式"
+            },
+            "info_texture_format_classification": {
+                ENGLISH: "Textures will be classified by compression format, such as BC1, BC3 or ASTC",
+                CHINESE: "纹理将按压缩格式分类存储，如 BC1、BC3、ASTC"
+            },
+            "info_texture_dimensions_classification": {
+                ENGLISH: "Textures will be classified by their longest side, such as 0-64px or 257-512px",
+                CHINESE: "纹理将按最长边尺寸分类存储，如 0-64px、257-512px"
+            },
+            "info_texture_no_classification": {
+                ENGLISH: "Textures will be saved directly to the main directory without classification",
+                CHINESE: "纹理将直接输出到主目录，无需分类"
+            },
+            "decode_textures_png": {
+                ENGLISH: "Decode to PNG",
+                CHINESE: "解码为PNG"
+            },
+            "decode_textures_png_info": {
+                ENGLISH: "Also decode BC1-BC5 and uncompressed textures to PNG next to the KTX file",
+                CHINESE: "同时把BC1-BC5和未压缩纹理解码为PNG，保存在KTX文件旁边"
+            },
+            "decode_textures_unavailable_info": {
+                ENGLISH: "Requires NumPy, which is not installed; textures are saved as KTX only",
+                CHINESE: "需要安装NumPy，当前只保存KTX文件"
+            },
+            "decode_all_mips": {
+                ENGLISH: "Decode All Mip Levels",
+                CHINESE: "解码所有Mip级别"
+            },
+            "decode_all_mips_info": {
+                ENGLISH: "Write a PNG for every mip level instead of only the full-size level",
+                CHINESE: "为每个Mip级别输出PNG，而不是只输出原始尺寸"
+            },
+            "textures_folder": {
+                ENGLISH: "Textures folder",
+                CHINESE: "纹理总文件夹"
+            },
+            "textures_category": {
+                ENGLISH: "Texture files",
+                CHINESE: "纹理文件"
+            },
+            "initializing_texture_extractor": {
+                ENGLISH: "Initializing texture extractor...",
+                CHINESE: "正在初始化纹理提取器..."
+            },
+            "texture_decode_unavailable": {
+                ENGLISH: "NumPy is not installed, textures will only be saved as KTX files",
+                CHINESE: "未安装NumPy，纹理将只保存为KTX文件"
+            },
+            "starting_texture_extraction": {
+                ENGLISH: "Starting texture extraction...",
+                CHINESE: "开始纹理提取..."
+            },
+            "decoding_textures": {
+                ENGLISH: "Decoding {} textures to PNG...",
+                CHINESE: "正在把{}个纹理解码为PNG..."
+            },
+            "saving_texture_history": {
+                ENGLISH: "Saving texture extraction history...",
+                CHINESE: "正在保存纹理提取历史记录..."
+            },
+            "texture_extraction_complete": {
+                ENGLISH: "Texture extraction complete! Found {} textures, successfully saved {} files (took {:.1f} seconds)",
+                CHINESE: "纹理提取完成! 发现{}个纹理，成功保存{}个文件 (耗时{:.1f}秒)"
+            },
+            "texture_extraction_failed": {
+                ENGLISH: "Texture extraction failed: {}",
+                CHINESE: "纹理提取失败: {}"
+            },
+            "textures_found": {
+                ENGLISH: "Textures found",
+                CHINESE: "发现纹理"
+            },
+            "textures_saved": {
+                ENGLISH: "Textures saved",
+                CHINESE: "保存纹理"
+            },
+            "textures_decoded": {
+                ENGLISH: "Textures decoded to PNG",
+                CHINESE: "解码为PNG的纹理"
+            },
+            "texture_decode_errors": {
+                ENGLISH: "Decode errors",
+                CHINESE: "解码失败"
+            },
+            # 网格提取相关
+            "extract_meshes": {
+                ENGLISH: "Meshes",
+                CHINESE: "网格"
+            },
+            "extract_mesh_title": {
+                ENGLISH: "Extract Meshes",
+                CHINESE: "提取网格"
+            },
+            "mesh_classification_method": {
+                ENGLISH: "Mesh Classification Method",
+                CHINESE: "网格分类方法"
+            },
+            "by_mesh_version": {
+                ENGLISH: "By Mesh Version",
+                CHINESE: "按网格版本"
+            },
+            "info_mesh_version_classification": {
+                ENGLISH: "Meshes will be classified by version, such as v2.00 or v4.00",
+                CHINESE: "网格将按版本分类存储，如 v2.00、v4.00"
+            },
+            "info_mesh_no_classification": {
+                ENGLISH: "Meshes will be saved directly to the main directory without classification",
+                CHINESE: "网格将直接输出到主目录，无需分类"
+            },
+            "convert_meshes_obj": {
+                ENGLISH: "Convert to OBJ",
+                CHINESE: "转换为OBJ"
+            },
+            "convert_meshes_obj_info": {
+                ENGLISH: "Also convert v1.00-v5.00 meshes to OBJ next to the mesh file",
+                CHINESE: "同时把v1.00-v5.00网格转换为OBJ，保存在网格文件旁边"
+            },
+            "meshes_folder": {
+                ENGLISH: "Meshes folder",
+                CHINESE: "网格总文件夹"
+            },
+            "meshes_category": {
+                ENGLISH: "Mesh files",
+                CHINESE: "网格文件"
+            },
+            "mesh_history": {
+                ENGLISH: "Mesh files",
+                CHINESE: "网格文件"
+            },
+            "initializing_mesh_extractor": {
+                ENGLISH: "Initializing mesh extractor...",
+                CHINESE: "正在初始化网格提取器..."
+            },
+            "starting_mesh_extraction": {
+                ENGLISH: "Starting mesh extraction...",
+                CHINESE: "开始网格提取..."
+            },
+            "converting_meshes": {
+                ENGLISH: "Converting {} meshes to OBJ...",
+                CHINESE: "正在把{}个网格转换为OBJ..."
+            },
+            "saving_mesh_history": {
+                ENGLISH: "Saving mesh extraction history...",
+                CHINESE: "正在保存网格提取历史记录..."
+            },
+            "mesh_extraction_complete": {
+                ENGLISH: "Mesh extraction complete! Found {} meshes, successfully saved {} files (took {:.1f} seconds)",
+                CHINESE: "网格提取完成! 发现{}个网格，成功保存{}个文件 (耗时{:.1f}秒)"
+            },
+            "mesh_extraction_failed": {
+                ENGLISH: "Mesh extraction failed: {}",
+                CHINESE: "网格提取失败: {}"
+            },
+            "meshes_found": {
+                ENGLISH: "Meshes found",
+                CHINESE: "发现网格"
+            },
+            "meshes_saved": {
+                ENGLISH: "Meshes saved",
+                CHINESE: "保存网格"
+            },
+            "meshes_converted": {
+                ENGLISH: "Meshes converted to OBJ",
+                CHINESE: "转换为OBJ的网格"
+            },
+            "mesh_conversion_errors": {
+                ENGLISH: "Conversion errors",
+                CHINESE: "转换失败"
+            },
+            # 模型提取相关
+            "extract_models": {
+                ENGLISH: "Models",
+                CHINESE: "模型"
+            },
+            "extract_model_title": {
+                ENGLISH: "Extract Models",
+                CHINESE: "提取模型"
+            },
+            "model_classification_method": {
+                ENGLISH: "Model Classification Method",
+                CHINESE: "模型分类方法"
+            },
+            "by_main_class": {
+                ENGLISH: "By Main Instance Class",
+                CHINESE: "按主要实例类型"
+            },
+            "info_main_class_classification": {
+                ENGLISH: "Models will be classified by their most common instance class, such as Part or MeshPart",
+                CHINESE: "模型将按实例最多的类分类存储，如 Part、MeshPart"
+            },
+            "info_model_no_classification": {
+                ENGLISH: "Models will be saved directly to the main directory without classification",
+                CHINESE: "模型将直接输出到主目录，无需分类"
+            },
+            "write_model_index": {
+                ENGLISH: "Write Model Index",
+                CHINESE: "写入模型索引"
+            },
+            "write_model_index_info": {
+                ENGLISH: "Record instance class counts and chunk offsets of every model in model_index.json",
+                CHINESE: "把每个模型的实例类型数量和块位置写入 model_index.json"
+            },
+            "models_folder": {
+                ENGLISH: "Models folder",
+                CHINESE: "模型总文件夹"
+            },
+            "models_category": {
+                ENGLISH: "Model files",
+                CHINESE: "模型文件"
+            },
+            "initializing_model_extractor": {
+                ENGLISH: "Initializing model extractor...",
+                CHINESE: "正在初始化模型提取器..."
+            },
+            "starting_model_extraction": {
+                ENGLISH: "Starting model extraction...",
+                CHINESE: "开始模型提取..."
+            },
+            "model_index_saved": {
+                ENGLISH: "Model index updated ({} models)",
+                CHINESE: "模型索引已更新（{}个模型）"
+            },
+            "saving_model_history": {
+                ENGLISH: "Saving model extraction history...",
+                CHINESE: "正在保存模型提取历史记录..."
+            },
+            "model_extraction_complete": {
+                ENGLISH: "Model extraction complete! Found {} models, successfully saved {} files (took {:.1f} seconds)",
+                CHINESE: "模型提取完成! 发现{}个模型，成功保存{}个文件 (耗时{:.1f}秒)"
+            },
+            "model_extraction_failed": {
+                ENGLISH: "Model extraction failed: {}",
+                CHINESE: "模型提取失败: {}"
+            },
+            "models_found": {
+                ENGLISH: "Models found",
+                CHINESE: "发现模型"
+            },
+            "models_saved": {
+                ENGLISH: "Models saved",
+                CHINESE: "保存模型"
+            },
+            "instances_indexed": {
+                ENGLISH: "Instances indexed",
+                CHINESE: "已索引实例"
+            },
+            "top_instance_classes": {
+                ENGLISH: "Top instance classes",
+                CHINESE: "主要实例类型"
+            },
+            "model_index_errors": {
+                ENGLISH: "Models without index",
+                CHINESE: "无法索引的模型"
+            },
+            # 监视缓存相关
+            "watch_cache": {
+                ENGLISH: "Watch",
+                CHINESE: "监视缓存"
+            },
+            "watch_cache_tooltip": {
+                ENGLISH: "Extract new cache entries automatically while playing, using the settings on this page",
+                CHINESE: "游戏时按本页设置自动提取新出现的缓存项目"
+            },
+            "stop_watching": {
+                ENGLISH: "Stop watching",
+                CHINESE: "停止监视"
+            },
+            "watching_cache": {
+                ENGLISH: "Watching cache for new assets...",
+                CHINESE: "正在监视缓存中的新资源..."
+            },
+            "watch_batch_label": {
+                ENGLISH: "Watching - last batch: {} new items",
+                CHINESE: "监视中 - 上一批: {} 个新项目"
+            },
+            "watch_started": {
+                ENGLISH: "Started watching the cache, {} existing entries will be skipped",
+                CHINESE: "开始监视缓存，已有的 {} 个项目将被跳过"
+            },
+            "watch_new_items": {
+                ENGLISH: "Found {} new cache entries, extracting...",
+                CHINESE: "发现 {} 个新缓存项目，正在提取..."
+            },
+            "watch_batch_failed": {
+                ENGLISH: "Failed to process new cache entries: {}",
+                CHINESE: "处理新缓存项目失败: {}"
+            },
+            "watch_stopped": {
+                ENGLISH: "Stopped watching the cache, {} new entries processed",
+                CHINESE: "已停止监视缓存，共处理 {} 个新项目"
+            },
+            # 阶段耗时相关
+            "stage_breakdown": {
+                ENGLISH: "Stage timings (per-item stages are summed across workers):",
+                CHINESE: "各阶段耗时（逐项目阶段为所有工作线程/进程的累计值）:"
+            },
+            "stage_timing": {
+                ENGLISH: "  {}: {:.2f} s ({} times)",
+                CHINESE: "  {}: {:.2f} 秒 ({} 次)"
+            },
             
             # 捐款相关翻译
             "donation": {
@@ -2598,6 +3020,10 @@ def get_translations():
                 ENGLISH: "Segments downloaded",
                 CHINESE: "下载片段"
             },
+            "segments_resumed": {
+                ENGLISH: "Segments resumed",
+                CHINESE: "续传片段"
+            },
             "videos_merged": {
                 ENGLISH: "Videos merged",
                 CHINESE: "合并视频"
@@ -2658,6 +3084,22 @@ def get_translations():
                 ENGLISH: "Auto cleanup disabled",
                 CHINESE: "已禁用自动清理"
             },
+            "resume_downloads": {
+                ENGLISH: "Resume Interrupted Downloads",
+                CHINESE: "断点续传"
+            },
+            "resume_downloads_desc": {
+                ENGLISH: "Keep downloaded segments on disk so interrupted videos can resume (writes every segment twice)",
+                CHINESE: "将已下载的片段保存到磁盘，中断的视频可以继续下载（每个片段会额外写入一次）"
+            },
+            "resume_downloads_enabled": {
+                ENGLISH: "Resume downloads enabled",
+                CHINESE: "已启用断点续传"
+            },
+            "resume_downloads_disabled": {
+                ENGLISH: "Resume downloads disabled",
+                CHINESE: "已禁用断点续传"
+            },
             "settings_updated": {
                 ENGLISH: "Settings Updated",
                 CHINESE: "设置已更新"
@@ -2715,6 +3157,10 @@ def get_translations():
                 ENGLISH: "Segments downloaded: {} items",
                 CHINESE: "下载片段：{} 个"
             },
+            "video_segments_resumed": {
+                ENGLISH: "Segments resumed: {} items",
+                CHINESE: "续传片段：{} 个"
+            },
             "video_merged_count": {
                 ENGLISH: "Videos merged: {} items",
                 CHINESE: "合并视频：{} 个"
@@ -3,4 +3,5 @@
 Logging module
 """
 
-from .central_log_handler import CentralLogHandler 
\ No newline at end of file
+from .central_log_handler import CentralLogHandler 
+from .log_file_writer import AsyncLogWriter
@@ -6,23 +6,59 @@ Central Log Handling System - Manages log display across all interfaces
 """
 
 import os
+import atexit
 import datetime
 import logging as std_logging  # 明确导入标准库的logging
+from collections import deque
+
+from src.logging.log_file_writer import AsyncLogWriter
 
 # 设置日志记录
 std_logging.basicConfig(level=std_logging.INFO, format='%(message)s')
 logger = std_logging.getLogger(__name__)
 
+# 时间戳前缀长度，格式为 "[YYYY-MM-DD HH:MM:SS] "
+_TIMESTAMP_LENGTH = 22
+
+# 消息类型前缀对应的颜色
+_PREFIX_COLORS = (
+    ("[SUCCESS] ", "#42ff5e"),  # 成功消息 - 绿色
+    ("[WARNING] ", "#FF8C00"),  # 警告消息 - 橙色
+    ("[ERROR] ", "#FF0000"),    # 错误消息 - 红色
+)
+
+
+def get_entry_color(entry, theme):
+    """
+    根据纯文本日志条目的类型前缀和主题获取显示颜色
+    
+    Args:
+        entry: 纯文本日志条目
+        theme: 当前主题
+        
+    Returns:
+        str: 颜色值
+    """
+    for text_prefix, color in _PREFIX_COLORS:
+        if entry.startswith(text_prefix, _TIMESTAMP_LENGTH):
+            return color
+    # 根据当前主题设置默认颜色
+    return "black" if theme == "light" else "white"
+
+
 class CentralLogHandler:
     """中央日志处理系统，管理所有界面的日志显示"""
 
     _instance = None  # 单例实例
-    _log_entries = []  # 存储所有日志条目
-    _text_edits = []   # 所有要更新的TextEdit控件
     _max_entries = 2000  # 最大日志条目数
+    _log_entries = deque(maxlen=_max_entries)  # 存储所有日志条目（环形缓冲区）
+    _text_edits = []   # 所有要更新的TextEdit控件
+    _view_model = None  # 虚拟化日志视图共享的模型
     _theme = "auto"    # 默认主题
     _config_manager = None  # 配置管理器
     _log_file_path = None  # 日志文件路径
+    _file_writer = None  # 后台日志文件写入器
+    _shutdown_registered = False  # 是否已注册退出时关闭写入线程
 
     @classmethod
     def getInstance(cls):
@@ -45,61 +81,43 @@ class CentralLogHandler:
         
         os.makedirs(log_dir, exist_ok=True)
         self._log_file_path = os.path.join(log_dir, f"app_log_{datetime.datetime.now().strftime('%Y%m%d')}.txt")
+        
+        # 启动后台写入线程，日志文件I/O不再占用GUI线程
+        if self._file_writer is not None:
+            self._file_writer.close()
+        self._file_writer = AsyncLogWriter(log_dir)
+        # 重复初始化时只注册一次
+        if not CentralLogHandler._shutdown_registered:
+            atexit.register(self.shutdown)
+            CentralLogHandler._shutdown_registered = True
+
+    def get_view_model(self):
+        """获取虚拟化日志视图共享的列表模型"""
+        if self._view_model is None:
+            from src.logging.log_view_model import LogListModel
+            CentralLogHandler._view_model = LogListModel(self._log_entries, self._theme)
+        return self._view_model
 
     def register_text_edit(self, text_edit):
         """注册TextEdit控件以接收日志更新"""
+        # 虚拟化日志视图直接共享日志模型，无需逐条追加
+        if hasattr(text_edit, 'setModel'):
+            text_edit.setModel(self.get_view_model())
+            return
+            
         if text_edit not in self._text_edits:
             self._text_edits.append(text_edit)
-            # 初始化显示已有日志
-            text_edit.clear()
             # 根据当前主题重新生成所有日志条目
             self._refresh_logs_in_text_edit(text_edit)
 
     def _refresh_logs_in_text_edit(self, text_edit):
         """根据当前主题刷新TextEdit中的所有日志"""
         text_edit.clear()
-        for entry in self._log_entries:
-            # 解析纯文本日志以提取前缀和消息
-            parts = entry.split("] ", 1)
-            if len(parts) == 2:
-                timestamp = parts[0] + "] "
-                rest = parts[1]
-                
-                # 检查前缀
-                prefix = ""
-                message = rest
-                # 移除emoji，改为文本前缀
-                if rest.startswith("✓ "):
-                    prefix = "[SUCCESS] "
-                    message = rest[2:]
-                elif rest.startswith("⚠ "):
-                    prefix = "[WARNING] "
-                    message = rest[2:]
-                elif rest.startswith("✗ "):
-                    prefix = "[ERROR] "
-                    message = rest[2:]
-                
-                # 根据前缀和当前主题确定颜色
-                if prefix == "[SUCCESS] ":
-                    color = "#42ff5e"  # 成功消息 - 绿色
-                elif prefix == "[WARNING] ":
-                    color = "#FF8C00"  # 警告消息 - 橙色
-                elif prefix == "[ERROR] ":
-                    color = "#FF0000"  # 错误消息 - 红色
-                else:
-                    # 根据当前主题设置默认颜色
-                    if self._theme == "light":
-                        color = "black"  # 浅色模式下默认黑色
-                    else:
-                        color = "white"  # 深色模式下默认白色
-                
-                # 创建HTML格式的日志条目
-                html_entry = f'<span style="color:{color}">{timestamp}{prefix}{message}</span>'
-                text_edit.append(html_entry)
-            else:
-                # 如果无法解析，直接添加原始条目
-                text_edit.append(entry)
-        
+        if self._log_entries:
+            text_edit.append("<br>".join(
+                f'<span style="color:{get_entry_color(entry, self._theme)}">{entry}</span>'
+                for entry in self._log_entries
+            ))
         text_edit.ensureCursorVisible()
 
     def set_theme(self, theme):
@@ -107,6 +125,9 @@ class CentralLogHandler:
         # 只有当主题实际变化时才进行刷新
         if self._theme != theme:
             self._theme = theme
+            # 虚拟化视图只重绘可见行
+            if self._view_model is not None:
+                self._view_model.set_theme(theme)
             # 刷新所有TextEdit控件中的日志
             for text_edit in self._text_edits:
                 try:
@@ -114,78 +135,116 @@ class CentralLogHandler:
                 except Exception:
                     pass  # 忽略刷新失败的控件
 
-    def add_log(self, message, prefix=""):
-        """添加日志条目并更新所有TextEdit控件"""
+    def _format_entry(self, message, prefix=""):
+        """格式化单条日志，返回(HTML条目, 纯文本条目)"""
         # 添加时间戳
         timestamp = datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S] ")
         
-        # 根据前缀确定消息类型和颜色
-        # 根据当前主题设置默认颜色
-        if self._theme == "light":
-            color = "black"  # 浅色模式下默认黑色
-        else:
-            color = "white"  # 深色模式下默认白色
-            
-        # 特殊消息类型覆盖默认颜色，并移除emoji，改为文本前缀
+        # 移除emoji，改为文本前缀
         text_prefix = ""
         if prefix == "✓ ":
-            color = "#42ff5e"  # 成功消息 - 绿色
             text_prefix = "[SUCCESS] "
         elif prefix == "⚠ ":
-            color = "#FF8C00"  # 警告消息 - 橙色
             text_prefix = "[WARNING] "
         elif prefix == "✗ ":
-            color = "#FF0000"  # 错误消息 - 红色
             text_prefix = "[ERROR] "
             
-        # 创建带颜色的HTML格式日志条目
-        html_entry = f'<span style="color:{color}">{timestamp}{text_prefix}{message}</span>'
         plain_entry = f"{timestamp}{text_prefix}{message}"
+        # 创建带颜色的HTML格式日志条目
+        html_entry = f'<span style="color:{get_entry_color(plain_entry, self._theme)}">{plain_entry}</span>'
+        return html_entry, plain_entry
+
+    def add_log(self, message, prefix=""):
+        """添加日志条目并更新所有TextEdit控件"""
+        self.add_logs([(message, prefix)])
+
+    def add_logs(self, entries):
+        """
+        批量添加日志条目，每个TextEdit控件只追加一次
         
-        # 添加到日志条目列表 (保存纯文本版本用于后续处理)
-        self._log_entries.append(plain_entry)
-        
-        # 限制日志条目数量
-        if len(self._log_entries) > self._max_entries:
-            self._log_entries = self._log_entries[-self._max_entries:]
+        Args:
+            entries: [(消息, 前缀), ...] 列表
+        """
+        if not entries:
+            return
             
-        # 更新所有TextEdit控件
-        for text_edit in self._text_edits:
-            try:
-                text_edit.append(html_entry)
-                text_edit.ensureCursorVisible()
-            except Exception:
-                pass  # 忽略更新失败的控件
-                
+        html_entries = []
+        plain_entries = []
+        for message, prefix in entries:
+            html_entry, plain_entry = self._format_entry(message, prefix)
+            html_entries.append(html_entry)
+            plain_entries.append(plain_entry)
+        
         # 如果启用了日志保存，保存到文件
-        self._save_log_to_file(plain_entry)
+        self._save_logs_to_file(plain_entries)
+        
+        # 添加到环形缓冲区 (保存纯文本版本用于后续处理)，超出容量时自动丢弃最旧条目
+        if self._view_model is not None:
+            self._view_model.append_entries(plain_entries)
+        else:
+            self._log_entries.extend(plain_entries)
+            
+        # 更新所有TextEdit控件，整批合并为一次追加
+        if self._text_edits:
+            html_block = "<br>".join(html_entries)
+            for text_edit in self._text_edits:
+                try:
+                    text_edit.append(html_block)
+                    text_edit.ensureCursorVisible()
+                except Exception:
+                    pass  # 忽略更新失败的控件
 
     def clear_logs(self):
         """清除所有日志"""
-        self._log_entries.clear()
+        if self._view_model is not None:
+            self._view_model.clear()
+        else:
+            self._log_entries.clear()
         for text_edit in self._text_edits:
             try:
                 text_edit.clear()
             except Exception:
                 pass
                 
-    def _save_log_to_file(self, log_entry):
-        """将日志保存到文件"""
+    def _save_logs_to_file(self, log_entries):
+        """将日志交给后台写入线程保存到文件"""
         if not self._config_manager or not self._config_manager.get("save_logs", False):
             return
             
-        if not self._log_file_path:
+        if not self._file_writer:
             return
             
-        try:
-            with open(self._log_file_path, 'a', encoding='utf-8') as f:
-                f.write(f"{log_entry}\n")
-        except Exception as e:
-            # 避免递归错误，不记录保存日志时的错误
-            pass
+        for log_entry in log_entries:
+            self._file_writer.write(log_entry)
+
+    def flush_logs(self, timeout=2.0):
+        """等待后台写入线程把已提交的日志写入磁盘"""
+        if self._file_writer:
+            return self._file_writer.flush(timeout)
+        return True
+
+    def get_file_writer_stats(self):
+        """获取日志文件写入吞吐量统计"""
+        if self._file_writer:
+            return self._file_writer.get_stats()
+        return {}
+
+    def shutdown(self):
+        """刷新并停止后台日志写入线程"""
+        if self._file_writer:
+            stats = self._file_writer.get_stats()
+            self._file_writer.close()
+            self._file_writer = None
+            logger.debug(
+                f"日志写入统计: {stats['lines_written']} 行, {stats['bytes_written']} 字节, "
+                f"{stats['lines_per_second']:.0f} 行/秒, 丢弃 {stats['dropped']} 行"
+            )
             
     def save_crash_log(self, error_info, traceback_info):
         """保存崩溃日志到文件，如果Debug模式开启"""
+        # 无论是否开启Debug模式，都确保崩溃前的日志已写入日志文件
+        self.flush_logs()
+        
         # 检查Debug模式是否开启
         if not self._config_manager or not self._config_manager.get("debug_mode_enabled", True):
             return None
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+异步日志文件写入器 - 在后台线程中批量写入日志文件
+Async Log File Writer - Writes log files in batches from a background thread
+"""
+
+import os
+import time
+import queue
+import datetime
+import threading
+from typing import Dict
+
+
+class AsyncLogWriter:
+    """
+    异步日志文件写入器
+
+    GUI线程只把日志行放入有界队列；后台线程批量写入并定期刷新到磁盘，
+    按日期切换日志文件，单个文件超过大小上限时轮转为 .1/.2/... 备份。
+    队列满时丢弃新日志而不是阻塞界面，并记录丢弃数量。
+    """
+
+    _FLUSH = object()  # 刷新请求标记
+    _STOP = object()   # 停止请求标记
+    _MAX_BATCH_LINES = 1000  # 单次写入的最大行数
+
+    def __init__(self, log_dir: str, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 5,
+                 flush_interval: float = 1.0, queue_size: int = 10000):
+        """
+        初始化异步日志写入器
+
+        Args:
+            log_dir: 日志目录
+            max_bytes: 单个日志文件最大字节数，超过后轮转
+            backup_count: 每天保留的轮转备份数量
+            flush_interval: 定期刷新间隔(秒)
+            queue_size: 队列最大长度
+        """
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._file_date = None
+        self._file_size = 0
+        self._last_flush = time.monotonic()
+
+        # 吞吐量统计
+        self._lines_written = 0
+        self._bytes_written = 0
+        self._dropped = 0
+        self._write_time = 0.0
+        self._stats_lock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._run, name="AsyncLogWriter", daemon=True)
+        self._thread.start()
+
+    @property
+    def current_path(self) -> str:
+        """当前日期对应的日志文件路径"""
+        return self._path_for_date(datetime.date.today())
+
+    def write(self, line: str) -> bool:
+        """
+        提交一行日志（不阻塞）
+
+        Returns:
+            bool: 是否成功放入队列
+        """
+        try:
+            self._queue.put_nowait(line)
+            return True
+        except queue.Full:
+            with self._stats_lock:
+                self._dropped += 1
+            return False
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        等待队列中已有的日志写入磁盘
+
+        Returns:
+            bool: 是否在超时前完成
+        """
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        try:
+            self._queue.put((self._FLUSH, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 2.0):
+        """刷新剩余日志并停止后台线程"""
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, float]:
+        """获取写入吞吐量统计"""
+        with self._stats_lock:
+            write_time = self._write_time
+            return {
+                "lines_written": self._lines_written,
+                "bytes_written": self._bytes_written,
+                "dropped": self._dropped,
+                "queued": self._queue.qsize(),
+                "write_time": write_time,
+                "lines_per_second": self._lines_written / write_time if write_time > 0 else 0.0,
+                "bytes_per_second": self._bytes_written / write_time if write_time > 0 else 0.0,
+            }
+
+    def _path_for_date(self, date: datetime.date, index: int = 0) -> str:
+        """获取指定日期（和轮转序号）的日志文件路径"""
+        suffix = f".{index}" if index else ""
+        return os.path.join(self.log_dir, f"app_log_{date.strftime('%Y%m%d')}{suffix}.txt")
+
+    def _run(self):
+        """后台线程主循环"""
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_file()
+                continue
+
+            # 尽量多取一些，合并为一次写入
+            lines = []
+            control = None
+            while True:
+                if item is self._STOP or isinstance(item, tuple):
+                    control = item
+                    break
+                lines.append(item)
+                if len(lines) >= self._MAX_BATCH_LINES:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if lines:
+                self._write_lines(lines)
+
+            if control is self._STOP:
+                self._flush_file()
+                self._close_file()
+                return
+            if control is not None:
+                self._flush_file()
+                control[1].set()
+            elif time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_file()
+
+    def _write_lines(self, lines):
+        """写入一批日志行"""
+        start = time.perf_counter()
+        try:
+            self._ensure_file()
+            data = "\n".join(lines) + "\n"
+            self._file.write(data)
+            size = len(data.encode('utf-8'))
+            self._file_size += size
+            if self._file_size >= self.max_bytes:
+                self._rotate()
+        except Exception:
+            # 避免递归错误，不记录写日志时的错误
+            return
+        finally:
+            elapsed = time.perf_counter() - start
+
+        with self._stats_lock:
+            self._lines_written += len(lines)
+            self._bytes_written += size
+            self._write_time += elapsed
+
+    def _ensure_file(self):
+        """确保打开了当天的日志文件，日期变化时切换文件"""
+        today = datetime.date.today()
+        if self._file is not None and self._file_date == today:
+            return
+        self._close_file()
+        os.makedirs(self.log_dir, exist_ok=True)
+        path = self._path_for_date(today)
+        self._file = open(path, 'a', encoding='utf-8')
+        self._file_date = today
+        self._file_size = os.path.getsize(path)
+
+    def _rotate(self):
+        """按大小轮转: app_log_DATE.txt -> app_log_DATE.1.txt -> ..."""
+        date = self._file_date
+        self._close_file()
+        for index in range(self.backup_count - 1, 0, -1):
+            src = self._path_for_date(date, index)
+            if os.path.exists(src):
+                os.replace(src, self._path_for_date(date, index + 1))
+        if self.backup_count > 0:
+            os.replace(self._path_for_date(date), self._path_for_date(date, 1))
+        else:
+            os.remove(self._path_for_date(date))
+
+    def _flush_file(self):
+        """把缓冲内容刷新到磁盘"""
+        self._last_flush = time.monotonic()
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except Exception:
+                pass
+
+    def _close_file(self):
+        """关闭当前日志文件"""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+        self._file = None
+        self._file_date = None
+        self._file_size = 0
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+虚拟化日志视图 - 基于模型/视图的日志显示，只绘制可见行
+Virtualized Log View - Model/view based log display that only paints visible rows
+"""
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QBrush, QColor, QKeySequence
+from PyQt5.QtWidgets import QAbstractItemView, QApplication
+
+from qfluentwidgets import ListView
+
+from src.logging.central_log_handler import get_entry_color
+
+
+class LogListModel(QAbstractListModel):
+    """
+    日志列表模型
+
+    直接包装中央日志处理器的环形缓冲区(deque)。颜色在绘制时根据当前主题计算，
+    因此切换主题只需发出一次dataChanged信号，由视图重绘可见行。
+    """
+
+    def __init__(self, entries, theme="auto", parent=None):
+        """
+        初始化日志列表模型
+
+        Args:
+            entries: 存放纯文本日志条目的deque（带maxlen）
+            theme: 当前主题
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._entries = entries
+        self._theme = theme
+        self._brush_cache = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._entries):
+            return None
+
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return entry
+        if role == Qt.ForegroundRole:
+            color = get_entry_color(entry, self._theme)
+            brush = self._brush_cache.get(color)
+            if brush is None:
+                brush = self._brush_cache[color] = QBrush(QColor(color))
+            return brush
+        return None
+
+    def append_entries(self, new_entries):
+        """追加日志条目，超出容量时先移除最旧的行"""
+        if not new_entries:
+            return
+
+        maxlen = self._entries.maxlen
+        if maxlen is not None:
+            if len(new_entries) > maxlen:
+                new_entries = new_entries[-maxlen:]
+            overflow = len(self._entries) + len(new_entries) - maxlen
+            if overflow > 0:
+                self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+                for _ in range(overflow):
+                    self._entries.popleft()
+                self.endRemoveRows()
+
+        start = len(self._entries)
+        self.beginInsertRows(QModelIndex(), start, start + len(new_entries) - 1)
+        self._entries.extend(new_entries)
+        self.endInsertRows()
+
+    def clear(self):
+        """清空所有日志条目"""
+        self.beginResetModel()
+        self._entries.clear()
+        self.endResetModel()
+
+    def set_theme(self, theme):
+        """更新主题，只通知视图重绘前景色"""
+        self._theme = theme
+        count = len(self._entries)
+        if count:
+            self.dataChanged.emit(self.index(0), self.index(count - 1), [Qt.ForegroundRole])
+
+
+class LogListView(ListView):
+    """
+    虚拟化日志视图
+
+    所有行高度一致，Qt只为可见行调用绘制；新日志到达时，
+    如果用户停留在底部则自动滚动，否则保持当前位置。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setWordWrap(False)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._follow_tail = True
+
+    def setModel(self, model):
+        """设置模型并监听行插入以实现自动滚动"""
+        old_model = self.model()
+        if old_model is model:
+            return
+        if old_model is not None:
+            try:
+                old_model.rowsAboutToBeInserted.disconnect(self._onRowsAboutToBeInserted)
+                old_model.rowsInserted.disconnect(self._onRowsInserted)
+            except TypeError:
+                pass
+        super().setModel(model)
+        if model is not None:
+            model.rowsAboutToBeInserted.connect(self._onRowsAboutToBeInserted)
+            model.rowsInserted.connect(self._onRowsInserted)
+        self.scrollToBottom()
+
+    def _onRowsAboutToBeInserted(self, parent, first, last):
+        scroll_bar = self.verticalScrollBar()
+        self._follow_tail = scroll_bar.value() >= scroll_bar.maximum()
+
+    def _onRowsInserted(self, parent, first, last):
+        if self._follow_tail:
+            self.scrollToBottom()
+
+    def ensureCursorVisible(self):
+        """兼容TextEdit接口：滚动到最新日志"""
+        self.scrollToBottom()
+
+    def append(self, text):
+        """兼容TextEdit接口：追加的文本写入中央日志"""
+        from src.logging.central_log_handler import CentralLogHandler
+        CentralLogHandler.getInstance().add_log(text)
+
+    def keyPressEvent(self, event):
+        """支持复制选中的日志行"""
+        if event.matches(QKeySequence.Copy):
+            rows = sorted(index.row() for index in self.selectedIndexes())
+            model = self.model()
+            if rows and model is not None:
+                lines = [model.data(model.index(row)) or "" for row in rows]
+                QApplication.clipboard().setText("\n".join(lines))
+            return
+        super().keyPressEvent(event)
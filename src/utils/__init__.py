@@ -15,6 +15,8 @@ from .multiprocessing_utils import (
     create_worker_function,
     enable_multiprocessing_logging
 )
+from .download_manager import DownloadManager, DownloadStats, DownloadError, SingleFlight, get_download_manager
+from .stage_timer import StageTimer, start_trace, stop_trace, is_tracing, write_chrome_trace
 
 __all__ = [
     # 文件工具
@@ -39,5 +41,19 @@ __all__ = [
     "get_optimal_process_count",
     "chunk_list",
     "create_worker_function",
-    "enable_multiprocessing_logging"
+    "enable_multiprocessing_logging",
+    
+    # 下载管理
+    "DownloadManager",
+    "DownloadStats",
+    "DownloadError",
+    "SingleFlight",
+    "get_download_manager",
+    
+    # 阶段计时
+    "StageTimer",
+    "start_trace",
+    "stop_trace",
+    "is_tracing",
+    "write_chrome_trace"
 ] 
\ No newline at end of file
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共享下载管理器 - 字体和视频提取器共用的连接池下载引擎
+Shared Download Manager - Pooled download engine shared by the font and video extractors
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+import contextlib
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+import requests.adapters
+
+logger = logging.getLogger(__name__)
+
+# 可重试的HTTP状态码（限流和服务端错误）
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class DownloadError(IOError):
+    """下载失败"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class DownloadStats:
+    """下载统计 - 线程安全，记录请求数、重试、失败和带宽"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._requests = 0
+        self._retries = 0
+        self._failures = 0
+        self._first_start = None
+        self._last_end = None
+
+    def record_transfer(self, byte_count: int, start: float, end: float):
+        """记录一次完成的传输"""
+        with self._lock:
+            self._bytes += byte_count
+            self._requests += 1
+            if self._first_start is None or start < self._first_start:
+                self._first_start = start
+            if self._last_end is None or end > self._last_end:
+                self._last_end = end
+
+    def record_retry(self):
+        """记录一次重试"""
+        with self._lock:
+            self._retries += 1
+
+    def record_failure(self):
+        """记录一次最终失败的下载"""
+        with self._lock:
+            self._failures += 1
+
+    def get_all(self) -> Dict[str, float]:
+        """
+        获取统计信息
+
+        带宽按第一次请求开始到最后一次请求结束的时间计算，
+        并发传输的时间不会被重复计入。
+        """
+        with self._lock:
+            span = 0.0
+            if self._first_start is not None and self._last_end is not None:
+                span = max(0.0, self._last_end - self._first_start)
+            return {
+                'bytes_downloaded': self._bytes,
+                'requests': self._requests,
+                'retries': self._retries,
+                'failures': self._failures,
+                'transfer_time': span,
+                'bytes_per_second': self._bytes / span if span > 0 else 0.0,
+            }
+
+
+class SingleFlight:
+    """
+    按键合并重复请求（single flight）
+
+    同一个键只执行一次：执行期间的其他调用等待第一次调用完成并共享其结果，
+    完成后的结果在整个运行期间保留，之后的调用直接返回。执行时抛出异常的键
+    不记录结果，之后的调用会重新执行。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: Dict[Hashable, Any] = {}
+        self._pending: Dict[Hashable, threading.Event] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        执行或等待键对应的调用
+
+        Args:
+            key: 请求键（如资源ID）
+            fn: 第一次调用时执行的函数
+
+        Returns:
+            Tuple[Any, bool]: (结果, 是否共享了其他调用的结果)
+        """
+        with self._lock:
+            if key in self._results:
+                self.coalesced += 1
+                return self._results[key], True
+            event = self._pending.get(key)
+            leader = event is None
+            if leader:
+                event = self._pending[key] = threading.Event()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            event.wait()
+            with self._lock:
+                return self._results.get(key), True
+
+        try:
+            result = fn()
+            with self._lock:
+                self._results[key] = result
+            return result, False
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            event.set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
+
+
+class DownloadManager:
+    """
+    下载管理器
+
+    所有下载共用一个保持连接(keep-alive)的requests会话，按主机限制并发连接数；
+    失败时按指数退避加随机抖动重试，429/503响应的Retry-After会被遵守。
+    数据以流的方式交给调用方，下载到文件时先写入.part文件，完成后再替换。
+    """
+
+    def __init__(self, max_connections_per_host: int = 8, max_retries: int = 3, timeout: float = 30,
+                 backoff_base: float = 0.5, backoff_max: float = 8.0, chunk_size: int = 64 * 1024,
+                 user_agent: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'):
+        """
+        初始化下载管理器
+
+        Args:
+            max_connections_per_host: 每个主机的最大并发连接数
+            max_retries: 默认最大尝试次数
+            timeout: 默认请求超时时间（秒）
+            backoff_base: 退避基础时间（秒）
+            backoff_max: 单次退避的最长时间（秒）
+            chunk_size: 流式读取的块大小
+            user_agent: 请求使用的User-Agent
+        """
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.max_retries = max(1, max_retries)
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.chunk_size = chunk_size
+        self.stats = DownloadStats()
+
+        self._host_limiters: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': user_agent})
+        # 连接池大小与每主机并发数一致，保证并发请求都能复用连接
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16,
+                                                pool_maxsize=self.max_connections_per_host)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def fetch(self, url: str, **kwargs) -> Optional[bytes]:
+        """
+        下载到内存
+
+        Args:
+            url: 下载地址
+            **kwargs: 传给stream()的参数
+
+        Returns:
+            Optional[bytes]: 数据，失败时返回None
+        """
+        data = bytearray()
+
+        def collect(chunks):
+            del data[:]
+            for chunk in chunks:
+                data.extend(chunk)
+
+        if not self.stream(url, collect, **kwargs):
+            return None
+        return bytes(data)
+
+    def download_to_file(self, url: str, path: str, **kwargs) -> bool:
+        """
+        流式下载到文件，完成后才出现在目标路径
+
+        Args:
+            url: 下载地址
+            path: 目标文件路径
+            **kwargs: 传给stream()的参数
+
+        Returns:
+            bool: 是否下载成功
+        """
+        part_path = path + ".part"
+
+        def write_file(chunks):
+            with open(part_path, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+
+        if self.stream(url, write_file, **kwargs):
+            os.replace(part_path, path)
+            return True
+
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        return False
+
+    def stream(self, url: str, consume: Callable[[Iterator[bytes]], Any],
+               cancel_check: Optional[Callable[[], bool]] = None,
+               limiter=None, max_retries: Optional[int] = None, timeout: Optional[float] = None,
+               stats: Optional[DownloadStats] = None) -> bool:
+        """
+        带重试地请求URL，把响应数据块交给consume处理
+
+        Args:
+            url: 下载地址
+            consume: 接收数据块迭代器的函数，每次重试都会重新调用
+            cancel_check: 取消检查函数
+            limiter: 调用方额外的并发配额（如多个视频共享的连接数）
+            max_retries: 最大尝试次数，默认使用管理器设置
+            timeout: 超时时间，默认使用管理器设置
+            stats: 调用方自己的统计对象，与管理器的全局统计同时更新
+
+        Returns:
+            bool: 是否下载成功
+        """
+        cancelled = cancel_check or (lambda: False)
+        attempts = max_retries or self.max_retries
+        limiter = limiter or contextlib.nullcontext()
+        host_limiter = self._get_host_limiter(url)
+
+        for attempt in range(attempts):
+            if cancelled():
+                return False
+
+            retry_after = None
+            try:
+                with limiter, host_limiter:
+                    start = time.monotonic()
+                    response = self.session.get(url, timeout=timeout or self.timeout, stream=True)
+                    try:
+                        self._check_status(response)
+                        expected = self._get_expected_length(response)
+                        received = 0
+
+                        def counted_chunks():
+                            nonlocal received
+                            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                                if cancelled():
+                                    return
+                                if chunk:
+                                    received += len(chunk)
+                                    yield chunk
+
+                        consume(counted_chunks())
+                    finally:
+                        response.close()
+                    end = time.monotonic()
+
+                if cancelled():
+                    return False
+                # 校验大小与Content-Length一致，避免把截断的数据当作完成
+                if expected is not None and received != expected:
+                    raise DownloadError(f"响应不完整: 收到 {received} 字节, Content-Length为 {expected}")
+
+                for target in (self.stats, stats):
+                    if target is not None:
+                        target.record_transfer(received, start, end)
+                return True
+
+            except DownloadError as e:
+                logger.warning(f"下载失败 (尝试 {attempt + 1}/{attempts}): {e}")
+                if not e.retryable:
+                    break
+                retry_after = getattr(e, 'retry_after', None)
+            except Exception as e:
+                logger.warning(f"下载失败 (尝试 {attempt + 1}/{attempts}): {e}")
+
+            if attempt < attempts - 1:
+                for target in (self.stats, stats):
+                    if target is not None:
+                        target.record_retry()
+                if not self._sleep(self._get_backoff(attempt, retry_after), cancelled):
+                    return False
+
+        for target in (self.stats, stats):
+            if target is not None:
+                target.record_failure()
+        return False
+
+    def get_stats(self) -> Dict[str, float]:
+        """获取管理器的全局下载统计"""
+        return self.stats.get_all()
+
+    def close(self):
+        """关闭会话和连接池"""
+        self.session.close()
+
+    def _get_host_limiter(self, url: str) -> threading.BoundedSemaphore:
+        """获取URL所属主机的连接数限制"""
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            limiter = self._host_limiters.get(host)
+            if limiter is None:
+                limiter = self._host_limiters[host] = threading.BoundedSemaphore(self.max_connections_per_host)
+            return limiter
+
+    def _check_status(self, response):
+        """检查响应状态，区分可重试和不可重试的错误"""
+        if response.status_code < 400:
+            return
+        error = DownloadError(f"HTTP {response.status_code}",
+                              retryable=response.status_code in RETRYABLE_STATUS_CODES)
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            error.retry_after = float(retry_after)
+        raise error
+
+    def _get_expected_length(self, response) -> Optional[int]:
+        """获取未压缩响应的Content-Length，压缩传输时无法校验返回None"""
+        encoding = response.headers.get('Content-Encoding', 'identity').lower()
+        if encoding not in ('', 'identity'):
+            return None
+        try:
+            return int(response.headers['Content-Length'])
+        except (KeyError, ValueError):
+            return None
+
+    def _get_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """计算指数退避时间，加入随机抖动避免多个线程同时重试"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        delay = random.uniform(delay / 2, delay)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max * 4))
+        return delay
+
+    def _sleep(self, seconds: float, cancelled: Callable[[], bool]) -> bool:
+        """可取消的等待，被取消时返回False"""
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            if cancelled():
+                return False
+            time.sleep(min(0.1, remaining))
+
+
+# 全局下载管理器实例（每个进程一个）
+_download_manager_instance = None
+_download_manager_lock = threading.Lock()
+
+
+def get_download_manager() -> DownloadManager:
+    """获取全局下载管理器实例"""
+    global _download_manager_instance
+    with _download_manager_lock:
+        if _download_manager_instance is None:
+            _download_manager_instance = DownloadManager()
+        return _download_manager_instance
@@ -29,6 +29,7 @@ class ExtractedHistory:
             'video': {'file_hashes': set(), 'content_hashes': set()},  # 视频文件类型
             'image': {'file_hashes': set(), 'content_hashes': set()},
             'texture': {'file_hashes': set(), 'content_hashes': set()},
+            'mesh': {'file_hashes': set(), 'content_hashes': set()},
             'model': {'file_hashes': set(), 'content_hashes': set()},
             'other': {'file_hashes': set(), 'content_hashes': set()}
         }
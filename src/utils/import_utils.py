@@ -15,22 +15,32 @@ from typing import Dict, Any, Optional, List, Callable
 
 # 全局变量跟踪导入状态
 _LIBS_IMPORTED = False
+_GUI_LIBS_IMPORTED = False
 
 # 导入的模块字典
 _imported_modules = {}
 
-def import_libs() -> Dict[str, Any]:
+def import_libs(include_gui: bool = True) -> Dict[str, Any]:
     """
     按需导入常用库，减少启动时间和内存占用
     Import commonly used libraries on demand, reducing startup time and memory usage
     
+    Args:
+        include_gui (bool): 是否同时导入PyQt5/qfluentwidgets，无界面环境（命令行、提取器）传False /
+                            Whether to also import PyQt5/qfluentwidgets; pass False for headless use
+    
     Returns:
         Dict[str, Any]: 包含导入模块的字典 / Dictionary containing imported modules
     """
-    global _LIBS_IMPORTED, _imported_modules
-    
-    if _LIBS_IMPORTED:
-        return _imported_modules
+    if not _LIBS_IMPORTED:
+        _import_standard_libs()
+    if include_gui:
+        _import_gui_libs()
+    return _imported_modules
+
+def _import_standard_libs():
+    """导入标准库 / Import standard libraries"""
+    global _LIBS_IMPORTED
     
     # 导入标准库
     modules_to_import = {
@@ -62,6 +72,15 @@ def import_libs() -> Dict[str, Any]:
         _imported_modules['ThreadPoolExecutor'] = None
         print("警告: 无法导入模块 concurrent.futures")
     
+    _LIBS_IMPORTED = True
+
+def _import_gui_libs():
+    """导入 PyQt5 和 qfluentwidgets / Import PyQt5 and qfluentwidgets"""
+    global _GUI_LIBS_IMPORTED
+    
+    if _GUI_LIBS_IMPORTED:
+        return
+    
     # 添加对 PyQt5 和 qfluentwidgets 的支持
     try:
         # 重要的库先导入
@@ -80,8 +99,7 @@ def import_libs() -> Dict[str, Any]:
     except ImportError as e:
         print(f"警告: 无法导入 PyQt5/qfluentwidgets: {e}")
     
-    _LIBS_IMPORTED = True
-    return _imported_modules
+    _GUI_LIBS_IMPORTED = True
 
 def patch_qfluent_wheel_event():
     """
@@ -87,6 +87,22 @@ class LogHandler:
         else:
             self._fallback_log(f"✗ {message}")
             
+    def batch(self, entries):
+        """
+        批量记录消息，一次性更新日志控件
+        Record a batch of messages, updating the log widget once
+
+        参数:
+        entries: [(消息, 类型), ...]，类型为 info/success/warning/error
+        """
+        prefixes = {"success": "✓ ", "warning": "⚠ ", "error": "✗ "}
+        prefixed = [(message, prefixes.get(log_type, "")) for message, log_type in entries]
+        if CentralLogHandler is not None:
+            CentralLogHandler.getInstance().add_logs(prefixed)
+        else:
+            for message, prefix in prefixed:
+                self._fallback_log(f"{prefix}{message}")
+
     def _fallback_log(self, message: str):
         """
         当中央日志处理器不可用时的后备日志方法
@@ -12,6 +12,8 @@ import multiprocessing
 import hashlib
 from typing import Dict, List, Any, Optional, Tuple, Callable
 
+from .stage_timer import StageTimer, start_trace, stop_trace, is_tracing, add_trace_events
+
 # 简单的日志打印函数
 def _log_info(message):
     print(f"[INFO] {message}")
@@ -148,7 +150,8 @@ class MultiprocessingManager:
                  num_processes: Optional[int] = None,
                  conservative: bool = True,
                  progress_callback: Optional[Callable] = None,
-                 cancel_check: Optional[Callable] = None):
+                 cancel_check: Optional[Callable] = None,
+                 stage_timer: Optional[StageTimer] = None):
         """初始化多进程管理器
         
         Args:
@@ -156,6 +159,7 @@ class MultiprocessingManager:
             conservative: 是否使用保守的进程数量策略
             progress_callback: 进度回调函数
             cancel_check: 取消检查函数
+            stage_timer: 阶段计时器，工作进程返回的阶段统计会合并到这里
         """
         # 确保Windows上的多进程正确启动
         try:
@@ -167,11 +171,13 @@ class MultiprocessingManager:
         self.num_processes = num_processes or get_optimal_process_count(conservative=conservative)
         self.progress_callback = progress_callback
         self.cancel_check = cancel_check
-        self.manager = multiprocessing.Manager()
-        self.stats = MultiprocessingStats(self.manager)
-        
-        # 创建共享的取消标志
-        self.cancelled = self.manager.Value('b', False)
+        self.stage_timer = stage_timer or StageTimer()
+        with self.stage_timer.span("mp_manager_start"):
+            self.manager = multiprocessing.Manager()
+            self.stats = MultiprocessingStats(self.manager)
+            
+            # 创建共享的取消标志
+            self.cancelled = self.manager.Value('b', False)
         
         _log_info(f"初始化多进程管理器: {self.num_processes} 个进程")
     
@@ -199,10 +205,13 @@ class MultiprocessingManager:
             chunk_size: 块大小
         
         Returns:
-            处理结果统计和成功处理的哈希列表
+            处理结果统计、成功处理的哈希列表、工作函数返回的结果列表和阶段统计
+            
+        工作函数返回的'stages'（StageTimer.breakdown()）会合并到self.stage_timer
         """
         if not items:
-            return {'stats': self.stats.get_all(), 'processed_hashes': []}
+            return {'stats': self.stats.get_all(), 'processed_hashes': [], 'results': [],
+                    'stages': self.stage_timer.breakdown()}
         
         # 分割任务
         chunks = chunk_list(items, chunk_size=chunk_size, num_chunks=self.num_processes)
@@ -214,49 +223,63 @@ class MultiprocessingManager:
         self.stats.set('start_time', start_time)
         completed_chunks = 0
         
-        # 收集所有处理的哈希
+        # 收集所有处理的哈希和工作函数返回的结果
         all_processed_hashes = []
+        all_results = []
+        # 主进程在记录trace时，工作进程也记录并随结果返回
+        tracing = is_tracing()
         
         try:
             # 使用原生multiprocessing.Pool
+            pool_start = time.perf_counter()
             with multiprocessing.Pool(processes=self.num_processes) as pool:
+                self.stage_timer.add("mp_pool_start", time.perf_counter() - pool_start)
                 # 提交所有任务
                 results = []
                 for chunk_idx, chunk in enumerate(chunks):
-                    result = pool.apply_async(worker_func, (chunk, config, self.cancelled))
+                    if tracing:
+                        result = pool.apply_async(_traced_worker, (worker_func, chunk, config, self.cancelled))
+                    else:
+                        result = pool.apply_async(worker_func, (chunk, config, self.cancelled))
                     results.append((chunk_idx, result))
                 
-                # 等待所有任务完成
-                for chunk_idx, result in results:
-                    if self.is_cancelled():
-                        _log_info("检测到取消信号，正在停止处理...")
-                        break
+                # 等待所有任务完成（主进程阻塞等待的时间）
+                with self.stage_timer.span("mp_wait", chunks=total_chunks):
+                    for chunk_idx, result in results:
+                        if self.is_cancelled():
+                            _log_info("检测到取消信号，正在停止处理...")
+                            break
                     
-                    try:
-                        # 获取结果
-                        chunk_result = result.get(timeout=60)  # 60秒超时
-                        if chunk_result:
-                            # 合并统计结果
-                            chunk_stats = chunk_result.get('stats', {})
-                            for key, value in chunk_stats.items():
-                                if isinstance(value, (int, float)):
-                                    self.stats.increment(key, value)
+                        try:
+                            # 获取结果
+                            chunk_result = result.get(timeout=60)  # 60秒超时
+                            if chunk_result:
+                                # 合并统计结果
+                                chunk_stats = chunk_result.get('stats', {})
+                                for key, value in chunk_stats.items():
+                                    if isinstance(value, (int, float)):
+                                        self.stats.increment(key, value)
                             
-                            # 收集处理的哈希
-                            chunk_hashes = chunk_result.get('processed_hashes', [])
-                            all_processed_hashes.extend(chunk_hashes)
+                                # 收集处理的哈希
+                                chunk_hashes = chunk_result.get('processed_hashes', [])
+                                all_processed_hashes.extend(chunk_hashes)
+                                all_results.extend(chunk_result.get('results', []))
+                                
+                                # 合并阶段统计和trace事件
+                                self.stage_timer.merge(chunk_result.get('stages'))
+                                add_trace_events(chunk_result.get('trace_events'))
                         
-                        completed_chunks += 1
+                            completed_chunks += 1
                         
-                        # 调用进度回调（降低频率）
-                        if self.progress_callback and completed_chunks % max(1, total_chunks // 10) == 0:
-                            progress = completed_chunks / total_chunks
-                            elapsed = time.time() - start_time
-                            self.progress_callback(completed_chunks, total_chunks, elapsed, progress)
+                            # 调用进度回调（降低频率）
+                            if self.progress_callback and completed_chunks % max(1, total_chunks // 10) == 0:
+                                progress = completed_chunks / total_chunks
+                                elapsed = time.time() - start_time
+                                self.progress_callback(completed_chunks, total_chunks, elapsed, progress)
                     
-                    except Exception as e:
-                        _log_error(f"处理块 {chunk_idx} 时出错: {e}")
-                        self.stats.increment('error_files', len(chunks[chunk_idx]))
+                        except Exception as e:
+                            _log_error(f"处理块 {chunk_idx} 时出错: {e}")
+                            self.stats.increment('error_files', len(chunks[chunk_idx]))
         
         except Exception as e:
             _log_error(f"多进程处理出现严重错误: {e}")
@@ -272,7 +295,32 @@ class MultiprocessingManager:
             items_per_second = len(items) / total_time
             _log_info(f"多进程处理完成: 用时 {total_time:.2f}秒, 处理速度 {items_per_second:.2f} 项/秒")
         
-        return {'stats': final_stats, 'processed_hashes': all_processed_hashes}
+        return {'stats': final_stats, 'processed_hashes': all_processed_hashes, 'results': all_results,
+                'stages': self.stage_timer.breakdown()}
+
+
+def _traced_worker(worker_func: Callable, items: List[Any], config: Any, cancelled) -> Dict[str, Any]:
+    """在工作进程中记录trace事件并随结果返回 - 必须在模块级别定义以支持pickle序列化
+    
+    Args:
+        worker_func: 实际的工作函数
+        items: 要处理的项目列表
+        config: 处理配置
+        cancelled: 共享的取消标志
+    
+    Returns:
+        工作函数的结果，另含'trace_events'
+    """
+    start_trace()
+    timer = StageTimer()
+    try:
+        with timer.span("mp_chunk", items=len(items)):
+            result = worker_func(items, config, cancelled)
+    finally:
+        events = stop_trace()
+    if isinstance(result, dict):
+        result['trace_events'] = events
+    return result
 
 
 def _multiprocessing_worker(items: List[Any], config: ProcessingConfig, cancelled) -> Dict[str, Any]:
@@ -284,7 +332,7 @@ def _multiprocessing_worker(items: List[Any], config: ProcessingConfig, cancelle
         cancelled: 共享的取消标志
     
     Returns:
-        当前进程的统计结果和成功处理的哈希列表
+        当前进程的统计结果、成功处理的哈希列表、保存的文件路径（results）和阶段统计（stages）
     """
     stats = {
         'processed_files': 0,
@@ -293,28 +341,32 @@ def _multiprocessing_worker(items: List[Any], config: ProcessingConfig, cancelle
         'already_processed': 0
     }
     
-    # 收集成功处理的哈希
+    # 收集成功处理的哈希和保存路径
     processed_hashes = []
+    output_paths = []
+    timer = StageTimer()
     
     # 导入处理函数 - 必须在工作进程中导入
     try:
         from src.extractors.audio_extractor import _process_file_worker
     except ImportError:
         _log_error("无法导入 _process_file_worker")
-        return {'stats': stats, 'processed_hashes': processed_hashes}
+        return {'stats': stats, 'processed_hashes': processed_hashes, 'results': output_paths}
     
     for item in items:
         if cancelled.value:
             break
             
         try:
-            result = _process_file_worker(item, config)
+            result = _process_file_worker(item, config, timer)
             
             if result['success'] is True:
                 # 文件已经预处理去重，直接计为成功处理
                 file_hash = result.get('file_hash')
                 if file_hash:
                     processed_hashes.append(file_hash)
+                if result.get('output_path'):
+                    output_paths.append(result['output_path'])
                 
                 stats['processed_files'] += 1
                     
@@ -334,7 +386,8 @@ def _multiprocessing_worker(items: List[Any], config: ProcessingConfig, cancelle
             stats['error_files'] += 1
             _log_error(f"处理项目 {item} 时出错: {e}")
     
-    return {'stats': stats, 'processed_hashes': processed_hashes}
+    return {'stats': stats, 'processed_hashes': processed_hashes, 'results': output_paths,
+            'stages': timer.breakdown()}
 
 
 def create_worker_function(process_func: Callable) -> Callable:
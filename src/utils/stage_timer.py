@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+阶段计时工具 - 统计提取流程各阶段的耗时和计数，可选导出Chrome trace
+Stage Timer - Per-stage timing and counters for extraction runs, with optional Chrome trace export
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+import contextlib
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 单次trace最多保留的事件数，避免长时间运行时占用过多内存
+MAX_TRACE_EVENTS = 200000
+
+# 把perf_counter换算成墙钟时间，使不同进程的事件可以对齐到同一时间轴
+_EPOCH_ORIGIN = time.time()
+_PERF_ORIGIN = time.perf_counter()
+
+_trace_lock = threading.Lock()
+_trace_events: Optional[List[Dict[str, Any]]] = None
+_trace_dropped = 0
+_thread_names: Dict[int, str] = {}
+
+
+def start_trace():
+    """开始在当前进程记录trace事件（已在记录时清空之前的事件）"""
+    global _trace_events, _trace_dropped
+    with _trace_lock:
+        _trace_events = []
+        _trace_dropped = 0
+        _thread_names.clear()
+
+
+def stop_trace() -> List[Dict[str, Any]]:
+    """
+    停止记录trace事件
+
+    Returns:
+        List[Dict[str, Any]]: 已记录的事件（含线程名元数据），未在记录时为空列表
+    """
+    global _trace_events
+    with _trace_lock:
+        events = _trace_events or []
+        _trace_events = None
+        pid = os.getpid()
+        metadata = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                    for tid, name in _thread_names.items()]
+        _thread_names.clear()
+        if _trace_dropped:
+            logger.warning(f"trace事件超过上限 {MAX_TRACE_EVENTS}，丢弃了 {_trace_dropped} 个")
+    return metadata + events
+
+
+def is_tracing() -> bool:
+    """当前进程是否在记录trace事件"""
+    return _trace_events is not None
+
+
+def add_trace_events(events: List[Dict[str, Any]]):
+    """
+    合并其他进程记录的trace事件
+
+    Args:
+        events: 事件列表（stop_trace的返回值）
+    """
+    global _trace_dropped
+    with _trace_lock:
+        if _trace_events is None or not events:
+            return
+        room = MAX_TRACE_EVENTS - len(_trace_events)
+        _trace_events.extend(events[:max(room, 0)])
+        _trace_dropped += max(len(events) - max(room, 0), 0)
+
+
+def _record_trace_event(name: str, start: float, end: float, args: Dict[str, Any]):
+    """记录一个完整事件（Chrome trace的"X"类型）"""
+    global _trace_dropped
+    with _trace_lock:
+        if _trace_events is None:
+            return
+        if len(_trace_events) >= MAX_TRACE_EVENTS:
+            _trace_dropped += 1
+            return
+        thread = threading.current_thread()
+        tid = thread.ident or 0
+        _thread_names.setdefault(tid, thread.name)
+        event = {
+            "name": name,
+            "cat": "stage",
+            "ph": "X",
+            "ts": round((start - _PERF_ORIGIN + _EPOCH_ORIGIN) * 1e6, 1),
+            "dur": round((end - start) * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        _trace_events.append(event)
+
+
+def write_chrome_trace(path: str, events: List[Dict[str, Any]]) -> str:
+    """
+    写出Chrome trace JSON（可在chrome://tracing或Perfetto中打开）
+
+    Args:
+        path: 输出文件路径
+        events: 事件列表
+
+    Returns:
+        str: 输出文件路径
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    logger.info(f"已导出 {len(events)} 个trace事件: {path}")
+    return path
+
+
+class StageTimer:
+    """
+    阶段计时器 - 线程安全地累计每个阶段的耗时、次数和自定义计数
+
+    逐项目的阶段（读取、哈希、写入等）可能在多个线程或进程中同时执行，
+    其耗时是各线程耗时之和，可能超过提取的总耗时。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    @contextlib.contextmanager
+    def span(self, name: str, **counters) -> Iterator[Dict[str, Any]]:
+        """
+        对一个阶段计时
+
+        Args:
+            name: 阶段名称
+            **counters: 要累加到该阶段的计数（如bytes），也可以在with块中修改返回的字典
+
+        Yields:
+            Dict[str, Any]: 计数字典
+        """
+        start = time.perf_counter()
+        try:
+            yield counters
+        finally:
+            end = time.perf_counter()
+            self.add(name, end - start, **counters)
+            if _trace_events is not None:
+                _record_trace_event(name, start, end, counters)
+
+    def add(self, name: str, seconds: float, count: int = 1, **counters):
+        """
+        累加在别处测得的阶段耗时
+
+        Args:
+            name: 阶段名称
+            seconds: 耗时（秒）
+            count: 次数
+            **counters: 要累加的计数
+        """
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = self._stages[name] = {"seconds": 0.0, "count": 0}
+            stage["seconds"] += seconds
+            stage["count"] += count
+            for key, value in counters.items():
+                if isinstance(value, (int, float)):
+                    stage[key] = stage.get(key, 0) + value
+
+    def merge(self, stages: Optional[Dict[str, Dict[str, float]]]):
+        """
+        合并其他计时器的统计（如工作进程返回的breakdown）
+
+        Args:
+            stages: breakdown()的返回值
+        """
+        for name, stage in (stages or {}).items():
+            counters = {k: v for k, v in stage.items() if k not in ("seconds", "count")}
+            self.add(name, stage.get("seconds", 0.0), stage.get("count", 0), **counters)
+
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        """
+        获取各阶段统计
+
+        Returns:
+            Dict[str, Dict[str, float]]: {阶段: {'seconds', 'count', 其他计数}}，按阶段首次出现的顺序
+        """
+        with self._lock:
+            result = {}
+            for name, stage in self._stages.items():
+                entry = dict(stage)
+                entry["seconds"] = round(entry["seconds"], 4)
+                result[name] = entry
+            return result
+
+    def reset(self):
+        """清空统计"""
+        with self._lock:
+            self._stages.clear()
@@ -11,10 +11,24 @@ from .extraction_worker import ExtractionWorker
 from .font_extraction_worker import FontExtractionWorker
 from .translation_extraction_worker import TranslationExtractionWorker
 from .video_extraction_worker import VideoExtractionWorker
+from .staged_extraction_worker import StagedExtractionWorker
+from .image_extraction_worker import ImageExtractionWorker
+from .texture_extraction_worker import TextureExtractionWorker
+from .mesh_extraction_worker import MeshExtractionWorker
+from .model_extraction_worker import ModelExtractionWorker
+from .cache_watch_worker import CacheWatchWorker
+from .signal_coalescer import SignalCoalescer
 
 __all__ = [
     'ExtractionWorker',
     'FontExtractionWorker', 
     'TranslationExtractionWorker',
-    'VideoExtractionWorker'
+    'VideoExtractionWorker',
+    'StagedExtractionWorker',
+    'ImageExtractionWorker',
+    'TextureExtractionWorker',
+    'MeshExtractionWorker',
+    'ModelExtractionWorker',
+    'CacheWatchWorker',
+    'SignalCoalescer'
 ] 
\ No newline at end of file
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+缓存监视工作线程
+Cache Watch Worker
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from src.extractors.cache_watcher import CacheWatcher, create_watch_scanner
+
+
+class CacheWatchWorker(QThread):
+    """
+    缓存监视工作线程 - 缓存中出现新项目时，用页面自己的提取工作线程类处理这些项目
+
+    每一批都在本线程中同步运行一个新的提取工作线程对象（不调用start），
+    因此提取与监视一样以较低优先级运行，并复用页面的全部提取设置。
+    """
+    progressUpdated = pyqtSignal(int, int, float, float)  # 进度更新信号(当前进度, 总数, 已用时间, 速度)
+    logMessage = pyqtSignal(str, str)  # 日志消息信号(消息, 类型)
+    logBatch = pyqtSignal(list)  # 批量日志信号([(消息, 类型), ...])
+    batchFinished = pyqtSignal(dict)  # 一批处理完成信号(结果字典，watch_items为该批项目数)
+
+    def __init__(self, worker_class, worker_params, cache_path=None, poll_interval=2.0, debounce=1.5):
+        """
+        初始化缓存监视工作线程
+
+        Args:
+            worker_class: 提取工作线程类，需要支持cache_items属性
+            worker_params: 提取工作线程的构造参数
+            cache_path: 要监视的缓存路径（.db数据库、rbx-storage文件夹或缓存目录），
+                        应与提取时扫描的路径相同，None表示自动检测Roblox缓存
+            poll_interval: 没有系统变更通知时检查缓存的间隔（秒）
+            debounce: 缓存停止变化多少秒后开始提取
+        """
+        super().__init__()
+        self.worker_class = worker_class
+        self.worker_params = tuple(worker_params)
+        self.cache_path = cache_path
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.watcher = None
+        self.batch_worker = None
+        self.is_stopping = False
+
+    def run(self):
+        """运行线程：监视缓存直到stop()被调用"""
+        def log_callback(message_key: str, log_type: str, *args):
+            """处理从监视器发送的日志消息"""
+            if args:
+                self.logMessage.emit(f"{message_key}|{chr(31)}|" + chr(31).join(str(arg) for arg in args), log_type)
+            else:
+                self.logMessage.emit(message_key, log_type)
+
+        self.watcher = CacheWatcher(
+            create_watch_scanner(self.cache_path),
+            self._process_batch,
+            poll_interval=self.poll_interval,
+            debounce=self.debounce,
+            log_callback=log_callback
+        )
+        if not self.is_stopping:
+            self.watcher.run()
+
+    def _process_batch(self, cache_items):
+        """用提取工作线程处理一批新缓存项目"""
+        worker = self.worker_class(*self.worker_params)
+        worker.cache_items = cache_items
+        results = []
+        worker.progressUpdated.connect(self.progressUpdated.emit)
+        worker.logMessage.connect(self.logMessage.emit)
+        if hasattr(worker, 'logBatch'):
+            worker.logBatch.connect(self.logBatch.emit)
+        worker.finished.connect(results.append)
+
+        self.batch_worker = worker
+        try:
+            # 直接调用run，在监视线程中同步执行
+            worker.run()
+        finally:
+            self.batch_worker = None
+
+        result = dict(results[0]) if results else {"success": False, "error": "No result"}
+        result["watch_items"] = len(cache_items)
+        self.batchFinished.emit(result)
+
+    def stop(self):
+        """停止监视，并取消正在处理的一批"""
+        self.is_stopping = True
+        if self.watcher:
+            self.watcher.stop()
+        worker = self.batch_worker
+        if worker:
+            worker.cancel()
@@ -14,6 +14,8 @@ from PyQt5.QtCore import QThread, pyqtSignal
 
 # 导入自定义提取器模块
 from src.extractors.audio_extractor import RobloxAudioExtractor, ClassificationMethod
+from src.extractors.audio_converter import AudioConverter
+from src.workers.signal_coalescer import SignalCoalescer
 
 
 class ExtractionWorker(QThread):
@@ -21,8 +23,10 @@ class ExtractionWorker(QThread):
     progressUpdated = pyqtSignal(int, int, float, float)  # 进度更新信号(当前进度, 总数, 已用时间, 速度)
     finished = pyqtSignal(dict)  # 完成信号(结果字典)
     logMessage = pyqtSignal(str, str)  # 日志消息信号(消息, 类型)
+    logBatch = pyqtSignal(list)  # 批量日志信号([(消息, 类型), ...])
 
-    def __init__(self, base_dir, num_threads, download_history, classification_method, custom_output_dir=None, scan_db=True, convert_enabled=False, convert_format="MP3", use_multiprocessing=False, conservative_multiprocessing=True):
+    def __init__(self, base_dir, num_threads, download_history, classification_method, custom_output_dir=None, scan_db=True, convert_enabled=False, convert_format="MP3", use_multiprocessing=False, conservative_multiprocessing=True,
+                 convert_while_extracting=True, keep_source_audio=True):
         super().__init__()
         self.base_dir = base_dir
         self.num_threads = num_threads
@@ -34,17 +38,22 @@ class ExtractionWorker(QThread):
         self.convert_format = convert_format
         self.use_multiprocessing = use_multiprocessing
         self.conservative_multiprocessing = conservative_multiprocessing
+        self.convert_while_extracting = convert_while_extracting  # 边提取边转换
+        self.keep_source_audio = keep_source_audio  # 转换后是否保留OGG文件
         self.is_cancelled = False
         self.total_files = 0
         self.processed_count = 0
         self.actual_extracted_count = 0  # 记录实际提取的文件数量
         self.extractor = None
+        self.cache_items = None  # 监视模式下只处理这些缓存项目，None表示扫描整个缓存
+        # 进度与日志信号合并器，避免大量文件时淹没Qt事件循环
+        self.signals = SignalCoalescer(self.progressUpdated.emit, self.logMessage.emit, self.logBatch.emit)
 
     def run(self):
         """运行线程：提取音频文件"""
         try:
             # 更新状态
-            self.logMessage.emit(self._get_lang('scanning_files'), 'info')
+            self.signals.log(self._get_lang('scanning_files'), 'info')
 
             # 创建日志回调函数，将日志转发到工作线程的logMessage信号
             def audio_log_callback(message_key: str, log_type: str, *args):
@@ -54,7 +63,7 @@ class ExtractionWorker(QThread):
                     message = f"{message_key}|{separator}|{'|'.join(map(str, args))}"
                 else:
                     message = message_key
-                self.logMessage.emit(message, log_type)
+                self.signals.log(message, log_type)
             
             # 创建提取器
             start_time = time.time()
@@ -79,17 +88,18 @@ class ExtractionWorker(QThread):
             self.extractor.set_cancel_check(check_cancelled)
 
             # 查找要处理的文件
-            files_to_process = self.extractor.find_files_to_process()
+            files_to_process = self.extractor.find_files_to_process(self.cache_items)
             scan_duration = time.time() - start_time
             self.total_files = len(files_to_process)
 
             # 使用特殊分隔符传递参数给主线程翻译系统
             separator = chr(31)
             message = f"found_files|{separator}|{self.total_files}{separator}{scan_duration:.2f}"
-            self.logMessage.emit(message, 'info')
+            self.signals.log(message, 'info')
 
             if not files_to_process:
-                self.logMessage.emit(self._get_lang('no_files_found'), 'warning')
+                self.signals.log(self._get_lang('no_files_found'), 'warning')
+                self.signals.flush()
                 self.finished.emit({
                     "success": True,
                     "processed": 0,
@@ -106,8 +116,8 @@ class ExtractionWorker(QThread):
             if self.use_multiprocessing:
                 separator = chr(31)
                 message = f"multiprocess_preprocessing|{separator}|{self.extractor.num_processes}"
-                self.logMessage.emit(message, 'info')
-                self.logMessage.emit(self._get_lang('preprocessing_files'), 'info')
+                self.signals.log(message, 'info')
+                self.signals.log(self._get_lang('preprocessing_files'), 'info')
 
             # 创建一个用于更新进度的函数
             original_process_file = self.extractor.process_file
@@ -125,8 +135,8 @@ class ExtractionWorker(QThread):
                 elapsed = time.time() - start_time
                 speed = self.processed_count / elapsed if elapsed > 0 else 0
                 
-                # 发送进度信号，不限制进度百分比为整数，让UI层处理
-                self.progressUpdated.emit(self.processed_count, self.total_files, elapsed, speed)
+                # 发送进度信号（由合并器节流），不限制进度百分比为整数，让UI层处理
+                self.signals.progress(self.processed_count, self.total_files, elapsed, speed)
                 return result
 
             # 包装处理方法以提供进度更新
@@ -135,48 +145,62 @@ class ExtractionWorker(QThread):
             # 处理文件
             separator = chr(31)
             message = f"processing_with_threads|{separator}|{self.num_threads}"
-            self.logMessage.emit(message, 'info')
+            self.signals.log(message, 'info')
+
+            # 边提取边转换：多线程模式下每保存一个文件就放入转换队列
+            # （多进程模式下文件在子进程中保存，提取结束后再统一转换）
+            converter = None
+            if self.convert_enabled and self.convert_while_extracting and not self.use_multiprocessing:
+                try:
+                    converter = self._start_streaming_conversion()
+                except Exception as e:
+                    self.signals.log(f'Audio conversion failed: {str(e)}', 'error')
 
             # 进行处理
-            extraction_result = self.extractor.process_files()
+            extraction_result = self.extractor.process_files(self.cache_items)
             
             # 不再强制覆盖processed统计，使用提取器返回的准确数据
             # 但保留actual_extracted_count用于转换逻辑判断
-            self.logMessage.emit(f"Processing completed: {extraction_result.get('processed', 0)} files processed", 'info')
+            self.signals.log(f"Processing completed: {extraction_result.get('processed', 0)} files processed", 'info')
 
             # 如果启用了音频转换且提取了文件，进行格式转换
-            if self.convert_enabled and extraction_result.get("processed", 0) > 0:
-                self.logMessage.emit(f'Converting audio files to {self.convert_format}...', 'info')
+            if self.convert_enabled and (converter is not None or extraction_result.get("processed", 0) > 0):
+                self.signals.log(f'Converting audio files to {self.convert_format}...', 'info')
                 try:
-                    conversion_result = self._convert_audio_files(extraction_result.get("output_dir", ""))
+                    if converter is not None:
+                        conversion_result = self._finish_conversion(converter)
+                        # 边提取边转换的文件在转换完成后才计入已提取
+                        extraction_result["processed"] = self.extractor.stats.get_all()['processed_files']
+                    else:
+                        conversion_result = self._convert_audio_files(self.extractor.get_saved_files())
                     extraction_result["conversion_result"] = conversion_result
-                    # 添加转换输出目录信息
-                    conversion_result["converted_dir"] = os.path.join(extraction_result.get("output_dir", ""), "Audio", f"Audio_{self.convert_format.upper()}")
                     if conversion_result["converted"] > 0:
-                        self.logMessage.emit(f'Successfully converted {conversion_result["converted"]} files to {self.convert_format}', 'success')
+                        self.signals.log(f'Successfully converted {conversion_result["converted"]} files to {self.convert_format}', 'success')
                     else:
-                        self.logMessage.emit('No files were converted', 'warning')
+                        self.signals.log('No files were converted', 'warning')
                 except Exception as e:
-                    self.logMessage.emit(f'Audio conversion failed: {str(e)}', 'error')
+                    self.signals.log(f'Audio conversion failed: {str(e)}', 'error')
                     extraction_result["conversion_error"] = str(e)
 
             # 确保历史记录被保存 - 修复：强制保存历史记录
             if self.download_history:
                 try:
                     self.download_history.save_history()
-                    self.logMessage.emit(f"History saved: {self.download_history.get_history_size()} files", 'info')
+                    self.signals.log(f"History saved: {self.download_history.get_history_size()} files", 'info')
                 except Exception as e:
-                    self.logMessage.emit(f"Failed to save history: {str(e)}", 'error')
+                    self.signals.log(f"Failed to save history: {str(e)}", 'error')
 
             # 设置结果
             extraction_result["success"] = True
+            self.signals.flush()
             self.finished.emit(extraction_result)
 
         except Exception as e:
             separator = chr(31)
             message = f"error_occurred|{separator}|{str(e)}"
-            self.logMessage.emit(message, 'error')
+            self.signals.log(message, 'error')
             traceback.print_exc()
+            self.signals.flush()
             self.finished.emit({"success": False, "error": str(e)})
 
     def cancel(self):
@@ -211,107 +235,74 @@ class ExtractionWorker(QThread):
                 return english_strings[key]
         return key  # 如果找不到键，返回键本身
     
-    def _convert_audio_files(self, output_dir):
-        """转换音频文件格式"""
-        import subprocess
-        import glob
-        
-        result = {
-            "converted": 0,
-            "failed": 0,
-            "errors": []
-        }
-        
-        if not output_dir or not os.path.exists(output_dir):
-            raise Exception("Output directory not found")
-        
-        # 查找所有OGG文件
-        audio_dir = os.path.join(output_dir, "Audio")
-        if not os.path.exists(audio_dir):
-            raise Exception("Audio directory not found")
-        
-        # 为转换后的格式创建专门的文件夹
-        convert_format_upper = self.convert_format.upper()
-        converted_dir = os.path.join(output_dir, "Audio", f"Audio_{convert_format_upper}")
+    def _create_converter(self):
+        """创建音频转换器"""
+        return AudioConverter(
+            self.extractor.audio_dir,
+            self.convert_format,
+            cancel_check=lambda: self.is_cancelled,
+            progress_callback=self.signals.progress,
+            log_callback=self.signals.log,
+            remove_source=not self.keep_source_audio
+        )
+    
+    def _start_streaming_conversion(self):
+        """
+        启动边提取边转换，提取线程保存的文件直接进入转换队列
         
-        # 递归查找所有.ogg文件
-        ogg_files = []
-        for root, dirs, files in os.walk(audio_dir):
-            for file in files:
-                if file.lower().endswith('.ogg'):
-                    ogg_files.append(os.path.join(root, file))
+        不保留OGG文件时，提取出的数据通过管道直接交给FFmpeg，不写出中间文件。
+        提取期间进度条显示提取进度，转换器只在提取结束后报告剩余的转换进度。
         
-        if not ogg_files:
-            return result
+        Returns:
+            AudioConverter: 正在运行的转换器
+        """
+        converter = self._create_converter()
+        converter.progress_callback = None
+        if self.keep_source_audio:
+            self.extractor.saved_callback = converter.submit
+        else:
+            self.extractor.content_sink = converter.submit
         
-        # 检查ffmpeg是否可用
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            raise Exception("FFmpeg is not installed or not found in PATH")
+        self.signals.log(f'Converting to {converter.output_format} while extracting '
+                         f'with {converter.max_workers} FFmpeg processes', 'info')
+        self.signals.log(f'Output directory: {converter.converted_dir}', 'info')
+        return converter
+    
+    def _finish_conversion(self, converter):
+        """
+        等待边提取边转换的剩余文件完成
         
-        self.logMessage.emit(f'Found {len(ogg_files)} OGG files to convert', 'info')
-        self.logMessage.emit(f'Converting to format: {convert_format_upper}', 'info')
-        self.logMessage.emit(f'Output directory: {converted_dir}', 'info')
+        Returns:
+            dict: 转换统计
+        """
+        self.extractor.saved_callback = None
+        self.extractor.content_sink = None
+        converter.progress_callback = self.signals.progress
+        result = converter.close()
+        self._log_conversion_result(result)
+        return result
+    
+    def _convert_audio_files(self, source_files):
+        """
+        并行转换本次运行保存的音频文件
         
-        for i, ogg_file in enumerate(ogg_files):
-            if self.is_cancelled:
-                break
-                
-            try:
-                # 获取OGG文件相对于Audio目录的路径
-                rel_path = os.path.relpath(ogg_file, audio_dir)
-                
-                # 生成对应的转换后文件路径，保持相同的文件夹结构
-                output_file_name = os.path.splitext(os.path.basename(rel_path))[0] + f'.{self.convert_format.lower()}'
-                output_file_dir = os.path.join(converted_dir, os.path.dirname(rel_path))
-                output_file = os.path.join(output_file_dir, output_file_name)
-                
-                # 确保输出目录存在
-                os.makedirs(output_file_dir, exist_ok=True)
-                
-                # 构建ffmpeg命令
-                cmd = [
-                    'ffmpeg', '-i', ogg_file, 
-                    '-y',  # 覆盖输出文件
-                    '-loglevel', 'error',  # 只显示错误
-                ]
-                
-                # 根据格式添加特定参数
-                if self.convert_format.upper() == 'MP3':
-                    cmd.extend(['-codec:a', 'libmp3lame', '-b:a', '192k'])
-                elif self.convert_format.upper() == 'WAV':
-                    cmd.extend(['-codec:a', 'pcm_s16le'])
-                elif self.convert_format.upper() == 'FLAC':
-                    cmd.extend(['-codec:a', 'flac'])
-                elif self.convert_format.upper() == 'AAC':
-                    cmd.extend(['-codec:a', 'aac', '-b:a', '128k'])
-                elif self.convert_format.upper() == 'M4A':
-                    cmd.extend(['-codec:a', 'aac', '-b:a', '128k'])
-                    
-                cmd.append(output_file)
-                
-                # 执行转换
-                process = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if process.returncode == 0:
-                    result["converted"] += 1
-                    # 转换成功后可以选择删除原文件
-                    # os.remove(ogg_file)  # 取消注释以删除原OGG文件
-                else:
-                    result["failed"] += 1
-                    error_msg = f"Failed to convert {os.path.basename(ogg_file)}: {process.stderr}"
-                    result["errors"].append(error_msg)
-                    self.logMessage.emit(error_msg, 'warning')
-                    
-            except Exception as e:
-                result["failed"] += 1
-                error_msg = f"Error converting {os.path.basename(ogg_file)}: {str(e)}"
-                result["errors"].append(error_msg)
-                self.logMessage.emit(error_msg, 'warning')
+        Args:
+            source_files: 本次运行保存的音频文件路径
             
-            # 更新进度 (可选)
-            if i % 10 == 0:  # 每转换10个文件更新一次进度
-                self.logMessage.emit(f'Converted {i+1}/{len(ogg_files)} files...', 'info')
+        Returns:
+            dict: 转换统计（converted, skipped, failed, errors, converted_dir, ...）
+        """
+        converter = self._create_converter()
+        
+        self.signals.log(f'Converting {len(source_files)} files to {converter.output_format} '
+                         f'with {converter.max_workers} FFmpeg processes', 'info')
+        self.signals.log(f'Output directory: {converter.converted_dir}', 'info')
         
-        return result 
\ No newline at end of file
+        result = converter.convert_all(source_files)
+        self._log_conversion_result(result)
+        return result
+    
+    def _log_conversion_result(self, result):
+        """记录转换结果和吞吐量"""
+        self.signals.log(f'Conversion finished: {result["converted"]} converted, {result["skipped"]} up to date, '
+                         f'{result["failed"]} failed ({result["files_per_second"]:.1f} files/s)', 'info')
@@ -13,6 +13,7 @@ from PyQt5.QtCore import QThread, pyqtSignal
 # 导入Roblox字体提取器
 from src.extractors.font_extractor import RobloxFontExtractor, FontClassificationMethod
 from src.locale import lang
+from src.workers.signal_coalescer import SignalCoalescer
 
 class FontExtractionWorker(QThread):
     """字体提取工作线程"""
@@ -20,6 +21,7 @@ class FontExtractionWorker(QThread):
     finished = pyqtSignal(dict)  # 完成信号(结果字典)
     logMessage = pyqtSignal(str, str)  # 日志消息信号(消息, 类型)
     statusMessage = pyqtSignal(str)  # 状态消息信号
+    logBatch = pyqtSignal(list)  # 批量日志信号([(消息, 类型), ...])
 
     def __init__(self, base_dir, num_threads, download_history, classification_method, custom_output_dir=None, scan_db=True, convert_enabled=True, convert_format="TTF", use_multiprocessing=False, conservative_multiprocessing=True):
         """
@@ -38,6 +40,8 @@ class FontExtractionWorker(QThread):
             conservative_multiprocessing: 是否使用保守的多进程策略
         """
         super().__init__()
+        # 进度与日志信号合并器
+        self.signals = SignalCoalescer(self.progressUpdated.emit, self.logMessage.emit, self.logBatch.emit)
         self.base_dir = base_dir
         self.num_threads = num_threads
         self.download_history = download_history
@@ -50,6 +54,7 @@ class FontExtractionWorker(QThread):
         self.conservative_multiprocessing = conservative_multiprocessing
         self.is_cancelled = False
         self.extractor = None
+        self.cache_items = None  # 监视模式下只处理这些缓存项目，None表示扫描整个缓存
         
         # 进度追踪
         self.start_time = 0
@@ -62,7 +67,7 @@ class FontExtractionWorker(QThread):
             self.start_time = time.time()
             
             # 发送开始消息
-            self.logMessage.emit(self._get_lang('starting_font_extraction'), 'info')
+            self.signals.log(self._get_lang('starting_font_extraction'), 'info')
             self.statusMessage.emit(self._get_lang('initializing_extractor'))
             
             # 创建日志回调函数
@@ -72,9 +77,9 @@ class FontExtractionWorker(QThread):
                 if args:
                     # 使用分隔符将翻译键和参数分开
                     message_with_args = f"{message_key}|{chr(31)}|" + chr(31).join(str(arg) for arg in args)
-                    self.logMessage.emit(message_with_args, log_type)
+                    self.signals.log(message_with_args, log_type)
                 else:
-                    self.logMessage.emit(message_key, log_type)
+                    self.signals.log(message_key, log_type)
             
             # 创建Roblox字体提取器
             self.extractor = RobloxFontExtractor(
@@ -95,7 +100,7 @@ class FontExtractionWorker(QThread):
             cache_info = self.extractor.get_cache_info()
             cache_path = cache_info.get('target_path', self._get_lang('unknown'))
             cache_type = self._get_lang('database') if cache_info.get('target_is_database', False) else self._get_lang('filesystem')
-            self.logMessage.emit(
+            self.signals.log(
                 self._get_lang('cache_info', cache_path, cache_type),
                 'info'
             )
@@ -103,7 +108,8 @@ class FontExtractionWorker(QThread):
             # 检查缓存路径
             if not cache_info.get('path_exists', False):
                 error_msg = self._get_lang('cache_path_not_found')
-                self.logMessage.emit(error_msg, 'error')
+                self.signals.log(error_msg, 'error')
+                self.signals.flush()
                 self.finished.emit({
                     "success": False,
                     "error": error_msg,
@@ -116,7 +122,8 @@ class FontExtractionWorker(QThread):
             self.statusMessage.emit(self._get_lang('extracting_fonts'))
             result = self.extractor.extract_fonts(
                 progress_callback=self._on_progress,
-                custom_cache_path=None  # 字体提取始终使用自动检测的Roblox缓存路径
+                custom_cache_path=None,  # 字体提取始终使用自动检测的Roblox缓存路径
+                cache_items=self.cache_items
             )
             
             # 计算最终统计
@@ -130,24 +137,26 @@ class FontExtractionWorker(QThread):
                 # 使用特殊分隔符传递参数给主线程翻译系统
                 separator = chr(31)
                 message = f"font_extraction_completed|{separator}|{fontlist_found}{separator}{fonts_downloaded}{separator}{duration:.1f}"
-                self.logMessage.emit(message, 'success')
+                self.signals.log(message, 'success')
             else:
                 error_msg = result.get('error', self._get_lang('unknown_error'))
-                self.logMessage.emit(
+                self.signals.log(
                     self._get_lang('extraction_failed', error_msg),
                     'error'
                 )
             
             # 发送完成信号
+            self.signals.flush()
             self.finished.emit(result)
             
         except Exception as e:
             separator = chr(31)
             error_message = f"extraction_error|{separator}|{str(e)}"
-            self.logMessage.emit(error_message, 'error')
+            self.signals.log(error_message, 'error')
             debug_message = f"error_details|{separator}|{traceback.format_exc()}"
-            self.logMessage.emit(debug_message, 'debug')
+            self.signals.log(debug_message, 'debug')
             
+            self.signals.flush()
             self.finished.emit({
                 "success": False,
                 "error": str(e),
@@ -161,9 +170,10 @@ class FontExtractionWorker(QThread):
                 try:
                     self.download_history.save_history()
                     history_size = self.download_history.get_history_size('font')
-                    self.logMessage.emit(f"History saved: {history_size} font files", 'info')
+                    self.signals.log(f"History saved: {history_size} font files", 'info')
                 except Exception as e:
-                    self.logMessage.emit(f"Failed to save font history: {str(e)}", 'error')
+                    self.signals.log(f"Failed to save font history: {str(e)}", 'error')
+            self.signals.flush()
 
     def _on_progress(self, current: int, total: int, message: str):
         """
@@ -188,7 +198,7 @@ class FontExtractionWorker(QThread):
             speed = 0.0
         
         # 发送进度信号
-        self.progressUpdated.emit(current, total, elapsed_time, speed)
+        self.signals.progress(current, total, elapsed_time, speed)
         
         # 发送状态消息
         self.statusMessage.emit(message)
@@ -196,7 +206,7 @@ class FontExtractionWorker(QThread):
         # 记录重要进度
         if total > 0 and current % max(1, total // 10) == 0:  # 每10%记录一次
             progress_percent = (current / total) * 100
-            self.logMessage.emit(
+            self.signals.log(
                 self._get_lang('progress_update', progress_percent, current, total),
                 'info'
             )
@@ -206,7 +216,7 @@ class FontExtractionWorker(QThread):
         self.is_cancelled = True
         if self.extractor:
             self.extractor.cancel()
-        self.logMessage.emit(self._get_lang('extraction_cancelled'), 'warning')
+        self.signals.log(self._get_lang('extraction_cancelled'), 'warning')
 
     def _get_lang(self, key, *args):
         """
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图像提取工作线程
+Image Extraction Worker
+"""
+
+from typing import Any, Dict
+
+# 导入Roblox图像提取器
+from src.extractors.image_extractor import RobloxImageExtractor
+from src.workers.staged_extraction_worker import StagedExtractionWorker
+
+
+class ImageExtractionWorker(StagedExtractionWorker):
+    """图像提取工作线程"""
+
+    EXTRACTOR_CLASS = RobloxImageExtractor
+
+    def __init__(self, base_dir, num_threads, download_history, classification_method, custom_output_dir=None, scan_db=True, use_multiprocessing=False, conservative_multiprocessing=True, block_avatar_images=True):
+        """
+        初始化图像提取工作线程
+
+        Args:
+            base_dir: 基础目录路径(Roblox缓存路径)
+            num_threads: 线程数量
+            download_history: 下载历史管理器
+            classification_method: 分类方法
+            custom_output_dir: 自定义输出目录
+            scan_db: 是否扫描数据库
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+            block_avatar_images: 是否阻止头像图片（WebP）
+        """
+        super().__init__(base_dir, num_threads, download_history, classification_method, custom_output_dir,
+                         scan_db, use_multiprocessing, conservative_multiprocessing)
+        self.block_avatar_images = block_avatar_images
+
+    def extractor_options(self) -> Dict[str, Any]:
+        return {'block_avatar_images': self.block_avatar_images}
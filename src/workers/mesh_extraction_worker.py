@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+网格提取工作线程
+Mesh Extraction Worker
+"""
+
+from typing import Any, Dict
+
+# 导入Roblox网格提取器
+from src.extractors.mesh_extractor import RobloxMeshExtractor
+from src.workers.staged_extraction_worker import StagedExtractionWorker
+
+
+class MeshExtractionWorker(StagedExtractionWorker):
+    """网格提取工作线程"""
+
+    EXTRACTOR_CLASS = RobloxMeshExtractor
+
+    def __init__(self, base_dir, num_threads, download_history, classification_method, custom_output_dir=None, scan_db=True, use_multiprocessing=False, conservative_multiprocessing=True, convert_obj=False):
+        """
+        初始化网格提取工作线程
+
+        Args:
+            base_dir: 基础目录路径(Roblox缓存路径)
+            num_threads: 线程数量
+            download_history: 下载历史管理器
+            classification_method: 分类方法
+            custom_output_dir: 自定义输出目录
+            scan_db: 是否扫描数据库
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+            convert_obj: 是否把网格转换为OBJ
+        """
+        super().__init__(base_dir, num_threads, download_history, classification_method, custom_output_dir,
+                         scan_db, use_multiprocessing, conservative_multiprocessing)
+        self.convert_obj = convert_obj
+
+    def extractor_options(self) -> Dict[str, Any]:
+        return {'convert_obj': self.convert_obj}
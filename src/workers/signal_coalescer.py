@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+信号合并器 - 限制工作线程发往界面的进度与日志信号频率
+Signal Coalescer - Rate-limits progress and log signals sent from worker threads to the UI
+"""
+
+import time
+import threading
+from typing import Callable, List, Optional, Tuple
+
+
+class SignalCoalescer:
+    """
+    信号合并器
+
+    进度信号按固定频率（默认20Hz）节流，只保留最新一次进度；
+    日志消息先缓存，达到批量大小或时间间隔后一次性发送。
+    所有方法都是线程安全的，可以直接在提取器的线程池中调用。
+    """
+
+    def __init__(self, progress_emit: Callable[[int, int, float, float], None],
+                 log_emit: Callable[[str, str], None],
+                 log_batch_emit: Optional[Callable[[list], None]] = None,
+                 progress_hz: float = 20.0, log_interval: float = 0.1, max_batch: int = 200):
+        """
+        初始化信号合并器
+
+        Args:
+            progress_emit: 进度信号发送函数(当前进度, 总数, 已用时间, 速度)
+            log_emit: 单条日志信号发送函数(消息, 类型)
+            log_batch_emit: 批量日志信号发送函数([(消息, 类型), ...])，为None时逐条发送
+            progress_hz: 进度信号最大频率
+            log_interval: 日志批量发送的最大间隔(秒)
+            max_batch: 单批最多日志条数
+        """
+        self._progress_emit = progress_emit
+        self._log_emit = log_emit
+        self._log_batch_emit = log_batch_emit
+        self._progress_interval = 1.0 / progress_hz if progress_hz > 0 else 0.0
+        self._log_interval = log_interval
+        self._max_batch = max(1, max_batch)
+
+        self._lock = threading.Lock()
+        self._pending_progress: Optional[Tuple[int, int, float, float]] = None
+        self._last_progress_time = 0.0
+        self._pending_logs: List[Tuple[str, str]] = []
+        self._last_log_time = 0.0
+
+    def progress(self, current: int, total: int, elapsed: float, speed: float):
+        """提交进度更新，超过频率限制时只保留最新值"""
+        with self._lock:
+            self._pending_progress = (current, total, elapsed, speed)
+            now = time.monotonic()
+            # 顺带发送积压的日志，避免长时间无新日志时缓存不被刷新
+            if self._pending_logs and now - self._last_log_time >= self._log_interval:
+                self._flush_logs_locked(now)
+            # 首次、完成时或距上次发送超过间隔时立即发送
+            if current >= total or now - self._last_progress_time >= self._progress_interval:
+                self._flush_progress_locked(now)
+
+    def log(self, message: str, log_type: str = 'info'):
+        """提交日志消息，按批量发送"""
+        with self._lock:
+            self._pending_logs.append((message, log_type))
+            now = time.monotonic()
+            # 错误消息立即发送，避免界面上看不到最后的错误
+            if (log_type == 'error' or len(self._pending_logs) >= self._max_batch
+                    or now - self._last_log_time >= self._log_interval):
+                self._flush_logs_locked(now)
+
+    def flush(self):
+        """立即发送所有缓存的进度和日志"""
+        with self._lock:
+            now = time.monotonic()
+            self._flush_logs_locked(now)
+            self._flush_progress_locked(now)
+
+    def _flush_progress_locked(self, now: float):
+        """发送缓存的进度（调用方需持有锁）"""
+        if self._pending_progress is None:
+            return
+        pending = self._pending_progress
+        self._pending_progress = None
+        self._last_progress_time = now
+        try:
+            self._progress_emit(*pending)
+        except RuntimeError:
+            pass  # 接收对象已销毁
+
+    def _flush_logs_locked(self, now: float):
+        """发送缓存的日志（调用方需持有锁）"""
+        if not self._pending_logs:
+            return
+        batch = self._pending_logs
+        self._pending_logs = []
+        self._last_log_time = now
+        try:
+            if self._log_batch_emit is not None and len(batch) > 1:
+                self._log_batch_emit(batch)
+            else:
+                for message, log_type in batch:
+                    self._log_emit(message, log_type)
+        except RuntimeError:
+            pass  # 接收对象已销毁
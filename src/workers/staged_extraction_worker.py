@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+暂存式提取工作线程基类 - 图像、纹理、网格和模型提取工作线程共用
+Staged Extraction Worker - Shared worker thread for the image, texture, mesh and model extractors
+"""
+
+import time
+from typing import Any, Dict
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from src.workers.signal_coalescer import SignalCoalescer
+
+
+class StagedExtractionWorker(QThread):
+    """
+    暂存式提取工作线程基类
+
+    子类设置EXTRACTOR_CLASS（StagedCacheExtractor的子类），并通过extractor_options()
+    提供该资源类型特有的提取器参数。前六个参数的位置与其他工作线程相同。
+    """
+    progressUpdated = pyqtSignal(int, int, float, float)  # 进度更新信号(当前进度, 总数, 已用时间, 速度)
+    finished = pyqtSignal(dict)  # 完成信号(结果字典)
+    logMessage = pyqtSignal(str, str)  # 日志消息信号(消息, 类型)
+    logBatch = pyqtSignal(list)  # 批量日志信号([(消息, 类型), ...])
+
+    EXTRACTOR_CLASS = None
+
+    def __init__(self, base_dir, num_threads, download_history, classification_method, custom_output_dir=None, scan_db=True, use_multiprocessing=False, conservative_multiprocessing=True):
+        """
+        初始化提取工作线程
+
+        Args:
+            base_dir: 基础目录路径(Roblox缓存路径)
+            num_threads: 线程数量
+            download_history: 下载历史管理器
+            classification_method: 分类方法
+            custom_output_dir: 自定义输出目录
+            scan_db: 是否扫描数据库
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+        """
+        super().__init__()
+        # 进度与日志信号合并器
+        self.signals = SignalCoalescer(self.progressUpdated.emit, self.logMessage.emit, self.logBatch.emit)
+        self.base_dir = base_dir
+        self.num_threads = num_threads
+        self.download_history = download_history
+        self.classification_method = classification_method
+        self.custom_output_dir = custom_output_dir
+        self.scan_db = scan_db
+        self.use_multiprocessing = use_multiprocessing
+        self.conservative_multiprocessing = conservative_multiprocessing
+        self.is_cancelled = False
+        self.extractor = None
+        self.cache_items = None  # 监视模式下只处理这些缓存项目，None表示扫描整个缓存
+
+        # 进度追踪
+        self.start_time = 0
+        self.processed_count = 0
+        self.total_count = 0
+
+    def extractor_options(self) -> Dict[str, Any]:
+        """该资源类型特有的提取器参数"""
+        return {}
+
+    def run(self):
+        """运行线程：提取资源"""
+        try:
+            self.start_time = time.time()
+
+            # 创建日志回调函数
+            def log_callback(message_key: str, log_type: str, *args):
+                """处理从提取器发送的日志消息"""
+                # 将翻译键和参数以特殊格式发送，让界面层处理翻译和格式化
+                if args:
+                    message_with_args = f"{message_key}|{chr(31)}|" + chr(31).join(str(arg) for arg in args)
+                    self.signals.log(message_with_args, log_type)
+                else:
+                    self.signals.log(message_key, log_type)
+
+            # 创建提取器
+            self.extractor = self.EXTRACTOR_CLASS(
+                output_dir=self.custom_output_dir,
+                classification_method=self.classification_method,
+                num_threads=self.num_threads,
+                use_multiprocessing=self.use_multiprocessing,
+                conservative_multiprocessing=self.conservative_multiprocessing,
+                log_callback=log_callback,
+                download_history=self.download_history,
+                **self.extractor_options()
+            )
+
+            # 设置取消检查函数
+            self.extractor.set_cancel_check(lambda: self.is_cancelled)
+
+            # 创建进度回调函数
+            def progress_callback(current: int, total: int, status: str):
+                """进度回调函数"""
+                self.processed_count = current
+                self.total_count = total
+
+                elapsed_time = time.time() - self.start_time
+                speed = current / elapsed_time if elapsed_time > 0 else 0
+                self.signals.progress(current, total, elapsed_time, speed)
+
+            # 如果启用数据库扫描，使用自动检测的Roblox缓存路径（传递None）
+            # 如果禁用数据库扫描，使用用户指定的自定义路径
+            cache_path = None if self.scan_db else self.base_dir
+            result = self.extractor.extract(progress_callback, cache_path, self.cache_items)
+
+            # 发送完成信号
+            self.signals.flush()
+            self.finished.emit(result)
+
+        except Exception as e:
+            error_msg = f"{self.EXTRACTOR_CLASS.ASSET_LABEL}提取过程中发生错误: {str(e)}"
+            self.signals.log(error_msg, 'error')
+
+            result = {
+                "success": False,
+                "error": error_msg,
+                "processed_caches": self.processed_count,
+                "stats": {},
+                "duration": time.time() - self.start_time if self.start_time > 0 else 0,
+                "output_dir": ""
+            }
+            self.signals.flush()
+            self.finished.emit(result)
+
+    def cancel(self):
+        """取消提取操作"""
+        self.is_cancelled = True
+        if self.extractor:
+            self.extractor.cancelled = True
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+纹理提取工作线程
+Texture Extraction Worker
+"""
+
+from typing import Any, Dict
+
+# 导入Roblox纹理提取器
+from src.extractors.texture_extractor import RobloxTextureExtractor
+from src.workers.staged_extraction_worker import StagedExtractionWorker
+
+
+class TextureExtractionWorker(StagedExtractionWorker):
+    """纹理提取工作线程"""
+
+    EXTRACTOR_CLASS = RobloxTextureExtractor
+
+    def __init__(self, base_dir, num_threads, download_history, classification_method, custom_output_dir=None, scan_db=True, use_multiprocessing=False, conservative_multiprocessing=True, decode_png=False, decode_all_mips=False):
+        """
+        初始化纹理提取工作线程
+
+        Args:
+            base_dir: 基础目录路径(Roblox缓存路径)
+            num_threads: 线程数量
+            download_history: 下载历史管理器
+            classification_method: 分类方法
+            custom_output_dir: 自定义输出目录
+            scan_db: 是否扫描数据库
+            use_multiprocessing: 是否使用多进程
+            conservative_multiprocessing: 是否使用保守的多进程策略
+            decode_png: 是否把纹理解码为PNG
+            decode_all_mips: 是否解码所有Mip级别（默认只解码级别0）
+        """
+        super().__init__(base_dir, num_threads, download_history, classification_method, custom_output_dir,
+                         scan_db, use_multiprocessing, conservative_multiprocessing)
+        self.decode_png = decode_png
+        self.decode_all_mips = decode_all_mips
+
+    def extractor_options(self) -> Dict[str, Any]:
+        return {
+            'decode_png': self.decode_png,
+            'decode_mip_levels': 32 if self.decode_all_mips else 1
+        }
@@ -12,6 +12,7 @@ from PyQt5.QtCore import QThread, pyqtSignal
 
 # 导入Roblox翻译文件提取器
 from src.extractors.translation_extractor import RobloxTranslationExtractor, TranslationClassificationMethod
+from src.workers.signal_coalescer import SignalCoalescer
 
 
 class TranslationExtractionWorker(QThread):
@@ -19,6 +20,7 @@ class TranslationExtractionWorker(QThread):
     progressUpdated = pyqtSignal(int, int, float, float)  # 进度更新信号(当前进度, 总数, 已用时间, 速度)
     finished = pyqtSignal(dict)  # 完成信号(结果字典)
     logMessage = pyqtSignal(str, str)  # 日志消息信号(消息, 类型)
+    logBatch = pyqtSignal(list)  # 批量日志信号([(消息, 类型), ...])
 
     def __init__(self, base_dir, num_threads, download_history, classification_method, custom_output_dir=None, scan_db=True, convert_enabled=True, convert_format="JSON", use_multiprocessing=False, conservative_multiprocessing=True):
         """
@@ -32,11 +34,13 @@ class TranslationExtractionWorker(QThread):
             custom_output_dir: 自定义输出目录
             scan_db: 是否扫描数据库
             convert_enabled: 是否启用翻译文件处理(与音频的convert_enabled对应)
-            convert_format: 翻译文件格式(保留以兼容接口)
+            convert_format: 翻译文件输出格式，JSON重新格式化，RAW按缓存中的原始内容写入，BUNDLE合并到翻译包
             use_multiprocessing: 是否使用多进程
             conservative_multiprocessing: 是否使用保守的多进程策略
         """
         super().__init__()
+        # 进度与日志信号合并器
+        self.signals = SignalCoalescer(self.progressUpdated.emit, self.logMessage.emit, self.logBatch.emit)
         self.base_dir = base_dir
         self.num_threads = num_threads
         self.download_history = download_history
@@ -49,6 +53,7 @@ class TranslationExtractionWorker(QThread):
         self.conservative_multiprocessing = conservative_multiprocessing
         self.is_cancelled = False
         self.extractor = None
+        self.cache_items = None  # 监视模式下只处理这些缓存项目，None表示扫描整个缓存
         
         # 进度追踪
         self.start_time = 0
@@ -61,7 +66,7 @@ class TranslationExtractionWorker(QThread):
             self.start_time = time.time()
             
             # 发送开始消息
-            self.logMessage.emit(self._get_lang('starting_translation_extraction'), 'info')
+            self.signals.log(self._get_lang('starting_translation_extraction'), 'info')
             
             # 创建日志回调函数
             def log_callback(message_key: str, log_type: str, *args):
@@ -70,9 +75,9 @@ class TranslationExtractionWorker(QThread):
                 if args:
                     # 使用分隔符将翻译键和参数分开
                     message_with_args = f"{message_key}|{chr(31)}|" + chr(31).join(str(arg) for arg in args)
-                    self.logMessage.emit(message_with_args, log_type)
+                    self.signals.log(message_with_args, log_type)
                 else:
-                    self.logMessage.emit(message_key, log_type)
+                    self.signals.log(message_key, log_type)
             
             # 创建Roblox翻译文件提取器
             self.extractor = RobloxTranslationExtractor(
@@ -83,7 +88,9 @@ class TranslationExtractionWorker(QThread):
                 use_multiprocessing=self.use_multiprocessing,
                 conservative_multiprocessing=self.conservative_multiprocessing,
                 log_callback=log_callback,
-                download_history=self.download_history
+                download_history=self.download_history,
+                pretty_print=self.convert_format.upper() != "RAW",
+                bundle=self.convert_format.upper() == "BUNDLE"
             )
             
             # 设置取消检查函数
@@ -100,20 +107,21 @@ class TranslationExtractionWorker(QThread):
                 speed = current / elapsed_time if elapsed_time > 0 else 0
                 
                 # 发送进度更新信号
-                self.progressUpdated.emit(current, total, elapsed_time, speed)
+                self.signals.progress(current, total, elapsed_time, speed)
             
             # 开始提取
             # 如果启用数据库扫描，使用自动检测的Roblox缓存路径（传递None）
             # 如果禁用数据库扫描，使用用户指定的自定义路径
             cache_path = None if self.scan_db else self.base_dir
-            result = self.extractor.extract_translations(progress_callback, cache_path)
+            result = self.extractor.extract_translations(progress_callback, cache_path, self.cache_items)
             
             # 发送完成信号
+            self.signals.flush()
             self.finished.emit(result)
             
         except Exception as e:
             error_msg = f"翻译文件提取过程中发生错误: {str(e)}"
-            self.logMessage.emit(error_msg, 'error')
+            self.signals.log(error_msg, 'error')
             
             # 发送失败结果
             result = {
@@ -124,6 +132,7 @@ class TranslationExtractionWorker(QThread):
                 "duration": time.time() - self.start_time if self.start_time > 0 else 0,
                 "output_dir": ""
             }
+            self.signals.flush()
             self.finished.emit(result)
 
     def cancel(self):
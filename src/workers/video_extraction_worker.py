@@ -12,6 +12,7 @@ from PyQt5.QtCore import QThread, pyqtSignal
 
 from src.extractors.video_extractor import RobloxVideoExtractor, VideoClassificationMethod
 from src.utils.history_manager import ExtractedHistory
+from src.workers.signal_coalescer import SignalCoalescer
 
 class VideoExtractionWorker(QThread):
     """视频提取工作线程"""
@@ -20,12 +21,14 @@ class VideoExtractionWorker(QThread):
     progressUpdated = pyqtSignal(int, int, float, float)  # current, total, elapsed_time, speed
     finished = pyqtSignal(dict)  # 提取完成信号，传递结果字典
     logMessage = pyqtSignal(str, str)  # 日志消息，message, type
+    logBatch = pyqtSignal(list)  # 批量日志信号([(消息, 类型), ...])
     
     def __init__(self, base_dir, num_threads, download_history, classification_method, 
                  custom_output_dir=None, scan_db=True, use_multiprocessing=False, 
                  conservative_multiprocessing=True, concurrent_downloads=True, 
                  auto_cleanup=True, ffmpeg_path=None, quality_preference=None, 
-                 timestamp_repair=True, convert_enabled=False, convert_format="MP4"):
+                 timestamp_repair=True, convert_enabled=False, convert_format="MP4",
+                 resume_downloads=False):
         """
         初始化视频提取工作线程
         
@@ -43,8 +46,11 @@ class VideoExtractionWorker(QThread):
             ffmpeg_path: FFmpeg路径
             convert_enabled: 是否启用格式转换
             convert_format: 转换格式
+            resume_downloads: 是否保存已完成的片段以便中断后续传
         """
         super().__init__()
+        # 进度与日志信号合并器
+        self.signals = SignalCoalescer(self.progressUpdated.emit, self.logMessage.emit, self.logBatch.emit)
         self.base_dir = base_dir
         self.num_threads = num_threads
         self.download_history = download_history
@@ -60,6 +66,7 @@ class VideoExtractionWorker(QThread):
         self.timestamp_repair = timestamp_repair
         self.convert_enabled = convert_enabled
         self.convert_format = convert_format
+        self.resume_downloads = resume_downloads
         self.extractor = None
         self._stop_requested = False
     
@@ -83,6 +90,7 @@ class VideoExtractionWorker(QThread):
             'video_output_directory': 'Output directory: {}',
             'video_processed_count': 'Videos processed: {} items',
             'video_segments_downloaded': 'Segments downloaded: {} items',
+            'video_segments_resumed': 'Segments resumed: {} items',
             'video_merged_count': 'Videos merged: {} items',
             'video_duplicates_skipped': 'Duplicates skipped: {} items',
             'video_download_failures': 'Download failures: {} items',
@@ -105,7 +113,7 @@ class VideoExtractionWorker(QThread):
         """运行视频提取"""
         try:
             self.start_time = time.time()
-            self.logMessage.emit(self._get_lang("video_initializing_extractor"), 'info')
+            self.signals.log(self._get_lang("video_initializing_extractor"), 'info')
             
             # 创建视频提取器
             self.extractor = RobloxVideoExtractor(
@@ -119,13 +127,16 @@ class VideoExtractionWorker(QThread):
                 conservative_multiprocessing=self.conservative_multiprocessing,
                 ffmpeg_path=self.ffmpeg_path,
                 quality_preference=self.quality_preference,
-                timestamp_repair=self.timestamp_repair
+                timestamp_repair=self.timestamp_repair,
+                concurrent_downloads=self.concurrent_downloads,
+                auto_cleanup=self.auto_cleanup,
+                resume_downloads=self.resume_downloads
             )
             
             # 设置取消检查函数
             self.extractor.set_cancel_check_function(lambda: self._stop_requested)
             
-            self.logMessage.emit(self._get_lang("video_scanning_cache"), 'info')
+            self.signals.log(self._get_lang("video_scanning_cache"), 'info')
             
             # 执行视频提取，传递进度回调
             result = self.extractor.extract_videos(
@@ -133,41 +144,46 @@ class VideoExtractionWorker(QThread):
             )
             
             if self._stop_requested:
-                self.logMessage.emit(self._get_lang("video_extraction_cancelled"), 'warning')
+                self.signals.log(self._get_lang("video_extraction_cancelled"), 'warning')
                 result['cancelled'] = True
             elif result.get('success', False):
                 # 输出统计信息
                 stats = result.get('stats', {})
-                self.logMessage.emit(self._get_lang("video_processing_complete"), 'success')
-                self.logMessage.emit(self._get_lang("video_processed_count", stats.get('processed_videos', 0)), 'info')
-                self.logMessage.emit(self._get_lang("video_segments_downloaded", stats.get('downloaded_segments', 0)), 'info')
-                self.logMessage.emit(self._get_lang("video_merged_count", stats.get('merged_videos', 0)), 'info')
+                self.signals.log(self._get_lang("video_processing_complete"), 'success')
+                self.signals.log(self._get_lang("video_processed_count", stats.get('processed_videos', 0)), 'info')
+                self.signals.log(self._get_lang("video_segments_downloaded", stats.get('downloaded_segments', 0)), 'info')
+                self.signals.log(self._get_lang("video_merged_count", stats.get('merged_videos', 0)), 'info')
+                
+                if stats.get('resumed_segments', 0) > 0:
+                    self.signals.log(self._get_lang("video_segments_resumed", stats.get('resumed_segments', 0)), 'info')
                 
                 if stats.get('duplicate_videos', 0) > 0:
-                    self.logMessage.emit(self._get_lang("video_duplicates_skipped", stats.get('duplicate_videos', 0)), 'info')
+                    self.signals.log(self._get_lang("video_duplicates_skipped", stats.get('duplicate_videos', 0)), 'info')
                 
                 if stats.get('download_failures', 0) > 0:
-                    self.logMessage.emit(self._get_lang("video_download_failures", stats.get('download_failures', 0)), 'warning')
+                    self.signals.log(self._get_lang("video_download_failures", stats.get('download_failures', 0)), 'warning')
                 
                 duration = result.get('duration', 0)
-                self.logMessage.emit(self._get_lang("video_total_duration", duration), 'info')
+                self.signals.log(self._get_lang("video_total_duration", duration), 'info')
                 
                 # 输出目录信息
                 output_dir = result.get('output_dir', '')
                 if output_dir:
-                    self.logMessage.emit(self._get_lang("video_output_directory", output_dir), 'info')
+                    self.signals.log(self._get_lang("video_output_directory", output_dir), 'info')
             else:
-                self.logMessage.emit(self._get_lang("video_extraction_failed"), 'error')
+                self.signals.log(self._get_lang("video_extraction_failed"), 'error')
             
             # 发送完成信号
+            self.signals.flush()
             self.finished.emit(result)
             
         except Exception as e:
             error_msg = self._get_lang("video_extraction_error", str(e))
-            self.logMessage.emit(error_msg, 'error')
-            self.logMessage.emit(self._get_lang("video_error_details", traceback.format_exc()), 'error')
+            self.signals.log(error_msg, 'error')
+            self.signals.log(self._get_lang("video_error_details", traceback.format_exc()), 'error')
             
             # 发送失败结果
+            self.signals.flush()
             self.finished.emit({
                 'success': False,
                 'error': str(e),
@@ -185,14 +201,14 @@ class VideoExtractionWorker(QThread):
             elapsed_time = current_time - self.start_time
             speed = current / elapsed_time if elapsed_time > 0 else 0
             
-            self.progressUpdated.emit(current, total, elapsed_time, speed)
+            self.signals.progress(current, total, elapsed_time, speed)
             
             if total > 0:
                 percentage = (current / total) * 100
                 # 使用特殊分隔符格式来与翻译系统兼容
                 separator = chr(31)
                 message = f"video_progress_update|{separator}|{percentage:.1f}{separator}{current}{separator}{total}"
-                self.logMessage.emit(message, 'info')
+                self.signals.log(message, 'info')
     
     def stop(self):
         """停止提取操作"""
@@ -200,7 +216,7 @@ class VideoExtractionWorker(QThread):
         if self.extractor:
             self.extractor.cancel()
         
-        self.logMessage.emit(self._get_lang("video_cancelling"), 'warning')
+        self.signals.log(self._get_lang("video_cancelling"), 'warning')
     
     def cancel(self):
         """取消提取操作（与其他worker保持接口一致性）"""